@@ -0,0 +1,18 @@
+"""Headless benchmarks for KeyQuest's hot paths.
+
+Run from the repo root (SDL's dummy video and audio drivers are selected
+unless already set, so this works on a Linux CI runner):
+
+  python -m benchmarks                                 # every case
+  python -m benchmarks typing screens.lesson           # cases whose name contains these
+  python -m benchmarks --output before.json
+  python -m benchmarks --output after.json --compare before.json
+  python -m benchmarks --current after.json --compare before.json --fail-on-slower
+
+Cases live in the ``bench_*`` modules, grouped by the first part of their
+name: ``typing`` (keystroke processing), ``lessons`` (``build_batch``),
+``text`` (``wrap_text``), ``screens`` (each ``draw_*`` screen),
+``progress`` (saves and loads), ``audio`` (effect synthesis), and
+``hangman`` (dictionary loading). ``harness.py`` does the timing, the JSON
+results, and the comparison.
+"""
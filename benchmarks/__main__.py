@@ -0,0 +1,97 @@
+"""Command line for the benchmark suite; see the package docstring."""
+
+import argparse
+import contextlib
+import os
+import tempfile
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from benchmarks import harness  # noqa: E402
+from benchmarks.context import Context  # noqa: E402
+
+from benchmarks import (  # noqa: E402,F401  (registers the cases)
+    bench_audio,
+    bench_hangman,
+    bench_lessons,
+    bench_progress,
+    bench_screens,
+    bench_text,
+    bench_typing,
+)
+
+
+def run(cases, repeat: int, verbose: bool) -> dict:
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="keyquest-bench-") as workdir:
+        # The app writes progress.json and its error log to the working folder.
+        os.chdir(workdir)
+        context = Context(workdir)
+        try:
+            for item in cases:
+                # Speech without a backend prints every announcement.
+                with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+                    result = harness.run_case(item, context, repeat)
+                results[item.name] = result
+                if verbose:
+                    print(f"{item.name:<40}{harness.format_ms(result['median_ms']):>12}", flush=True)
+        finally:
+            with open(os.devnull, "w") as quiet, contextlib.redirect_stdout(quiet):
+                context.close()
+            os.chdir(cwd)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Run KeyQuest's headless benchmarks.")
+    parser.add_argument("patterns", nargs="*", help="Only run cases whose name contains one of these")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed samples per case (default: 5)")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", metavar="PREVIOUS", help="Compare against an earlier results file")
+    parser.add_argument("--current", metavar="RESULTS", help="Compare this results file instead of running")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change that counts (default: 0.10)")
+    parser.add_argument("--fail-on-slower", action="store_true", help="Exit 1 if any case got slower")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    args = parser.parse_args()
+
+    cases = harness.select(args.patterns)
+    if args.list:
+        for item in cases:
+            print(f"{item.name:<40}{item.description}")
+        return 0
+    if not cases:
+        print(f"No benchmarks match {' '.join(args.patterns)}")
+        return 1
+
+    if args.current:
+        document = harness.load_results(args.current)
+    else:
+        document = harness.results_document(run(cases, max(1, args.repeat), verbose=True))
+        print()
+        print(harness.format_results(document["results"]))
+    if args.output:
+        harness.save_results(document, args.output)
+        print(f"Results -> {args.output}")
+
+    if args.compare:
+        previous = harness.load_results(args.compare)["results"]
+        current = document["results"]
+        if args.patterns:
+            names = {item.name for item in cases}
+            previous = {name: result for name, result in previous.items() if name in names}
+            current = {name: result for name, result in current.items() if name in names}
+        rows = harness.compare(current, previous, args.threshold)
+        print()
+        print(harness.format_comparison(rows))
+        slower = [row for row in rows if row[3] == "slower"]
+        print(f"\n{len(slower)} slower, {sum(1 for row in rows if row[3] == 'faster')} faster than {args.compare}")
+        if slower and args.fail_on_slower:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,32 @@
+"""Sound synthesis, without the sound bank or the disk cache."""
+
+from benchmarks.harness import case
+from games import sounds
+from modules.audio_manager import AudioManager
+
+# Every no-argument effect generator: feedback, celebration, and pet sounds.
+APP_EFFECTS = sorted(
+    name for name in vars(AudioManager)
+    if name.startswith("make_") and name not in ("make_tone", "make_progressive_tone")
+)
+
+
+def _synthesis_case(generator, params=()):
+    def setup(context):
+        return lambda: generator(*params)
+    return setup
+
+
+for _name in APP_EFFECTS:
+    case(f"audio.{_name[len('make_'):]}", number=5, description=f"AudioManager.{_name}()")(
+        _synthesis_case(getattr(AudioManager, _name))
+    )
+
+case("audio.progressive_tone", number=20, description="AudioManager.make_progressive_tone(0.5)")(
+    _synthesis_case(AudioManager.make_progressive_tone, (0.5,))
+)
+
+for _generator, _params in dict.fromkeys((generator, params) for generator, params, _ in sounds.GAME_EFFECTS):
+    case(f"audio.game_{_generator.__name__}", number=5, description=f"games.sounds.{_generator.__name__}()")(
+        _synthesis_case(_generator, _params)
+    )
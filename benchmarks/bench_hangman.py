@@ -0,0 +1,98 @@
+"""Hangman dictionary loading: the compact file and the JSON fallback."""
+
+import json
+import os
+import random
+import string
+from contextlib import contextmanager
+from pathlib import Path
+
+from benchmarks.harness import case
+from games import hangman
+from games.hangman_dictionary import HangmanDictionary, write_hangman_dictionary
+
+# About the size of the packaged offline dictionary.
+ENTRIES = 220000
+FIRST_ROUND_LENGTH = 7
+_STATE = (
+    "EXTERNAL_WORDLIST_PATH",
+    "EXTERNAL_DEFINITIONS_PATH",
+    "EXTERNAL_DICTIONARY_PATH",
+    "_EXTERNAL_WORDS_CACHE",
+    "_EXTERNAL_DEFINITIONS_CACHE",
+    "_CANDIDATE_POOL_CACHE",
+    "_CANDIDATE_LENGTH_BUCKETS_CACHE",
+    "_COMPACT_DICTIONARY_CACHE",
+)
+
+
+def _dictionary_files(context):
+    json_path = context.path("hangman_definitions.json")
+    compact_path = context.path("hangman_dictionary.bin")
+    if not os.path.exists(compact_path):
+        rng = random.Random(1)
+        definitions = {}
+        while len(definitions) < ENTRIES:
+            word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 12)))
+            definitions[word] = " ".join(
+                "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(12)
+            )
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(definitions, f)
+        write_hangman_dictionary(definitions.items(), compact_path)
+    return Path(json_path), Path(compact_path)
+
+
+@contextmanager
+def _cold_hangman(definitions_path: Path, dictionary_path: Path):
+    """Hangman pointed at the given files with nothing loaded yet."""
+    saved = {name: getattr(hangman, name) for name in _STATE}
+    for name in _STATE:
+        setattr(hangman, name, None)
+    hangman.EXTERNAL_WORDLIST_PATH = definitions_path.with_name("missing_words.txt")
+    hangman.EXTERNAL_DEFINITIONS_PATH = definitions_path
+    hangman.EXTERNAL_DICTIONARY_PATH = dictionary_path
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(hangman, name, value)
+
+
+def _first_round():
+    """What _choose_word() needs for the first round."""
+    hangman.load_candidate_bucket_sizes()
+    hangman.pick_candidate(FIRST_ROUND_LENGTH)
+
+
+@case("hangman.first_round_compact")
+def first_round_compact(context):
+    """Open the memory-mapped dictionary and pick the first word (220,000 entries)."""
+    json_path, compact_path = _dictionary_files(context)
+
+    def load():
+        with _cold_hangman(json_path, compact_path):
+            _first_round()
+
+    return load
+
+
+@case("hangman.first_round_json")
+def first_round_json(context):
+    """Parse hangman_definitions.json and pick the first word, the fallback without the compact file."""
+    json_path, compact_path = _dictionary_files(context)
+    missing = compact_path.with_name("missing_dictionary.bin")
+
+    def load():
+        with _cold_hangman(json_path, missing):
+            _first_round()
+
+    return load
+
+
+@case("hangman.next_word_compact", number=1000)
+def next_word_compact(context):
+    """A random word of the first round's length from an open compact dictionary (every later round)."""
+    _, compact_path = _dictionary_files(context)
+    dictionary = HangmanDictionary(str(compact_path))
+    return lambda: dictionary.random_entry(FIRST_ROUND_LENGTH)
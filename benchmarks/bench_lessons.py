@@ -0,0 +1,41 @@
+"""Lesson batch generation."""
+
+from benchmarks.harness import case
+from modules import lesson_manager, state_manager
+
+
+def _practised_settings():
+    """Settings with key stats, so weak-key weighting has work to do."""
+    settings = state_manager.AppState().settings
+    settings.key_stats = {
+        chr(code): {"attempts": 400 + code, "correct": 360 + code % 40, "errors": 40 - code % 40, "recent": [1, 0, 1, 1, 1]}
+        for code in range(ord("a"), ord("z") + 1)
+    }
+    return settings
+
+
+def _build_batch_case(stage: int):
+    def setup(context):
+        settings = _practised_settings()
+
+        def build():
+            lesson_manager.LessonManager.build_batch(state_manager.LessonState(stage=stage), stage, settings)
+
+        return build
+    return setup
+
+
+_LAST_LETTER_STAGE = max(
+    stage for stage in range(len(lesson_manager.STAGE_LETTERS))
+    if stage not in lesson_manager.SPECIAL_KEY_COMMANDS
+)
+
+case("lessons.build_batch_early", number=20, description="build_batch for lesson 2 (home row)")(
+    _build_batch_case(2)
+)
+case("lessons.build_batch_mid", number=20, description="build_batch for lesson 8")(_build_batch_case(8))
+case(
+    "lessons.build_batch_last",
+    number=20,
+    description=f"build_batch for lesson {_LAST_LETTER_STAGE}, the last letters lesson",
+)(_build_batch_case(_LAST_LETTER_STAGE))
@@ -0,0 +1,140 @@
+"""Progress saves and loads on a long-lived profile."""
+
+import os
+from datetime import date, timedelta
+
+from benchmarks.harness import case
+from modules import dashboard_manager, key_analytics
+from modules.state_manager import AppState, ProgressManager
+
+STAGES = 50
+SQLITE_SESSIONS = 50000
+
+
+def _session(n: int) -> dict:
+    day = date(2024, 1, 1) + timedelta(days=n // 6)
+    return {
+        "type": ("lesson", "speed_test", "sentence_practice", "game")[n % 4],
+        "summary": f"Lesson {n % 40 + 1}",
+        "date": day.isoformat(),
+        "time": "4:15 PM",
+        "timestamp": f"{day.isoformat()}T16:15:00",
+        "wpm": 20.0 + n % 40,
+        "accuracy": 90.0 + n % 10,
+        "duration": 60.0 + n % 300,
+        "stars": n % 4,
+        "earned": "12 XP, 5 coins",
+    }
+
+
+def _veteran_state(sessions: int) -> AppState:
+    """A profile with every lesson played, every key practised, and ``sessions`` sessions."""
+    state = AppState()
+    settings = state.settings
+    settings.current_lesson = 30
+    settings.unlocked_lessons = set(range(31))
+    settings.lesson_stars = {i: 3 for i in range(31)}
+    settings.lesson_best_wpm = {i: 40.0 + i for i in range(31)}
+    settings.key_stats = {
+        chr(c): {"attempts": 5000 + c, "correct": 4800 + c, "errors": 200, "recent": [1, 1, 0, 1, 1, 1, 1, 0, 1, 1]}
+        for c in range(32, 127)
+    }
+    settings.coins = 4200
+    settings.pet_type = "dragon"
+    settings.pet_name = "Ember"
+    settings.session_history = [_session(n) for n in range(sessions)]
+    return state
+
+
+def _json_profile(context) -> str:
+    path = context.path("progress_bench.json")
+    if not os.path.exists(path):
+        ProgressManager(path).save(_veteran_state(100))
+    return path
+
+
+def _sqlite_profile(context) -> dict:
+    kwargs = {"filename": context.path("progress_db.json"), "database": context.path("progress_bench.db")}
+    if not os.path.exists(kwargs["database"]):
+        manager = ProgressManager(**kwargs)
+        manager.write(manager.changes(_veteran_state(SQLITE_SESSIONS)))
+        manager.store.close()
+    return kwargs
+
+
+def _finish_session(state: AppState, n: int) -> None:
+    """A finished session: one new history row and a few changed fields."""
+    dashboard_manager.record_session(state.settings, _session(n))
+    key_analytics.record_keystroke(state.settings, "e", True)
+    state.settings.coins += 5
+
+
+def _saver(manager: ProgressManager, state: AppState):
+    sessions = [len(state.settings.session_history)]
+
+    def save():
+        sessions[0] += 1
+        _finish_session(state, sessions[0])
+        manager.write(manager.changes(state))
+
+    return save
+
+
+def _changes(manager: ProgressManager, state: AppState):
+    sessions = [len(state.settings.session_history)]
+
+    def changes():
+        sessions[0] += 1
+        _finish_session(state, sessions[0])
+        return manager.changes(state)
+
+    return changes
+
+
+@case("progress.changes", number=20)
+def changes(context):
+    """A finished session plus ProgressManager.changes(), the part of a save that runs on the pygame thread."""
+    manager = ProgressManager(_json_profile(context))
+    state = AppState()
+    manager.load(state, STAGES)
+    return _changes(manager, state)
+
+
+@case("progress.save_json", number=20)
+def save_json(context):
+    """changes() and write() of one session to progress.json (journal appends, periodic compaction)."""
+    manager = ProgressManager(_json_profile(context))
+    state = AppState()
+    manager.load(state, STAGES)
+    return _saver(manager, state)
+
+
+@case("progress.load_json", number=5)
+def load_json(context):
+    """ProgressManager.load() of a 100-session progress.json."""
+    path = _json_profile(context)
+    return lambda: ProgressManager(path).load(AppState(), STAGES)
+
+
+@case("progress.save_sqlite", number=20)
+def save_sqlite(context):
+    """changes() and write() of one session to a 50,000-session SQLite store."""
+    manager = ProgressManager(**_sqlite_profile(context))
+    state = AppState()
+    manager.load(state, STAGES)
+    return _saver(manager, state)
+
+
+@case("progress.load_sqlite", number=5)
+def load_sqlite(context):
+    """ProgressManager.load() of a 50,000-session SQLite store, then the dashboard's first history read."""
+    kwargs = _sqlite_profile(context)
+
+    def load():
+        manager = ProgressManager(**kwargs)
+        state = AppState()
+        manager.load(state, STAGES)
+        len(state.settings.session_history)
+        manager.store.close()
+
+    return load
@@ -0,0 +1,69 @@
+"""Frame time of each screen's draw_* method on a full redraw."""
+
+from benchmarks.harness import case
+from modules import state_manager, test_modes
+
+FRAMES = 20
+
+
+def _lesson(app):
+    app.begin_lesson_practice(8)
+    lesson = app.state.lesson
+    lesson.typed = lesson.batch_words[lesson.index][:1]
+
+
+def _test(app):
+    app.state.test = state_manager.TestState(duration_seconds=600)
+    app.test_setup_topic_index = 0
+    test_modes.begin_test_typing(app)
+    test = app.state.test
+    test.typed = test.current[: len(test.current) // 2]
+
+
+def _results(app):
+    app.state.mode = "RESULTS"
+    app.state.results_title = "Speed Test Results"
+    app.state.results_instructions = "Press Enter to continue. Press Escape to return to the main menu."
+    app.state.results_text = "\n".join(
+        ["Words per minute: 42.5", "Accuracy: 97.3 percent", "Sentences completed: 6", "Earned: 25 XP, 10 coins"]
+        + [f"Tip {n}: keep your fingers on the home row and your eyes on the screen." for n in range(8)]
+    )
+
+
+# Screen name -> how the app gets there. Each entry becomes screens.<name>.
+SCREENS = {
+    "main_menu": lambda app: None,
+    "lesson_menu": lambda app: app.show_lesson_menu(),
+    "lesson_intro": lambda app: app.show_lesson_intro(1),
+    "lesson": _lesson,
+    "free_practice_ready": lambda app: app.start_free_practice_setup(),
+    "test_setup": lambda app: app.start_test(),
+    "test": _test,
+    "practice_setup": lambda app: app.start_practice(),
+    "results": _results,
+    "games_menu": lambda app: app.show_games_menu(),
+    "game_letter_fall": lambda app: app.start_game(0),
+    "game_word_typing": lambda app: app.start_game(1),
+    "game_hangman": lambda app: app.start_game(2),
+    "shop": lambda app: app.show_shop(),
+    "pet": lambda app: app.show_pet(),
+    "learn_sounds_menu": lambda app: app.show_learn_sounds_menu(),
+    "options": lambda app: app.show_options_menu(),
+    "about": lambda app: app.show_about_menu(),
+    "keyboard_explorer": lambda app: app.start_keyboard_explorer(),
+    "tutorial": lambda app: app.start_tutorial(),
+}
+
+
+def _screen_case(enter):
+    def setup(context):
+        app = context.reset_app()
+        enter(app)
+        return app.draw
+    return setup
+
+
+for _name, _enter in SCREENS.items():
+    case(f"screens.{_name}", number=FRAMES, description=f"KeyQuestApp.draw() on the {_name.replace('_', ' ')} screen")(
+        _screen_case(_enter)
+    )
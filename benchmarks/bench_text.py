@@ -0,0 +1,46 @@
+"""Word wrapping of the longest practice sentences."""
+
+import itertools
+
+import pygame.freetype
+
+from benchmarks.harness import case
+from modules import font_manager
+from ui import text_wrap
+
+WIDTHS = (300, 500, 760, 1100)
+COLOR = (255, 255, 255)
+
+
+def _wraps(context):
+    pygame.freetype.init()
+    _, text_font, _ = font_manager.build_fonts("100%")
+    pairs = [(line, width) for line in context.long_sentences(40) for width in WIDTHS]
+    return text_font, pairs
+
+
+@case("text.wrap_long_sentence_cold", number=160)
+def wrap_cold(context):
+    """wrap_text on one of the 40 longest sentences with an empty layout cache."""
+    font, pairs = _wraps(context)
+    cycle = itertools.cycle(pairs)
+
+    def wrap():
+        line, width = next(cycle)
+        text_wrap.clear_wrap_cache()
+        text_wrap.wrap_text(font, line, width, COLOR)
+
+    return wrap
+
+
+@case("text.wrap_long_sentence_warm", number=160)
+def wrap_warm(context):
+    """wrap_text on one of the 40 longest sentences with its layout cached (every later frame)."""
+    font, pairs = _wraps(context)
+    cycle = itertools.cycle(pairs)
+
+    def wrap():
+        line, width = next(cycle)
+        text_wrap.wrap_text(font, line, width, COLOR)
+
+    return wrap, lambda: [text_wrap.wrap_text(font, line, width, COLOR) for line, width in pairs]
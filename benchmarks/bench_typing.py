@@ -0,0 +1,60 @@
+"""Per-keystroke processing in lessons and speed tests."""
+
+from benchmarks.harness import case
+from modules import state_manager, test_modes
+
+# A letters-only lesson with words (no special-key commands). Samples stay
+# under the 12 items after which a lesson may end early.
+LESSON_STAGE = 8
+LESSON_KEYS_PER_SAMPLE = 20
+TEST_KEYS_PER_SAMPLE = 200
+
+
+def _start_lesson(context):
+    app = context.reset_app()
+    app.begin_lesson_practice(LESSON_STAGE)
+    return app
+
+
+@case("typing.lesson_correct_key", number=LESSON_KEYS_PER_SAMPLE)
+def lesson_correct_key(context):
+    """process_lesson_typing for the next expected key."""
+    app = context.app()
+
+    def press():
+        lesson = app.state.lesson
+        target = lesson.batch_words[lesson.index]
+        app.process_lesson_typing(context.key_event(target[len(lesson.typed)]))
+
+    return press, lambda: _start_lesson(context)
+
+
+@case("typing.lesson_wrong_key", number=LESSON_KEYS_PER_SAMPLE)
+def lesson_wrong_key(context):
+    """process_lesson_typing for a wrong key (error tone, hint, and speech)."""
+    app = context.app()
+
+    def press():
+        lesson = app.state.lesson
+        expected = lesson.batch_words[lesson.index][len(lesson.typed)]
+        app.process_lesson_typing(context.key_event("z" if expected != "z" else "q"))
+
+    return press, lambda: _start_lesson(context)
+
+
+@case("typing.test_correct_key", number=TEST_KEYS_PER_SAMPLE)
+def test_correct_key(context):
+    """process_test_typing for the next expected character of a speed test."""
+    app = context.app()
+
+    def prepare():
+        context.reset_app()
+        app.state.test = state_manager.TestState(duration_seconds=600)
+        app.test_setup_topic_index = 0
+        test_modes.begin_test_typing(app)
+
+    def press():
+        test = app.state.test
+        app.process_test_typing(context.key_event(test.current[len(test.typed)]))
+
+    return press, prepare
@@ -0,0 +1,65 @@
+"""Shared state for benchmark cases: a headless app and test data."""
+
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import pygame
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SENTENCES_DIR = ROOT / "Sentences"
+
+
+class Context:
+    """Built once per run; cases take what they need from it.
+
+    The runner switches into ``workdir`` first, so the app's progress files
+    and error log land there rather than in the checkout.
+    """
+
+    def __init__(self, workdir: str):
+        self.workdir = workdir
+        self._app = None
+
+    def app(self):
+        """A ``KeyQuestApp`` on an empty profile, built on first use."""
+        if self._app is None:
+            from modules.keyquest_app import KeyQuestApp
+
+            self._app = KeyQuestApp()
+            self._app._render_frame()
+            self._app._finish_startup()
+            self._app.prewarm.ensure(*self._app.prewarm.names(), timeout=60.0)
+        return self._app
+
+    def reset_app(self, mode: str = "MENU"):
+        """The app back on ``mode`` with no flash or escape countdown pending."""
+        app = self.app()
+        app.state.mode = mode
+        app._escape_remaining = 0
+        app._flash = type(app._flash)()
+        return app
+
+    @staticmethod
+    def key_event(char: str, key: Optional[int] = None):
+        if key is None:
+            key = ord(char.lower()) if char else 0
+        return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=char, mod=0, scancode=0)
+
+    @staticmethod
+    def long_sentences(count: int = 40) -> List[str]:
+        """The longest lines across the Sentences files, longest first."""
+        lines = []
+        for path in sorted(SENTENCES_DIR.glob("*.txt")):
+            with path.open("r", encoding="utf-8") as f:
+                lines.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+        return sorted(set(lines), key=len, reverse=True)[:count]
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.workdir, name)
+
+    def close(self) -> None:
+        if self._app is not None:
+            self._app._shutdown_storage()
+        pygame.quit()
@@ -0,0 +1,184 @@
+"""Benchmark registry, timing, JSON results, and run-to-run comparison.
+
+A case is a setup function registered with ``@case``. It gets the shared
+``Context`` and returns the operation to time, or ``(operation, prepare)``
+when state has to be reset before each sample (``prepare`` is not timed).
+Each sample calls the operation ``number`` times, and results are reported
+per call.
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+RESULTS_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable
+    number: int = 1
+    description: str = ""
+
+    @property
+    def group(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, number: int = 1, description: str = ""):
+    """Register a benchmark setup function under ``group.name``."""
+    def register(setup):
+        if name in CASES:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        CASES[name] = Case(name, setup, number, description or (setup.__doc__ or "").strip())
+        return setup
+    return register
+
+
+def select(patterns: Optional[List[str]] = None) -> List[Case]:
+    """Cases whose name starts with or contains any of ``patterns`` (all when empty)."""
+    cases = sorted(CASES.values(), key=lambda item: item.name)
+    if not patterns:
+        return cases
+    return [item for item in cases if any(pattern in item.name for pattern in patterns)]
+
+
+def measure(
+    operation: Callable[[], object],
+    number: int = 1,
+    repeat: int = 5,
+    prepare: Optional[Callable[[], object]] = None,
+    warmup: int = 1,
+    clock=time.perf_counter,
+) -> dict:
+    """Per-call times in ms over ``repeat`` samples of ``number`` calls each."""
+    samples = []
+    for index in range(warmup + repeat):
+        if prepare is not None:
+            prepare()
+        started = clock()
+        for _ in range(number):
+            operation()
+        elapsed = (clock() - started) * 1000.0 / number
+        if index >= warmup:
+            samples.append(elapsed)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+    }
+
+
+def run_case(item: Case, context, repeat: int) -> dict:
+    prepared = item.setup(context)
+    operation, prepare = prepared if isinstance(prepared, tuple) else (prepared, None)
+    result = measure(operation, item.number, repeat, prepare)
+    result["group"] = item.group
+    result["description"] = item.description
+    return result
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": sys.platform,
+        "machine": platform.machine(),
+        "video_driver": os.environ.get("SDL_VIDEODRIVER", ""),
+        "audio_driver": os.environ.get("SDL_AUDIODRIVER", ""),
+    }
+
+
+def results_document(results: Dict[str, dict]) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "results": results,
+    }
+
+
+def save_results(document: dict, path: str) -> None:
+    tmp_path = f"{path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def load_results(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path} is not a version {RESULTS_VERSION} benchmark result file")
+    return document
+
+
+def compare(
+    current: Dict[str, dict],
+    previous: Dict[str, dict],
+    threshold: float = 0.10,
+    floor_ms: float = 0.001,
+) -> List[Tuple[str, Optional[float], Optional[float], str]]:
+    """(name, previous median, current median, status) rows.
+
+    A case is "slower" or "faster" when its median moved by more than
+    ``threshold`` (relative) and ``floor_ms`` (absolute); otherwise "same".
+    Cases only in one run are "new" or "missing".
+    """
+    rows = []
+    for name in sorted(set(current) | set(previous)):
+        before = previous.get(name, {}).get("median_ms")
+        after = current.get(name, {}).get("median_ms")
+        if before is None:
+            status = "new"
+        elif after is None:
+            status = "missing"
+        elif after - before > max(before * threshold, floor_ms):
+            status = "slower"
+        elif before - after > max(before * threshold, floor_ms):
+            status = "faster"
+        else:
+            status = "same"
+        rows.append((name, before, after, status))
+    return rows
+
+
+def format_ms(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value < 1.0:
+        return f"{value * 1000.0:.1f} us"
+    return f"{value:.2f} ms"
+
+
+def format_results(results: Dict[str, dict]) -> str:
+    lines = [f"{'benchmark':<40}{'median':>12}{'min':>12}{'calls':>8}"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<40}{format_ms(result['median_ms']):>12}{format_ms(result['min_ms']):>12}"
+            f"{result['number'] * result['repeat']:>8}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows) -> str:
+    lines = [f"{'benchmark':<40}{'previous':>12}{'current':>12}{'change':>9}  status"]
+    for name, before, after, status in rows:
+        change = f"{(after / before - 1.0) * 100.0:+.0f}%" if before and after is not None else "-"
+        lines.append(f"{name:<40}{format_ms(before):>12}{format_ms(after):>12}{change:>9}  {status}")
+    return "\n".join(lines)
@@ -8,6 +8,7 @@ from games.base_game import BaseGame
 from games import sounds
 import pygame
 import random
+from ui.text_cache import render_text
 
 
 class MyNewGame(BaseGame):
@@ -20,6 +21,8 @@ class MyNewGame(BaseGame):
     HOTKEYS = """Type letters: Letter keys
 Repeat score: Ctrl+Space
 Pause game: Escape"""
+    # "realtime" if things move every frame, "timer" for countdowns, "idle" otherwise
+    FRAME_PACE = "timer"
 
     def __init__(
         self,
@@ -29,6 +32,7 @@ Pause game: Escape"""
         play_sound_func,
         show_info_dialog_func,
         session_complete_callback=None,
+        play_effect_func=None,
     ):
         """Initialize your game.
 
@@ -38,6 +42,7 @@ Pause game: Escape"""
             speech: Speech object for announcements
             play_sound_func: Function to play sound waves
             show_info_dialog_func: Function to show accessible info dialogs
+            play_effect_func: Function to play cached effects by generator
         """
         # Call parent constructor (REQUIRED)
         super().__init__(
@@ -47,6 +52,7 @@ Pause game: Escape"""
             play_sound_func,
             show_info_dialog_func,
             session_complete_callback,
+            play_effect_func,
         )
 
         # Add your game-specific state here
@@ -135,27 +141,27 @@ Pause game: Escape"""
         """Draw the game screen when mode is PLAYING."""
 
         # Title
-        title_surf, _ = self.title_font.render(self.NAME, self.ACCENT)
+        title_surf, _ = render_text(self.title_font, self.NAME, self.ACCENT)
         self.screen.blit(title_surf, (450 - title_surf.get_width() // 2, 30))
 
         # Draw current letter (example)
         if self.current_letter:
-            letter_surf, _ = self.title_font.render(self.current_letter.upper(), self.FG)
+            letter_surf, _ = render_text(self.title_font, self.current_letter.upper(), self.FG)
             self.screen.blit(letter_surf, (450 - letter_surf.get_width() // 2, 250))
 
         # Score and lives
         stats = f"Score: {self.score}   Lives: {self.lives}"
-        stats_surf, _ = self.text_font.render(stats, self.ACCENT)
+        stats_surf, _ = render_text(self.text_font, stats, self.ACCENT)
         self.screen.blit(stats_surf, (450 - stats_surf.get_width() // 2, 450))
 
         # High score
         if self.high_score > 0:
-            hs_surf, _ = self.small_font.render(f"High: {self.high_score}", self.ACCENT)
+            hs_surf, _ = render_text(self.small_font, f"High: {self.high_score}", self.ACCENT)
             self.screen.blit(hs_surf, (450 - hs_surf.get_width() // 2, 490))
 
         # Controls hint
         controls = "Type the letter | Ctrl+Space = score | Esc = pause"
-        ctrl_surf, _ = self.small_font.render(controls, self.FG)
+        ctrl_surf, _ = render_text(self.small_font, controls, self.FG)
         self.screen.blit(ctrl_surf, (450 - ctrl_surf.get_width() // 2, 550))
 
     # ========== Game Logic Methods (Your Custom Code) ==========
@@ -177,18 +183,18 @@ Pause game: Escape"""
                 self.high_score = self.score
 
             # Play success sound
-            self.play_sound(sounds.letter_hit())
+            self.play_effect(sounds.letter_hit)
 
             # Spawn next letter
             self.spawn_letter()
         else:
             # Wrong letter
-            self.play_sound(sounds.letter_miss())
+            self.play_effect(sounds.letter_miss)
 
     def lose_life(self):
         """Player loses a life."""
         self.lives -= 1
-        self.play_sound(sounds.life_lost())
+        self.play_effect(sounds.life_lost)
 
         if self.lives > 0:
             self.speech.say(f"Time's up! {self.lives} lives left.", priority=True)
@@ -197,7 +203,7 @@ Pause game: Escape"""
             # Game over - show results and return to menu
             self.running = False
             self.mode = "MENU"
-            self.play_sound(sounds.game_over())
+            self.play_effect(sounds.game_over)
 
             # Show results dialog (accessible, screen reader friendly)
             results = f"""GAME OVER
@@ -231,7 +237,8 @@ ACCESSIBILITY REQUIREMENTS:
 - Announce letters/words/targets when they appear
 - Provide clear audio/speech feedback for hits/misses
 
-SOUND USAGE:
+SOUND USAGE (pass the generator to self.play_effect() so the app can cache it,
+e.g. self.play_effect(sounds.letter_hit) or self.play_effect(sounds.combo_sound, 3)):
 - sounds.letter_hit() - Correct letter typed
 - sounds.letter_miss() - Wrong letter typed
 - sounds.combo_sound(level) - Combo achieved
@@ -5,12 +5,34 @@ through engaging gameplay with rich audio feedback.
 
 All games inherit from BaseGame to ensure consistent menu structure,
 keyboard navigation, and accessibility features.
+
+The game classes are imported on first access, so ``games.sounds`` and
+``games.hangman`` can be used without loading every game.
 """
 
-from games.base_game import BaseGame
-from games.letter_fall import LetterFallGame
-from games.word_typing import WordTypingGame
-from games.hangman import HangmanGame
+import importlib
+
+_CLASS_MODULES = {
+    'BaseGame': 'games.base_game',
+    'LetterFallGame': 'games.letter_fall',
+    'WordTypingGame': 'games.word_typing',
+    'HangmanGame': 'games.hangman',
+}
+
+# Games in menu order
+GAME_CLASS_NAMES = ('LetterFallGame', 'WordTypingGame', 'HangmanGame')
 
 # List of all available games
-__all__ = ['BaseGame', 'LetterFallGame', 'WordTypingGame', 'HangmanGame']
+__all__ = ['BaseGame', 'LetterFallGame', 'WordTypingGame', 'HangmanGame', 'load_game_classes']
+
+
+def load_game_classes():
+    """Import the game modules and return the game classes in menu order."""
+    return [__getattr__(name) for name in GAME_CLASS_NAMES]
+
+
+def __getattr__(name):
+    module_name = _CLASS_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'games' has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -7,6 +7,7 @@ keyboard navigation, and accessibility features.
 from modules import dialog_manager
 from ui.a11y import draw_controls_hint, draw_focus_frame
 from ui.layout import center_x, get_footer_y, get_screen_size
+from ui.text_cache import render_text
 
 
 class BaseGame:
@@ -31,6 +32,17 @@ class BaseGame:
     INSTRUCTIONS = "Detailed instructions"
     HOTKEYS = "Key summary"
 
+    # Main-loop frame pacing while playing (modules/frame_pacer.py): "realtime"
+    # for games that move every frame, "timer" for games that only show a
+    # countdown, "idle" for games that change only on input.
+    FRAME_PACE = "idle"
+
+    # Prewarm tasks (modules/prewarm.py) the app makes sure have run before
+    # start(). Sound effects are not listed: the app moves them to the front
+    # of the prewarm queue, and the first round builds any effect it plays
+    # before the prewarm thread gets to it.
+    PREWARM_ASSETS = ()
+
     def __init__(
         self,
         screen,
@@ -39,6 +51,7 @@ class BaseGame:
         play_sound_func,
         show_info_dialog_func,
         session_complete_callback=None,
+        play_effect_func=None,
     ):
         """Initialize base game components.
 
@@ -48,6 +61,9 @@ class BaseGame:
             speech: Speech object for announcements
             play_sound_func: Function to play sound waves
             show_info_dialog_func: Function to show accessible info dialogs
+            play_effect_func: Optional function that plays a cached effect from
+                a generator and its parameters; defaults to synthesizing the
+                wave and passing it to play_sound_func
         """
         self.screen = screen
         self.title_font = fonts['title_font']
@@ -55,8 +71,11 @@ class BaseGame:
         self.small_font = fonts['small_font']
         self.speech = speech
         self.play_sound = play_sound_func
+        self._play_effect_func = play_effect_func
         self.show_info_dialog = show_info_dialog_func  # For backwards compatibility
         self.on_session_complete = session_complete_callback
+        # Set by the app to a modules.keystroke_log.KeystrokeRecorder.
+        self.keystroke_recorder = None
 
         # Universal dialog system (centralized)
         self.dialog_manager = dialog_manager
@@ -73,6 +92,21 @@ class BaseGame:
         self.DANGER = (255, 50, 50)
         self.GOOD = (50, 255, 100)
 
+    def play_effect(self, generator, *params, gain=1.0):
+        """Play a sound effect by generator so the app can serve it from its sound bank."""
+        if self._play_effect_func is not None:
+            self._play_effect_func(generator, *params, gain=gain)
+            return
+        wave = generator(*params)
+        if gain != 1.0:
+            wave = (wave * gain).astype("float32")
+        self.play_sound(wave)
+
+    def record_keystroke(self, expected, typed, correct):
+        """Log a gameplay keystroke's timing (expected/typed are characters)."""
+        if self.keystroke_recorder is not None:
+            self.keystroke_recorder.record("game", expected, typed, correct)
+
     # ========== Menu Management (Implemented) ==========
 
     def start(self):
@@ -198,7 +232,7 @@ Great job!
         """Draw the game menu."""
         screen_w, screen_h = self._screen_size()
         # Title
-        title_surf, _ = self.title_font.render(self.NAME, self.ACCENT)
+        title_surf, _ = render_text(self.title_font, self.NAME, self.ACCENT)
         self.screen.blit(title_surf, (center_x(screen_w, title_surf.get_width()), 80))
 
         # Menu items
@@ -207,7 +241,7 @@ Great job!
             selected = idx == self.menu_index
             color = self.GOOD if selected else self.FG
             item_text = f"> {item}" if selected else f"  {item}"
-            item_surf, _ = self.text_font.render(item_text, color)
+            item_surf, _ = render_text(self.text_font, item_text, color)
             item_rect = item_surf.get_rect(topleft=(center_x(screen_w, item_surf.get_width()), y))
             self.screen.blit(item_surf, item_rect)
             if selected:
@@ -4,15 +4,18 @@ from pathlib import Path
 import json
 import random
 import time
+from typing import Optional, Sequence
 
 import pygame
 
 from games.base_game import BaseGame
 from games import sounds
+from games.hangman_dictionary import HangmanDictionary
 from modules import speech_format
 from ui.a11y import draw_controls_hint, draw_focus_frame
 from ui.game_layout import draw_game_title
 from ui.layout import draw_centered_text, draw_left_wrapped_text, get_content_width, get_footer_y
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -37,10 +40,13 @@ WORD_BANK = {
 
 EXTERNAL_WORDLIST_PATH = Path(__file__).resolve().parents[1] / "data" / "wordlists" / "hangman_words.txt"
 EXTERNAL_DEFINITIONS_PATH = Path(__file__).resolve().parents[1] / "data" / "wordlists" / "hangman_definitions.json"
+# Compact form of the definitions, built by tools/dev/build_hangman_dictionary.py.
+EXTERNAL_DICTIONARY_PATH = Path(__file__).resolve().parents[1] / "data" / "wordlists" / "hangman_dictionary.bin"
 _EXTERNAL_WORDS_CACHE = None
 _EXTERNAL_DEFINITIONS_CACHE = None
 _CANDIDATE_POOL_CACHE = None
 _CANDIDATE_LENGTH_BUCKETS_CACHE = None
+_COMPACT_DICTIONARY_CACHE = None
 MIN_WORD_LENGTH = 5
 
 
@@ -112,15 +118,23 @@ def load_external_definitions() -> dict[str, str]:
     return _EXTERNAL_DEFINITIONS_CACHE
 
 
-def load_candidate_pool() -> list[tuple[str, str]]:
+def load_candidate_pool() -> Sequence[tuple[str, str]]:
     """Load and cache playable (word, definition) candidates.
 
-    Every candidate is guaranteed to have a definition.
+    Every candidate is guaranteed to have a definition. With the compact
+    dictionary this is the memory-mapped dictionary itself, which decodes
+    entries as they are read; only the JSON fallback builds a list.
     """
     global _CANDIDATE_POOL_CACHE
     if _CANDIDATE_POOL_CACHE is not None:
         return _CANDIDATE_POOL_CACHE
 
+    compact = load_compact_dictionary()
+    if compact is not None:
+        # Already filtered and deduplicated when it was built.
+        _CANDIDATE_POOL_CACHE = compact
+        return _CANDIDATE_POOL_CACHE
+
     external_definitions = load_external_definitions()
     max_word_length = _determine_max_word_length()
     pool: list[tuple[str, str]] = []
@@ -153,12 +167,18 @@ def load_candidate_pool() -> list[tuple[str, str]]:
     return _CANDIDATE_POOL_CACHE
 
 
-def load_candidate_length_buckets() -> dict[int, list[tuple[str, str]]]:
+def load_candidate_length_buckets() -> dict[int, Sequence[tuple[str, str]]]:
     """Group candidates by exact word length for better variation."""
     global _CANDIDATE_LENGTH_BUCKETS_CACHE
     if _CANDIDATE_LENGTH_BUCKETS_CACHE is not None:
         return _CANDIDATE_LENGTH_BUCKETS_CACHE
 
+    compact = load_compact_dictionary()
+    if compact is not None:
+        # Views into the file, already grouped by length.
+        _CANDIDATE_LENGTH_BUCKETS_CACHE = compact.buckets()
+        return _CANDIDATE_LENGTH_BUCKETS_CACHE
+
     buckets: dict[int, list[tuple[str, str]]] = {}
     for word, definition in load_candidate_pool():
         buckets.setdefault(len(word), []).append((word, definition))
@@ -167,6 +187,39 @@ def load_candidate_length_buckets() -> dict[int, list[tuple[str, str]]]:
     return _CANDIDATE_LENGTH_BUCKETS_CACHE
 
 
+def load_compact_dictionary() -> Optional[HangmanDictionary]:
+    """Open and cache the memory-mapped dictionary, or None when it is unavailable."""
+    global _COMPACT_DICTIONARY_CACHE
+    if _COMPACT_DICTIONARY_CACHE is not None:
+        return _COMPACT_DICTIONARY_CACHE or None
+
+    _COMPACT_DICTIONARY_CACHE = False
+    if EXTERNAL_DICTIONARY_PATH.exists():
+        try:
+            _COMPACT_DICTIONARY_CACHE = HangmanDictionary(str(EXTERNAL_DICTIONARY_PATH))
+        except Exception:
+            _COMPACT_DICTIONARY_CACHE = False
+    return _COMPACT_DICTIONARY_CACHE or None
+
+
+def load_candidate_bucket_sizes() -> dict[int, int]:
+    """Number of playable candidates of each word length."""
+    compact = load_compact_dictionary()
+    if compact is not None:
+        return compact.bucket_sizes()
+    return {length: len(words) for length, words in load_candidate_length_buckets().items()}
+
+
+def pick_candidate(length: int) -> tuple[str, str]:
+    """Random (word, definition) candidate of exactly ``length`` letters."""
+    compact = load_compact_dictionary()
+    if compact is not None:
+        entry = compact.random_entry(length)
+        if entry is not None:
+            return entry
+    return random.choice(load_candidate_length_buckets()[length])
+
+
 def build_spoken_word_progress(word: str, guessed_letters: set[str]) -> str:
     """Return a speakable progress string with 'blank' placeholders."""
     tokens = []
@@ -321,6 +374,7 @@ Type sentence text
 Enter: Submit sentence
 Ctrl+Space: Read remaining text
 Esc x3: Exit to main menu"""
+    PREWARM_ASSETS = ("hangman_words",)
 
     def __init__(
         self,
@@ -330,6 +384,7 @@ Esc x3: Exit to main menu"""
         play_sound_func,
         show_info_dialog_func,
         session_complete_callback=None,
+        play_effect_func=None,
     ):
         super().__init__(
             screen,
@@ -338,6 +393,7 @@ Esc x3: Exit to main menu"""
             play_sound_func,
             show_info_dialog_func,
             session_complete_callback,
+            play_effect_func,
         )
         self.running = False
         self.word = ""
@@ -366,15 +422,15 @@ Esc x3: Exit to main menu"""
         self.sentence_feedback = "Type the sentence exactly as shown, including capitals and punctuation."
 
     def _choose_word(self) -> tuple[str, str]:
-        buckets = load_candidate_length_buckets()
+        buckets = load_candidate_bucket_sizes()
         if not buckets:
             return ("typing", "The act of entering text using a keyboard.")
         lengths = sorted(buckets.keys())
 
         # Blend toward common-length words, while still allowing short and very long outliers.
-        total_words = sum(len(words) for words in buckets.values())
+        total_words = sum(buckets.values())
         weighted_avg = (
-            sum(length * len(buckets[length]) for length in lengths) / max(1, total_words)
+            sum(length * buckets[length] for length in lengths) / max(1, total_words)
         )
         # "Common speech" center: keep near practical typing lengths.
         center = max(5.0, min(10.0, weighted_avg))
@@ -385,10 +441,10 @@ Esc x3: Exit to main menu"""
         roll = random.random()
         if short_lengths and roll < 0.15:
             chosen_length = random.choice(short_lengths)
-            return random.choice(buckets[chosen_length])
+            return pick_candidate(chosen_length)
         if very_long_lengths and roll < 0.22:
             chosen_length = random.choice(very_long_lengths)
-            return random.choice(buckets[chosen_length])
+            return pick_candidate(chosen_length)
 
         # Default path: weighted toward the center, with non-zero chance for all lengths.
         weighted_lengths = []
@@ -397,11 +453,11 @@ Esc x3: Exit to main menu"""
             # Smoothly reduce weight farther from center; never drop to zero.
             weight = max(0.08, 1.0 / (1.0 + (distance / 2.5) ** 2))
             # Keep length-frequency influence so common lengths appear naturally.
-            weight *= max(1, len(buckets[length]))
+            weight *= max(1, buckets[length])
             weighted_lengths.append(weight)
 
         chosen_length = random.choices(lengths, weights=weighted_lengths, k=1)[0]
-        return random.choice(buckets[chosen_length])
+        return pick_candidate(chosen_length)
 
     def start_playing(self):
         self.mode = "PLAYING"
@@ -433,7 +489,7 @@ Esc x3: Exit to main menu"""
             protect_seconds=1.8,
         )
         # Keep the start cue subtle so it does not mask spoken instructions.
-        self.play_sound((sounds.level_start() * 0.2).astype("float32"))
+        self.play_effect(sounds.level_start, gain=0.2)
 
     def announce_word_progress(self, priority: bool = False, interrupt: bool = True):
         progress = build_spoken_word_progress(self.word, self.guessed_letters)
@@ -646,11 +702,11 @@ Esc x3: Exit to main menu"""
         remaining = self.remaining_guesses
 
         if won:
-            self.play_sound(sounds.level_complete())
+            self.play_effect(sounds.level_complete)
             headline = "YOU WIN!"
             ending = "Great word solving."
         else:
-            self.play_sound(sounds.game_over())
+            self.play_effect(sounds.game_over)
             headline = "GAME OVER"
             ending = "Better luck next round."
 
@@ -701,7 +757,7 @@ Esc x3: Exit to main menu"""
             self.repeated_guesses += 1
             self.last_feedback = f"{letter.upper()} was already guessed. No penalty."
             self.speech.say(self.last_feedback, priority=True)
-            self.play_sound(sounds.menu_move())
+            self.play_effect(sounds.menu_move)
             self.announce_word_progress(priority=True)
             return
 
@@ -712,7 +768,7 @@ Esc x3: Exit to main menu"""
             self.correct_guesses += 1
             self.last_feedback = f"Correct letter: {letter.upper()}."
             self.speech.say(self.last_feedback, priority=True)
-            self.play_sound(sounds.letter_hit())
+            self.play_effect(sounds.letter_hit)
             self.announce_word_progress(priority=True)
             if self._is_word_solved():
                 self.speech.say(f"Word solved: {self.word}.", priority=True, protect_seconds=1.8)
@@ -725,7 +781,7 @@ Esc x3: Exit to main menu"""
         stage_description = describe_hangman_stage(self.wrong_guesses)
         self.last_feedback = f"Wrong letter: {letter.upper()}."
         self.speech.say(stage_description, priority=True, protect_seconds=1.2, interrupt=True)
-        self.play_sound(sounds.letter_miss())
+        self.play_effect(sounds.letter_miss)
         self.announce_word_progress(priority=True, interrupt=False)
         self.announce_remaining(interrupt=False)
         if self.remaining_guesses <= 0:
@@ -787,12 +843,12 @@ Esc x3: Exit to main menu"""
             return None
         if event.key == pygame.K_UP:
             self.results_menu_index = (self.results_menu_index - 1) % len(self.results_menu_items)
-            self.play_sound(sounds.menu_move())
+            self.play_effect(sounds.menu_move)
             self._announce_results_menu()
             return None
         if event.key == pygame.K_DOWN:
             self.results_menu_index = (self.results_menu_index + 1) % len(self.results_menu_items)
-            self.play_sound(sounds.menu_move())
+            self.play_effect(sounds.menu_move)
             self._announce_results_menu()
             return None
         if event.key in (pygame.K_RETURN, pygame.K_SPACE):
@@ -804,13 +860,13 @@ Esc x3: Exit to main menu"""
             elif choice == "Copy Word + Definition":
                 self.copy_word_and_definition()
             elif choice == "Play Again":
-                self.play_sound(sounds.menu_select())
+                self.play_effect(sounds.menu_select)
                 self.start_playing()
             elif choice == "Type Practice Sentences":
-                self.play_sound(sounds.menu_select())
+                self.play_effect(sounds.menu_select)
                 self.start_sentence_practice()
             else:
-                self.play_sound(sounds.menu_select())
+                self.play_effect(sounds.menu_select)
                 self.mode = "MENU"
                 self.say_game_menu()
         return None
@@ -831,7 +887,7 @@ Esc x3: Exit to main menu"""
             target = self.sentence_items[self.sentence_index]
             if self.sentence_typed != target:
                 self.sentence_feedback = "Sentence does not match. Try again."
-                self.play_sound(sounds.letter_miss())
+                self.play_effect(sounds.letter_miss)
                 self.speech.say("Sentence does not match. Try again.", priority=True)
             return None
 
@@ -839,12 +895,14 @@ Esc x3: Exit to main menu"""
         if ch and ch.isprintable() and ch not in ("\r", "\n"):
             target = self.sentence_items[self.sentence_index]
             pos = len(self.sentence_typed)
-            if pos < len(target) and ch == target[pos]:
+            expected = target[pos] if pos < len(target) else ""
+            self.record_keystroke(expected, ch, ch == expected)
+            if ch == expected:
                 self.sentence_typed += ch
                 if self.sentence_typed == target:
                     self.sentence_correct += 1
                     self.sentence_feedback = "Correct sentence."
-                    self.play_sound(sounds.level_complete())
+                    self.play_effect(sounds.level_complete)
                     self.speech.say("Correct sentence.", priority=True)
                     self.sentence_index += 1
                     self.sentence_typed = ""
@@ -861,7 +919,7 @@ Esc x3: Exit to main menu"""
             else:
                 remaining = target[pos:]
                 self.sentence_feedback = speech_format.build_remaining_text_feedback(remaining)
-                self.play_sound(sounds.letter_miss())
+                self.play_effect(sounds.letter_miss)
                 self.speech.say(self.sentence_feedback, priority=True, protect_seconds=1.5)
         return None
 
@@ -906,7 +964,7 @@ Esc x3: Exit to main menu"""
         spacing = 16
         total_width = 0
         for token in progress_tokens:
-            surf, _ = self.text_font.render(token, self.FG)
+            surf, _ = render_text(self.text_font, token, self.FG)
             token_surfaces.append(surf)
             total_width += surf.get_width()
         if token_surfaces:
@@ -924,7 +982,7 @@ Esc x3: Exit to main menu"""
         guessed_lines = wrap_text(self.small_font, f"Guessed: {guessed}", panel_max_width, self.ACCENT)
         y = 260
         for line in guessed_lines:
-            guessed_surf, _ = self.small_font.render(line, self.ACCENT)
+            guessed_surf, _ = render_text(self.small_font, line, self.ACCENT)
             self.screen.blit(guessed_surf, (panel_center_x - guessed_surf.get_width() // 2, y))
             y += guessed_surf.get_height() + 4
 
@@ -933,17 +991,17 @@ Esc x3: Exit to main menu"""
         remaining_lines = wrap_text(self.text_font, f"Remaining guesses: {remaining}", panel_max_width, remain_color)
         y = max(y + 8, 320)
         for line in remaining_lines:
-            remaining_surf, _ = self.text_font.render(line, remain_color)
+            remaining_surf, _ = render_text(self.text_font, line, remain_color)
             self.screen.blit(remaining_surf, (panel_center_x - remaining_surf.get_width() // 2, y))
             y += remaining_surf.get_height() + 4
 
-        letters_surf, _ = self.small_font.render(f"Letters in word: {len(self.word)}", self.ACCENT)
+        letters_surf, _ = render_text(self.small_font, f"Letters in word: {len(self.word)}", self.ACCENT)
         self.screen.blit(letters_surf, (panel_center_x - letters_surf.get_width() // 2, y + 4))
         y += letters_surf.get_height() + 12
 
         feedback_lines = wrap_text(self.small_font, self.last_feedback, panel_max_width, self.FG)
         for line in feedback_lines:
-            feedback_surf, _ = self.small_font.render(line, self.FG)
+            feedback_surf, _ = render_text(self.small_font, line, self.FG)
             self.screen.blit(feedback_surf, (panel_center_x - feedback_surf.get_width() // 2, y))
             y += feedback_surf.get_height() + 4
 
@@ -994,7 +1052,7 @@ Esc x3: Exit to main menu"""
             item_rect = None
             wrapped_lines = wrap_text(font, text, screen_w - 160, color) or [text]
             for wrapped in wrapped_lines:
-                surf, _ = font.render(wrapped, color)
+                surf, _ = render_text(font, wrapped, color)
                 rect = surf.get_rect(topleft=(80, y))
                 self.screen.blit(surf, rect)
                 item_rect = rect if item_rect is None else item_rect.union(rect)
@@ -1023,7 +1081,7 @@ Esc x3: Exit to main menu"""
             y=18,
         )
         if not self.sentence_items:
-            empty_surf, _ = self.small_font.render("No sentence prompts available.", self.FG)
+            empty_surf, _ = render_text(self.small_font, "No sentence prompts available.", self.FG)
             self.screen.blit(empty_surf, (60, 120))
             return
 
@@ -1037,28 +1095,28 @@ Esc x3: Exit to main menu"""
             y=76,
         )
 
-        target_label, _ = self.small_font.render("Type now:", self.ACCENT)
+        target_label, _ = render_text(self.small_font, "Type now:", self.ACCENT)
         self.screen.blit(target_label, (60, 120))
         current = self.sentence_items[self.sentence_index]
         y = 150
         for line in wrap_text(self.text_font, current, screen_w - 120, self.FG):
-            surf, _ = self.text_font.render(line, self.FG)
+            surf, _ = render_text(self.text_font, line, self.FG)
             self.screen.blit(surf, (60, y))
             y += 36
 
-        typed_label, _ = self.small_font.render("You typed:", self.ACCENT)
+        typed_label, _ = render_text(self.small_font, "You typed:", self.ACCENT)
         typed_label_y = max(300, y + 12)
         self.screen.blit(typed_label, (60, typed_label_y))
         typed_value = self.sentence_typed if self.sentence_typed else "_"
         typed_color = self.GOOD if current.startswith(self.sentence_typed) else self.DANGER
         y = typed_label_y + 30
         for line in wrap_text(self.text_font, typed_value, screen_w - 120, typed_color) or [typed_value]:
-            typed_surf, _ = self.text_font.render(line, typed_color)
+            typed_surf, _ = render_text(self.text_font, line, typed_color)
             self.screen.blit(typed_surf, (60, y))
             y += typed_surf.get_height() + 4
 
         for line in wrap_text(self.small_font, self.sentence_feedback, screen_w - 120, self.FG):
-            feedback_surf, _ = self.small_font.render(line, self.FG)
+            feedback_surf, _ = render_text(self.small_font, line, self.FG)
             self.screen.blit(feedback_surf, (60, y + 8))
             y += feedback_surf.get_height() + 4
 
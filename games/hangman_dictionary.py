@@ -0,0 +1,155 @@
+"""Compact offline Hangman dictionary.
+
+``tools/dev/build_hangman_dictionary.py`` writes
+``data/wordlists/hangman_dictionary.bin`` next to the JSON definitions. The
+JSON file is a ~220k-entry object that has to be parsed into a dict (and
+then copied into candidate lists) before the first round; this file is
+memory-mapped instead, and a round reads one entry.
+
+Entries are sorted by (word length, word), so each length is a contiguous
+range and picking a word of a given length is one random index. The
+dictionary and its ``buckets()`` are read-only sequences that decode an
+entry only when it is indexed.
+
+File layout (little endian): ``KQHD`` magic, u16 version, u16 length
+count, u32 entry count, u32 text size, u32 lengths (one per bucket), u32
+bucket starts (count + 1), u32 entry offsets (count + 1), then each entry's
+word followed directly by its UTF-8 definition. Words are ASCII, so the
+bucket length says where the word ends.
+"""
+
+from bisect import bisect_right
+from collections.abc import Sequence
+import os
+import random
+import struct
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+
+HANGMAN_DICTIONARY_VERSION = 1
+_MAGIC = b"KQHD"
+_HEADER = struct.Struct("<4sHHII")
+
+
+def write_hangman_dictionary(entries: Iterable[Tuple[str, str]], path: str) -> int:
+    """Write playable (word, definition) pairs. Returns the entry count.
+
+    Entries must already be filtered to plain ASCII words with definitions;
+    the first definition of a repeated word wins.
+    """
+    definitions: Dict[str, str] = {}
+    for word, definition in entries:
+        definitions.setdefault(word, definition)
+
+    ordered = sorted(definitions.items(), key=lambda item: (len(item[0]), item[0]))
+    encoded = [word.encode("ascii") + definition.encode("utf-8") for word, definition in ordered]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(entry) for entry in encoded], out=offsets[1:])
+
+    lengths = []
+    starts = []
+    for index, (word, _) in enumerate(ordered):
+        if not lengths or lengths[-1] != len(word):
+            lengths.append(len(word))
+            starts.append(index)
+    starts.append(len(ordered))
+
+    tmp_path = f"{path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, HANGMAN_DICTIONARY_VERSION, len(lengths), len(encoded), int(offsets[-1])))
+        f.write(np.array(lengths, dtype="<u4").tobytes())
+        f.write(np.array(starts, dtype="<u4").tobytes())
+        f.write(offsets.tobytes())
+        f.write(b"".join(encoded))
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+class _Bucket(Sequence):
+    """Read-only view of the entries of one word length."""
+
+    def __init__(self, dictionary: "HangmanDictionary", length: int, start: int, stop: int):
+        self._dictionary = dictionary
+        self._length = length
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: int) -> Tuple[str, str]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._dictionary._entry(self._start + index, self._length)
+
+
+class HangmanDictionary(Sequence):
+    """Memory-mapped Hangman dictionary; see the module docstring for the layout."""
+
+    def __init__(self, path: str):
+        self.path = path
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version, bucket_count, count, text_size = _HEADER.unpack(bytes(data[: _HEADER.size]))
+        if magic != _MAGIC or version != HANGMAN_DICTIONARY_VERSION:
+            raise ValueError(f"{path} is not a version {HANGMAN_DICTIONARY_VERSION} Hangman dictionary")
+        start = _HEADER.size
+        lengths = data[start:start + 4 * bucket_count].view("<u4")
+        start += 4 * bucket_count
+        starts = data[start:start + 4 * (bucket_count + 1)].view("<u4")
+        start += 4 * (bucket_count + 1)
+        self._offsets = data[start:start + 4 * (count + 1)].view("<u4")
+        start += 4 * (count + 1)
+        self._text = data[start:start + text_size]
+        self._count = count
+        # A few dozen lengths at most, so plain lists.
+        self._lengths = [int(length) for length in lengths]
+        self._starts = [int(value) for value in starts]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def bucket_sizes(self) -> Dict[int, int]:
+        """Number of words of each length."""
+        return {
+            length: self._starts[index + 1] - self._starts[index]
+            for index, length in enumerate(self._lengths)
+        }
+
+    def buckets(self) -> Dict[int, _Bucket]:
+        """Entries of each word length, as views into the file."""
+        return {
+            length: _Bucket(self, length, self._starts[index], self._starts[index + 1])
+            for index, length in enumerate(self._lengths)
+        }
+
+    def __getitem__(self, position: int) -> Tuple[str, str]:
+        if position < 0:
+            position += self._count
+        return self.entry(position)
+
+    def entry(self, position: int) -> Tuple[str, str]:
+        """(word, definition) at ``position`` in (length, word) order."""
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        return self._entry(position, self._lengths[bisect_right(self._starts, position) - 1])
+
+    def entries(self) -> Iterator[Tuple[str, str]]:
+        for position in range(self._count):
+            yield self.entry(position)
+
+    def random_entry(self, length: int, rng=random) -> Optional[Tuple[str, str]]:
+        """A random (word, definition) of exactly ``length`` letters, if any."""
+        if length not in self._lengths:
+            return None
+        index = self._lengths.index(length)
+        position = rng.randrange(self._starts[index], self._starts[index + 1])
+        return self._entry(position, length)
+
+    def _entry(self, position: int, length: int) -> Tuple[str, str]:
+        raw = bytes(self._text[int(self._offsets[position]):int(self._offsets[position + 1])])
+        return raw[:length].decode("ascii"), raw[length:].decode("utf-8")
@@ -19,6 +19,7 @@ from modules import audio_manager, phonetics
 from ui.a11y import draw_controls_hint
 from ui.game_layout import draw_centered_status_lines, draw_game_title
 from ui.layout import center_x, get_footer_y
+from ui.text_cache import render_text
 
 
 SCREEN_W = 900
@@ -129,8 +130,18 @@ class LetterFallGame(BaseGame):
 List current target and queue: Tab
 Repeat current target: Ctrl+Space
 Escape: Pause and return to game menu"""
-
-    def __init__(self, screen, fonts, speech, play_sound_func, show_info_dialog_func, session_complete_callback=None):
+    FRAME_PACE = "realtime"
+
+    def __init__(
+        self,
+        screen,
+        fonts,
+        speech,
+        play_sound_func,
+        show_info_dialog_func,
+        session_complete_callback=None,
+        play_effect_func=None,
+    ):
         """Initialize the Letter Fall game."""
         super().__init__(
             screen,
@@ -139,6 +150,7 @@ Escape: Pause and return to game menu"""
             play_sound_func,
             show_info_dialog_func,
             session_complete_callback,
+            play_effect_func,
         )
 
         self.running = False
@@ -188,7 +200,7 @@ Escape: Pause and return to game menu"""
         self.countdown_flash_until = 0.0
         self.recent_letters.clear()
         self.game_start_time = current_time
-        self.play_sound(sounds.level_start())
+        self.play_effect(sounds.level_start)
         self.spawn_letter()
 
     def handle_game_input(self, event, mods):
@@ -254,7 +266,7 @@ Escape: Pause and return to game menu"""
         if item is None:
             return
         item.last_countdown_second = -1
-        self.speech.say(f"Target {self._spoken_letter(item.letter)}", priority=priority)
+        self.speech.say(f"Target {self._spoken_letter(item.letter)}", priority=priority, category="letters")
         self.last_letter_announcement = time.time()
 
     def _promote_next_target(self, priority=False):
@@ -281,7 +293,7 @@ Escape: Pause and return to game menu"""
             minimum_spawn_interval = 0.75 if self.profile["name"] == "arcade" else 1.05
             self.spawn_interval = max(minimum_spawn_interval, self.spawn_interval - 0.08)
             self.speech.say("Speed up!", priority=False)
-            self.play_sound(sounds.speed_up())
+            self.play_effect(sounds.speed_up)
 
     def _active_target_remaining_seconds(self, item):
         """Estimate how long the active target has before reaching the bottom."""
@@ -314,20 +326,25 @@ Escape: Pause and return to game menu"""
         item.last_countdown_second = countdown_step
         self.countdown_flash_until = time.time() + 0.2
         remaining_ratio = max(0.0, min(1.0, countdown_step / float(countdown_from)))
-        self.play_sound(audio_manager.AudioManager.make_progressive_tone(remaining_ratio))
+        self.play_effect(audio_manager.AudioManager.make_progressive_tone, remaining_ratio)
         self.speech.say(self._spoken_letter(item.letter), priority=False)
 
     def try_hit_letter(self, char):
         """Try to hit the active target letter."""
         active_target = self._current_target()
+        self.record_keystroke(
+            active_target.letter if active_target else "",
+            char,
+            active_target is not None and active_target.letter == char,
+        )
         if active_target is None:
             self.combo = 0
-            self.play_sound(audio_manager.AudioManager.make_miss_sound())
+            self.play_effect(audio_manager.AudioManager.make_miss_sound)
             return False
 
         if active_target.letter != char:
             self.combo = 0
-            self.play_sound(audio_manager.AudioManager.make_miss_sound())
+            self.play_effect(audio_manager.AudioManager.make_miss_sound)
             return False
 
         self.letters.remove(active_target)
@@ -344,12 +361,12 @@ Escape: Pause and return to game menu"""
         self.hit_x = active_target.x
         self.hit_y = active_target.y
 
-        self.play_sound(audio_manager.AudioManager.make_coin_sound())
+        self.play_effect(audio_manager.AudioManager.make_coin_sound)
 
         if bonus:
             self.speech.say("Clutch save!", priority=False)
         if self.combo in (3, 5, 10):
-            self.play_sound(audio_manager.AudioManager.make_success_tones())
+            self.play_effect(audio_manager.AudioManager.make_success_tones)
 
         if self.combo == 3:
             self.speech.say("Combo 3!", priority=False)
@@ -368,7 +385,7 @@ Escape: Pause and return to game menu"""
             self.letters.remove(target)
         self.lives -= 1
         self.combo = 0
-        self.play_sound(sounds.life_lost())
+        self.play_effect(sounds.life_lost)
 
         if self.lives > 0:
             self.speech.say(
@@ -380,7 +397,7 @@ Escape: Pause and return to game menu"""
 
         self.running = False
         self.mode = "MENU"
-        self.play_sound(sounds.game_over())
+        self.play_effect(sounds.game_over)
 
         results = f"""GAME OVER
 
@@ -481,13 +498,13 @@ Max Combo: {self.max_combo}
         queued = self._queue_letters()
 
         if active_target is None and not queued:
-            self.speech.say("No letters falling.", priority=True)
+            self.speech.say("No letters falling.", priority=True, category="letters")
             return
 
         if active_target is None:
             waiting = len(queued)
             msg = "No active target." if waiting == 0 else f"No active target. {waiting} waiting."
-            self.speech.say(msg, priority=True)
+            self.speech.say(msg, priority=True, category="letters")
             return
 
         if not queued:
@@ -495,7 +512,7 @@ Max Combo: {self.max_combo}
         else:
             msg = f"{self._spoken_letter(active_target.letter)}. {len(queued)} waiting."
 
-        self.speech.say(msg, priority=True)
+        self.speech.say(msg, priority=True, category="letters")
 
     def _get_performance_message(self):
         """Get an encouraging message based on performance."""
@@ -527,7 +544,7 @@ Max Combo: {self.max_combo}
             halo_color = self.ACCENT
             outline_width += 2
 
-        letter_surface, _ = self.text_font.render(item.letter.upper(), base_color)
+        letter_surface, _ = render_text(self.text_font, item.letter.upper(), base_color)
         scaled_size = (
             max(1, int(letter_surface.get_width() * scale)),
             max(1, int(letter_surface.get_height() * scale)),
@@ -548,7 +565,7 @@ Max Combo: {self.max_combo}
 
     def _draw_queued_letter(self, item):
         """Draw a queued non-active letter with lower emphasis."""
-        letter_surface, _ = self.small_font.render(item.letter.upper(), (190, 190, 190))
+        letter_surface, _ = render_text(self.small_font, item.letter.upper(), (190, 190, 190))
         rect = letter_surface.get_rect(center=(int(item.x), int(item.y)))
         self.screen.blit(letter_surface, rect)
 
@@ -579,7 +596,7 @@ Max Combo: {self.max_combo}
                 self._draw_queued_letter(item)
 
         if time.time() - self.last_hit_time < 0.3:
-            hit_surf, _ = self.text_font.render(self.hit_letter, self.GOOD)
+            hit_surf, _ = render_text(self.text_font, self.hit_letter, self.GOOD)
             self.screen.blit(hit_surf, (int(self.hit_x), int(self.hit_y)))
 
         status_lines = [
@@ -615,5 +632,5 @@ Max Combo: {self.max_combo}
         pygame.draw.line(self.screen, self.DANGER, (0, danger_y), (screen_w, danger_y), 2)
         if active_target is not None and active_target.y > DANGER_START_Y:
             warn_text = "ACTIVE TARGET IN DANGER"
-            warn_surf, _ = self.small_font.render(warn_text, self.DANGER)
+            warn_surf, _ = render_text(self.small_font, warn_text, self.DANGER)
             self.screen.blit(warn_surf, (center_x(screen_w, warn_surf.get_width()), max(80, screen_h - 150)))
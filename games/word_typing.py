@@ -56,8 +56,18 @@ Submit word: Space
 Correct mistakes: Backspace
 Repeat current word: Ctrl+Space
 Escape: End session and return to game menu"""
-
-    def __init__(self, screen, fonts, speech, play_sound_func, show_info_dialog_func, session_complete_callback=None):
+    FRAME_PACE = "timer"
+
+    def __init__(
+        self,
+        screen,
+        fonts,
+        speech,
+        play_sound_func,
+        show_info_dialog_func,
+        session_complete_callback=None,
+        play_effect_func=None,
+    ):
         """Initialize the Word Typing game."""
         super().__init__(
             screen,
@@ -66,6 +76,7 @@ Escape: End session and return to game menu"""
             play_sound_func,
             show_info_dialog_func,
             session_complete_callback,
+            play_effect_func,
         )
 
         # Game state
@@ -116,7 +127,7 @@ Escape: End session and return to game menu"""
         # Get first word
         self.current_word = self.word_pool[0] if self.word_pool else "word"
 
-        self.play_sound(sounds.level_start())
+        self.play_effect(sounds.level_start)
 
         # Announce first word
         self.speech.say(self.current_word, priority=True)
@@ -155,7 +166,12 @@ Escape: End session and return to game menu"""
         # Type character
         char = event.unicode
         if char and (char.isalpha() or char == "'" or char == "-"):
-            self.typed_text += char.lower()
+            char = char.lower()
+            pos = len(self.typed_text)
+            target = self.current_word.lower()
+            expected = target[pos] if pos < len(target) else ""
+            self.record_keystroke(expected, char, char == expected)
+            self.typed_text += char
             return None
 
         return None
@@ -175,13 +191,13 @@ Escape: End session and return to game menu"""
         # Check if word is correct
         if typed == target:
             self.words_completed += 1
-            self.play_sound(audio_manager.AudioManager.make_coin_sound())
+            self.play_effect(audio_manager.AudioManager.make_coin_sound)
 
             # Get next word
             self.next_word()
         else:
             # Wrong word
-            self.play_sound(audio_manager.AudioManager.make_miss_sound())
+            self.play_effect(audio_manager.AudioManager.make_miss_sound)
             self.speech.say("Incorrect. Try again.", priority=True)
             self.typed_text = ""
 
@@ -200,7 +216,7 @@ Escape: End session and return to game menu"""
     def end_game(self):
         """End the game and show results."""
         self.running = False
-        self.play_sound(sounds.game_over())
+        self.play_effect(sounds.game_over)
 
         # Calculate stats
         elapsed_minutes = (time.time() - self.game_start_time) / 60.0
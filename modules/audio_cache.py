@@ -0,0 +1,181 @@
+"""On-disk cache of synthesized audio for KeyQuest.
+
+Every effect is synthesized with numpy at runtime. On slow machines that
+cost shows up at startup and the first time each effect plays, so finished
+int16 PCM is written to ``cache/audio`` next to the app and memory-mapped on
+later launches instead of being synthesized again.
+
+Cache keys hash the generator's module code and the shared synthesis engine
+(so editing any synthesis helper invalidates its effects), the generator
+parameters, the synthesis sample rate, and the mixer layout the PCM was
+prepared for.
+"""
+
+import hashlib
+import os
+import sys
+import types
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from modules.app_paths import get_app_dir
+
+
+CACHE_FORMAT_VERSION = 1
+CACHE_SUBDIR = os.path.join("cache", "audio")
+PCM_SUFFIX = ".pcm"
+# Modules every generator renders through; their code is part of every key.
+SHARED_SYNTH_MODULES = ("modules.synth",)
+
+_module_fingerprints: Dict[str, str] = {}
+
+
+def get_default_cache_dir() -> str:
+    """Return the audio cache folder under the app data directory."""
+    return os.path.join(get_app_dir(), CACHE_SUBDIR)
+
+
+def _hash_code(code: types.CodeType, digest) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def _module_functions(module):
+    """Yield (qualname, function) for functions and methods defined in ``module``."""
+    for value in vars(module).values():
+        if isinstance(value, types.FunctionType) and value.__module__ == module.__name__:
+            yield value.__qualname__, value
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            for member in vars(value).values():
+                func = getattr(member, "__func__", member)
+                if isinstance(func, types.FunctionType):
+                    yield func.__qualname__, func
+
+
+def module_fingerprint(module_name: str) -> str:
+    """Return a stable hash of every function's code in a generator module."""
+    cached = _module_fingerprints.get(module_name)
+    if cached is not None:
+        return cached
+    module = sys.modules.get(module_name)
+    digest = hashlib.sha256()
+    if module is not None:
+        for qualname, func in sorted(_module_functions(module), key=lambda item: item[0]):
+            digest.update(qualname.encode("utf-8"))
+            _hash_code(func.__code__, digest)
+    fingerprint = digest.hexdigest()
+    _module_fingerprints[module_name] = fingerprint
+    return fingerprint
+
+
+def generator_name(generator) -> str:
+    """Return the qualified name used to identify a sound generator."""
+    module = getattr(generator, "__module__", None) or "unknown"
+    name = getattr(generator, "__qualname__", None) or getattr(generator, "__name__", repr(generator))
+    return f"{module}.{name}"
+
+
+class AudioDiskCache:
+    """Store and memory-map int16 PCM for synthesized effects."""
+
+    def __init__(self, root: Optional[str] = None, sample_rate: int = 44100, channels: int = 2):
+        self.root = root or get_default_cache_dir()
+        self.sample_rate = int(sample_rate)
+        self.channels = max(1, int(channels))
+        self.hits = 0
+        self.misses = 0
+        self.write_errors = 0
+
+    def key_for(self, generator, params: Tuple = ()) -> str:
+        """Build the cache key for ``generator(*params)`` in this cache's layout."""
+        digest = hashlib.sha256()
+        parts = (
+            CACHE_FORMAT_VERSION,
+            generator_name(generator),
+            module_fingerprint(getattr(generator, "__module__", "") or ""),
+            tuple(module_fingerprint(name) for name in SHARED_SYNTH_MODULES),
+            tuple(params),
+            self.sample_rate,
+            self.channels,
+        )
+        digest.update(repr(parts).encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, key + PCM_SUFFIX)
+
+    def load(self, key: str) -> Optional[np.ndarray]:
+        """Return memory-mapped PCM for ``key``, or None when it is not cached."""
+        path = self._path(key)
+        try:
+            if os.path.getsize(path) == 0:
+                return None
+            pcm = np.memmap(path, dtype=np.int16, mode="r")
+        except (OSError, ValueError):
+            return None
+        if self.channels > 1:
+            if pcm.size % self.channels:
+                return None
+            pcm = pcm.reshape(-1, self.channels)
+        return pcm
+
+    def store(self, key: str, pcm: np.ndarray) -> bool:
+        """Write PCM for ``key`` atomically. Returns False if the write failed."""
+        path = self._path(key)
+        tmp = path + ".tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            data = np.ascontiguousarray(pcm, dtype=np.int16)
+            with open(tmp, "wb") as handle:
+                handle.write(data.tobytes())
+            os.replace(tmp, path)
+            return True
+        except OSError:
+            self.write_errors += 1
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return False
+
+    def load_or_build(self, key: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return cached PCM for ``key``, synthesizing and storing it on a miss."""
+        pcm = self.load(key)
+        if pcm is not None:
+            self.hits += 1
+            return pcm
+        self.misses += 1
+        pcm = build()
+        if pcm is not None and len(pcm):
+            self.store(key, pcm)
+        return pcm
+
+    def clear(self) -> int:
+        """Delete every cached PCM file. Returns the number of removed files."""
+        removed = 0
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return 0
+        for name in names:
+            if name.endswith(PCM_SUFFIX):
+                try:
+                    os.remove(os.path.join(self.root, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "write_errors": self.write_errors,
+            "root": self.root,
+        }
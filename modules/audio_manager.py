@@ -7,6 +7,12 @@ All sounds are generated using numpy for consistency.
 import numpy as np
 import pygame
 
+from modules import audio_cache
+from modules import channel_pool
+from modules import synth
+from modules.sound_bank import SoundBank
+from modules.synth import Note, adsr, bell, chord, exp_decay, rest
+
 
 class AudioManager:
     """Manages all audio generation and playback for KeyQuest."""
@@ -18,28 +24,70 @@ class AudioManager:
         "normal": 1.00,
         "strong": 1.35,
     }
+    # In-word progress tones are quantized to this many pitch steps (G5 to E6).
+    PROGRESSIVE_TONE_STEPS = 32
+    # Bank effects built by prebuild_sound_bank(): name -> (generator method, follows typing intensity)
+    BANK_EFFECTS = {
+        "success": ("make_success_tones", True),
+        "victory": ("make_victory_sound", False),
+        "unlock": ("make_unlock_sound", False),
+        "badge": ("make_badge_sound", False),
+        "levelup": ("make_levelup_sound", False),
+        "quest": ("make_quest_sound", False),
+        "buzz": ("make_buzz_sound", False),
+        "pet_robot": ("make_robot_sound", False),
+        "pet_dragon": ("make_dragon_sound", False),
+        "pet_owl": ("make_owl_sound", False),
+        "pet_cat": ("make_cat_sound", False),
+        "pet_dog": ("make_dog_sound", False),
+        "pet_phoenix": ("make_phoenix_sound", False),
+        "pet_tribble": ("make_tribble_sound", False),
+        "pet_feed": ("make_pet_feed_sound", False),
+        "pet_play": ("make_pet_play_sound", False),
+        "pet_evolve": ("make_pet_evolve_sound", False),
+    }
+
+    def __init__(self, channel_voices=None, disk_cache=None, prebuild_tones=True):
+        """Initialize audio manager and cache common sounds.
 
-    def __init__(self):
-        """Initialize audio manager and cache common sounds."""
+        Args:
+            channel_voices: Optional mapping of channel group name to voice count
+                (defaults to channel_pool.DEFAULT_GROUP_VOICES)
+            disk_cache: Optional audio_cache.AudioDiskCache used to load
+                synthesized PCM from disk instead of generating it again
+            prebuild_tones: Build the progress tones now; when False they are
+                built on first use or by a later prebuild_progressive_tones()
+        """
         # Cache frequently-used sounds for performance
         self.tone_ok = None
         self.tone_bad = None
         self._sound_ok = None
         self._sound_bad = None
-        self._feedback_channel = None
+        self._channel_voices = channel_voices
+        self._channels = None
+        self._disk_cache = disk_cache
         self.typing_sound_intensity = "normal"
+        # Ready-to-play Sound objects for named effects (celebrations, pets, etc.).
+        self._sound_bank = SoundBank()
+        # Quantized progress tones keyed by step, filled lazily and cleared on
+        # intensity change. The prewarm thread fills it while keystrokes read
+        # it; a bank never holds its lock during a build (see SoundBank).
+        self._progressive_tones = SoundBank(capacity=self.PROGRESSIVE_TONE_STEPS)
 
         try:
             self._refresh_typing_sounds()
-            # Reserve one channel for rapid typing feedback so short sounds are less likely to be lost.
-            self._feedback_channel = pygame.mixer.find_channel(force=False)
+            if prebuild_tones:
+                self.prebuild_progressive_tones()
+            # Reserve voices per sound group so fast typing and game effects don't cut each other off.
+            self._channels = channel_pool.ChannelScheduler.from_mixer(self._channel_voices)
         except Exception as e:
             print(f"Warning: Could not initialize audio tones: {e}")
             self.tone_ok = None
             self.tone_bad = None
             self._sound_ok = None
             self._sound_bad = None
-            self._feedback_channel = None
+            self._channels = None
+            self._progressive_tones.clear()
 
     # ========== Basic Tone Generation ==========
 
@@ -54,10 +102,7 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-        t = np.linspace(0, dur_ms / 1000.0, int(fs * dur_ms / 1000.0), endpoint=False)
-        wave = 0.5 * np.sin(2 * np.pi * freq * t)
-        return wave.astype(np.float32)
+        return synth.render([Note(freq, dur_ms / 1000.0, amplitude=0.5)], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_coin_sound():
@@ -69,20 +114,13 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-        dur_ms = 110  # Short and more audible
-        t = np.linspace(0, dur_ms / 1000.0, int(fs * dur_ms / 1000.0), endpoint=False)
-
-        # E6 fundamental with E7 harmonic (octave up)
+        # E6 fundamental with E7 harmonic (octave up), sharp decay for crisp feedback
         fundamental = 1319  # E6
         harmonic = 2637     # E7 (octave overtone)
-
-        # Sharp attack envelope for crisp feedback
-        envelope = np.exp(-6.0 * t / (dur_ms / 1000.0))
-        wave = 0.35 * np.sin(2 * np.pi * fundamental * t) * envelope
-        wave += 0.15 * np.sin(2 * np.pi * harmonic * t) * envelope  # Quieter harmonic
-
-        return wave.astype(np.float32)
+        return synth.render([
+            Note(fundamental, 0.110, partials=((1, 0.35), (harmonic / fundamental, 0.15)),  # Quieter harmonic
+                 envelope=exp_decay(6.0)),
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_miss_sound():
@@ -94,20 +132,10 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-        dur_ms = 160  # Short and clearer
-        t = np.linspace(0, dur_ms / 1000.0, int(fs * dur_ms / 1000.0), endpoint=False)
-
-        # Start at A5 (880Hz), descend to F5 (698Hz)
-        start_freq = 880
-        end_freq = 698
-        freq_sweep = start_freq - (start_freq - end_freq) * (t / (dur_ms / 1000.0))
-
-        phase = 2 * np.pi * np.cumsum(freq_sweep) / fs
-        envelope = np.exp(-5.5 * t / (dur_ms / 1000.0))  # Sharper envelope
-        wave = 0.4 * np.sin(phase) * envelope
-
-        return wave.astype(np.float32)
+        # Start at A5 (880Hz), descend to F5 (698Hz) with a sharper envelope
+        return synth.render([
+            Note(880, 0.160, end_freq=698, amplitude=0.4, envelope=exp_decay(5.5)),
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_progressive_tone(percentage: float):
@@ -122,7 +150,6 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         dur_ms = 95  # Slightly longer so in-word progress is easier to hear
 
         # Start from G5 (784 Hz) and raise pitch as we progress
@@ -132,19 +159,10 @@ class AudioManager:
         pitch_range = 535  # Range from G5 to E6 (1319 - 784)
         fundamental = base_freq + (pitch_range * percentage)
 
-        # Harmonic is one octave higher (like in success sound)
-        harmonic = fundamental * 2
-
-        t = np.linspace(0, dur_ms / 1000.0, int(fs * dur_ms / 1000.0), endpoint=False)
-
-        # Same envelope style as success sound for consistency
-        envelope = np.exp(-5.0 * t / (dur_ms / 1000.0))
-
-        # Same harmonic blend as success sound - fundamental + octave harmonic
-        tone = 0.35 * np.sin(2 * np.pi * fundamental * t) * envelope
-        tone += 0.12 * np.sin(2 * np.pi * harmonic * t) * envelope
-
-        return tone.astype(np.float32)
+        # Same envelope and harmonic blend as success sound - fundamental + octave harmonic
+        return synth.render([
+            Note(fundamental, dur_ms / 1000.0, partials=((1, 0.35), (2, 0.12)), envelope=exp_decay(5.0)),
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_success_tones():
@@ -155,9 +173,7 @@ class AudioManager:
         Returns:
             numpy array of audio samples (3 concatenated tones)
         """
-        fs = AudioManager.SAMPLE_RATE
         dur_ms = 80  # Each tone is 80ms (total: 240ms)
-        tones = []
 
         # Three ascending tones with harmonics: G5, C6, E6
         notes = [
@@ -166,16 +182,11 @@ class AudioManager:
             (1319, 2637)    # E6 with E7 harmonic
         ]
 
-        for fundamental, harmonic in notes:
-            t = np.linspace(0, dur_ms / 1000.0, int(fs * dur_ms / 1000.0), endpoint=False)
-            envelope = np.exp(-5.0 * t / (dur_ms / 1000.0))
-            tone = 0.35 * np.sin(2 * np.pi * fundamental * t) * envelope
-            tone += 0.12 * np.sin(2 * np.pi * harmonic * t) * envelope
-            tones.append(tone)
-
-        # Concatenate all tones
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        return synth.render([
+            Note(fundamental, dur_ms / 1000.0, partials=((1, 0.35), (harmonic / fundamental, 0.12)),
+                 envelope=exp_decay(5.0))
+            for fundamental, harmonic in notes
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_buzz_sound():
@@ -188,8 +199,6 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-
         # Neutral descending pattern: G5, E5, C5, G4 (descending in C major)
         # Tempo is moderate - not rushed, not slow
         # Pattern feels like "time... has... ended... now"
@@ -200,24 +209,13 @@ class AudioManager:
             (392, 0.56)    # G4 (final resolution, held longer)
         ]
 
-        tones = []
-        for freq, dur in melody:
-            t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-
-            # Moderate envelope - not too sharp, not too long
-            # The final note has longer sustain for resolution
-            decay_rate = 2.0 if dur > 0.4 else 2.8
-            envelope = np.exp(-decay_rate * t / dur)
-
-            # Note with subtle harmonic for clarity
-            tone = 0.38 * np.sin(2 * np.pi * freq * t) * envelope
-            tone += 0.10 * np.sin(2 * np.pi * freq * 2 * t) * envelope  # Subtle octave harmonic
-
-            tones.append(tone)
-
-        # Concatenate all notes (total: ~1.4s)
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        # Moderate envelope; the final note has longer sustain for resolution.
+        # Each note gets a subtle octave harmonic for clarity (total: ~1.4s).
+        return synth.render([
+            Note(freq, dur, partials=((1, 0.38), (2, 0.10)),
+                 envelope=exp_decay(2.0 if dur > 0.4 else 2.8))
+            for freq, dur in melody
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_victory_sound():
@@ -230,7 +228,6 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         note_duration = 0.13  # 130ms per note (6 notes = 780ms total)
 
         # Melody with harmonics: E5, G5, E6 (octave jump), E6, G6, E7
@@ -244,22 +241,12 @@ class AudioManager:
             (2637, 5274)    # E7 with E8 harmonic (final high note)
         ]
 
-        tones = []
-        for fundamental, harmonic in melody:
-            t = np.linspace(0, note_duration, int(fs * note_duration), endpoint=False)
-
-            # Musical envelope
-            envelope = np.exp(-3.0 * t / note_duration)
-
-            # Fundamental + octave harmonic for rich Mario-like sound
-            tone = 0.35 * np.sin(2 * np.pi * fundamental * t) * envelope
-            tone += 0.15 * np.sin(2 * np.pi * harmonic * t) * envelope
-
-            tones.append(tone)
-
-        # Concatenate all notes
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        # Fundamental + octave harmonic for rich Mario-like sound
+        return synth.render([
+            Note(fundamental, note_duration, partials=((1, 0.35), (harmonic / fundamental, 0.15)),
+                 envelope=exp_decay(3.0))
+            for fundamental, harmonic in melody
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_unlock_sound():
@@ -272,8 +259,6 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-
         # Part 1: "Unlock" chord (G4 + B4 together, then D5 + G5 together)
         unlock_chords = [
             ([392, 494], 0.11),    # G4 + B4 (major third)
@@ -288,33 +273,13 @@ class AudioManager:
             (1047, 0.18)   # C6 (held longer for finish)
         ]
 
-        tones = []
-
-        # Generate unlock chords (total: 220ms)
-        for freqs, dur in unlock_chords:
-            t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-            envelope = np.exp(-5.0 * t / dur)
-            chord_wave = np.zeros_like(t)
-
-            for freq in freqs:
-                chord_wave += 0.25 * np.sin(2 * np.pi * freq * t)
-
-            chord_wave *= envelope
-            tones.append(chord_wave)
-
-        # Generate triumphant reveal melody (total: 450ms)
-        for freq, dur in reveal_melody:
-            t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-            envelope = np.exp(-3.0 * t / dur)
-
-            # Note with octave harmonic
-            tone = 0.35 * np.sin(2 * np.pi * freq * t) * envelope
-            tone += 0.12 * np.sin(2 * np.pi * freq * 2 * t) * envelope
-            tones.append(tone)
-
-        # Concatenate all parts (total: ~540ms)
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        # Unlock chords (220ms) then the reveal melody with octave harmonics (450ms)
+        notes = [chord(freqs, dur, amplitude=0.25, envelope=exp_decay(5.0)) for freqs, dur in unlock_chords]
+        notes += [
+            Note(freq, dur, partials=((1, 0.35), (2, 0.12)), envelope=exp_decay(3.0))
+            for freq, dur in reveal_melody
+        ]
+        return synth.render(notes, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_badge_sound():
@@ -327,7 +292,6 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         dur_ms = 140  # Each note 140ms
 
         # Three-note jingle: B5 -> E6 -> B6 (octave jump), all with harmonics
@@ -337,19 +301,12 @@ class AudioManager:
             (1976, 3951)    # B6 with B7 harmonic (final high note)
         ]
 
-        tones = []
-        for fundamental, harmonic in notes:
-            t = np.linspace(0, dur_ms / 1000.0, int(fs * dur_ms / 1000.0), endpoint=False)
-            envelope = np.exp(-4.5 * t / (dur_ms / 1000.0))
-
-            # Fundamental + harmonic for richness
-            tone = 0.35 * np.sin(2 * np.pi * fundamental * t) * envelope
-            tone += 0.15 * np.sin(2 * np.pi * harmonic * t) * envelope
-            tones.append(tone)
-
-        # Concatenate notes (total: ~420ms)
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        # Fundamental + harmonic for richness (total: ~420ms)
+        return synth.render([
+            Note(fundamental, dur_ms / 1000.0, partials=((1, 0.35), (harmonic / fundamental, 0.15)),
+                 envelope=exp_decay(4.5))
+            for fundamental, harmonic in notes
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_levelup_sound():
@@ -362,28 +319,16 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         note_duration = 0.08  # 80ms per note (7 notes = 560ms total)
 
         # Rising arpeggio in D major: D4, F#4, A4, D5, F#5, A5, D6
         melody = [294, 370, 440, 587, 740, 880, 1175]
 
-        tones = []
-        for freq in melody:
-            t = np.linspace(0, note_duration, int(fs * note_duration), endpoint=False)
-
-            # Quick envelope for energetic feel
-            envelope = np.exp(-4.0 * t / note_duration)
-            tone = 0.32 * np.sin(2 * np.pi * freq * t) * envelope
-
-            # Add octave harmonic for richness
-            tone += 0.12 * np.sin(2 * np.pi * freq * 2 * t) * envelope
-
-            tones.append(tone)
-
-        # Concatenate all notes (total: ~560ms)
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        # Quick envelope for energetic feel, octave harmonic for richness
+        return synth.render([
+            Note(freq, note_duration, partials=((1, 0.32), (2, 0.12)), envelope=exp_decay(4.0))
+            for freq in melody
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_quest_sound():
@@ -396,8 +341,6 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-
         # Fanfare melody with harmony: intro notes, then triumphant ending
         # Pattern: G4, G4, G4, E5, (pause), C5+E5 chord, G5+C6 chord (held)
         notes = [
@@ -409,28 +352,14 @@ class AudioManager:
             ([784, 1047], 0.38)   # G5 + C6 chord (final, held longer)
         ]
 
-        tones = []
-        for freqs, dur in notes:
-            t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-
-            # Envelope - longer sustain on final chord
-            decay_rate = 1.8 if dur > 0.3 else 3.5
-            envelope = np.exp(-decay_rate * t / dur)
-
-            # Generate note or chord
-            wave = np.zeros_like(t)
-            volume = 0.3 if len(freqs) > 1 else 0.36  # Quieter for chords
-            for freq in freqs:
-                wave += volume * np.sin(2 * np.pi * freq * t)
-                # Add octave harmonic
-                wave += volume * 0.15 * np.sin(2 * np.pi * freq * 2 * t)
-
-            wave *= envelope
-            tones.append(wave)
-
-        # Concatenate all notes (total: ~960ms)
-        wave = np.concatenate(tones)
-        return wave.astype(np.float32)
+        # Longer sustain on the final chord; chords are quieter, every tone
+        # gets an octave harmonic (total: ~960ms)
+        return synth.render([
+            chord(freqs, dur, harmonics=((2, 0.15),),
+                  amplitude=0.3 if len(freqs) > 1 else 0.36,
+                  envelope=exp_decay(1.8 if dur > 0.3 else 3.5))
+            for freqs, dur in notes
+        ], sample_rate=AudioManager.SAMPLE_RATE)
 
     # ========== Playback Methods ==========
 
@@ -448,6 +377,7 @@ class AudioManager:
         base_bad = self.make_miss_sound()
         self.tone_ok = self._apply_typing_intensity(base_ok)
         self.tone_bad = self._apply_typing_intensity(base_bad)
+        self._progressive_tones.clear()
         self._sound_ok = self._make_sound_object(self.tone_ok)
         self._sound_bad = self._make_sound_object(self.tone_bad)
 
@@ -455,29 +385,203 @@ class AudioManager:
         """Set typing sound intensity preset: subtle, normal, or strong."""
         if intensity not in self.TYPING_INTENSITY_GAIN:
             intensity = "normal"
+        changed = intensity != self.typing_sound_intensity
         self.typing_sound_intensity = intensity
+        if changed:
+            # Only effects that scale with typing intensity need rebuilding.
+            self._sound_bank.invalidate(lambda key: key[2] is not None)
         try:
             self._refresh_typing_sounds()
         except Exception:
             pass
 
-    def _make_sound_object(self, wave):
-        """Convert float wave [-1,1] to a reusable pygame Sound object."""
-        if wave is None:
-            return None
+    @staticmethod
+    def _wave_to_pcm(wave):
+        """Convert a float wave [-1,1] to int16 PCM in the mixer's channel layout."""
         arr = (wave * 32767).astype(np.int16)
         init = pygame.mixer.get_init()
         if init is not None:
             _, _, channels = init
             if channels == 2:
                 arr = np.column_stack((arr, arr))
-        return pygame.sndarray.make_sound(arr)
+        return arr
+
+    def _make_sound_object(self, wave):
+        """Convert float wave [-1,1] to a reusable pygame Sound object."""
+        if wave is None:
+            return None
+        return pygame.sndarray.make_sound(self._wave_to_pcm(wave))
+
+    def _disk_cache_for_mixer(self):
+        """Return the disk cache when the mixer format matches its PCM layout."""
+        cache = self._disk_cache
+        if cache is None:
+            return None
+        if pygame.mixer.get_init() != (cache.sample_rate, -16, cache.channels):
+            return None
+        return cache
+
+    def _synthesize_sound(self, generator, params=(), typed: bool = False, gain: float = 1.0):
+        """Build a Sound for ``generator(*params)``, using the disk cache when enabled.
+
+        Args:
+            generator: Callable returning a float wave for ``params``
+            params: Hashable generator arguments
+            typed: True when the effect follows the typing-sound intensity
+            gain: Extra fixed gain applied after synthesis
+
+        Returns:
+            pygame Sound object, or None when audio is unavailable
+        """
+        def render():
+            wave = generator(*params)
+            if gain != 1.0:
+                wave = np.clip(wave * gain, -1.0, 1.0).astype(np.float32)
+            if typed:
+                wave = self._apply_typing_intensity(wave)
+            return wave
+
+        cache = self._disk_cache_for_mixer()
+        if cache is None:
+            return self._make_sound_object(render())
+
+        key_params = tuple(params) + (("gain", gain), ("intensity", self.typing_sound_intensity if typed else None))
+        pcm = cache.load_or_build(cache.key_for(generator, key_params), lambda: self._wave_to_pcm(render()))
+        if pcm is None:
+            return None
+        return pygame.sndarray.make_sound(pcm)
+
+    def _bank_sound(self, name: str, generator, *params, typed: bool = False, gain: float = 1.0):
+        """Return a cached Sound for a named effect, synthesizing it on first use.
 
-    def play_wave(self, wave):
+        Args:
+            name: Effect name used as the bank key
+            generator: Callable returning a float wave for ``params``
+            params: Hashable generator arguments
+            typed: True when the effect follows the typing-sound intensity
+            gain: Extra fixed gain applied after synthesis
+
+        Returns:
+            pygame Sound object, or None when audio is unavailable
+        """
+        self._sound_bank.check_format(pygame.mixer.get_init())
+        intensity = self.typing_sound_intensity if typed else None
+        key_params = params if gain == 1.0 else params + (("gain", gain),)
+        key = SoundBank.make_key(name, key_params, intensity)
+        return self._sound_bank.get_or_build(
+            key, lambda: self._synthesize_sound(generator, params, typed=typed, gain=gain)
+        )
+
+    def _play_bank_sound(
+        self,
+        name: str,
+        generator,
+        *params,
+        typed: bool = False,
+        group: str = "celebration",
+        priority: int = channel_pool.PRIORITY_HIGH,
+        gain: float = 1.0,
+    ):
+        """Play a named effect from the sound bank on a channel group."""
+        try:
+            sound = self._bank_sound(name, generator, *params, typed=typed, gain=gain)
+            self._play_sound(sound, group, priority)
+        except Exception:
+            # Silently ignore audio errors (non-critical)
+            pass
+
+    def play_effect(
+        self,
+        generator,
+        *params,
+        gain: float = 1.0,
+        group: str = "sfx",
+        priority: int = channel_pool.PRIORITY_NORMAL,
+    ):
+        """Play ``generator(*params)`` from the sound bank.
+
+        Games use this instead of play_wave() so each effect is synthesized
+        once (or loaded from the disk cache) and replayed afterwards.
+
+        Args:
+            generator: Sound generator such as a games.sounds function
+            params: Hashable generator arguments
+            gain: Extra fixed gain applied after synthesis
+            group: Channel group to play on
+            priority: Voice-stealing priority within the group
+        """
+        name = audio_cache.generator_name(generator)
+        self._play_bank_sound(
+            name, generator, *params, group=group, priority=priority, gain=gain
+        )
+
+    def prebuild_sound_bank(self, effects=None):
+        """Build bank effects ahead of time (all BANK_EFFECTS by default).
+
+        Args:
+            effects: Optional iterable of BANK_EFFECTS names
+        """
+        for name in (self.BANK_EFFECTS if effects is None else effects):
+            method_name, typed = self.BANK_EFFECTS[name]
+            self._bank_sound(name, getattr(self, method_name), typed=typed)
+
+    def prebuild_effects(self, effects):
+        """Build play_effect() sounds ahead of time.
+
+        Args:
+            effects: Iterable of (generator, params, gain), such as games.sounds.GAME_EFFECTS
+        """
+        for generator, params, gain in effects:
+            self._bank_sound(audio_cache.generator_name(generator), generator, *params, gain=gain)
+
+    def get_disk_cache_stats(self) -> dict:
+        """Return disk cache hit/miss counters, or an empty dict when disabled."""
+        if self._disk_cache is None:
+            return {}
+        return self._disk_cache.stats()
+
+    def _ensure_channels(self):
+        """Return the channel scheduler, creating it once the mixer is ready."""
+        if self._channels is None and pygame.mixer.get_init() is not None:
+            self._channels = channel_pool.ChannelScheduler.from_mixer(self._channel_voices)
+        return self._channels
+
+    def _play_sound(self, sound, group: str, priority: int = channel_pool.PRIORITY_NORMAL) -> bool:
+        """Play a Sound on a channel group, falling back to any free channel.
+
+        Returns:
+            True when the sound was handled (played or deliberately dropped
+            because its group was busy with more important sounds)
+        """
+        if sound is None:
+            return False
+        try:
+            channels = self._ensure_channels()
+        except Exception:
+            channels = None
+        if channels is not None:
+            channels.play(group, sound, priority)
+        else:
+            sound.play()
+        return True
+
+    def get_channel_stats(self) -> dict:
+        """Return per-group played/stolen/dropped voice counts."""
+        if self._channels is None:
+            return {}
+        return self._channels.stats()
+
+    def get_sound_bank_stats(self) -> dict:
+        """Return sound bank hit/miss counters and occupancy."""
+        return self._sound_bank.stats()
+
+    def play_wave(self, wave, group: str = "sfx", priority: int = channel_pool.PRIORITY_NORMAL):
         """Play an audio wave through pygame.
 
         Args:
             wave: numpy array of audio samples
+            group: Channel group to play on (games use "sfx")
+            priority: Voice-stealing priority within the group
 
         Returns:
             None
@@ -489,84 +593,97 @@ class AudioManager:
             sound = self._make_sound_object(wave)
             if sound is None:
                 return
-            sound.play()
+            self._play_sound(sound, group, priority)
         except Exception:
             # Silently ignore audio errors (non-critical)
             pass
 
-    def beep_ok(self):
-        """Play a positive feedback beep (high tone)."""
+    def _play_feedback_sound(self, sound, priority: int = channel_pool.PRIORITY_NORMAL) -> bool:
+        """Play a typing feedback Sound on the typing channel group.
+
+        Returns:
+            True when the sound was handed to the mixer
+        """
         try:
-            if self._sound_ok is not None:
-                if self._feedback_channel is None:
-                    self._feedback_channel = pygame.mixer.find_channel(force=False)
-                if self._feedback_channel is not None:
-                    self._feedback_channel.play(self._sound_ok)
-                else:
-                    self._sound_ok.play()
-                return
+            return self._play_sound(sound, "typing", priority)
         except Exception:
-            pass
-        self.play_wave(self.tone_ok)
+            return False
+
+    def beep_ok(self):
+        """Play a positive feedback beep (high tone)."""
+        if not self._play_feedback_sound(self._sound_ok):
+            self.play_wave(self.tone_ok, group="typing")
 
     def beep_bad(self):
         """Play a negative feedback beep (low tone)."""
-        try:
-            if self._sound_bad is not None:
-                if self._feedback_channel is None:
-                    self._feedback_channel = pygame.mixer.find_channel(force=False)
-                if self._feedback_channel is not None:
-                    self._feedback_channel.play(self._sound_bad)
-                else:
-                    self._sound_bad.play()
-                return
-        except Exception:
-            pass
-        self.play_wave(self.tone_bad)
+        # Errors outrank progress tones so a miss is never stolen by the next keystroke.
+        if not self._play_feedback_sound(self._sound_bad, channel_pool.PRIORITY_HIGH):
+            self.play_wave(self.tone_bad, group="typing", priority=channel_pool.PRIORITY_HIGH)
+
+    @classmethod
+    def progressive_step(cls, percentage: float) -> int:
+        """Map a completion percentage to its quantized progress-tone step."""
+        clamped = min(1.0, max(0.0, float(percentage)))
+        return int(round(clamped * (cls.PROGRESSIVE_TONE_STEPS - 1)))
+
+    def _progressive_sound(self, step: int):
+        """Return the Sound for a progress-tone step, building it on first use."""
+        percentage = step / (self.PROGRESSIVE_TONE_STEPS - 1)
+        return self._progressive_tones.get_or_build(
+            step, lambda: self._synthesize_sound(self.make_progressive_tone, (percentage,), typed=True)
+        )
+
+    def prebuild_progressive_tones(self):
+        """Build every quantized progress tone so keystrokes only do a table lookup."""
+        for step in range(self.PROGRESSIVE_TONE_STEPS):
+            self._progressive_sound(step)
 
     def play_progressive(self, percentage: float):
         """Play a progressive tone based on completion percentage.
 
+        The percentage is quantized to PROGRESSIVE_TONE_STEPS pitch steps so
+        each keystroke plays a prebuilt Sound instead of synthesizing one.
+
         Args:
             percentage: Completion percentage (0.0 to 1.0)
         """
-        tone = self._apply_typing_intensity(self.make_progressive_tone(percentage))
-        self.play_wave(tone)
+        try:
+            sound = self._progressive_sound(self.progressive_step(percentage))
+        except Exception:
+            sound = None
+        if not self._play_feedback_sound(sound):
+            tone = self._apply_typing_intensity(self.make_progressive_tone(percentage))
+            self.play_wave(tone, group="typing")
 
     def play_success(self):
         """Play success tones (3 rising notes)."""
-        tones = self._apply_typing_intensity(self.make_success_tones())
-        self.play_wave(tones)
+        self._play_bank_sound(
+            "success", self.make_success_tones, typed=True, group="typing"
+        )
 
     def play_victory(self):
         """Play victory melody (lesson complete)."""
-        victory = self.make_victory_sound()
-        self.play_wave(victory)
+        self._play_bank_sound("victory", self.make_victory_sound)
 
     def play_unlock(self):
         """Play unlock sound (new lesson unlocked)."""
-        unlock = self.make_unlock_sound()
-        self.play_wave(unlock)
+        self._play_bank_sound("unlock", self.make_unlock_sound)
 
     def play_badge(self):
         """Play badge sound (badge earned)."""
-        badge = self.make_badge_sound()
-        self.play_wave(badge)
+        self._play_bank_sound("badge", self.make_badge_sound)
 
     def play_levelup(self):
         """Play level up sound (leveled up)."""
-        levelup = self.make_levelup_sound()
-        self.play_wave(levelup)
+        self._play_bank_sound("levelup", self.make_levelup_sound)
 
     def play_quest(self):
         """Play quest complete sound (quest finished)."""
-        quest = self.make_quest_sound()
-        self.play_wave(quest)
+        self._play_bank_sound("quest", self.make_quest_sound)
 
     def play_buzz(self):
         """Play timeout buzz sound."""
-        buzz = self.make_buzz_sound()
-        self.play_wave(buzz)
+        self._play_bank_sound("buzz", self.make_buzz_sound)
 
     # ========== Pet Sounds ==========
 
@@ -583,31 +700,12 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-        dur = 0.25
-
-        t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-
-        # Pitch bend upward (R2D2-style chirp)
-        start_freq = 600
-        end_freq = 900
-        freq = start_freq + (end_freq - start_freq) * (t / dur)
-
-        # Generate phase for varying frequency
-        phase = 2 * np.pi * np.cumsum(freq) / fs
-
-        # Square wave (pulse) - classic chiptune sound
-        # Use sign of sine to create square wave
-        beep = np.sign(np.sin(phase))
-
-        # Smooth edges slightly to reduce harshness
-        beep = 0.7 * beep + 0.3 * np.sin(phase)
-
-        # Sharp decay envelope
-        envelope = np.exp(-4.0 * t / dur)
-
-        beep = beep * envelope
-        return (0.25 * beep).astype(np.float32)
+        # Square wave pitch bend 600Hz -> 900Hz (R2D2-style chirp), smoothed
+        # slightly with a sine of the same phase to reduce harshness
+        return synth.render([
+            Note(600, 0.25, wave=synth.SQUARE, end_freq=900,
+                 partials=((1, 0.7), (1, 0.3, synth.SINE)), envelope=exp_decay(4.0)),
+        ], gain=0.25, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_dragon_sound():
@@ -622,39 +720,13 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-        dur = 0.4
-
-        t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-
-        # Downward pitch slide (growl effect)
-        start_freq = 280
-        end_freq = 180
-        freq = start_freq + (end_freq - start_freq) * (t / dur)
-
-        # Generate phase
-        phase = 2 * np.pi * np.cumsum(freq) / fs
-
-        # Triangle wave - softer than square, good for growls
-        # sawtooth modulo approach to create triangle
-        triangle = 2 * np.abs(2 * (phase / (2 * np.pi) % 1) - 1) - 1
-
-        # Mix with sine for smoother sound
-        wave = 0.6 * triangle + 0.4 * np.sin(phase)
-
-        # ASR envelope
-        attack_samples = int(fs * 0.05)
-        release_samples = int(fs * 0.15)
-        sustain_samples = len(t) - attack_samples - release_samples
-
-        envelope = np.concatenate([
-            np.linspace(0, 1, attack_samples),
-            np.ones(sustain_samples),
-            np.linspace(1, 0, release_samples)
-        ])
-
-        wave = wave * envelope
-        return (0.35 * wave).astype(np.float32)
+        # Downward triangle slide 280Hz -> 180Hz (growl) mixed with sine for
+        # smoothness, under an attack-sustain-release envelope
+        return synth.render([
+            Note(280, 0.4, wave=synth.TRIANGLE, end_freq=180,
+                 partials=((1, 0.6), (1, 0.4, synth.SINE)),
+                 envelope=adsr(attack=0.05, decay=0.0, sustain_level=1.0, release=0.15)),
+        ], gain=0.35, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_owl_sound():
@@ -669,28 +741,12 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         hoot_dur = 0.18
         gap_dur = 0.12
 
-        hoots = []
-        for _ in range(2):  # Two hoots
-            t = np.linspace(0, hoot_dur, int(fs * hoot_dur), endpoint=False)
-
-            # Simple sine wave at 420Hz (from Duck Hunt intro analysis)
-            freq = 420
-            wave = np.sin(2 * np.pi * freq * t)
-
-            # Bell-shaped envelope
-            envelope = np.exp(-6.0 * ((t - hoot_dur/2) / hoot_dur) ** 2)
-
-            wave = wave * envelope
-            hoots.append(wave)
-
-        # Combine with gap
-        silence = np.zeros(int(fs * gap_dur))
-        combined = np.concatenate([hoots[0], silence, hoots[1]])
-        return (0.28 * combined).astype(np.float32)
+        # Two bell-shaped 420Hz sine hoots (from Duck Hunt intro analysis) with a gap
+        hoot = Note(420, hoot_dur, envelope=bell(6.0))
+        return synth.render([hoot, rest(gap_dur), hoot], gain=0.28, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_cat_sound():
@@ -710,21 +766,16 @@ class AudioManager:
 
         t = np.linspace(0, dur, int(fs * dur), endpoint=False)
 
-        # Pitch contour (meow shape)
-        pitch = np.zeros_like(t)
-        for i, time in enumerate(t):
-            progress = time / dur
-            if progress < 0.25:
-                # Rise to peak
-                pitch[i] = 600 + (300 * (progress / 0.25))
-            elif progress < 0.65:
-                # Hold at peak with vibrato
-                vibrato = 20 * np.sin(2 * np.pi * 8 * time)
-                pitch[i] = 900 + vibrato
-            else:
-                # Drop to end
-                drop_prog = (progress - 0.65) / 0.35
-                pitch[i] = 900 - (400 * drop_prog)
+        # Pitch contour (meow shape): rise to peak, hold with vibrato, drop to end
+        progress = t / dur
+        pitch = np.select(
+            (progress < 0.25, progress < 0.65),
+            (
+                600 + (300 * (progress / 0.25)),
+                900 + 20 * np.sin(2 * np.pi * 8 * t),
+            ),
+            default=900 - (400 * ((progress - 0.65) / 0.35)),
+        )
 
         # Generate phase
         phase = 2 * np.pi * np.cumsum(pitch) / fs
@@ -819,34 +870,17 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         note_duration = 0.12
 
         # Magical ascending melody
         melody = [659, 784, 988, 1319]
 
-        tones = []
-        for i, freq in enumerate(melody):
-            t = np.linspace(0, note_duration, int(fs * note_duration), endpoint=False)
-
-            # Triangle wave for magical chime character
-            phase = 2 * np.pi * freq * t
-            triangle = 2 * np.abs(2 * (phase / (2 * np.pi) % 1) - 1) - 1
-
-            # Add sine for smoothness
-            wave = 0.6 * triangle + 0.4 * np.sin(phase)
-
-            # Longer decay on final note
-            if i == len(melody) - 1:
-                envelope = np.exp(-2.5 * t / note_duration)
-            else:
-                envelope = np.exp(-4.0 * t / note_duration)
-
-            wave = wave * envelope
-            tones.append(wave)
-
-        combined = np.concatenate(tones)
-        return (0.30 * combined).astype(np.float32)
+        # Triangle for chime character plus sine for smoothness; longer decay on final note
+        return synth.render([
+            Note(freq, note_duration, wave=synth.TRIANGLE, partials=((1, 0.6), (1, 0.4, synth.SINE)),
+                 envelope=exp_decay(2.5 if i == len(melody) - 1 else 4.0))
+            for i, freq in enumerate(melody)
+        ], gain=0.30, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_tribble_sound():
@@ -861,36 +895,12 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-        dur = 0.3
-
-        t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-
-        # High-pitched squeak (from small creature analysis)
-        base_freq = 3700
-        vibrato_rate = 8  # Fast vibrato for cute character
-        vibrato_depth = 0.08  # 8% variation
-        vibrato = 1 + vibrato_depth * np.sin(2 * np.pi * vibrato_rate * t)
-        freq = base_freq * vibrato
-
-        phase = 2 * np.pi * np.cumsum(freq) / fs
-
-        # Pure sine wave
-        squeak = np.sin(phase)
-
-        # Gentle envelope
-        attack_samples = int(fs * 0.05)
-        release_samples = int(fs * 0.10)
-        sustain_samples = len(t) - attack_samples - release_samples
-
-        envelope = np.concatenate([
-            np.linspace(0, 1, attack_samples),
-            np.ones(sustain_samples),
-            np.linspace(1, 0, release_samples)
-        ])
-
-        squeak = squeak * envelope
-        return (0.22 * squeak).astype(np.float32)
+        # High-pitched 3700Hz squeak (small creature frequency) with a fast 8%
+        # vibrato for cute character, under a gentle attack/release envelope
+        return synth.render([
+            Note(3700, 0.3, vibrato=(8, 0.08),
+                 envelope=adsr(attack=0.05, decay=0.0, sustain_level=1.0, release=0.10)),
+        ], gain=0.22, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_pet_feed_sound():
@@ -901,23 +911,12 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-
         # Happy eating: quick ascending chirps
         notes = [523, 659, 784]  # C5, E5, G5
-        dur = 0.1
-
-        tones = []
-        for freq in notes:
-            t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-            wave = np.sin(2 * np.pi * freq * t)
-            wave += 0.3 * np.sin(2 * np.pi * freq * 2 * t)
-            envelope = np.exp(-6.0 * t / dur)
-            wave = wave * envelope
-            tones.append(wave)
-
-        combined = np.concatenate(tones)
-        return (0.35 * combined).astype(np.float32)
+        return synth.render([
+            Note(freq, 0.1, partials=((1, 1.0), (2, 0.3)), envelope=exp_decay(6.0))
+            for freq in notes
+        ], gain=0.35, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_pet_play_sound():
@@ -928,24 +927,12 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
-
-        # Playful bouncing pattern: up-down-up
+        # Playful bouncing pattern: up-down-up, pulse wave for playful character
         notes = [659, 523, 784]  # E5, C5, G5
-        dur = 0.08
-
-        tones = []
-        for freq in notes:
-            t = np.linspace(0, dur, int(fs * dur), endpoint=False)
-            # Pulse wave for playful character
-            phase = (freq * t) % 1.0
-            wave = np.where(phase < 0.5, 1.0, -1.0)
-            envelope = np.exp(-7.0 * t / dur)
-            wave = wave * envelope
-            tones.append(wave)
-
-        combined = np.concatenate(tones)
-        return (0.3 * combined).astype(np.float32)
+        return synth.render([
+            Note(freq, 0.08, wave=synth.PULSE, duty=0.5, envelope=exp_decay(7.0))
+            for freq in notes
+        ], gain=0.3, sample_rate=AudioManager.SAMPLE_RATE)
 
     @staticmethod
     def make_pet_evolve_sound():
@@ -956,27 +943,14 @@ class AudioManager:
         Returns:
             numpy array of audio samples
         """
-        fs = AudioManager.SAMPLE_RATE
         note_duration = 0.1
 
-        # Magical ascending scale: C5 to C6
+        # Magical ascending scale: C5 to C6, rich harmonics plus a sparkle partial
         melody = [523, 587, 659, 784, 880, 988, 1047]
-
-        tones = []
-        for freq in melody:
-            t = np.linspace(0, note_duration, int(fs * note_duration), endpoint=False)
-
-            # Rich harmonics for magical quality
-            wave = 0.3 * np.sin(2 * np.pi * freq * t)
-            wave += 0.2 * np.sin(2 * np.pi * freq * 2 * t)
-            wave += 0.1 * np.sin(2 * np.pi * freq * 4 * t)  # Add sparkle
-
-            envelope = np.exp(-4.0 * t / note_duration)
-            wave = wave * envelope
-            tones.append(wave)
-
-        combined = np.concatenate(tones)
-        return (0.38 * combined).astype(np.float32)
+        return synth.render([
+            Note(freq, note_duration, partials=((1, 0.3), (2, 0.2), (4, 0.1)), envelope=exp_decay(4.0))
+            for freq in melody
+        ], gain=0.38, sample_rate=AudioManager.SAMPLE_RATE)
 
     def play_pet_sound(self, pet_type: str):
         """Play the sound for a specific pet type.
@@ -995,20 +969,25 @@ class AudioManager:
         }
 
         if pet_type in sound_map:
-            sound = sound_map[pet_type]()
-            self.play_wave(sound)
+            self._play_bank_sound(
+                f"pet_{pet_type}", sound_map[pet_type],
+                group="pet", priority=channel_pool.PRIORITY_NORMAL,
+            )
 
     def play_pet_feed(self):
         """Play pet feeding sound."""
-        sound = self.make_pet_feed_sound()
-        self.play_wave(sound)
+        self._play_bank_sound(
+            "pet_feed", self.make_pet_feed_sound,
+            group="pet", priority=channel_pool.PRIORITY_NORMAL,
+        )
 
     def play_pet_play(self):
         """Play pet playing sound."""
-        sound = self.make_pet_play_sound()
-        self.play_wave(sound)
+        self._play_bank_sound(
+            "pet_play", self.make_pet_play_sound,
+            group="pet", priority=channel_pool.PRIORITY_NORMAL,
+        )
 
     def play_pet_evolve(self):
         """Play pet evolution sound."""
-        sound = self.make_pet_evolve_sound()
-        self.play_wave(sound)
+        self._play_bank_sound("pet_evolve", self.make_pet_evolve_sound, group="pet")
@@ -0,0 +1,154 @@
+"""Mixer channel scheduling for KeyQuest audio.
+
+Sounds are grouped by purpose (typing feedback, game effects, celebrations,
+pet sounds). Each group owns a fixed number of reserved mixer voices so fast
+typing cannot starve celebrations and vice versa. When every voice in a group
+is busy, a new sound steals the lowest-priority (then oldest) voice if it is
+at least as important; otherwise the new sound is dropped. Played, stolen,
+and dropped counts are kept per group for tuning.
+"""
+
+import itertools
+from typing import Dict, List, Optional
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 1
+PRIORITY_HIGH = 2
+
+DEFAULT_GROUP_VOICES = {
+    "typing": 3,
+    "sfx": 4,
+    "celebration": 2,
+    "pet": 1,
+}
+
+# Unreserved channels left for plain Sound.play() calls.
+FREE_CHANNELS = 4
+
+
+class _Voice:
+    """One mixer channel plus the priority and start order of its current sound."""
+
+    __slots__ = ("channel", "priority", "started")
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.priority = PRIORITY_LOW
+        self.started = 0
+
+    def is_busy(self) -> bool:
+        try:
+            return bool(self.channel.get_busy())
+        except Exception:
+            return False
+
+
+class ChannelScheduler:
+    """Route sounds to named channel groups with priority-based voice stealing."""
+
+    def __init__(self, channels_by_group: Dict[str, List]):
+        self._groups: Dict[str, List[_Voice]] = {
+            name: [_Voice(channel) for channel in channels]
+            for name, channels in channels_by_group.items()
+        }
+        self._order = itertools.count(1)
+        self._stats = {
+            name: {"played": 0, "stolen": 0, "dropped": 0}
+            for name in self._groups
+        }
+
+    @classmethod
+    def from_mixer(cls, voices: Optional[Dict[str, int]] = None) -> "ChannelScheduler":
+        """Reserve mixer channels for each group and build a scheduler over them.
+
+        Raises:
+            RuntimeError: When pygame or its mixer is unavailable
+        """
+        if pygame is None or pygame.mixer.get_init() is None:
+            raise RuntimeError("pygame mixer is not initialized")
+        voices = dict(DEFAULT_GROUP_VOICES if voices is None else voices)
+        reserved = sum(max(0, int(count)) for count in voices.values())
+        total = max(pygame.mixer.get_num_channels(), reserved + FREE_CHANNELS)
+        pygame.mixer.set_num_channels(total)
+        # Reserved channels are skipped by Sound.play() and find_channel().
+        pygame.mixer.set_reserved(reserved)
+
+        channels_by_group = {}
+        index = 0
+        for name, count in voices.items():
+            count = max(0, int(count))
+            channels_by_group[name] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        return cls(channels_by_group)
+
+    @property
+    def groups(self) -> List[str]:
+        return list(self._groups)
+
+    def play(self, group: str, sound, priority: int = PRIORITY_NORMAL) -> bool:
+        """Play ``sound`` on a voice from ``group``.
+
+        Returns:
+            True when the sound started, False when it was dropped
+        """
+        voices = self._groups.get(group)
+        if not voices or sound is None:
+            if group in self._stats:
+                self._stats[group]["dropped"] += 1
+            return False
+
+        voice = None
+        stolen = False
+        for candidate in voices:
+            if not candidate.is_busy():
+                voice = candidate
+                break
+        if voice is None:
+            victim = min(voices, key=lambda v: (v.priority, v.started))
+            if victim.priority > priority:
+                self._stats[group]["dropped"] += 1
+                return False
+            voice = victim
+            stolen = True
+
+        try:
+            voice.channel.play(sound)
+        except Exception:
+            self._stats[group]["dropped"] += 1
+            return False
+
+        voice.priority = priority
+        voice.started = next(self._order)
+        self._stats[group]["played"] += 1
+        if stolen:
+            self._stats[group]["stolen"] += 1
+        return True
+
+    def stop_group(self, group: str) -> None:
+        """Stop every voice in a group."""
+        for voice in self._groups.get(group, []):
+            try:
+                voice.channel.stop()
+            except Exception:
+                pass
+
+    def stats(self) -> dict:
+        """Return per-group voice counts and played/stolen/dropped totals."""
+        report = {}
+        for name, voices in self._groups.items():
+            entry = dict(self._stats[name])
+            entry["voices"] = len(voices)
+            entry["busy"] = sum(1 for voice in voices if voice.is_busy())
+            report[name] = entry
+        return report
+
+    def reset_stats(self) -> None:
+        for entry in self._stats.values():
+            for key in entry:
+                entry[key] = 0
@@ -1,29 +1,264 @@
-"""Progress dashboard and practice-log formatting for KeyQuest."""
-
-from datetime import datetime, timedelta
+"""Progress dashboard and practice-log formatting for KeyQuest.
+
+``record_session()`` also keeps running per-day aggregates in
+``Settings.dashboard_days`` (count, duration, WPM and accuracy sums and
+bests, perfect sessions, and the same numbers per activity) and lifetime
+counts in ``Settings.dashboard_totals``. The dashboard, weekly summary, and
+practice log read the days they show from there instead of walking the whole
+session history. ``verify_dashboard_stats()`` checks the aggregates against
+the raw history and repairs them.
+"""
+
+from datetime import date, datetime, timedelta
 from collections import OrderedDict
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from modules import state_manager
+
+# Bump when the aggregate layout changes; older aggregates are rebuilt.
+DASHBOARD_STATS_VERSION = 1
+
+
+def _history_store(settings):
+    """The SQLite store holding every session, or None when history is in memory."""
+    return getattr(settings, "history_store", None)
 
 
 def record_session(settings, session_data: dict):
-    """Record a session in history."""
+    """Record a session in history and in the dashboard aggregates.
+
+    ``session_history`` keeps the newest 100 sessions; with a SQLite store the
+    next save also adds the session to its unlimited history.
+    """
+    # Build missing aggregates before history is trimmed.
+    stats = _dashboard_stats(settings)
     if len(settings.session_history) >= 100:
-        settings.session_history = settings.session_history[-99:]
+        # Trimmed in place so the save journals only the new session.
+        del settings.session_history[:-99]
 
     now = datetime.now()
     session_data.setdefault("date", now.strftime("%Y-%m-%d"))
     session_data.setdefault("time", now.strftime("%I:%M %p").lstrip("0"))
     session_data.setdefault("timestamp", now.isoformat(timespec="seconds"))
     settings.session_history.append(session_data)
+    state_manager.mark_appended(settings, "session_history")
+    if stats is not None:
+        _add_session_to_stats(stats[0], stats[1], session_data)
+        state_manager.mark_changed(settings, "dashboard_days", _session_day_key(session_data))
+        state_manager.mark_changed(settings, "dashboard_totals")
+
+
+# ---- aggregates ----
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _new_bucket() -> dict:
+    return {
+        "count": 0,
+        "duration": 0.0,
+        "wpm_sum": 0.0,
+        "wpm_count": 0,
+        "accuracy_sum": 0.0,
+        "accuracy_count": 0,
+        "best_wpm": 0.0,
+        "best_accuracy": 0.0,
+        "perfect": 0,
+    }
+
+
+def _add_to_bucket(bucket: dict, session: dict) -> None:
+    bucket["count"] += 1
+    duration = session.get("duration")
+    if _is_number(duration):
+        bucket["duration"] += duration
+    wpm = session.get("wpm")
+    if _is_number(wpm) and wpm > 0:
+        bucket["wpm_sum"] += wpm
+        bucket["wpm_count"] += 1
+        bucket["best_wpm"] = max(bucket["best_wpm"], wpm)
+    accuracy = session.get("accuracy")
+    if _is_number(accuracy) and accuracy > 0:
+        bucket["accuracy_sum"] += accuracy
+        bucket["accuracy_count"] += 1
+        bucket["best_accuracy"] = max(bucket["best_accuracy"], accuracy)
+        if accuracy >= 100:
+            bucket["perfect"] += 1
+
+
+def _merge_bucket(total: dict, bucket: dict) -> None:
+    for name in ("count", "duration", "wpm_sum", "wpm_count", "accuracy_sum", "accuracy_count", "perfect"):
+        total[name] += bucket.get(name, 0)
+    total["best_wpm"] = max(total["best_wpm"], bucket.get("best_wpm", 0.0))
+    total["best_accuracy"] = max(total["best_accuracy"], bucket.get("best_accuracy", 0.0))
+
+
+def _bucket_from_sessions(sessions: list) -> dict:
+    bucket = _new_bucket()
+    for session in sessions:
+        _add_to_bucket(bucket, session)
+    return bucket
+
+
+def _bucket_average_wpm(bucket: dict) -> float:
+    return bucket["wpm_sum"] / bucket["wpm_count"] if bucket["wpm_count"] else 0.0
+
+
+def _bucket_average_accuracy(bucket: dict) -> float:
+    return bucket["accuracy_sum"] / bucket["accuracy_count"] if bucket["accuracy_count"] else 0.0
+
+
+def _session_day_key(session: dict) -> str:
+    dt = _session_datetime(session)
+    return dt.strftime("%Y-%m-%d") if dt else session.get("date", "Unknown date")
+
+
+def _add_session_to_stats(days: dict, totals: dict, session: dict) -> None:
+    key = _session_day_key(session)
+    day = days.get(key)
+    if day is None:
+        newest = next(reversed(days), None) if days else None
+        day = {"totals": _new_bucket(), "activities": {}}
+        days[key] = day
+        if newest is not None and key < newest:
+            # Keep days in date order so the newest are at the end.
+            ordered = sorted(days.items())
+            days.clear()
+            days.update(ordered)
+    _add_to_bucket(day["totals"], session)
+
+    summary = _session_summary_text(session).strip()
+    if summary:
+        activities = day["activities"]
+        entry = activities.pop(summary, None) or _new_bucket()
+        _add_to_bucket(entry, session)
+        # Most recent activity first, as the practice log lists them.
+        day["activities"] = {summary: entry, **activities}
+
+    totals["sessions"] = totals.get("sessions", 0) + 1
+    if _is_number(session.get("accuracy")) and session["accuracy"] >= 100:
+        totals["perfect"] = totals.get("perfect", 0) + 1
+
+
+def rebuild_dashboard_stats(sessions: list) -> Tuple[dict, dict]:
+    """Build (dashboard_days, dashboard_totals) from raw sessions, oldest first."""
+    days: dict = {}
+    totals = {"version": DASHBOARD_STATS_VERSION, "sessions": 0, "perfect": 0}
+    for session in sessions:
+        if isinstance(session, dict):
+            _add_session_to_stats(days, totals, session)
+    return days, totals
+
+
+def _all_sessions(settings) -> list:
+    store = _history_store(settings)
+    if store is not None:
+        return store.sessions_since("")
+    return list(settings.session_history)
+
+
+def _dashboard_stats(settings) -> Optional[Tuple[dict, dict]]:
+    """Return (days, totals), building them from history the first time.
+
+    None for settings objects without aggregate fields.
+    """
+    if not hasattr(settings, "dashboard_totals"):
+        return None
+    if settings.dashboard_totals.get("version") != DASHBOARD_STATS_VERSION:
+        settings.dashboard_days, settings.dashboard_totals = rebuild_dashboard_stats(_all_sessions(settings))
+    return settings.dashboard_days, settings.dashboard_totals
+
+
+def _days_bucket(days: dict, first: date, last: date) -> dict:
+    """Sum the day aggregates from ``first`` to ``last`` inclusive."""
+    bucket = _new_bucket()
+    day = first
+    while day <= last:
+        entry = days.get(day.isoformat())
+        if entry:
+            _merge_bucket(bucket, entry["totals"])
+        day += timedelta(days=1)
+    return bucket
+
+
+def _week_buckets(settings) -> Tuple[dict, dict]:
+    """Buckets for the last 7 days and the 7 days before that."""
+    stats = _dashboard_stats(settings)
+    if stats is None:
+        this_week = get_recent_sessions(settings, 7)
+        last_week = [session for session in get_recent_sessions(settings, 14) if session not in this_week]
+        return _bucket_from_sessions(this_week), _bucket_from_sessions(last_week)
+    now = datetime.now()
+    this_start = (now - timedelta(days=7)).date()
+    last_start = (now - timedelta(days=14)).date()
+    days = stats[0]
+    return (
+        _days_bucket(days, this_start, now.date()),
+        _days_bucket(days, last_start, this_start - timedelta(days=1)),
+    )
+
+
+def verify_dashboard_stats(settings, repair: bool = True) -> List[str]:
+    """Compare the aggregates with aggregates rebuilt from raw history.
+
+    Without a SQLite store, history older than the newest 100 sessions is
+    gone, so only days after the oldest retained one can be checked; the
+    lifetime counts are then checked against the stored days instead.
+
+    Returns:
+        The day keys that differed, plus "totals" when the lifetime counts
+        were wrong. With ``repair`` those are rewritten.
+    """
+    days = settings.dashboard_days
+    totals = settings.dashboard_totals
+    sessions = _all_sessions(settings)
+    rebuilt_days, rebuilt_totals = rebuild_dashboard_stats(sessions)
+    complete = _history_store(settings) is not None or totals.get("sessions", 0) <= len(sessions)
+
+    if complete:
+        checked = set(days) | set(rebuilt_days)
+    else:
+        oldest = min(_session_day_key(session) for session in sessions) if sessions else ""
+        checked = {key for key in set(days) | set(rebuilt_days) if key > oldest}
+    mismatched = sorted(key for key in checked if days.get(key) != rebuilt_days.get(key))
+
+    if repair:
+        for key in mismatched:
+            if key in rebuilt_days:
+                days[key] = rebuilt_days[key]
+            else:
+                days.pop(key, None)
+        ordered = sorted(days.items())
+        days.clear()
+        days.update(ordered)
+        if mismatched:
+            state_manager.mark_changed(settings, "dashboard_days", *mismatched)
+
+    if complete:
+        expected_totals = rebuilt_totals
+    else:
+        expected_totals = {
+            "version": DASHBOARD_STATS_VERSION,
+            "sessions": sum(day["totals"]["count"] for day in days.values()),
+            "perfect": sum(day["totals"]["perfect"] for day in days.values()),
+        }
+    if totals != expected_totals:
+        mismatched.append("totals")
+        if repair:
+            settings.dashboard_totals = expected_totals
+    return mismatched
 
 
 def get_recent_sessions(settings, days: int = 7) -> list:
     """Get sessions from the last N days."""
-    if not settings.session_history:
-        return []
-
     cutoff_date = datetime.now() - timedelta(days=days)
     cutoff_str = cutoff_date.strftime("%Y-%m-%d")
+    store = _history_store(settings)
+    if store is not None:
+        return store.sessions_since(cutoff_str)
+    if not settings.session_history:
+        return []
     return [session for session in settings.session_history if session.get("date", "") >= cutoff_str]
 
 
@@ -75,13 +310,12 @@ def format_dashboard(settings) -> str:
     if settings.highest_wpm > 0:
         lines.append(f"Best WPM Ever: {settings.highest_wpm:.1f}")
 
-    this_week = get_recent_sessions(settings, 7)
-    last_week = [session for session in get_recent_sessions(settings, 14) if session not in this_week]
-    if this_week:
-        this_week_wpm = calculate_average_wpm(this_week)
+    this_week, last_week = _week_buckets(settings)
+    if this_week["count"]:
+        this_week_wpm = _bucket_average_wpm(this_week)
         lines.append(f"This Week Average: {this_week_wpm:.1f} WPM")
-        if last_week:
-            last_week_wpm = calculate_average_wpm(last_week)
+        if last_week["count"]:
+            last_week_wpm = _bucket_average_wpm(last_week)
             lines.append(f"Last Week Average: {last_week_wpm:.1f} WPM")
             improvement = this_week_wpm - last_week_wpm
             if improvement > 0:
@@ -94,11 +328,11 @@ def format_dashboard(settings) -> str:
                 lines.append("Consistent performance")
 
     _append_section(lines, "ACCURACY TRENDS")
-    if this_week:
-        this_week_acc = calculate_average_accuracy(this_week)
+    if this_week["count"]:
+        this_week_acc = _bucket_average_accuracy(this_week)
         lines.append(f"This Week Average: {this_week_acc:.1f}%")
-        if last_week:
-            last_week_acc = calculate_average_accuracy(last_week)
+        if last_week["count"]:
+            last_week_acc = _bucket_average_accuracy(last_week)
             lines.append(f"Last Week Average: {last_week_acc:.1f}%")
             improvement = this_week_acc - last_week_acc
             if improvement > 0:
@@ -108,7 +342,14 @@ def format_dashboard(settings) -> str:
             else:
                 lines.append("Consistent accuracy")
 
-    perfect_count = sum(1 for session in settings.session_history if session.get("accuracy", 0) >= 100)
+    stats = _dashboard_stats(settings)
+    store = _history_store(settings)
+    if stats is not None:
+        perfect_count = stats[1].get("perfect", 0)
+    elif store is not None:
+        perfect_count = store.count_sessions(min_accuracy=100)
+    else:
+        perfect_count = sum(1 for session in settings.session_history if session.get("accuracy", 0) >= 100)
     if perfect_count > 0:
         lines.append(f"Perfect Accuracy Sessions: {perfect_count}")
 
@@ -191,14 +432,23 @@ def format_practice_log(settings, limit: int = 30) -> str:
     previous_same_type_map = _build_previous_same_type_map(recent_sessions)
     grouped_sessions = _group_sessions_by_day(recent_sessions)
     ordered_days = list(grouped_sessions.keys())
+    stats = _dashboard_stats(settings)
+    stored_days = stats[0] if stats is not None else {}
+    previous_days = _previous_day_keys(stored_days, ordered_days) if stored_days else {}
 
     for day_index, day_key in enumerate(ordered_days):
         sessions = grouped_sessions[day_key]
         day_dt = _session_datetime(sessions[0])
         lines.append(_format_day_heading(day_dt, day_key))
 
-        day_summary = _build_day_summary(sessions)
-        previous_summary = _build_day_summary(grouped_sessions[ordered_days[day_index + 1]]) if day_index + 1 < len(ordered_days) else None
+        if day_key in stored_days:
+            # Whole-day numbers, compared with the previous day practiced.
+            day_summary = _day_summary_from_stats(stored_days[day_key])
+            previous_key = previous_days.get(day_key)
+            previous_summary = _day_summary_from_stats(stored_days[previous_key]) if previous_key else None
+        else:
+            day_summary = _build_day_summary(sessions)
+            previous_summary = _build_day_summary(grouped_sessions[ordered_days[day_index + 1]]) if day_index + 1 < len(ordered_days) else None
         comparison_text = _format_day_comparison(day_summary, previous_summary)
         if comparison_text:
             lines.append(comparison_text)
@@ -237,12 +487,38 @@ def _session_datetime(session: dict) -> Optional[datetime]:
 def _group_sessions_by_day(sessions: list[dict]) -> OrderedDict[str, list[dict]]:
     grouped: OrderedDict[str, list[dict]] = OrderedDict()
     for session in sessions:
-        dt = _session_datetime(session)
-        key = dt.strftime("%Y-%m-%d") if dt else session.get("date", "Unknown date")
-        grouped.setdefault(key, []).append(session)
+        grouped.setdefault(_session_day_key(session), []).append(session)
     return grouped
 
 
+def _previous_day_keys(days: dict, shown: list[str]) -> dict:
+    """Map each shown day to the stored day before it, walking back from the newest."""
+    wanted = set(shown)
+    previous = {}
+    waiting = None
+    for key in reversed(days):
+        if waiting is not None:
+            previous[waiting] = key
+            waiting = None
+        if key in wanted:
+            wanted.discard(key)
+            waiting = key
+        elif not wanted and waiting is None:
+            break
+    return previous
+
+
+def _day_summary_from_stats(day: dict) -> dict:
+    bucket = day["totals"]
+    return {
+        "count": bucket["count"],
+        "duration": bucket["duration"],
+        "avg_wpm": _bucket_average_wpm(bucket),
+        "avg_accuracy": _bucket_average_accuracy(bucket),
+        "activities": list(day["activities"]),
+    }
+
+
 def _ordinal(n: int) -> str:
     if 10 <= n % 100 <= 20:
         suffix = "th"
@@ -471,23 +747,20 @@ def _format_session_comparison(session: dict, previous_similar: Optional[dict])
 
 def format_weekly_summary(settings) -> str:
     """Generate weekly summary report."""
-    this_week = get_recent_sessions(settings, 7)
-    if not this_week:
+    this_week, _ = _week_buckets(settings)
+    if not this_week["count"]:
         return "No practice sessions this week. Start practicing to see your weekly summary!"
 
     lines = ["This Week's Summary", ""]
-    lines.append(f"Practice Sessions: {len(this_week)}")
-    total_time = sum(session.get("duration", 0) for session in this_week)
-    lines.append(f"Total Practice Time: {int(total_time // 60)} minutes")
-    lines.append(f"Average WPM: {calculate_average_wpm(this_week):.1f}")
-    lines.append(f"Average Accuracy: {calculate_average_accuracy(this_week):.1f}%")
-
-    best_wpm_session = max(this_week, key=lambda session: session.get("wpm", 0), default=None)
-    if best_wpm_session and best_wpm_session.get("wpm", 0) > 0:
-        lines.append(f"Best WPM: {best_wpm_session['wpm']:.1f}")
-
-    best_acc_session = max(this_week, key=lambda session: session.get("accuracy", 0), default=None)
-    if best_acc_session and best_acc_session.get("accuracy", 0) > 0:
-        lines.append(f"Best Accuracy: {best_acc_session['accuracy']:.1f}%")
+    lines.append(f"Practice Sessions: {this_week['count']}")
+    lines.append(f"Total Practice Time: {int(this_week['duration'] // 60)} minutes")
+    lines.append(f"Average WPM: {_bucket_average_wpm(this_week):.1f}")
+    lines.append(f"Average Accuracy: {_bucket_average_accuracy(this_week):.1f}%")
+
+    if this_week["best_wpm"] > 0:
+        lines.append(f"Best WPM: {this_week['best_wpm']:.1f}")
+
+    if this_week["best_accuracy"] > 0:
+        lines.append(f"Best Accuracy: {this_week['best_accuracy']:.1f}%")
 
     return "\n".join(lines)
@@ -0,0 +1,74 @@
+"""Dirty-region tracking for the main render loop.
+
+Most KeyQuest screens are static until the learner presses a key, so the app
+only redraws when something marked the screen dirty. A full mark redraws the
+whole window and flips it; partial marks redraw under a clip and push only
+those rectangles to the display.
+"""
+
+from typing import List, Optional, Tuple
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+class DirtyRegions:
+    """Collect the screen areas that need redrawing before the next frame."""
+
+    def __init__(self):
+        # The first frame always draws everything.
+        self._full = True
+        self._rects: List = []
+        self.frames_drawn = 0
+        self.frames_skipped = 0
+
+    @property
+    def pending(self) -> bool:
+        """True when anything is waiting to be redrawn."""
+        return self._full or bool(self._rects)
+
+    @property
+    def is_full(self) -> bool:
+        return self._full
+
+    def mark_full(self) -> None:
+        """Redraw the whole screen on the next frame."""
+        self._full = True
+        self._rects.clear()
+
+    def mark(self, rect) -> None:
+        """Redraw ``rect`` (a pygame.Rect or (x, y, w, h)) on the next frame."""
+        if self._full or rect is None:
+            return
+        rect = pygame.Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        self._rects.append(rect)
+
+    def take(self) -> Tuple[bool, List]:
+        """Return (full, rects) for this frame and clear the pending marks."""
+        full, rects = self._full, self._rects
+        self._full = False
+        self._rects = []
+        if full or rects:
+            self.frames_drawn += 1
+        else:
+            self.frames_skipped += 1
+        return full, rects
+
+    @staticmethod
+    def union(rects) -> Optional["pygame.Rect"]:
+        """Return the bounding rect of ``rects`` (None for an empty list)."""
+        if not rects:
+            return None
+        return rects[0].unionall(rects[1:])
+
+    def stats(self) -> dict:
+        total = self.frames_drawn + self.frames_skipped
+        return {
+            "frames_drawn": self.frames_drawn,
+            "frames_skipped": self.frames_skipped,
+            "skip_rate": (self.frames_skipped / total) if total else 0.0,
+        }
@@ -0,0 +1,135 @@
+"""Per-mode frame pacing for the main loop.
+
+Only real-time games need a steady 60 frames per second. Countdown screens
+need a few frames per second for their clocks, and menus, lessons, and
+results only change when an event arrives. ``FramePacer.wait()`` ticks at
+the pace's frame rate, or for ``PACE_IDLE`` blocks in ``pygame.event.wait``
+until an event arrives or the next scheduled wake-up is due, so an idle
+screen uses almost no CPU.
+
+The pacer also measures how long each frame's work took and what share of
+wall time the process spent on the CPU, for the debug overlay.
+"""
+
+import time
+from typing import List, Optional
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+PACE_REALTIME = "realtime"
+PACE_ANIMATED = "animated"
+PACE_TIMER = "timer"
+PACE_IDLE = "idle"
+
+# Frames per second for each pace; idle screens wait for events instead.
+PACE_FPS = {
+    PACE_REALTIME: 60,
+    PACE_ANIMATED: 30,
+    PACE_TIMER: 10,
+    PACE_IDLE: 0,
+}
+
+# Longest an idle wait blocks, so the loop still turns over now and then.
+MAX_IDLE_WAIT = 1.0
+
+# Stats are averaged over windows of this many seconds.
+STATS_WINDOW = 1.0
+
+
+class FramePacer:
+    """Sleep between frames according to a pace and measure frame cost."""
+
+    def __init__(self, clock=None, wall_time=time.perf_counter, cpu_time=time.process_time):
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self._wall_time = wall_time
+        self._cpu_time = cpu_time
+
+        now = wall_time()
+        self._last_wake = now
+        self._frame_started = now
+        self._window_started = now
+        self._window_cpu = cpu_time()
+        self._window_frames = 0
+        self._window_work = 0.0
+        self._stats = {"pace": PACE_IDLE, "fps": 0.0, "frame_ms": 0.0, "cpu_busy": 0.0}
+        self.stats_updated = False
+        self.pace = PACE_IDLE
+
+    def wait(self, pace: str, wake_in: Optional[float] = None) -> List:
+        """Wait for the next frame and return the events that arrived.
+
+        Args:
+            pace: One of the PACE_* constants
+            wake_in: Seconds until something scheduled needs the loop (None
+                when nothing is scheduled). Only shortens idle waits; paced
+                frames are always sooner than any wake-up that matters.
+
+        Returns:
+            List of pygame events to handle this frame
+        """
+        pace_changed = pace != self.pace
+        self.pace = pace
+        fps = PACE_FPS.get(pace, 0)
+        if fps:
+            self.clock.tick(fps)
+            events = pygame.event.get()
+        else:
+            events = self._wait_for_events(wake_in)
+        self._frame_started = self._wall_time()
+        if pace_changed:
+            # Don't hand a long idle wait to the first frame of a faster pace.
+            self._last_wake = self._frame_started - (1.0 / fps if fps else 0.0)
+        return events
+
+    def _wait_for_events(self, wake_in: Optional[float]) -> List:
+        if pygame.event.peek():
+            return pygame.event.get()
+        timeout = MAX_IDLE_WAIT if wake_in is None else min(MAX_IDLE_WAIT, max(0.0, wake_in))
+        timeout_ms = int(timeout * 1000)
+        if timeout_ms <= 0:
+            return pygame.event.get()
+        first = pygame.event.wait(timeout_ms)
+        # Keep the clock's idea of the last tick current for the next paced frame.
+        self.clock.tick()
+        if first.type == pygame.NOEVENT:
+            return []
+        return [first] + pygame.event.get()
+
+    def frame_dt(self) -> float:
+        """Seconds since the previous frame started (for game updates)."""
+        now = self._frame_started
+        dt = now - self._last_wake
+        self._last_wake = now
+        return dt
+
+    def end_frame(self) -> None:
+        """Record the work time of the frame that just finished."""
+        now = self._wall_time()
+        self._window_work += now - self._frame_started
+        self._window_frames += 1
+        elapsed = now - self._window_started
+        if elapsed < STATS_WINDOW:
+            return
+
+        cpu_now = self._cpu_time()
+        frames = self._window_frames
+        self._stats = {
+            "pace": self.pace,
+            "fps": frames / elapsed,
+            "frame_ms": (self._window_work / frames) * 1000.0 if frames else 0.0,
+            "cpu_busy": min(100.0, max(0.0, (cpu_now - self._window_cpu) / elapsed * 100.0)),
+        }
+        self.stats_updated = True
+        self._window_started = now
+        self._window_cpu = cpu_now
+        self._window_frames = 0
+        self._window_work = 0.0
+
+    def stats(self) -> dict:
+        """Return the last completed window's pace, fps, frame_ms, and cpu_busy (%)."""
+        self.stats_updated = False
+        return dict(self._stats)
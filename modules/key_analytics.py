@@ -1,4 +1,84 @@
-"""Per-key typing analytics and reporting helpers."""
+"""Per-key typing analytics and reporting helpers.
+
+Accuracy comes from ``Settings.key_stats``. Timing comes from the digraph
+tables in ``Settings.transition_stats`` (a ``TransitionStats`` set by the
+app), when they have data.
+"""
+
+from modules import state_manager
+from modules.lesson_manager import STAGE_LETTERS
+from modules.weak_keys import key_weights
+
+# Keys typed by each finger, used for the weakest and slowest finger.
+FINGER_KEYS = {
+    "left_pinky": ['q', 'a', 'z', '1', '`', 'tab', 'caps lock', 'shift'],
+    "left_ring": ['w', 's', 'x', '2'],
+    "left_middle": ['e', 'd', 'c', '3'],
+    "left_index": ['r', 'f', 'v', 't', 'g', 'b', '4', '5'],
+    "right_index": ['y', 'h', 'n', 'u', 'j', 'm', '6', '7'],
+    "right_middle": ['i', 'k', ',', '8'],
+    "right_ring": ['o', 'l', '.', '9'],
+    "right_pinky": ['p', ';', '/', '[', ']', '\\', '-', '=', '0', 'enter', 'backspace']
+}
+
+# Minimum timed transitions before a pair or finger is reported.
+MIN_TRANSITION_SAMPLES = 10
+
+
+def _transition_stats(settings):
+    """The TransitionStats tables, or None when timing is not being recorded."""
+    return getattr(settings, "transition_stats", None)
+
+
+def _key_label(key: str) -> str:
+    return "Space" if key == " " else key.upper()
+
+
+def _finger_label(finger: str) -> str:
+    return finger.replace("_", " ").title()
+
+
+def get_slowest_fingers(settings, min_samples: int = MIN_TRANSITION_SAMPLES) -> list:
+    """Fingers ordered by median latency of transitions into their keys.
+
+    Returns:
+        List of (finger name, median ms, error rate) tuples, slowest first
+    """
+    transitions = _transition_stats(settings)
+    if transitions is None:
+        return []
+    latencies = transitions.group_latencies(FINGER_KEYS, min_samples)
+    ranked = sorted(latencies.items(), key=lambda item: -item[1]["median_ms"])
+    return [(_finger_label(finger), stats["median_ms"], stats["error_rate"]) for finger, stats in ranked]
+
+
+def format_transition_report(settings, limit: int = 5) -> list:
+    """Report lines for the slowest key transitions (empty without timing data)."""
+    transitions = _transition_stats(settings)
+    if transitions is None:
+        return []
+    pairs = transitions.slowest_pairs(limit, MIN_TRANSITION_SAMPLES)
+    if not pairs:
+        return []
+
+    lines = ["\n⏱️ Slowest Key Transitions:"]
+    for entry in pairs:
+        first, second = entry["keys"]
+        lines.append(
+            f"  • {_key_label(first)} to {_key_label(second)}: {entry['median_ms']:.0f} ms typical, "
+            f"{entry['error_rate']:.1f}% errors"
+        )
+
+    trigraphs = transitions.slowest_trigraphs(3, MIN_TRANSITION_SAMPLES)
+    if trigraphs:
+        sequences = [f"{'-'.join(_key_label(key) for key in entry['keys'])} ({entry['mean_ms']:.0f} ms)" for entry in trigraphs]
+        lines.append(f"  Slowest three-key sequences: {', '.join(sequences)}")
+
+    fingers = get_slowest_fingers(settings)
+    if fingers:
+        finger, median_ms, _ = fingers[0]
+        lines.append(f"  Slowest finger: {finger}, {median_ms:.0f} ms typical per key")
+    return lines
 
 # =========== Key Statistics Tracking ===========
 
@@ -22,6 +102,7 @@ def record_keystroke(settings, key: str, correct: bool):
         settings.key_stats[key]["correct"] += 1
     else:
         settings.key_stats[key]["errors"] += 1
+    state_manager.mark_changed(settings, "key_stats", key)
 
 
 def get_key_accuracy(settings, key: str) -> float:
@@ -154,6 +235,8 @@ def format_key_performance_report(settings, min_attempts: int = 10) -> str:
         lines.append(f"  Focus on practicing these keys: {', '.join(worst_keys)}")
         lines.append("  Try Free Practice mode to improve without pressure.")
 
+    lines.extend(format_transition_report(settings))
+
     # Overall stats
     if settings.key_stats:
         total_attempts = sum(s["attempts"] for s in settings.key_stats.values())
@@ -176,23 +259,12 @@ def get_weakest_finger(settings, min_attempts: int = 10) -> dict:
         min_attempts: Minimum attempts to consider
 
     Returns:
-        Dict with finger name and problem keys
+        Dict with finger name and problem keys; with timing data, also the
+        slowest finger and its typical latency in milliseconds
     """
-    # Map keys to fingers
-    finger_map = {
-        "left_pinky": ['q', 'a', 'z', '1', '`', 'tab', 'caps lock', 'shift'],
-        "left_ring": ['w', 's', 'x', '2'],
-        "left_middle": ['e', 'd', 'c', '3'],
-        "left_index": ['r', 'f', 'v', 't', 'g', 'b', '4', '5'],
-        "right_index": ['y', 'h', 'n', 'u', 'j', 'm', '6', '7'],
-        "right_middle": ['i', 'k', ',', '8'],
-        "right_ring": ['o', 'l', '.', '9'],
-        "right_pinky": ['p', ';', '/', '[', ']', '\\', '-', '=', '0', 'enter', 'backspace']
-    }
-
     finger_stats = {}
 
-    for finger, keys in finger_map.items():
+    for finger, keys in FINGER_KEYS.items():
         total_attempts = 0
         total_correct = 0
         problem_keys = []
@@ -217,51 +289,53 @@ def get_weakest_finger(settings, min_attempts: int = 10) -> dict:
                 "problem_keys": problem_keys
             }
 
+    slowest = get_slowest_fingers(settings)
+    timing = {}
+    if slowest:
+        timing = {"slowest_finger": slowest[0][0], "slowest_finger_ms": slowest[0][1]}
+
     if not finger_stats:
-        return {"finger": "Unknown", "accuracy": 100.0, "problem_keys": []}
+        return {"finger": "Unknown", "accuracy": 100.0, "problem_keys": [], **timing}
 
     # Find weakest finger
     weakest = min(finger_stats.items(), key=lambda x: x[1]["accuracy"])
 
-    return {
-        "finger": weakest[0].replace("_", " ").title(),
+    result = {
+        "finger": _finger_label(weakest[0]),
         "accuracy": weakest[1]["accuracy"],
         "problem_keys": [k for k, a in weakest[1]["problem_keys"]],
-        "attempts": weakest[1]["attempts"]
+        "attempts": weakest[1]["attempts"],
+        **timing,
     }
+    for finger, median_ms, _ in slowest:
+        if finger == result["finger"]:
+            result["latency_ms"] = median_ms
+    return result
 
 
 def recommend_lessons_for_keys(settings, keys: list) -> list:
     """Recommend lessons that focus on specific keys.
 
+    Each key maps to the lesson that introduces it; lessons are ranked by the
+    practice weight (``weak_keys.key_weights``, the model lesson generation
+    uses) of the requested keys they introduce.
+
     Args:
         settings: Settings object
         keys: List of keys to practice
 
     Returns:
-        List of recommended lesson numbers
+        Up to 5 lesson numbers, the one covering the weakest keys first
     """
-    # This is a simplified mapping; it does not currently bind to
-    # lesson_manager.STAGE_LETTERS and returns general recommendations.
-
-    recommendations = []
-
-    # Home row letters (lessons 0-8)
-    home_row = ['a', 's', 'd', 'f', 'j', 'k', 'l', ';']
-    if any(k in home_row for k in keys):
-        recommendations.extend([0, 1, 2, 3, 4, 5, 6, 7, 8])
-
-    # Top row letters (lessons 9-13)
-    top_row = ['q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p']
-    if any(k in top_row for k in keys):
-        recommendations.extend([9, 10, 11, 12, 13])
-
-    # Bottom row letters (lessons 14-18)
-    bottom_row = ['z', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '/']
-    if any(k in bottom_row for k in keys):
-        recommendations.extend([14, 15, 16, 17, 18])
-
-    # Remove duplicates and sort
-    recommendations = sorted(list(set(recommendations)))
-
-    return recommendations[:5]  # Return top 5
+    wanted = [key.lower() for key in keys]
+    weights = key_weights(wanted, getattr(settings, "key_stats", None), _transition_stats(settings))
+
+    lesson_weight = {}
+    for key in wanted:
+        for lesson, stage_keys in enumerate(STAGE_LETTERS):
+            if key in stage_keys:
+                lesson_weight[lesson] = lesson_weight.get(lesson, 0.0) + weights[key]
+                break
+
+    ranked = sorted(lesson_weight, key=lambda lesson: (-lesson_weight[lesson], lesson))
+    return ranked[:5]  # Return top 5
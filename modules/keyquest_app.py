@@ -1,14 +1,17 @@
 #!python3.9
 """Main Pygame application entry point for KeyQuest."""
 
+# Imported first so the startup timeline starts before the heavy imports.
+from modules import startup_timeline
+
 import sys
 import os
 import time
 import random
+import operator
 import threading
 import subprocess
 import traceback
-import webbrowser
 from collections import Counter
 from pathlib import Path
 from typing import List, Optional
@@ -16,6 +19,7 @@ from typing import List, Optional
 from modules.app_paths import get_app_dir
 from modules import dialog_manager
 from modules import audio_manager
+from modules import audio_cache
 from modules import results_formatter
 from modules import state_manager
 from modules import lesson_manager
@@ -41,36 +45,31 @@ from modules import sound_demo
 from modules import learn_sounds_mode
 from modules.escape_guard import EscapePressGuard
 from modules import flash_manager
+from modules.dirty_regions import DirtyRegions
+from modules import frame_pacer
+from modules import keystroke_log
+from modules import transition_stats
+from modules import progress_store
+from modules import save_worker
+from modules import prewarm
+from modules import speech_backend_watcher
 from modules import font_manager
 from modules import shop_mode
 from modules import pet_mode
 from modules import pet_manager
 from modules import progress_views
 from modules import notifications
-from modules import update_manager
 from modules import dashboard_manager
 from modules import currency_manager
 from modules.version import __version__
 import pygame
 import pygame.freetype
-from games import LetterFallGame
-from games import HangmanGame
-from games.word_typing import WordTypingGame
+from games import load_game_classes
 from ui.render_menus import draw_main_menu, draw_lesson_menu, draw_games_menu
-from ui.render_shop import draw_shop
-from ui.render_pet import draw_pet
-from ui.render_options import draw_options
-from ui.render_results import draw_results_screen
-from ui.render_lesson import draw_lesson_screen
-from ui.render_test_setup import draw_test_setup_screen, draw_practice_setup_screen
-from ui.render_lesson_intro import draw_lesson_intro_screen
-from ui.render_learn_sounds import draw_learn_sounds_menu
-from ui.render_test_active import draw_test_screen, draw_practice_screen
-from ui.render_keyboard_explorer import draw_keyboard_explorer_screen
-from ui.render_free_practice_ready import draw_free_practice_ready_screen
-from ui.render_tutorial import draw_tutorial_screen
-from ui.text_wrap import wrap_text
-from ui.render_updating import draw_updating_screen
+from ui.text_cache import clear_text_cache, render_text, text_cache_stats
+from ui.text_wrap import clear_wrap_cache, wrap_cache_stats, wrap_text
+
+startup_timeline.mark("imports")
 
 
 REPO_OWNER = "WebFriendlyHelp"
@@ -94,6 +93,37 @@ SCREEN_W, SCREEN_H = app_config.SCREEN_W, app_config.SCREEN_H
 FONT_NAME = app_config.FONT_NAME
 TITLE_SIZE, TEXT_SIZE, SMALL_SIZE = app_config.TITLE_SIZE, app_config.TEXT_SIZE, app_config.SMALL_SIZE
 
+# Modes whose screens change without input (timers, animation, game motion)
+# are redrawn every frame; every other mode redraws only when marked dirty.
+ANIMATED_MODES = frozenset({"GAME", "TEST", "PRACTICE", "PET", "UPDATING"})
+
+# Window events after which the OS expects the window contents to be repainted.
+REPAINT_EVENTS = frozenset(
+    getattr(pygame, name)
+    for name in (
+        "VIDEOEXPOSE",
+        "ACTIVEEVENT",
+        "WINDOWEXPOSED",
+        "WINDOWSHOWN",
+        "WINDOWRESTORED",
+        "WINDOWMAXIMIZED",
+        "WINDOWSIZECHANGED",
+        "WINDOWFOCUSGAINED",
+    )
+    if hasattr(pygame, name)
+)
+
+# Frame pacing outside of games; anything not listed waits for events.
+MODE_FRAME_PACES = {
+    "PET": frame_pacer.PACE_ANIMATED,
+    "TEST": frame_pacer.PACE_TIMER,
+    "PRACTICE": frame_pacer.PACE_TIMER,
+    "UPDATING": frame_pacer.PACE_TIMER,
+}
+
+# How often idle screens wake up to collect update-check/download results.
+UPDATE_POLL_INTERVAL = 0.1
+
 SYSTEM_THEME = theme_manager.detect_theme()
 BG, FG, ACCENT, HILITE = theme_manager.get_theme_colors(SYSTEM_THEME)
 
@@ -114,6 +144,13 @@ def _offer_general_error_log_copy() -> None:
         message.append("KeyQuest could not copy the local error log to the clipboard automatically.")
     dialog_manager.show_info_dialog("KeyQuest Error", "\n".join(message))
 
+
+def _open_in_browser(url: str, new: int = 2) -> None:
+    """Open ``url`` in the default browser; webbrowser is imported on first use."""
+    import webbrowser
+
+    webbrowser.open(url, new=new)
+
 class KeyQuestApp:
     def __init__(self):
         # wx.App must exist before pygame so modal dialogs can be created reliably.
@@ -128,6 +165,7 @@ class KeyQuestApp:
         except Exception as e:
             self.wx_app = None
             print(f"Warning: Could not initialize wx.App: {e}")
+        startup_timeline.mark("wx")
 
         try:
             # Lower mixer buffer for snappier short typing sounds.
@@ -138,25 +176,44 @@ class KeyQuestApp:
         except Exception as e:
             error_logging.log_exception(e)
             raise
+        startup_timeline.mark("pygame init")
 
         self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.RESIZABLE)
         pygame.display.set_caption("Key Quest")
         self.clock = pygame.time.Clock()
+        self._pacer = frame_pacer.FramePacer(self.clock)
+        # Set KEYQUEST_DEBUG_OVERLAY=1 to show frame timing in the corner.
+        self._debug_overlay = os.environ.get("KEYQUEST_DEBUG_OVERLAY", "") not in ("", "0")
         self._maximize_window()
 
         self.title_font = pygame.freetype.SysFont(FONT_NAME, TITLE_SIZE)
         self.text_font = pygame.freetype.SysFont(FONT_NAME, TEXT_SIZE)
         self.small_font = pygame.freetype.SysFont(FONT_NAME, SMALL_SIZE)
+        startup_timeline.mark("window and fonts")
 
         self.state = state_manager.AppState()
-        self.speech = Speech()
+        # Tolk and TTS are probed after the first frame (see _finish_startup);
+        # speech said before then waits in the queue.
+        self.speech = Speech(probe=False)
         self.state.backend_label = self._backend_label()
-        self._last_speech_backend_check = 0.0
         self._startup_menu_event = pygame.USEREVENT + 1
+        # Posted by the speech watcher thread to wake the loop after a change.
+        self._speech_backend_event = pygame.USEREVENT + 2
+        # Auto speech mode follows screen readers starting and stopping. The
+        # Narrator process probe runs on the watcher thread, started after
+        # the first frame; Tolk is asked on this thread once per interval.
+        self.speech_watcher = speech_backend_watcher.SpeechBackendWatcher(
+            self.speech.narrator_running,
+            interval=speech_backend_watcher.interval_from_env(),
+            initial=False,
+            notify=lambda: pygame.event.post(pygame.event.Event(self._speech_backend_event)),
+        )
+        self._next_screen_reader_check = 0.0
         self._startup_menu_armed = False
         self.escape_guard = EscapePressGuard()
-        self._self_update_supported = update_manager.can_self_update()
-        self._portable_update_mode = self._self_update_supported and update_manager.is_portable_layout(get_app_dir())
+        # Set by _finish_startup(), which imports the update manager after the first frame.
+        self._self_update_supported = False
+        self._portable_update_mode = False
         self._update_lock = threading.Lock()
         self._update_check_thread = None
         self._update_check_result = None
@@ -176,8 +233,18 @@ class KeyQuestApp:
         self._escape_remaining: int = 0
         self._escape_noun: str = ""
 
-        self.audio = audio_manager.AudioManager()
-        self.progress_manager = state_manager.ProgressManager()
+        # Static screens are only redrawn when something marks them dirty.
+        self._dirty = DirtyRegions()
+        self._last_drawn_mode: Optional[str] = None
+        self._flash_drawn = False
+
+        # Synthesized PCM is cached on disk so later launches skip numpy synthesis.
+        # Progress tones wait for the prewarm thread (see _register_prewarm_tasks).
+        self.audio = audio_manager.AudioManager(disk_cache=audio_cache.AudioDiskCache(), prebuild_tones=False)
+        startup_timeline.mark("audio")
+        self.progress_manager = state_manager.ProgressManager(database=self._progress_database())
+        # Progress is written off the pygame thread; see save_progress().
+        self.save_worker = save_worker.SaveWorker(self.progress_manager.write, merge=operator.add)
         self.speed_test_sentences = []
         self.practice_sentences = []
         self.practice_setup_options = []
@@ -195,44 +262,27 @@ class KeyQuestApp:
         self.test_setup_topic_options = ["English", "Spanish"]
         self.test_setup_topic_index = 0
 
-        fonts = {
-            'title_font': self.title_font,
-            'text_font': self.text_font,
-            'small_font': self.small_font
-        }
-        self.games = [
-            LetterFallGame(
-                self.screen,
-                fonts,
-                self.speech,
-                self.audio.play_wave,
-                self.show_info_dialog,
-                self.handle_game_session_complete,
-            ),
-            WordTypingGame(
-                self.screen,
-                fonts,
-                self.speech,
-                self.audio.play_wave,
-                self.show_info_dialog,
-                self.handle_game_session_complete,
-            ),
-            HangmanGame(
-                self.screen,
-                fonts,
-                self.speech,
-                self.audio.play_wave,
-                self.show_info_dialog,
-                self.handle_game_session_complete,
-            ),
-        ]
+        # Built on first entry to the games menu; see the games property.
+        self._games = None
         self.current_game = None
         self.game_time = 0
 
+        # Game and practice assets load in the background once the menu is up.
+        self.prewarm = prewarm.PrewarmScheduler()
+        self._register_prewarm_tasks()
+
+        # Per-keystroke timing rows, appended to keystrokes.bin when sessions
+        # end. The save worker does the writing, so ending a session never
+        # waits on the disk.
+        self.keystrokes = keystroke_log.KeystrokeRecorder()
+        self.keystrokes.defer = self.save_worker.defer
+
         self.load_progress()
+        startup_timeline.mark("progress")
 
         # Rebuild fonts after settings load so DPI and user overrides are applied together.
         self._rebuild_fonts()
+        startup_timeline.mark("fonts")
 
         self.check_and_update_streak()
         quest_manager.initialize_quests(self.state.settings)
@@ -240,14 +290,96 @@ class KeyQuestApp:
             challenge_manager.reset_daily_challenge(self.state.settings)
             self.save_progress()
 
-        # Cache practice content for the currently selected language.
+        self._init_menus()
+        startup_timeline.mark("menus")
+        # The prewarm thread (sentence pools, game modules), the speech
+        # probe, and update checks start in _finish_startup(), once the
+        # first frame is on screen.
+
+    def _finish_startup(self):
+        """Start the work deferred until after the first frame."""
+        self.prewarm.start()
+        self.speech.probe()
+        self.state.backend_label = self._backend_label()
+        self.speech_watcher.start(initial=self.speech.screen_reader_detected == "Narrator")
+        startup_timeline.mark("speech")
+
+        from modules import update_manager
+
+        self._self_update_supported = update_manager.can_self_update()
+        self._portable_update_mode = self._self_update_supported and update_manager.is_portable_layout(get_app_dir())
+        self._start_startup_update_check_if_enabled()
+        startup_timeline.mark("deferred startup")
+
+    @property
+    def games(self) -> list:
+        """The game objects, built when the games menu first needs them.
+
+        The prewarm thread imports the game modules once the menu is up, so
+        this usually only constructs the games.
+        """
+        if self._games is None:
+            fonts = {
+                'title_font': self.title_font,
+                'text_font': self.text_font,
+                'small_font': self.small_font
+            }
+            self._games = []
+            for game_class in load_game_classes():
+                game = game_class(
+                    self.screen,
+                    fonts,
+                    self.speech,
+                    self.audio.play_wave,
+                    self.show_info_dialog,
+                    self.handle_game_session_complete,
+                    self.audio.play_effect,
+                )
+                game.keystroke_recorder = self.keystrokes
+                self._games.append(game)
+        return self._games
+
+    def _startup_report_extra(self) -> dict:
+        """Background load times for the JSON startup trace (sentences, sounds, ...)."""
+        timings = dict(self.prewarm.timings_ms)
+        return {"prewarm_ms": {name: round(ms, 3) for name, ms in timings.items()}}
+
+    def _register_prewarm_tasks(self):
+        """Queue first-use loads in the order screens are likely to need them."""
+        self.prewarm.add("typing_tones", self.audio.prebuild_progressive_tones, priority=0)
+        # Lessons weight keys by latency once these tables are in (see WeakKeyGenerator.for_settings).
+        self.prewarm.add("transitions", lambda: self.keystrokes.transitions.ensure_loaded(), priority=1)
+        self.prewarm.add("game_classes", load_game_classes, priority=1)
+        self.prewarm.add("game_sounds", self._prebuild_game_sounds, priority=1)
+        self.prewarm.add("sentences", self._load_sentence_pools, priority=2)
+        self.prewarm.add("hangman_words", self._load_hangman_words, priority=3)
+        self.prewarm.add("word_index", self._load_word_index, priority=4)
+        self.prewarm.add("celebration_sounds", self.audio.prebuild_sound_bank, priority=5)
+
+    def _prebuild_game_sounds(self):
+        from games import sounds
+
+        self.audio.prebuild_effects(sounds.GAME_EFFECTS)
+
+    @staticmethod
+    def _load_hangman_words():
+        from games import hangman
+
+        hangman.load_candidate_bucket_sizes()
+
+    @staticmethod
+    def _load_word_index():
+        from modules import word_index
+
+        word_index.get_word_index()
+
+    def _load_sentence_pools(self):
+        """Read every sentence file, then cache the pools for the selected language."""
+        sentences_manager.preload_sentence_files()
         self.speed_test_sentences = sentences_manager.load_speed_test_sentences()
         self.practice_sentences = sentences_manager.load_practice_sentences(self.state.settings.sentence_language)
         print(f"Loaded {len(self.practice_sentences)} practice sentences in {self.state.settings.sentence_language}")
 
-        self._init_menus()
-        self._start_startup_update_check_if_enabled()
-
     def _init_menus(self):
         """Initialize all menu objects."""
         # Main menu
@@ -278,7 +410,7 @@ class KeyQuestApp:
         # Games menu
         self.games_menu = menu_handler.Menu(
             name="Games",
-            items=self.games,
+            items=lambda: self.games,
             speech_system=self.speech,
             on_select_callback=lambda game: self.start_game(self.games.index(game)),
             get_item_text_func=lambda game: f"{game.NAME}. {game.DESCRIPTION}",
@@ -537,7 +669,7 @@ class KeyQuestApp:
         """Open the published user instructions in the default browser."""
         self.speech.say("Opening Key Quest Instructions.", priority=True)
         try:
-            webbrowser.open(PAGES_GUIDE_URL, new=2)
+            _open_in_browser(PAGES_GUIDE_URL)
         except Exception:
             self.speech.say("Unable to open Key Quest Instructions.", priority=True)
 
@@ -545,7 +677,7 @@ class KeyQuestApp:
         """Open the published changelog page in the default browser."""
         self.speech.say("Opening New in Key Quest.", priority=True)
         try:
-            webbrowser.open(PAGES_CHANGELOG_URL, new=2)
+            _open_in_browser(PAGES_CHANGELOG_URL)
         except Exception:
             self.speech.say("Unable to open New in Key Quest.", priority=True)
 
@@ -575,7 +707,7 @@ class KeyQuestApp:
             return
 
         try:
-            webbrowser.open(INSTALLER_DOWNLOAD_URL)
+            _open_in_browser(INSTALLER_DOWNLOAD_URL, new=0)
             self.speech.say("Opening the KeyQuest setup download.", priority=True)
         except Exception as e:
             self.speech.say(f"Unable to open the KeyQuest setup download. {e}", priority=True)
@@ -618,14 +750,14 @@ class KeyQuestApp:
         if item_id == "website":
             self.speech.say("Opening webfriendlyhelp dot com.", priority=True)
             try:
-                webbrowser.open("https://webfriendlyhelp.com", new=2)
+                _open_in_browser("https://webfriendlyhelp.com")
             except Exception:
                 self.speech.say("Unable to open website.", priority=True)
             return
         if item_id == "donate":
             self.speech.say("Opening the KeyQuest donation page.", priority=True)
             try:
-                webbrowser.open(DONATE_URL, new=2)
+                _open_in_browser(DONATE_URL)
             except Exception:
                 self.speech.say("Unable to open donation page.", priority=True)
             return
@@ -659,6 +791,8 @@ class KeyQuestApp:
             self.apply_visual_theme()
         elif option_name == "sentence_language":
             print(f"Language changed from {old_value} to {new_value}")
+            # The prewarm thread must not overwrite the new pool with the old language.
+            self.prewarm.ensure("sentences")
             self.practice_sentences = sentences_manager.load_practice_sentences(new_value)
             print(f"Reloaded {len(self.practice_sentences)} practice sentences in {new_value}")
             if self.practice_sentences:
@@ -680,6 +814,7 @@ class KeyQuestApp:
         except Exception:
             pass
 
+        self._shutdown_storage()
         self.speech.say("Goodbye.", priority=True, protect_seconds=1.2, interrupt=False)
         pygame.time.wait(900)
         pygame.quit()
@@ -745,9 +880,30 @@ class KeyQuestApp:
         explanation = menu_handler.get_speech_mode_explanation(self.state.settings.speech_mode)
         return menu_handler.build_options_menu_announcement(options[0], explanation)
 
+    @staticmethod
+    def _progress_database():
+        """SQLite progress store path, or None to keep progress.json.
+
+        KEYQUEST_PROGRESS_STORE=sqlite opts in; once progress.db exists it
+        stays in use so switching back cannot hide newer progress.
+        """
+        if os.environ.get("KEYQUEST_PROGRESS_STORE", "").strip().lower() == "sqlite":
+            return progress_store.PROGRESS_DB_FILE
+        if os.path.exists(progress_store.PROGRESS_DB_FILE):
+            return progress_store.PROGRESS_DB_FILE
+        return None
+
     def load_progress(self):
         """Load progress from file using ProgressManager."""
         self.progress_manager.load(self.state, len(lesson_manager.STAGE_LETTERS))
+        store = self.progress_manager.store
+        if store is not None:
+            self.keystrokes.store = store
+        # Read on first use; rebuilt from the keystroke log if the file is missing.
+        self.keystrokes.transitions = transition_stats.TransitionStats(
+            source=store.load_keystrokes if store is not None else keystroke_log.load_keystrokes
+        )
+        self.state.settings.transition_stats = self.keystrokes.transitions
         # Apply loaded settings
         self.apply_speech_mode()
         self.apply_typing_sound_intensity()
@@ -755,8 +911,28 @@ class KeyQuestApp:
         self.apply_visual_theme()
 
     def save_progress(self):
-        """Save progress to file using ProgressManager."""
-        self.progress_manager.save(self.state)
+        """Queue what changed in progress for the background save worker."""
+        try:
+            ops = self.progress_manager.changes(self.state)
+        except Exception as e:
+            error_logging.log_exception(e)
+            return
+        if ops:
+            self.save_worker.submit(ops)
+
+    def _shutdown_storage(self):
+        """Stop background probes and prewarming, then flush keystrokes and pending saves before the process exits."""
+        self.speech_watcher.stop()
+        self.prewarm.cancel()
+        self.keystrokes.end_session()
+        if not self.save_worker.close():
+            # The worker is still writing; compacting now would race it.
+            error_logging.log_message(
+                "Progress save",
+                "Progress save did not finish before exit; skipped compacting the progress files.",
+            )
+            return
+        self.progress_manager.compact()
 
     def check_and_update_streak(self):
         """Check and update the daily practice streak."""
@@ -874,6 +1050,8 @@ class KeyQuestApp:
 
     def _check_for_updates_worker(self, manual: bool):
         """Worker that queries the latest GitHub release."""
+        from modules import update_manager
+
         try:
             release = update_manager.fetch_latest_release()
             version = update_manager.parse_release_version(release)
@@ -958,6 +1136,8 @@ class KeyQuestApp:
 
     def _download_update_worker(self, payload: dict):
         """Worker that downloads the update installer."""
+        from modules import update_manager
+
         try:
             version = payload["version"]
             asset = payload["asset"]
@@ -1007,6 +1187,8 @@ class KeyQuestApp:
                 download_result = self._update_download_result
                 self._update_download_result = None
 
+        if check_result is not None or download_result is not None:
+            self._dirty.mark_full()
         if check_result is not None:
             self._handle_update_check_result(check_result)
         if download_result is not None:
@@ -1074,6 +1256,8 @@ class KeyQuestApp:
 
     def _launch_downloaded_update(self, download_path: str, version: str):
         """Launch the correct update handoff and then exit the app."""
+        from modules import update_manager
+
         app_exe_path = sys.executable if getattr(sys, "frozen", False) else os.path.join(get_app_dir(), "KeyQuest.exe")
         if self._portable_update_mode:
             launcher_path = update_manager.create_portable_update_launcher(
@@ -1110,6 +1294,8 @@ class KeyQuestApp:
         action_text = "Installing" if not self._portable_update_mode else "Applying portable update for"
         self._update_status = f"{action_text} KeyQuest {version}. KeyQuest will restart automatically."
         self.save_progress()
+        # The updater copies progress files once this process exits.
+        self._shutdown_storage()
         self.speech.say(
             f"{action_text} KeyQuest version {version}. KeyQuest will restart automatically.",
             priority=True,
@@ -1172,6 +1358,7 @@ class KeyQuestApp:
         Games report their metrics through BaseGame.show_game_results(). Future games
         only need to call that method with optional session_stats.
         """
+        self.keystrokes.end_session()
         stats = session_stats or {}
         accuracy = float(stats.get("accuracy", 80.0))
         if accuracy < 0:
@@ -1339,6 +1526,7 @@ class KeyQuestApp:
 
     def start_free_practice(self):
         """Start the free practice session."""
+        self.prewarm.ensure("word_index")
         self.state.mode = "FREE_PRACTICE"
         self.state.free_practice.in_session = True
 
@@ -1463,8 +1651,9 @@ class KeyQuestApp:
 
     def run(self):
         # Draw first frame before speaking (helps with initialization)
-        self.draw()
-        pygame.display.flip()
+        self._render_frame()
+        startup_timeline.mark("first frame")
+        self._finish_startup()
 
         # Arm a delayed startup menu announcement so screen reader title
         # announcement can finish first.
@@ -1472,10 +1661,11 @@ class KeyQuestApp:
         self._startup_menu_armed = True
 
         while True:
-            dt = self.clock.tick(60) / 1000.0  # Delta time in seconds
-            self._refresh_auto_speech_backend()
+            events = self._pacer.wait(self._frame_pace(), self._seconds_until_wakeup())
+            dt = self._pacer.frame_dt()  # Delta time in seconds
+            self._apply_speech_backend_change()
             self._poll_update_work()
-            for event in pygame.event.get():
+            for event in events:
                 try:
                     self.handle_event(event)
                 except Exception as e:
@@ -1486,24 +1676,138 @@ class KeyQuestApp:
             if self.state.mode == "GAME" and self.current_game:
                 self.current_game.update(dt)
 
+            # Speech queued behind the backend's pacing gap goes out here.
+            self.speech.pump()
+
+            if self._debug_overlay and self._pacer.stats_updated:
+                self._dirty.mark_full()
+            self._render_frame()
+            self._pacer.end_frame()
+
+    def _frame_pace(self) -> str:
+        """Return how fast the main loop should turn for the current screen."""
+        if self._flash.is_active():
+            # Keep the flash fade smooth.
+            return frame_pacer.PACE_REALTIME
+        if self.state.mode == "GAME" and self.current_game:
+            if self.current_game.mode == "PLAYING":
+                return self.current_game.FRAME_PACE
+            return frame_pacer.PACE_IDLE
+        return MODE_FRAME_PACES.get(self.state.mode, frame_pacer.PACE_IDLE)
+
+    def _seconds_until_wakeup(self) -> Optional[float]:
+        """Seconds until a timer-driven check needs the loop, or None."""
+        wakeups = []
+        if self._update_work_running():
+            wakeups.append(UPDATE_POLL_INTERVAL)
+        if self._debug_overlay:
+            wakeups.append(frame_pacer.STATS_WINDOW)
+        speech_due = self.speech.seconds_until_due()
+        if speech_due is not None:
+            wakeups.append(speech_due)
+        if self.state.settings.speech_mode == "auto":
+            wakeups.append(max(0.0, self._next_screen_reader_check - time.perf_counter()))
+        return min(wakeups) if wakeups else None
+
+    def _update_work_running(self) -> bool:
+        """True while an update check or download thread may still post a result."""
+        with self._update_lock:
+            if self._update_check_result is not None or self._update_download_result is not None:
+                return True
+        threads = (self._update_check_thread, self._update_download_thread)
+        return any(thread is not None and thread.is_alive() for thread in threads)
+
+    def _debug_overlay_lines(self) -> List[str]:
+        """Text lines for the KEYQUEST_DEBUG_OVERLAY corner readout."""
+        frame = self._pacer.stats()
+        dirty = self._dirty.stats()
+        text = text_cache_stats()
+        wrap = wrap_cache_stats()
+        saves = self.save_worker.stats()
+        save_line = f"Last save {saves['last_latency_ms']:.1f} ms, {saves['coalesced']} coalesced"
+        if saves["failures"]:
+            save_line += f", {saves['failures']} failed ({saves['last_error']})"
+        warm = self.prewarm.stats()
+        prewarm_line = (
+            f"Prewarm {warm['done']}/{warm['tasks']} done in {warm['busy_ms']:.0f} ms, "
+            f"waited {warm['waited_ms']:.0f} ms"
+        )
+        voice = self.speech.scheduler_stats()
+        speech_line = (
+            f"Speech {voice['sent']} sent, {voice['replaced']} replaced, {voice['merged']} merged, "
+            f"wait {voice['latency_avg_ms']:.0f}/{voice['latency_max_ms']:.0f} ms avg/max"
+        )
+        watch = self.speech_watcher.stats()
+        watcher_line = (
+            f"Narrator probe {watch['probe_max_ms']:.0f} ms max ({watch['probes']} runs), "
+            f"UI poll {watch['poll_max_ms'] * 1000:.0f} us max"
+        )
+        return [
+            f"{frame['pace']}: {frame['fps']:.0f} fps, {frame['frame_ms']:.1f} ms/frame",
+            f"CPU busy {frame['cpu_busy']:.0f}%, skipped {dirty['skip_rate']:.0%} of frames",
+            f"Text cache {text['hit_rate']:.0%} hits, {text['entries']} surfaces, {text['bytes'] / 1024:.0f} KB",
+            f"Wrap cache {wrap['hit_rate']:.0%} hits, {wrap['layouts']} layouts",
+            save_line,
+            prewarm_line,
+            speech_line,
+            watcher_line,
+        ]
+
+    def _render_frame(self) -> bool:
+        """Draw and present the frame if anything changed.
+
+        Returns:
+            True when the display was updated, False when the frame was skipped
+        """
+        mode = self.state.mode
+        flash_active = self._flash.is_active()
+        # Animated screens, mode switches, and flash fades (plus one frame to
+        # clear the overlay) always redraw everything.
+        if mode in ANIMATED_MODES or mode != self._last_drawn_mode or flash_active or self._flash_drawn:
+            self._dirty.mark_full()
+
+        full, rects = self._dirty.take()
+        if not full and not rects:
+            return False
+
+        if full:
             self.draw()
             pygame.display.flip()
+        else:
+            self.screen.set_clip(DirtyRegions.union(rects))
+            try:
+                self.draw()
+            finally:
+                self.screen.set_clip(None)
+            pygame.display.update(rects)
+        self._last_drawn_mode = mode
+        self._flash_drawn = flash_active
+        return True
 
-    def _refresh_auto_speech_backend(self):
-        """Auto mode: keep backend in sync with screen reader runtime state."""
-        now = time.time()
-        if now - self._last_speech_backend_check < 1.0:
-            return
-        self._last_speech_backend_check = now
+    def _apply_speech_backend_change(self):
+        """Auto mode: switch backends when a screen reader starts or stops.
 
+        The watcher thread reports Narrator; Tolk is asked here, on the
+        thread that speaks, once per watcher interval or when Narrator
+        started or stopped.
+        """
+        changed, narrator_running = self.speech_watcher.poll()
         if self.state.settings.speech_mode != "auto":
             return
+        now = time.perf_counter()
+        if not changed and now < self._next_screen_reader_check:
+            return
+        self._next_screen_reader_check = now + self.speech_watcher.interval
+        detected_reader = self.speech.detect_screen_reader(narrator_running)
+        if detected_reader == self.speech.screen_reader_detected:
+            return
 
         previous_backend = self.speech.backend
-        if not self.speech.refresh_backend(self.state.settings.speech_mode):
+        if not self.speech.apply_detected_reader(detected_reader, self.state.settings.speech_mode):
             return
 
         self.state.backend_label = self._backend_label()
+        self._dirty.mark_full()
 
         if self.speech.backend == "tts":
             self.speech.say(
@@ -1528,6 +1832,11 @@ class KeyQuestApp:
             return
         if event.type == pygame.QUIT:
             self._quit_app()
+        if event.type == self._speech_backend_event:
+            # Only wakes the loop; _apply_speech_backend_change() already ran.
+            return
+        if event.type in REPAINT_EVENTS:
+            self._dirty.mark_full()
         if event.type == pygame.VIDEORESIZE:
             self._resize_window(event.w, event.h)
             return
@@ -1536,14 +1845,19 @@ class KeyQuestApp:
             self._startup_menu_armed = False
             if self.state.mode == "MENU":
                 self.say_menu(on_startup=True)
+            startup_timeline.mark("menu announced")
+            startup_timeline.report_once(self._startup_report_extra())
             return
         if event.type == pygame.KEYDOWN:
             if self._startup_menu_armed:
                 pygame.time.set_timer(self._startup_menu_event, 0)
                 self._startup_menu_armed = False
+                startup_timeline.mark("first key before menu announcement")
+                startup_timeline.report_once(self._startup_report_extra())
             mods = pygame.key.get_mods()
             if event.key == pygame.K_ESCAPE and self._handle_escape_shortcut():
                 return
+            self._dirty.mark_full()
             if event.key != pygame.K_ESCAPE:
                 self.escape_guard.reset()
                 self._escape_remaining = 0
@@ -1649,6 +1963,8 @@ class KeyQuestApp:
         if not completed:
             self._escape_remaining = remaining
             self._escape_noun = policy["noun"]
+            # Only the counter line changes while the sequence is in progress.
+            self._dirty.mark(self._escape_counter_rect())
             self.speech.say(
                 f"Escape. Press {remaining} more time{'s' if remaining != 1 else ''} to {policy['noun']}.",
                 priority=True,
@@ -1658,11 +1974,13 @@ class KeyQuestApp:
         # Sequence complete — clear the visual counter.
         self._escape_remaining = 0
         self._escape_noun = ""
+        self._dirty.mark_full()
 
         if policy["action"] == "finish_practice":
             self.finish_practice()
             return True
 
+        self.keystrokes.end_session()
         self.current_game = None
         self.state.mode = "MENU"
         self.speech.say("Exiting to main menu.", priority=True)
@@ -1672,6 +1990,11 @@ class KeyQuestApp:
     def _screen_size(self) -> tuple[int, int]:
         return self.screen.get_size()
 
+    def _escape_counter_rect(self) -> pygame.Rect:
+        """Screen strip holding the Escape press counter drawn by draw()."""
+        screen_w, _ = self._screen_size()
+        return pygame.Rect(0, 0, screen_w, 6 + self.small_font.get_sized_height() + 6)
+
     def _resize_window(self, width: int, height: int) -> None:
         min_width = max(800, app_config.SCREEN_W)
         min_height = max(600, app_config.SCREEN_H)
@@ -1679,6 +2002,7 @@ class KeyQuestApp:
             (max(min_width, width), max(min_height, height)),
             pygame.RESIZABLE,
         )
+        self._dirty.mark_full()
 
     def _maximize_window(self) -> None:
         try:
@@ -1763,6 +2087,8 @@ class KeyQuestApp:
     def start_game(self, game_index):
         """Start a game."""
         self.current_game = self.games[game_index]
+        self.prewarm.promote("game_sounds")
+        self.prewarm.ensure(*self.current_game.PREWARM_ASSETS)
         self.state.mode = "GAME"
         self.game_time = time.time()
         self.current_game.start()
@@ -1772,6 +2098,7 @@ class KeyQuestApp:
         if self.current_game:
             result = self.current_game.handle_input(event, mods)
             if result == "GAMES_MENU":
+                self.keystrokes.end_session()
                 self.current_game = None
                 self.show_games_menu()
 
@@ -1789,6 +2116,7 @@ class KeyQuestApp:
     def apply_speech_mode(self):
         """Apply the selected speech mode and switch backends accordingly."""
         self.speech.apply_mode(self.state.settings.speech_mode)
+        self.speech_watcher.set_active(self.state.settings.speech_mode == "auto")
         self.state.backend_label = self._backend_label()
 
     def apply_typing_sound_intensity(self):
@@ -1809,6 +2137,7 @@ class KeyQuestApp:
         theme = self.state.settings.visual_theme
 
         BG, FG, ACCENT, HILITE = theme_manager.get_theme_colors(theme)
+        clear_text_cache()
 
     def _rebuild_fonts(self):
         """Recreate fonts at the user-selected (or DPI-auto) scale factor.
@@ -1821,8 +2150,10 @@ class KeyQuestApp:
         self.title_font, self.text_font, self.small_font = font_manager.build_fonts(
             self.state.settings.font_scale
         )
+        clear_wrap_cache()
+        clear_text_cache()
         # Propagate to game objects that cache fonts at construction time.
-        for game in self.games:
+        for game in self._games or ():
             game.title_font = self.title_font
             game.text_font = self.text_font
             game.small_font = self.small_font
@@ -2134,6 +2465,7 @@ class KeyQuestApp:
     # ==================== LESSON (ADAPTIVE) ====================
     def begin_lesson_practice(self, lesson_num):
         """Begin the actual lesson practice after intro."""
+        self.prewarm.ensure("word_index")
         self.state.mode = "LESSON"
         self.state.results_action = ""
 
@@ -2353,6 +2685,7 @@ class KeyQuestApp:
         be triggered on every keystroke.
         """
         self._flash.trigger(color, duration)
+        self._dirty.mark_full()
 
     def draw(self):
         self.screen.fill(BG)
@@ -2408,9 +2741,17 @@ class KeyQuestApp:
             msg = (
                 f"Escape: {presses} more press{'es' if presses != 1 else ''} to {noun}"
             )
-            esc_surf, _ = self.small_font.render(msg, ACCENT)
+            esc_surf, _ = render_text(self.small_font, msg, ACCENT)
             self.screen.blit(esc_surf, (screen_w // 2 - esc_surf.get_width() // 2, 6))
 
+        if self._debug_overlay:
+            line_h = self.small_font.get_sized_height() + 2
+            lines = self._debug_overlay_lines()
+            for i, line in enumerate(lines):
+                surf, _ = render_text(self.small_font, line, FG)
+                y = screen_h - 6 - line_h * (len(lines) - i)
+                self.screen.blit(surf, (screen_w - surf.get_width() - 8, y))
+
         # Render keystroke flash overlay last so it appears above all content.
         if self._flash.is_active():
             from ui.a11y import draw_keystroke_flash
@@ -2475,6 +2816,7 @@ class KeyQuestApp:
 
     def draw_learn_sounds_menu(self):
         screen_w, screen_h = self._screen_size()
+        from ui.render_learn_sounds import draw_learn_sounds_menu
         draw_learn_sounds_menu(
             screen=self.screen,
             title_font=self.title_font,
@@ -2491,14 +2833,14 @@ class KeyQuestApp:
 
     def draw_about(self):
         screen_w, screen_h = self._screen_size()
-        title_surf, _ = self.title_font.render("About", HILITE)
+        title_surf, _ = render_text(self.title_font, "About", HILITE)
         self.screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 40))
 
-        version_surf, _ = self.small_font.render(f"KeyQuest {__version__}", ACCENT)
+        version_surf, _ = render_text(self.small_font, f"KeyQuest {__version__}", ACCENT)
         self.screen.blit(version_surf, (screen_w // 2 - version_surf.get_width() // 2, 84))
 
         subtitle = "Web Friendly Help LLC"
-        subtitle_surf, _ = self.text_font.render(subtitle, FG)
+        subtitle_surf, _ = render_text(self.text_font, subtitle, FG)
         self.screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, 116))
 
         y = 180
@@ -2507,7 +2849,7 @@ class KeyQuestApp:
             prefix = "> " if selected else "  "
             text = f"{prefix}{item['display']}"
             color = HILITE if selected else FG
-            surf, _ = self.text_font.render(text, color)
+            surf, _ = render_text(self.text_font, text, color)
             rect = surf.get_rect(topleft=(80, y))
             if selected:
                 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_focus_frame
@@ -2529,6 +2871,7 @@ class KeyQuestApp:
 
     def draw_updating(self):
         screen_w, screen_h = self._screen_size()
+        from ui.render_updating import draw_updating_screen
         draw_updating_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2548,6 +2891,7 @@ class KeyQuestApp:
     def draw_shop(self):
         """Draw the shop interface."""
         screen_w, screen_h = self._screen_size()
+        from ui.render_shop import draw_shop
         draw_shop(
             screen=self.screen,
             title_font=self.title_font,
@@ -2570,6 +2914,7 @@ class KeyQuestApp:
         """Draw the pet interface."""
         pet_mode.ensure_pet_ui_state(self)
         screen_w, screen_h = self._screen_size()
+        from ui.render_pet import draw_pet
         draw_pet(
             screen=self.screen,
             title_font=self.title_font,
@@ -2597,6 +2942,7 @@ class KeyQuestApp:
         """Draw the options menu."""
         screen_w, screen_h = self._screen_size()
         options = [opt["get_text"]() for opt in self.options_menu.options]
+        from ui.render_options import draw_options
         draw_options(
             screen=self.screen,
             title_font=self.title_font,
@@ -2636,6 +2982,7 @@ class KeyQuestApp:
         keys_to_find_display = phonetics.format_needed_keys_for_display(needed_keys) if needed_keys else ""
         keys_found_display = ", ".join(sorted([k.upper() for k in intro.keys_found])) if intro.keys_found else ""
 
+        from ui.render_lesson_intro import draw_lesson_intro_screen
         draw_lesson_intro_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2662,6 +3009,7 @@ class KeyQuestApp:
 
     def draw_keyboard_explorer(self):
         screen_w, screen_h = self._screen_size()
+        from ui.render_keyboard_explorer import draw_keyboard_explorer_screen
         draw_keyboard_explorer_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2676,6 +3024,7 @@ class KeyQuestApp:
 
     def draw_tutorial(self):
         screen_w, screen_h = self._screen_size()
+        from ui.render_tutorial import draw_tutorial_screen
         draw_tutorial_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2695,6 +3044,7 @@ class KeyQuestApp:
     def draw_lesson(self):
         screen_w, _screen_h = self._screen_size()
         lesson = self.state.lesson
+        from ui.render_lesson import draw_lesson_screen
         draw_lesson_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2713,6 +3063,7 @@ class KeyQuestApp:
 
     def draw_free_practice_ready(self):
         screen_w, screen_h = self._screen_size()
+        from ui.render_free_practice_ready import draw_free_practice_ready_screen
         draw_free_practice_ready_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2732,6 +3083,7 @@ class KeyQuestApp:
     def draw_test_setup(self):
         """Draw the test duration selection screen."""
         screen_w, screen_h = self._screen_size()
+        from ui.render_test_setup import draw_test_setup_screen
         draw_test_setup_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2752,6 +3104,7 @@ class KeyQuestApp:
     def draw_practice_setup(self):
         """Draw sentence practice setup screen."""
         screen_w, screen_h = self._screen_size()
+        from ui.render_test_setup import draw_practice_setup_screen
         draw_practice_setup_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -2784,6 +3137,7 @@ class KeyQuestApp:
         else:
             remaining = t.duration_seconds
 
+        from ui.render_test_active import draw_test_screen
         draw_test_screen(
             screen=self.screen,
             text_font=self.text_font,
@@ -2804,6 +3158,7 @@ class KeyQuestApp:
         t = self.state.test
 
         elapsed_seconds = (time.time() - t.start_time) if t.start_time > 0 else 0.0
+        from ui.render_test_active import draw_practice_screen
         draw_practice_screen(
             screen=self.screen,
             text_font=self.text_font,
@@ -2821,6 +3176,7 @@ class KeyQuestApp:
 
     def draw_results(self):
         screen_w, screen_h = self._screen_size()
+        from ui.render_results import draw_results_screen
         draw_results_screen(
             screen=self.screen,
             title_font=self.title_font,
@@ -0,0 +1,259 @@
+"""Per-keystroke timing capture for lessons, tests, practice, and games.
+
+``KeystrokeRecorder.record()`` writes one fixed-size row (monotonic
+nanosecond timestamp, expected and typed characters, mode, lesson, session,
+correctness) into a preallocated numpy ring buffer, so a keystroke costs a
+single row assignment and memory stays bounded however long the session
+runs. Rows are appended to ``keystrokes.bin`` in bulk when a session ends or
+the buffer fills. The file is a flat array of ``KEYSTROKE_DTYPE`` records and
+is trimmed to its newest rows once it passes ``max_file_records``. When
+progress lives in SQLite, ``store`` is set and rows go to its ``keystrokes``
+table instead. When ``transitions`` is set, each flushed batch also updates
+its digraph latency tables (``modules/transition_stats.py``). When ``defer``
+is set (the app passes ``SaveWorker.defer``), a flush only detaches the
+pending rows; writing them, updating the tables, and saving the tables run
+on that worker, so ending a session does no disk work on the pygame thread.
+
+Characters are stored as code points. Named keys from lesson batches (Tab,
+F5, ...) are stored above the Unicode range; see ``char_code()``.
+"""
+
+import os
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from modules import error_logging
+
+
+KEYSTROKE_FILE = "keystrokes.bin"
+
+KEYSTROKE_DTYPE = np.dtype(
+    [
+        ("t_ns", "<i8"),  # time.monotonic_ns() when the key was processed
+        ("session", "<u4"),  # wall-clock second the session started (unique, see record())
+        ("expected", "<u4"),  # code point (0 when nothing was expected)
+        ("typed", "<u4"),
+        ("lesson", "<i2"),  # lesson number, -1 outside lessons
+        ("mode", "u1"),  # index into MODES
+        ("correct", "u1"),
+    ]
+)
+
+# Append only: the index of each mode is stored in the file.
+MODES = ("lesson", "free_practice", "test", "practice", "game")
+
+# Append only: named keys are stored as NAMED_KEY_BASE + index.
+NAMED_KEYS = (
+    "tab", "backspace", "delete", "insert", "home", "end", "pageup", "pagedown",
+    "f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11", "f12",
+    "capslock", "enter", "space", "escape",
+)
+NAMED_KEY_BASE = 0x110000
+_NAMED_KEY_CODES = {name: NAMED_KEY_BASE + i for i, name in enumerate(NAMED_KEYS)}
+
+# Start a new session after this long without keystrokes in the same context.
+SESSION_GAP_NS = 5 * 60 * 1_000_000_000
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_MAX_FILE_RECORDS = 1_000_000
+
+
+def char_code(text: Optional[str]) -> int:
+    """Return the stored code for a character or named key ("" / None -> 0)."""
+    if not text:
+        return 0
+    if len(text) == 1:
+        return ord(text)
+    return _NAMED_KEY_CODES.get(text.lower(), 0)
+
+
+def code_char(code: int) -> str:
+    """Inverse of char_code()."""
+    code = int(code)
+    if code <= 0:
+        return ""
+    if code >= NAMED_KEY_BASE:
+        index = code - NAMED_KEY_BASE
+        return NAMED_KEYS[index] if index < len(NAMED_KEYS) else ""
+    return chr(code)
+
+
+class KeystrokeRecorder:
+    """Ring buffer of keystroke timing rows with bulk appends to disk."""
+
+    def __init__(
+        self,
+        path: Optional[str] = KEYSTROKE_FILE,
+        capacity: int = DEFAULT_CAPACITY,
+        max_file_records: int = DEFAULT_MAX_FILE_RECORDS,
+        clock=time.monotonic_ns,
+    ):
+        self.path = path
+        self.capacity = max(1, int(capacity))
+        self.max_file_records = max(self.capacity, int(max_file_records))
+        self._clock = clock
+        # ProgressStore to flush into instead of the file (set by the app).
+        self.store = None
+        # TransitionStats fed with every flushed batch (set by the app).
+        self.transitions = None
+        # Runs a callable off the pygame thread, in order (set by the app).
+        self.defer: Optional[Callable[[Callable[[], object]], None]] = None
+        self._buffer = np.zeros(self.capacity, dtype=KEYSTROKE_DTYPE)
+        # Rows [_start, _start + _count) modulo capacity are waiting to be written.
+        self._start = 0
+        self._count = 0
+        self._session = 0
+        self._context = None
+        self._last_ns = 0
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.flush_errors = 0
+
+    @property
+    def pending(self) -> int:
+        return self._count
+
+    def record(self, mode: str, expected: str, typed: str, correct: bool, lesson: int = -1) -> None:
+        """Record one keystroke. ``expected`` / ``typed`` are characters or key names."""
+        now = self._clock()
+        mode_index = MODES.index(mode)
+        context = (mode_index, lesson)
+        if context != self._context or now - self._last_ns > SESSION_GAP_NS:
+            self._context = context
+            # Sessions started within the same second still get distinct ids.
+            self._session = max(int(time.time()), self._session + 1)
+        self._last_ns = now
+
+        if self._count == self.capacity:
+            # Full: write the buffer out, or overwrite the oldest row when that fails.
+            if not self.flush():
+                self._start = (self._start + 1) % self.capacity
+                self._count -= 1
+                self.dropped += 1
+
+        index = (self._start + self._count) % self.capacity
+        self._buffer[index] = (
+            now,
+            self._session,
+            char_code(expected),
+            char_code(typed),
+            lesson,
+            mode_index,
+            1 if correct else 0,
+        )
+        self._count += 1
+        self.recorded += 1
+
+    def pending_rows(self) -> np.ndarray:
+        """Return a copy of the rows not yet written, oldest first."""
+        end = self._start + self._count
+        if end <= self.capacity:
+            return self._buffer[self._start:end].copy()
+        return np.concatenate((self._buffer[self._start:], self._buffer[: end - self.capacity]))
+
+    def flush(self) -> bool:
+        """Append pending rows to the keystroke file. Returns False on failure.
+
+        With ``defer`` set the rows are handed to it and this returns True;
+        a batch that then fails to write is counted in ``dropped``.
+        """
+        if not self._count:
+            return True
+        if not self.path and self.store is None:
+            return False
+        rows = self.pending_rows()
+        if self.defer is not None:
+            self._start = 0
+            self._count = 0
+            self.defer(lambda: self._write_deferred(rows))
+            return True
+        if not self._write_rows(rows):
+            return False
+        self._start = 0
+        self._count = 0
+        return True
+
+    def _write_deferred(self, rows: np.ndarray) -> None:
+        if not self._write_rows(rows):
+            self.dropped += len(rows)
+
+    def _write_rows(self, rows: np.ndarray) -> bool:
+        if self.transitions is not None:
+            # A rebuild from the log must happen before these rows join it.
+            self.transitions.ensure_loaded()
+        if self.store is not None:
+            try:
+                self.store.append_keystrokes(rows)
+            except Exception as e:
+                self.flush_errors += 1
+                error_logging.log_exception(e)
+                return False
+        else:
+            try:
+                with open(self.path, "ab") as f:
+                    # Drop a partial row left by an interrupted write so rows stay aligned.
+                    torn = f.tell() % KEYSTROKE_DTYPE.itemsize
+                    if torn:
+                        f.truncate(f.tell() - torn)
+                        f.seek(0, os.SEEK_END)
+                    rows.tofile(f)
+                self._trim_file()
+            except OSError as e:
+                self.flush_errors += 1
+                error_logging.log_exception(e)
+                return False
+        self.flushed += len(rows)
+        if self.transitions is not None:
+            self.transitions.update(rows)
+        return True
+
+    def end_session(self) -> bool:
+        """Flush at the end of a lesson, test, practice round, or game."""
+        self._context = None
+        flushed = self.flush()
+        if self.transitions is not None:
+            if self.defer is not None:
+                self.defer(self.transitions.save)
+            else:
+                self.transitions.save()
+        return flushed
+
+    def _trim_file(self) -> None:
+        size = os.path.getsize(self.path)
+        records = size // KEYSTROKE_DTYPE.itemsize
+        if records <= self.max_file_records:
+            return
+        # Keep the newest half of the allowance so trimming stays rare.
+        keep = self.max_file_records // 2
+        newest = np.fromfile(
+            self.path,
+            dtype=KEYSTROKE_DTYPE,
+            count=keep,
+            offset=(records - keep) * KEYSTROKE_DTYPE.itemsize,
+        )
+        tmp_path = f"{self.path}.tmp"
+        newest.tofile(tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def stats(self) -> dict:
+        return {
+            "recorded": self.recorded,
+            "pending": self._count,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "flush_errors": self.flush_errors,
+            "buffer_bytes": self._buffer.nbytes,
+        }
+
+
+def load_keystrokes(path: str = KEYSTROKE_FILE) -> np.ndarray:
+    """Load every recorded keystroke row (empty array if there is no file)."""
+    if not path or not os.path.exists(path):
+        return np.zeros(0, dtype=KEYSTROKE_DTYPE)
+    size = os.path.getsize(path)
+    usable = size - size % KEYSTROKE_DTYPE.itemsize
+    # A torn final write leaves a partial row; ignore it.
+    return np.fromfile(path, dtype=KEYSTROKE_DTYPE, count=usable // KEYSTROKE_DTYPE.itemsize)
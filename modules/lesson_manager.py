@@ -7,6 +7,7 @@ import os
 import random
 
 from modules import speech_format
+from modules.weak_keys import WeakKeyGenerator
 
 try:
     os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
@@ -233,9 +234,19 @@ STAGE_PHRASES = {
 }
 
 
-def _stage_allowed_characters(stage: int) -> set[str]:
+# Cumulative keys unlocked through each lesson, built once.
+_STAGE_ALLOWED = []
+for _stage_keys in STAGE_LETTERS:
+    _STAGE_ALLOWED.append(frozenset(_STAGE_ALLOWED[-1] if _STAGE_ALLOWED else ()) | frozenset(_stage_keys))
+
+# Real words drawn from the word index per lesson batch.
+INDEXED_WORDS_PER_BATCH = 40
+MAX_INDEXED_WORD_LENGTH = 8
+
+
+def _stage_allowed_characters(stage: int) -> frozenset[str]:
     """Return all characters that are valid for the given lesson stage."""
-    return set().union(*STAGE_LETTERS[: stage + 1])
+    return _STAGE_ALLOWED[stage]
 
 
 def content_uses_only_introduced_keys(stage: int, text: str) -> bool:
@@ -245,7 +256,22 @@ def content_uses_only_introduced_keys(stage: int, text: str) -> bool:
 
 def filter_stage_content(stage: int, items: list[str]) -> list[str]:
     """Drop authored lesson content that includes keys from future lessons."""
-    return [item for item in items if content_uses_only_introduced_keys(stage, item)]
+    allowed = _stage_allowed_characters(stage)
+    return [item for item in items if allowed.issuperset(item)]
+
+
+def get_indexed_words(keys, count: int = INDEXED_WORDS_PER_BATCH, require=(), min_length: int = 2,
+                      max_length: int = MAX_INDEXED_WORD_LENGTH) -> list[str]:
+    """Random real words typeable with ``keys`` from the packaged word index.
+
+    Returns an empty list when the index has not been built.
+    """
+    from modules import word_index
+
+    index = word_index.get_word_index()
+    if index is None:
+        return []
+    return index.sample(keys, count, require=require, min_length=min_length, max_length=max_length)
 
 
 def get_stage_natural_words(stage: int) -> set[str]:
@@ -369,7 +395,7 @@ def generate_words_from_keys(keys, count=15, use_real_words=True):
     Args:
         keys: List of keys to use for word generation
         count: Number of words to generate (default 15)
-        use_real_words: Whether to attempt to use real words (currently generates random combinations)
+        use_real_words: Whether to mix in real words from the word index (up to half)
 
     Returns:
         List of generated words/strings
@@ -378,7 +404,8 @@ def generate_words_from_keys(keys, count=15, use_real_words=True):
         keys = ['a', 's', 'd', 'f']  # Fallback to home row
 
     keys_list = sorted(list(keys))
-    words = []
+    words = get_indexed_words(keys_list, count // 2) if use_real_words else []
+    count -= len(words)
 
     # Generate random character combinations from the given keys
     for _ in range(count):
@@ -387,6 +414,7 @@ def generate_words_from_keys(keys, count=15, use_real_words=True):
         word = "".join(random.choice(keys_list) for _ in range(length))
         words.append(word)
 
+    random.shuffle(words)
     return words
 
 
@@ -448,12 +476,13 @@ class LessonManager:
     """Manages lesson content generation and progression logic."""
 
     @staticmethod
-    def build_batch(lesson_state, stage: int):
+    def build_batch(lesson_state, stage: int, settings=None):
         """Build a new batch of practice items for the lesson.
 
         Args:
             lesson_state: LessonState object to populate
             stage: Current lesson number (0-based)
+            settings: Optional Settings whose key stats and timing weight the keys
         """
         lesson = lesson_state
 
@@ -478,23 +507,10 @@ class LessonManager:
         batch_size = LESSON_BATCH
         items = []
 
-        # Review mode focuses on struggling keys
+        # Review mode focuses on struggling keys, mixed with all learned keys
         if lesson.review_mode and lesson.review_keys:
-            # Mix struggling keys with all learned keys
-            for _ in range(batch_size):
-                if random.random() < 0.7:  # 70% focus on struggling keys
-                    length = random.randint(2, 3)
-                    word_chars = []
-                    for _ in range(length):
-                        if random.random() < 0.8:
-                            word_chars.append(random.choice(lesson.review_keys))
-                        else:
-                            word_chars.append(random.choice(allowed_list))
-                    items.append("".join(word_chars))
-                else:
-                    # General practice
-                    length = random.randint(2, 4)
-                    items.append("".join(random.choice(allowed_list) for _ in range(length)))
+            generator = WeakKeyGenerator.for_settings(settings, allowed_list, focus=lesson.review_keys)
+            items.extend(generator.words(batch_size, 2, 4))
         else:
             # Normal lesson progression
             # Use phrases if available
@@ -504,38 +520,23 @@ class LessonManager:
                     items.append(random.choice(phrases))
 
             # Use real words if available and use_words is True
-            if stage in STAGE_WORDS and lesson.use_words:
-                words = STAGE_WORDS[stage]
+            words = STAGE_WORDS.get(stage, []) + get_indexed_words(allowed_list) if lesson.use_words else []
+            if words:
                 remaining = batch_size - len(items)
                 for _ in range(remaining):
                     items.append(random.choice(words))
             else:
-                # Generate random character combinations
+                # Generate weighted character combinations
+                new_key_focus = WeakKeyGenerator.for_settings(settings, allowed_list, focus=new_keys_list)
+                balanced = WeakKeyGenerator.for_settings(settings, allowed_list)
                 remaining = batch_size - len(items)
                 for i in range(remaining):
-                    # First 60% of batch: focus heavily on new keys
                     if i < batch_size * 0.6:
-                        # 80% chance to include at least one new key
-                        if random.random() < 0.8 and new_keys_list:
-                            length = random.randint(2, 4)
-                            word_chars = []
-                            # Ensure at least one new key in the word
-                            word_chars.append(random.choice(new_keys_list))
-                            for _ in range(length - 1):
-                                if random.random() < 0.5:
-                                    word_chars.append(random.choice(new_keys_list))
-                                else:
-                                    word_chars.append(random.choice(allowed_list))
-                            random.shuffle(word_chars)
-                            items.append("".join(word_chars))
-                        else:
-                            # Mix of new and old keys
-                            length = random.randint(2, 4)
-                            items.append("".join(random.choice(allowed_list) for _ in range(length)))
+                        # First 60% of batch: focus heavily on new keys
+                        items.append(new_key_focus.word(random.randint(2, 4)))
                     else:
-                        # Last 40%: balanced mix
-                        length = random.randint(2, 5)
-                        items.append("".join(random.choice(allowed_list) for _ in range(length)))
+                        # Last 40%: balanced mix, still leaning on weak keys
+                        items.append(balanced.word(random.randint(2, 5)))
 
         lesson.batch_words = items
         lesson.index = 0
@@ -564,12 +565,13 @@ class LessonManager:
             return (False, f"Type {speakable}")
 
     @staticmethod
-    def extend_practice(lesson_state, stage: int):
+    def extend_practice(lesson_state, stage: int, settings=None):
         """Extend lesson with additional practice items for struggling students.
 
         Args:
             lesson_state: LessonState object to extend
             stage: Current lesson number
+            settings: Optional Settings whose key stats and timing weight the keys
         """
         lesson = lesson_state
         allowed = set().union(*STAGE_LETTERS[:stage + 1])
@@ -581,40 +583,22 @@ class LessonManager:
         # Add 5-10 more items (depending on how much room we have left)
         items_to_add = min(10, MAX_LESSON_BATCH - len(lesson.batch_words))
 
-        new_items = []
-        for _ in range(items_to_add):
-            if struggling:
-                # 60% chance to focus on struggling keys
-                if random.random() < 0.6:
-                    # Mix struggling keys with some good keys
-                    length = random.randint(2, 3)
-                    word_chars = []
-                    for _ in range(length):
-                        if random.random() < 0.7:
-                            word_chars.append(random.choice(struggling))
-                        else:
-                            word_chars.append(random.choice(allowed_list))
-                    new_items.append("".join(word_chars))
-                else:
-                    # Easier practice with all available keys
-                    length = random.randint(2, 4)
-                    new_items.append("".join(random.choice(allowed_list) for _ in range(length)))
-            else:
-                # General practice
-                length = random.randint(2, 4)
-                new_items.append("".join(random.choice(allowed_list) for _ in range(length)))
+        # Struggling keys take a fixed share of the characters
+        generator = WeakKeyGenerator.for_settings(settings, allowed_list, focus=struggling)
+        new_items = generator.words(max(0, items_to_add), 2, 4)
 
         # Add to end of batch
         lesson.batch_words.extend(new_items)
 
     @staticmethod
-    def inject_adaptive_content(lesson_state, stage: int, current_index: int):
+    def inject_adaptive_content(lesson_state, stage: int, current_index: int, settings=None):
         """Dynamically adjust lesson difficulty mid-batch based on real-time performance.
 
         Args:
             lesson_state: LessonState object
             stage: Current lesson number
             current_index: Current position in batch
+            settings: Optional Settings whose key stats and timing weight the keys
         """
         lesson = lesson_state
 
@@ -645,6 +629,15 @@ class LessonManager:
                     word = "".join(random.choice(good_keys) for _ in range(length))
                     easier_words.append(word)
 
+                # Then two with one struggling key, weakest (long-term) most often
+                struggling_keys = WeakKeyGenerator.for_settings(settings, struggling)
+                for _ in range(2):
+                    length = random.randint(2, 3)
+                    word_chars = [random.choice(good_keys) for _ in range(length - 1)]
+                    word_chars.append(struggling_keys.key())
+                    random.shuffle(word_chars)
+                    easier_words.append("".join(word_chars))
+
                 # Inject these easier words into the batch after current position
                 insert_position = current_index + 1
                 for i, word in enumerate(easier_words):
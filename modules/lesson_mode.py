@@ -18,7 +18,9 @@ from modules import lesson_manager
 from modules import quest_manager
 from modules import results_formatter
 from modules import speech_format
+from modules import state_manager
 from modules import xp_manager
+from modules.weak_keys import WeakKeyGenerator
 
 # Star-rating thresholds
 _STARS_3_ACCURACY = 95.0
@@ -124,19 +126,33 @@ def build_lesson_batch(app) -> None:
         stage,
         lesson_manager.STAGE_WORDS.get(stage, []),
     )
+    if lesson_state.use_words:
+        # Real words from the word index; early lessons keep 3-4 key targets.
+        valid_words += lesson_manager.get_indexed_words(
+            allowed_list,
+            min_length=3 if early_stage else 2,
+            max_length=4 if early_stage else lesson_manager.MAX_INDEXED_WORD_LENGTH,
+        )
 
     struggling = lesson_state.tracker.get_struggling_keys()
+    settings = app.state.settings
     batch = []
 
     if lesson_state.review_mode and struggling:
         lesson_state.review_keys = struggling[:3]
+        # Long-term misses and slow transitions decide which review key comes up most.
+        review = WeakKeyGenerator.for_settings(settings, lesson_state.review_keys)
+        review_words = lesson_manager.get_indexed_words(allowed_list, require=lesson_state.review_keys)
         for _ in range(lesson_manager.LESSON_BATCH):
+            if review_words and random.random() < 0.4:
+                batch.append(random.choice(review_words))
+                continue
             length = random.randint(3, 4) if early_stage else random.randint(1, 3)
-            word = "".join(random.choice(lesson_state.review_keys) for _ in range(length))
-            batch.append(word)
+            batch.append(review.word(length))
     elif early_stage:
         batch = _build_front_loaded_early_batch(stage, allowed_list, valid_words, valid_phrases)
     else:
+        weighted = WeakKeyGenerator.for_settings(settings, allowed_list)
         for _ in range(lesson_manager.LESSON_BATCH):
             roll = random.random()
             target = None
@@ -154,7 +170,7 @@ def build_lesson_batch(app) -> None:
                     )
                     target = "".join(random.choice(subset) for _ in range(length))
                 else:
-                    target = "".join(random.choice(allowed_list) for _ in range(length))
+                    target = weighted.word(length)
 
             if early_stage:
                 target = _normalize_early_target(target, allowed_list)
@@ -194,22 +210,8 @@ def extend_lesson_practice(app) -> None:
     struggling = lesson_state.tracker.get_struggling_keys()
     items_to_add = min(10, lesson_manager.MAX_LESSON_BATCH - len(lesson_state.batch_words))
 
-    new_items = []
-    for _ in range(items_to_add):
-        if struggling and random.random() < 0.6:
-            length = random.randint(2, 3)
-            word_chars = []
-            for _ in range(length):
-                if random.random() < 0.7:
-                    word_chars.append(random.choice(struggling))
-                else:
-                    word_chars.append(random.choice(allowed_list))
-            new_items.append("".join(word_chars))
-        else:
-            length = random.randint(2, 4)
-            new_items.append("".join(random.choice(allowed_list) for _ in range(length)))
-
-    lesson_state.batch_words.extend(new_items)
+    generator = WeakKeyGenerator.for_settings(app.state.settings, allowed_list, focus=struggling)
+    lesson_state.batch_words.extend(generator.words(max(0, items_to_add), 2, 4))
     app.speech.say("Let's practice a bit more.", priority=True, protect_seconds=2.0)
     pygame.time.wait(1500)
 
@@ -245,10 +247,11 @@ def check_and_inject_adaptive_content(app) -> None:
         word = "".join(random.choice(good_keys) for _ in range(length))
         easier_words.append(word)
 
+    struggling_keys = WeakKeyGenerator.for_settings(app.state.settings, struggling)
     for _ in range(2):
         length = random.randint(2, 3)
         word_chars = [random.choice(good_keys) for _ in range(length - 1)]
-        word_chars.append(random.choice(struggling))
+        word_chars.append(struggling_keys.key())
         random.shuffle(word_chars)
         easier_words.append("".join(word_chars))
 
@@ -318,6 +321,9 @@ def evaluate_lesson_performance(app) -> None:
     _require_pygame()
     lesson_state = app.state.lesson
     lesson_state.end_time = time.time()
+    recorder = getattr(app, "keystrokes", None)
+    if recorder is not None:
+        recorder.end_session()
 
     app.audio.play_victory()
 
@@ -335,14 +341,17 @@ def evaluate_lesson_performance(app) -> None:
     prev_stars = app.state.settings.lesson_stars.get(lesson_state.stage, 0)
     if stars > prev_stars:
         app.state.settings.lesson_stars[lesson_state.stage] = stars
+        state_manager.mark_changed(app.state.settings, "lesson_stars", lesson_state.stage)
 
     prev_wpm = app.state.settings.lesson_best_wpm.get(lesson_state.stage, 0.0)
     if wpm > prev_wpm:
         app.state.settings.lesson_best_wpm[lesson_state.stage] = wpm
+        state_manager.mark_changed(app.state.settings, "lesson_best_wpm", lesson_state.stage)
 
     prev_accuracy = app.state.settings.lesson_best_accuracy.get(lesson_state.stage, 0.0)
     if accuracy > prev_accuracy:
         app.state.settings.lesson_best_accuracy[lesson_state.stage] = accuracy
+        state_manager.mark_changed(app.state.settings, "lesson_best_accuracy", lesson_state.stage)
 
     app.state.settings.total_lessons_completed += 1
     app.state.settings.total_practice_time += duration
@@ -354,6 +363,9 @@ def evaluate_lesson_performance(app) -> None:
     for badge_id in new_badges:
         app.state.settings.earned_badges.add(badge_id)
         app.state.settings.badge_notifications.append(badge_id)
+    if new_badges:
+        state_manager.mark_changed(app.state.settings, "earned_badges")
+        state_manager.mark_changed(app.state.settings, "badge_notifications")
 
     xp_earned = xp_manager.XP_AWARDS["lesson"]
     xp_earned += total_correct * xp_manager.XP_AWARDS["keystroke"]
@@ -444,6 +456,7 @@ def evaluate_lesson_performance(app) -> None:
         next_lesson = min(lesson_state.stage + 1, len(lesson_manager.STAGE_LETTERS) - 1)
         if next_lesson not in app.state.settings.unlocked_lessons:
             app.state.settings.unlocked_lessons.add(next_lesson)
+            state_manager.mark_changed(app.state.settings, "unlocked_lessons")
             unlocked_new = True
             next_name = (
                 lesson_manager.LESSON_NAMES[next_lesson]
@@ -586,6 +599,15 @@ def handle_lesson_input(app, event, mods: int) -> None:
         process_lesson_typing(app, event)
 
 
+def _record_timing(app, expected: str, typed: str, correct: bool) -> None:
+    """Log the keystroke's timing for hesitation / latency analysis."""
+    recorder = getattr(app, "keystrokes", None)
+    if recorder is None:
+        return
+    mode = "free_practice" if app.state.mode == "FREE_PRACTICE" else "lesson"
+    recorder.record(mode, expected, typed, correct, app.state.lesson.stage)
+
+
 def process_lesson_typing(app, event) -> None:
     _require_pygame()
     target = app.current_word()
@@ -599,12 +621,14 @@ def process_lesson_typing(app, event) -> None:
                 app.trigger_flash((0, 80, 0), 0.12)
                 lesson_state.tracker.record_keystroke(target, True)
                 key_analytics.record_keystroke(app.state.settings, target.lower(), True)
+                _record_timing(app, target, pressed_key_name, True)
                 next_lesson_item(app)
                 return
             app.audio.beep_bad()
             app.trigger_flash((100, 0, 0), 0.12)
             lesson_state.tracker.record_keystroke(pressed_key_name, False)
             key_analytics.record_keystroke(app.state.settings, pressed_key_name.lower(), False)
+            _record_timing(app, target, pressed_key_name, False)
             app.speech.say(f"That was {pressed_key_name}. Try {target}.", priority=True)
         return
 
@@ -624,6 +648,7 @@ def process_lesson_typing(app, event) -> None:
         app.trigger_flash((100, 0, 0), 0.12)
         lesson_state.tracker.record_keystroke(ch, False)
         key_analytics.record_keystroke(app.state.settings, ch.lower(), False)
+        _record_timing(app, target[len(typed) - 1] if len(typed) <= len(target) else "", ch, False)
         lesson_state.typed = typed[:-1]
         lesson_state.errors_in_row += 1
         app.provide_key_guidance(ch, target, lesson_state.typed)
@@ -635,6 +660,7 @@ def process_lesson_typing(app, event) -> None:
     lesson_state.hint_message = ""
     lesson_state.tracker.record_keystroke(ch, True)
     key_analytics.record_keystroke(app.state.settings, ch.lower(), True)
+    _record_timing(app, ch, ch, True)
 
     if typed == target:
         app.audio.play_success()
@@ -1,12 +1,14 @@
 from modules import badge_manager
 from modules import currency_manager
 from modules import quest_manager
+from modules import state_manager
 
 
 def show_badge_notifications(app) -> None:
     """Show any pending badge unlock notifications."""
     while app.state.settings.badge_notifications:
         badge_id = app.state.settings.badge_notifications.pop(0)
+        state_manager.mark_changed(app.state.settings, "badge_notifications")
         badge = badge_manager.get_badge_info(badge_id)
 
         message = (
@@ -57,6 +59,7 @@ def show_quest_notifications(app) -> None:
     """Show any pending quest completion notifications."""
     while app.state.settings.quest_notifications:
         quest_id = app.state.settings.quest_notifications.pop(0)
+        state_manager.mark_changed(app.state.settings, "quest_notifications")
 
         message = quest_manager.format_quest_completion(quest_id)
 
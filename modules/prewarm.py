@@ -0,0 +1,164 @@
+"""Background prewarming of game and practice assets.
+
+Several screens load something the first time they open: Hangman opens its
+dictionary in ``_choose_word``, every game effect is synthesized (or read
+from the disk cache) the first time it plays, and lessons open the word
+index. ``PrewarmScheduler`` runs those loads on one background thread once
+the main menu is up, highest priority first, so they are usually done
+before the learner gets there.
+
+When the learner does get there first, the screen calls ``ensure(name)``:
+a task that has not started yet runs right away on the calling thread, and
+one already running on the worker is waited for. Either way it runs once.
+A screen that can start without a task (games build any effect they play
+on demand) calls ``promote(name)`` instead, which moves the task to the
+front of the background queue without waiting for it.
+``cancel()`` drops whatever has not started and stops the thread; the app
+calls it on quit.
+"""
+
+import heapq
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from modules import error_logging
+
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class PrewarmScheduler:
+    """Run named warm-up tasks once each, on a background thread or on demand."""
+
+    def __init__(self, clock=time.perf_counter):
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[int, int, str]] = []
+        self._tasks: Dict[str, Callable[[], None]] = {}
+        self._states: Dict[str, str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = False
+        self.timings_ms: Dict[str, float] = {}
+        self.waited_ms = 0.0
+
+    def add(self, name: str, task: Callable[[], None], priority: int = 0) -> None:
+        """Register ``task`` under ``name``; lower priorities run first."""
+        with self._cond:
+            if name in self._tasks:
+                raise ValueError(f"Prewarm task {name!r} is already registered")
+            self._tasks[name] = task
+            self._states[name] = PENDING
+            heapq.heappush(self._queue, (priority, len(self._tasks), name))
+            self._cond.notify()
+
+    def start(self) -> None:
+        """Start the background thread (once)."""
+        with self._cond:
+            if self._thread is not None or self._cancelled:
+                return
+            self._thread = threading.Thread(target=self._run, name="KeyQuestPrewarm", daemon=True)
+        self._thread.start()
+
+    def ensure(self, *names: str, timeout: Optional[float] = None) -> bool:
+        """Make sure ``names`` have run, running or waiting for them as needed.
+
+        Unknown names count as done. Returns False if a task failed or the
+        wait timed out; callers then load the asset themselves as before.
+        """
+        started = self._clock()
+        ok = True
+        for name in names:
+            with self._cond:
+                run_here = self._states.get(name) in (PENDING, CANCELLED)
+                if run_here:
+                    # Not started: run it here rather than queue behind others.
+                    self._states[name] = RUNNING
+                deadline = None if timeout is None else started + timeout
+                while not run_here and self._states.get(name) == RUNNING:
+                    remaining = None if deadline is None else deadline - self._clock()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                state = self._states.get(name, DONE)
+            if run_here:
+                state = self._run_task(name)
+            ok = ok and state == DONE
+        self.waited_ms += (self._clock() - started) * 1000.0
+        return ok
+
+    def promote(self, *names: str) -> None:
+        """Run ``names`` next on the background thread, if they have not started."""
+        with self._cond:
+            front = min((entry[0] for entry in self._queue), default=0) - 1
+            for name in names:
+                if self._states.get(name) == PENDING:
+                    # The old queue entry is skipped once this one has run.
+                    heapq.heappush(self._queue, (front, 0, name))
+            self._cond.notify()
+
+    def cancel(self, timeout: Optional[float] = 2.0) -> bool:
+        """Drop tasks that have not started and stop the thread. False if it timed out."""
+        with self._cond:
+            self._cancelled = True
+            for name, state in self._states.items():
+                if state == PENDING:
+                    self._states[name] = CANCELLED
+            self._queue.clear()
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def names(self) -> List[str]:
+        with self._cond:
+            return list(self._tasks)
+
+    def state(self, name: str) -> Optional[str]:
+        with self._cond:
+            return self._states.get(name)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                name = None
+                while self._queue and name is None:
+                    _, _, candidate = heapq.heappop(self._queue)
+                    if self._states.get(candidate) == PENDING:
+                        name = candidate
+                if name is None or self._cancelled:
+                    return
+                self._states[name] = RUNNING
+            self._run_task(name)
+
+    def _run_task(self, name: str) -> str:
+        started = self._clock()
+        try:
+            self._tasks[name]()
+        except Exception as e:
+            error_logging.log_exception(e)
+            state = FAILED
+        else:
+            state = DONE
+        with self._cond:
+            self.timings_ms[name] = (self._clock() - started) * 1000.0
+            self._states[name] = state
+            self._cond.notify_all()
+        return state
+
+    def stats(self) -> dict:
+        with self._cond:
+            done = sum(1 for state in self._states.values() if state == DONE)
+            return {
+                "tasks": len(self._states),
+                "done": done,
+                "failed": sum(1 for state in self._states.values() if state == FAILED),
+                "busy_ms": sum(self.timings_ms.values()),
+                "waited_ms": self.waited_ms,
+            }
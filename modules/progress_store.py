@@ -0,0 +1,349 @@
+"""SQLite progress and analytics store.
+
+An optional alternative to ``progress.json`` for long-lived profiles. Session
+history, per-key stats, and keystroke timing rows get their own tables, so
+history is not capped and dashboard queries are indexed range scans instead
+of walks over one JSON list. ``dashboard_days`` also keeps one row per day,
+so a save touches only the days that changed. Every other progress field is
+a row in ``progress`` holding its JSON value.
+
+``ProgressManager(database=...)`` owns the store: it imports an existing
+``progress.json`` on first use and turns each save into a transaction that
+touches only changed rows. The dashboard reaches the store through
+``Settings.history_store``.
+
+The database runs in WAL mode so readers never wait on a save. One
+connection is shared under a lock, so the store can be used from a
+background thread.
+"""
+
+import json
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from modules.keystroke_log import KEYSTROKE_DTYPE
+
+
+PROGRESS_DB_FILE = "progress.db"
+STORE_SCHEMA_VERSION = 2
+
+# Progress fields that live in their own tables rather than in ``progress``.
+SESSION_FIELD = "session_history"
+KEY_STATS_FIELD = "key_stats"
+DASHBOARD_DAYS_FIELD = "dashboard_days"
+# Dict fields stored one entry per row, in a table named after the field.
+KEYED_FIELDS = (KEY_STATS_FIELD, DASHBOARD_DAYS_FIELD)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    field TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL DEFAULT '',
+    wpm REAL NOT NULL DEFAULT 0,
+    accuracy REAL NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions (date);
+CREATE INDEX IF NOT EXISTS idx_sessions_type_date ON sessions (type, date);
+CREATE TABLE IF NOT EXISTS key_stats (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS dashboard_days (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keystrokes (
+    t_ns INTEGER NOT NULL,
+    session INTEGER NOT NULL,
+    expected INTEGER NOT NULL,
+    typed INTEGER NOT NULL,
+    lesson INTEGER NOT NULL,
+    mode INTEGER NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_keystrokes_session ON keystrokes (session);
+"""
+
+
+def _number(value) -> float:
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else 0.0
+
+
+def _session_row(session: dict) -> tuple:
+    return (
+        str(session.get("date", "") or ""),
+        str(session.get("type", "") or ""),
+        str(session.get("timestamp", "") or ""),
+        _number(session.get("wpm")),
+        _number(session.get("accuracy")),
+        _number(session.get("duration")),
+        json.dumps(session),
+    )
+
+
+class ProgressStore:
+    """SQLite tables for progress fields, sessions, key stats, and keystrokes."""
+
+    def __init__(self, path: str = PROGRESS_DB_FILE):
+        # Imported here so progress.json users never load sqlite3.
+        import sqlite3
+
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+            self._split_keyed_fields()
+            self._conn.execute(f"PRAGMA user_version = {STORE_SCHEMA_VERSION}")
+
+    # ---- progress document ----
+
+    def is_empty(self) -> bool:
+        """True until progress has been imported or saved."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM progress LIMIT 1").fetchone()
+        return row is None
+
+    def load_progress(self, history_limit: int = 100) -> dict:
+        """Return progress as a ``progress.json``-shaped dict.
+
+        ``session_history`` holds only the newest ``history_limit`` sessions;
+        older ones stay in the table for the dashboard queries.
+        """
+        with self._lock:
+            data = {name: json.loads(value) for name, value in self._conn.execute("SELECT field, value FROM progress")}
+            for name in KEYED_FIELDS:
+                data[name] = self._load_entries(name)
+            data[SESSION_FIELD] = self.recent_sessions(history_limit)
+        return data
+
+    def load_fields(self, names: Iterable[str], history_limit: int = 100) -> dict:
+        """Return just the named progress fields (one section's worth)."""
+        names = list(names)
+        plain = [name for name in names if name != SESSION_FIELD and name not in KEYED_FIELDS]
+        data = {}
+        with self._lock:
+            if plain:
+                placeholders = ", ".join("?" for _ in plain)
+                rows = self._conn.execute(
+                    f"SELECT field, value FROM progress WHERE field IN ({placeholders})", plain
+                )
+                data.update((name, json.loads(value)) for name, value in rows)
+            for name in KEYED_FIELDS:
+                if name in names:
+                    data[name] = self._load_entries(name)
+            if SESSION_FIELD in names:
+                data[SESSION_FIELD] = self.recent_sessions(history_limit)
+        return data
+
+    def replace_progress(self, data: dict) -> None:
+        """Overwrite everything except keystrokes with ``data``."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM progress")
+                self._conn.execute("DELETE FROM sessions")
+                for name in KEYED_FIELDS:
+                    self._conn.execute(f"DELETE FROM {name}")
+                for name, value in data.items():
+                    if name == SESSION_FIELD:
+                        self._insert_sessions(value)
+                    elif name in KEYED_FIELDS:
+                        self._upsert_entries(name, value)
+                    else:
+                        self._set_field(name, value)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def apply_ops(self, ops: List[dict]) -> None:
+        """Apply ProgressManager journal ops in one transaction.
+
+        Sessions are only ever added here: an ``append`` op's front trimming
+        applies to the in-memory list, not to the stored history, and a
+        ``set`` op adds just the sessions the table does not hold yet.
+        Only ``replace_progress()`` deletes stored sessions.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for op in ops:
+                    self._apply_op(op)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _apply_op(self, op: dict) -> None:
+        kind = op["op"]
+        name = op["key"]
+        if name == SESSION_FIELD:
+            if kind == "append":
+                self._insert_sessions(op["items"])
+            elif kind == "set":
+                self._insert_missing_sessions(op["value"] or [])
+        elif name in KEYED_FIELDS:
+            if kind == "merge":
+                self._upsert_entries(name, op["set"])
+                self._conn.executemany(f"DELETE FROM {name} WHERE key = ?", [(key,) for key in op["del"]])
+            elif kind == "set":
+                self._conn.execute(f"DELETE FROM {name}")
+                self._upsert_entries(name, op["value"] or {})
+        else:
+            value = self._get_field(name)
+            if kind == "append":
+                items = list(value or []) + list(op["items"])
+                keep = int(op["keep"])
+                value = items[len(items) - keep:] if keep else []
+            elif kind == "merge":
+                value = dict(value or {})
+                value.update(op["set"])
+                for removed in op["del"]:
+                    value.pop(removed, None)
+            else:
+                value = op["value"]
+            self._set_field(name, value)
+
+    def _get_field(self, name: str):
+        row = self._conn.execute("SELECT value FROM progress WHERE field = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set_field(self, name: str, value) -> None:
+        self._conn.execute(
+            "INSERT INTO progress (field, value) VALUES (?, ?) "
+            "ON CONFLICT(field) DO UPDATE SET value = excluded.value",
+            (name, json.dumps(value)),
+        )
+
+    def _insert_sessions(self, sessions: Iterable[dict]) -> None:
+        self._conn.executemany(
+            "INSERT INTO sessions (date, type, timestamp, wpm, accuracy, duration, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [_session_row(session) for session in sessions if isinstance(session, dict)],
+        )
+
+    def _insert_missing_sessions(self, sessions: Iterable[dict]) -> None:
+        """Insert the sessions not stored yet, matched by timestamp and content."""
+        sessions = [session for session in sessions if isinstance(session, dict)]
+        stored = set()
+        stamps = sorted({_session_row(session)[2] for session in sessions})
+        for start in range(0, len(stamps), 500):
+            chunk = stamps[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            stored.update(
+                self._conn.execute(f"SELECT timestamp, data FROM sessions WHERE timestamp IN ({placeholders})", chunk)
+            )
+        missing = []
+        for session in sessions:
+            row = _session_row(session)
+            if (row[2], row[-1]) not in stored:
+                stored.add((row[2], row[-1]))
+                missing.append(session)
+        self._insert_sessions(missing)
+
+    def _load_entries(self, name: str) -> dict:
+        rows = self._conn.execute(f"SELECT key, data FROM {name} ORDER BY key")
+        return {key: json.loads(value) for key, value in rows}
+
+    def _upsert_entries(self, name: str, entries: Dict[str, object]) -> None:
+        self._conn.executemany(
+            f"INSERT INTO {name} (key, data) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET data = excluded.data",
+            [(str(key), json.dumps(value)) for key, value in entries.items()],
+        )
+
+    def _split_keyed_fields(self) -> None:
+        """Move keyed fields stored whole in ``progress`` (schema 1) into their tables."""
+        for name in KEYED_FIELDS:
+            value = self._get_field(name)
+            if value is None:
+                continue
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if isinstance(value, dict):
+                    self._upsert_entries(name, value)
+                self._conn.execute("DELETE FROM progress WHERE field = ?", (name,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    # ---- session queries ----
+
+    def sessions_since(self, date_text: str, activity_type: Optional[str] = None) -> List[dict]:
+        """Sessions dated ``date_text`` (YYYY-MM-DD) or later, oldest first."""
+        with self._lock:
+            if activity_type is None:
+                rows = self._conn.execute("SELECT data FROM sessions WHERE date >= ? ORDER BY id", (date_text,))
+            else:
+                rows = self._conn.execute(
+                    "SELECT data FROM sessions WHERE type = ? AND date >= ? ORDER BY id",
+                    (activity_type, date_text),
+                )
+            return [json.loads(data) for (data,) in rows]
+
+    def recent_sessions(self, limit: int) -> List[dict]:
+        """The newest ``limit`` sessions, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM sessions ORDER BY id DESC LIMIT ?", (max(0, int(limit)),))
+            sessions = [json.loads(data) for (data,) in rows]
+        sessions.reverse()
+        return sessions
+
+    def count_sessions(self, min_accuracy: float = 0.0) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM sessions WHERE accuracy >= ?", (min_accuracy,)).fetchone()
+        return int(row[0])
+
+    # ---- keystroke timings ----
+
+    def append_keystrokes(self, rows: np.ndarray) -> None:
+        """Insert ``KEYSTROKE_DTYPE`` rows from keystroke_log."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO keystrokes (t_ns, session, expected, typed, lesson, mode, correct) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows.tolist(),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def load_keystrokes(self, since_session: int = 0) -> np.ndarray:
+        """Keystroke rows from sessions starting at ``since_session`` or later."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT t_ns, session, expected, typed, lesson, mode, correct FROM keystrokes "
+                "WHERE session >= ? ORDER BY rowid",
+                (int(since_session),),
+            ).fetchall()
+        return np.array([tuple(row) for row in rows], dtype=KEYSTROKE_DTYPE)
+
+    # ---- maintenance ----
+
+    def checkpoint(self) -> bool:
+        """Fold the WAL into the main database file (called on clean exit).
+
+        Returns False when another connection kept the WAL busy, so the
+        ``-wal`` file still holds commits the main file does not.
+        """
+        with self._lock:
+            busy, _, _ = self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        return not busy
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,7 @@
 """Quest definitions and quest-progress helpers."""
 
+from modules import state_manager
+
 # =========== Quest Definitions ===========
 
 QUESTS = {
@@ -111,6 +113,7 @@ def initialize_quests(settings):
                     "progress": 0,
                     "started_date": ""
                 }
+                state_manager.mark_changed(settings, "active_quests", quest_id)
 
 
 def get_quest_info(quest_id: str) -> dict:
@@ -216,6 +219,8 @@ def update_quest_progress(settings, quest_id: str, progress_data: dict) -> dict:
         current_progress = three_star_count
         settings.active_quests[quest_id]["progress"] = current_progress
 
+    state_manager.mark_changed(settings, "active_quests", quest_id)
+
     # Check if completed
     target_value = target.get("count", target.get("wpm", target.get("duration", 1)))
     completed = current_progress >= target_value
@@ -223,6 +228,8 @@ def update_quest_progress(settings, quest_id: str, progress_data: dict) -> dict:
     if completed and quest_id not in settings.completed_quests:
         settings.completed_quests.add(quest_id)
         settings.quest_notifications.append(quest_id)
+        state_manager.mark_changed(settings, "completed_quests")
+        state_manager.mark_changed(settings, "quest_notifications")
         return {"updated": True, "completed": True, "progress": current_progress}
 
     return {"updated": True, "completed": False, "progress": current_progress}
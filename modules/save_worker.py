@@ -0,0 +1,157 @@
+"""Background writer for progress saves.
+
+``KeyQuestApp.save_progress()`` used to write progress on the pygame thread,
+so a slow disk or a network-redirected profile folder stalled the frame that
+plays results and celebration sounds. The app now collects what changed
+(``ProgressManager.changes()``, fresh JSON-shaped journal ops) and hands it
+to ``SaveWorker.submit()``, which returns immediately. The worker thread
+writes it with ``ProgressManager.write()``; payloads submitted while a write
+is running are combined with ``merge`` (the app concatenates op lists), or
+replace each other when there is no ``merge``, so a burst of saves becomes
+one write. ``defer()`` runs other disk work on the same thread
+(keystroke batches, latency tables), in order and never coalesced. ``close()`` writes whatever is still pending and stops
+the thread; the app calls it before exiting. Writes never overlap: saves
+submitted after ``close()`` go to the thread until it has exited, and only
+then are written on the caller's thread.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from modules import error_logging
+
+
+class SaveWorker:
+    """Write progress on a background thread, coalescing queued saves."""
+
+    def __init__(
+        self,
+        write: Callable[[Any], None],
+        clock=time.perf_counter,
+        merge: Optional[Callable[[Any, Any], Any]] = None,
+    ):
+        self._write = write
+        self._clock = clock
+        self._merge = merge
+        self._cond = threading.Condition()
+        self._pending: Optional[Any] = None
+        self._tasks: "deque[Callable[[], object]]" = deque()
+        self._writing = False
+        self._closed = False
+        self._exited = False
+        self.submitted = 0
+        self.written = 0
+        self.coalesced = 0
+        self.failures = 0
+        self.last_latency_ms = 0.0
+        self.last_error = ""
+        self._thread = threading.Thread(target=self._run, name="KeyQuestSaveWorker", daemon=True)
+        self._thread.start()
+
+    def submit(self, snapshot: Any) -> None:
+        """Queue a save; merges with (or replaces) one that has not started yet."""
+        with self._cond:
+            if not self._exited:
+                # After close() timed out, the thread is still running and
+                # writes this before it exits.
+                if self._pending is not None:
+                    self.coalesced += 1
+                    if self._merge is not None:
+                        snapshot = self._merge(self._pending, snapshot)
+                self._pending = snapshot
+                self.submitted += 1
+                self._cond.notify()
+                return
+        # Late saves after the thread has exited are written synchronously,
+        # outside the lock; nothing else is writing by then.
+        self._write_one(snapshot)
+
+    def defer(self, task: Callable[[], object]) -> None:
+        """Run ``task`` on the worker thread after the tasks deferred before it."""
+        with self._cond:
+            if not self._exited:
+                self._tasks.append(task)
+                self._cond.notify()
+                return
+        self._run_task(task)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted snapshot and deferred task is done. False on timeout."""
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while self._pending is not None or self._tasks or self._writing:
+                remaining = None if deadline is None else deadline - self._clock()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> bool:
+        """Write anything pending and stop the thread.
+
+        Returns False if the thread was still writing at the timeout; it
+        keeps running and writes the rest, so the caller must not touch the
+        progress files meanwhile.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    @property
+    def busy(self) -> bool:
+        with self._cond:
+            return self._pending is not None or bool(self._tasks) or self._writing
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None and not self._tasks and not self._closed:
+                    self._cond.wait()
+                if self._pending is None and not self._tasks:
+                    self._exited = True
+                    return
+                snapshot, self._pending = self._pending, None
+                task = self._tasks.popleft() if snapshot is None else None
+                self._writing = True
+            try:
+                if snapshot is not None:
+                    self._write_one(snapshot)
+                else:
+                    self._run_task(task)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    @staticmethod
+    def _run_task(task: Callable[[], object]) -> None:
+        try:
+            task()
+        except Exception as e:
+            error_logging.log_exception(e)
+
+    def _write_one(self, snapshot: Any) -> None:
+        started = self._clock()
+        try:
+            self._write(snapshot)
+        except Exception as e:
+            self.failures += 1
+            self.last_error = f"{type(e).__name__}: {e}"
+            error_logging.log_exception(e)
+        else:
+            self.written += 1
+        self.last_latency_ms = (self._clock() - started) * 1000.0
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "last_latency_ms": self.last_latency_ms,
+            "last_error": self.last_error,
+        }
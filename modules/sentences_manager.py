@@ -15,16 +15,42 @@ DEFAULT_SPEED_TEST_SENTENCES = [
 ]
 
 
+# path -> (modification time, size, sentences); see preload_sentence_files().
+_SENTENCE_FILE_CACHE = {}
+
+
 def _load_sentences_file(file_path: str):
+    stat = os.stat(file_path)
+    cached = _SENTENCE_FILE_CACHE.get(file_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return list(cached[2])
+
     sentences = []
     with open(file_path, "r", encoding="utf-8") as file:
         for line in file:
             line = line.strip()
             if line:
                 sentences.append(line)
+    _SENTENCE_FILE_CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, tuple(sentences))
     return sentences
 
 
+def preload_sentence_files(app_dir: str = "") -> int:
+    """Read every Sentences/*.txt file into the cache. Returns the file count.
+
+    Files edited afterwards are read again on their next load.
+    """
+    sentences_dir = os.path.join(app_dir or get_app_dir(), "Sentences")
+    if not os.path.isdir(sentences_dir):
+        return 0
+    count = 0
+    for entry in os.listdir(sentences_dir):
+        if entry.lower().endswith(".txt"):
+            _load_sentences_file(os.path.join(sentences_dir, entry))
+            count += 1
+    return count
+
+
 def get_sentence_topics_from_folder(app_dir: str = ""):
     """Load available practice topics from Sentences/*.txt filenames."""
     app_dir = app_dir or get_app_dir()
@@ -6,6 +6,8 @@ on sound packs, themes, power-ups, pet items, and music.
 
 from typing import Dict, List, Optional
 
+from modules import state_manager
+
 
 # Shop item definitions
 SHOP_ITEMS = {
@@ -297,10 +299,12 @@ def purchase_item(settings, item_id: str) -> tuple[bool, str]:
         if item_id not in settings.inventory:
             settings.inventory[item_id] = 0
         settings.inventory[item_id] += 1
+        state_manager.mark_changed(settings, "inventory", item_id)
         return True, f"Purchased {item['name']}! You now have {settings.inventory[item_id]}."
     else:
         # For permanent items, add to owned_items
         settings.owned_items.add(item_id)
+        state_manager.mark_changed(settings, "owned_items")
         return True, f"Purchased {item['name']}!"
 
 
@@ -321,6 +325,7 @@ def use_consumable(settings, item_id: str) -> tuple[bool, str]:
         return False, "You don't have any of this item"
 
     settings.inventory[item_id] -= 1
+    state_manager.mark_changed(settings, "inventory", item_id)
 
     item = get_item_info(item_id)
     return True, f"Used {item['name']}!"
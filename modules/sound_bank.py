@@ -0,0 +1,136 @@
+"""Precomputed sound bank for KeyQuest audio playback.
+
+Synthesizing a waveform and converting it into a pygame Sound is the
+expensive part of playing an effect. The bank keeps ready-to-play Sound
+objects keyed by generator name, parameters, and typing intensity so each
+effect is built once and replayed from memory afterwards.
+
+The prewarm thread (``modules/prewarm.py``) fills the bank while the
+pygame thread plays from it, so every method holds the bank's lock. Builds
+run outside the lock, so a hit never waits on another effect's synthesis;
+a sound the pygame thread asks for while the prewarm thread is building
+that same sound waits for it and is built once, not twice.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SoundBank:
+    """Bounded LRU cache of built sound objects with hit/miss counters."""
+
+    DEFAULT_CAPACITY = 64
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._format: Optional[Tuple] = None
+        self._lock = threading.RLock()
+        # Keys being built right now, set when the build finishes.
+        self._building: Dict[Hashable, threading.Event] = {}
+        # Bumped by invalidate() and clear() so a build that started
+        # before either one is not stored afterwards.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(name: str, params: Tuple = (), intensity: Optional[str] = None) -> Tuple:
+        """Build the content key for an effect: generator name, parameters, and intensity."""
+        return (name, tuple(params), intensity)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]):
+        """Return the cached sound for ``key``, building and storing it on a miss.
+
+        Builders that return None (for example when the mixer is unavailable)
+        are not cached so a later call can retry.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                building = self._building.get(key)
+                if building is None:
+                    self.misses += 1
+                    building = self._building[key] = threading.Event()
+                    generation = self._generation
+                    break
+            # Another thread is building this key; use its result.
+            building.wait()
+
+        entry = None
+        try:
+            entry = build()
+        finally:
+            with self._lock:
+                del self._building[key]
+                if entry is not None and generation == self._generation:
+                    self._entries[key] = entry
+                    while len(self._entries) > self.capacity:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+            building.set()
+        return entry
+
+    def check_format(self, mixer_format) -> bool:
+        """Invalidate the bank when the mixer format changes.
+
+        Returns True when the bank was cleared.
+        """
+        with self._lock:
+            if mixer_format == self._format:
+                return False
+            had_format = self._format is not None
+            self._format = mixer_format
+            if had_format:
+                self.clear()
+                return True
+            return False
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop entries matching ``predicate`` (all entries when omitted).
+
+        Returns the number of dropped entries.
+        """
+        with self._lock:
+            self._generation += 1
+            if predicate is None:
+                dropped = len(self._entries)
+                self._entries.clear()
+                return dropped
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        """Remove all cached sounds while keeping the counters."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "capacity": self.capacity,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
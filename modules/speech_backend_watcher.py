@@ -0,0 +1,152 @@
+"""Screen reader detection with the slow probe on a background thread.
+
+In auto speech mode the app used to call ``Speech.refresh_backend()`` from
+the frame loop once a second. Each call asked Tolk which screen reader is
+running and, when none was, ran ``tasklist`` to look for Narrator. On
+Windows that subprocess alone can stall a frame for a large fraction of a
+second.
+
+``SpeechBackendWatcher`` runs the probe (``Speech.narrator_running()``) on
+its own thread every ``interval`` seconds while it is active. When the
+result differs from the last one it publishes it and sets a
+``threading.Event``. The main loop calls ``poll()``, which only checks that
+event. Tolk is not thread-safe and needs COM on the thread that uses it, so
+the app asks Tolk itself, on the main thread, with the watcher's result
+(``Speech.detect_screen_reader()``), once per interval. A ``notify``
+callback can wake the loop when something changed; the app posts a pygame
+event. ``stats()`` reports the worst ``poll()`` time next to the probe
+times, so the debug overlay shows what the UI thread pays against what the
+probe costs.
+
+Set ``KEYQUEST_SPEECH_POLL_SECONDS`` to change the interval (default 1).
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from modules import error_logging
+
+
+ENV_VAR = "KEYQUEST_SPEECH_POLL_SECONDS"
+DEFAULT_INTERVAL = 1.0
+MIN_INTERVAL = 0.1
+
+
+def interval_from_env(default: float = DEFAULT_INTERVAL) -> float:
+    """Polling interval from ``KEYQUEST_SPEECH_POLL_SECONDS``, at least ``MIN_INTERVAL``."""
+    try:
+        return max(MIN_INTERVAL, float(os.environ.get(ENV_VAR, "") or default))
+    except ValueError:
+        return default
+
+
+class SpeechBackendWatcher:
+    """Run a slow probe in the background and flag changes in its result."""
+
+    def __init__(
+        self,
+        probe: Callable[[], Any],
+        interval: float = DEFAULT_INTERVAL,
+        initial: Any = None,
+        notify: Optional[Callable[[], None]] = None,
+        clock=time.perf_counter,
+    ):
+        self._probe = probe
+        self._notify = notify
+        self._clock = clock
+        self.interval = max(MIN_INTERVAL, interval)
+        self.changed = threading.Event()
+        self._cond = threading.Condition()
+        self._detected = initial
+        self._active = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self.probes = 0
+        self.changes = 0
+        self.probe_max_ms = 0.0
+        self.poll_max_ms = 0.0
+
+    def start(self, initial: Any = None) -> None:
+        """Start the thread (once). ``initial``, if given, replaces the constructor's."""
+        with self._cond:
+            if self._thread is not None or self._stopped:
+                return
+            if initial is not None:
+                self._detected = initial
+            self._thread = threading.Thread(target=self._run, name="KeyQuestSpeechWatcher", daemon=True)
+        self._thread.start()
+
+    def set_active(self, active: bool) -> None:
+        """Probe only while active (auto speech mode)."""
+        with self._cond:
+            if active == self._active:
+                return
+            self._active = active
+            self._cond.notify_all()
+
+    def set_interval(self, interval: float) -> None:
+        with self._cond:
+            self.interval = max(MIN_INTERVAL, interval)
+            self._cond.notify_all()
+
+    def poll(self) -> Tuple[bool, Any]:
+        """(changed, last probe result) for the main loop; never waits on the probe."""
+        started = self._clock()
+        changed = self.changed.is_set()
+        if changed:
+            self.changed.clear()
+        detected = self._detected
+        self.poll_max_ms = max(self.poll_max_ms, (self._clock() - started) * 1000.0)
+        return changed, detected
+
+    def stop(self, timeout: Optional[float] = 2.0) -> bool:
+        """Stop the thread. False if a probe was still running at the timeout."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                # Wait a full interval, then keep waiting while inactive.
+                self._cond.wait(self.interval)
+                while not self._stopped and not self._active:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+            self._probe_once()
+
+    def _probe_once(self) -> None:
+        started = self._clock()
+        try:
+            detected = self._probe()
+        except Exception as e:
+            error_logging.log_exception(e)
+            return
+        self.probes += 1
+        self.probe_max_ms = max(self.probe_max_ms, (self._clock() - started) * 1000.0)
+        if detected == self._detected:
+            return
+        self._detected = detected
+        self.changes += 1
+        self.changed.set()
+        if self._notify is not None:
+            try:
+                self._notify()
+            except Exception as e:
+                error_logging.log_exception(e)
+
+    def stats(self) -> dict:
+        return {
+            "probes": self.probes,
+            "changes": self.changes,
+            "probe_max_ms": self.probe_max_ms,
+            "poll_max_ms": self.poll_max_ms,
+        }
@@ -2,6 +2,9 @@ import subprocess
 import threading
 import time
 import traceback
+from typing import Optional
+
+from modules import speech_scheduler
 
 
 LOG_FILE = "keyquest_error.log"
@@ -42,7 +45,7 @@ except Exception:
 class Speech:
     """Speech system with intelligent screen reader detection and TTS fallback."""
 
-    def __init__(self):
+    def __init__(self, probe: bool = True):
         print("Speech.__init__() starting...")
         self.enabled = True
         self._lock = threading.Lock()
@@ -61,12 +64,36 @@ class Speech:
         self._screen_reader_detected = None
         self.backend = "none"
         self._priority_until = 0.0
+        # Paces and coalesces utterances per backend; see speech_scheduler.
+        self._scheduler = speech_scheduler.SpeechScheduler()
         self._last_text = ""
         self._last_speak_time = 0.0
         self.tts_rate = 200
         self.tts_volume = 1.0
         self.tts_voice_id = ""
+        self._probed = False
+        # Mode and TTS settings applied before probe(); it applies them after.
+        self._pending_mode: Optional[str] = None
+        self._pending_tts_settings: Optional[tuple] = None
         print("Speech basic init complete")
+        if probe:
+            self.probe()
+
+    @property
+    def probed(self) -> bool:
+        return self._probed
+
+    def probe(self) -> None:
+        """Start TTS, load Tolk and pick a backend. Runs once.
+
+        This is the slow part of setting up speech (SAPI/COM, Tolk's screen
+        reader query and possibly a ``tasklist`` run), so the app builds
+        ``Speech(probe=False)`` and calls this after its first frame. Speech
+        said before then stays queued and is sent here.
+        """
+        if self._probed:
+            return
+        self._probed = True
 
         # Initialize TTS before Tolk to avoid COM apartment conflicts on Windows.
         self._init_tts_engine()
@@ -104,6 +131,13 @@ class Speech:
 
         print(f"Speech initialized with backend: {self.backend}")
 
+        if self._pending_tts_settings is not None:
+            self.apply_tts_settings(*self._pending_tts_settings)
+        if self._pending_mode is not None:
+            self.apply_mode(self._pending_mode)
+        with self._lock:
+            self._send_due()
+
     def _detect_narrator_process(self) -> bool:
         """Return True when the Windows Narrator process appears to be running."""
         try:
@@ -209,7 +243,13 @@ class Speech:
         priority: bool = False,
         protect_seconds: float = 0.0,
         interrupt: bool = True,
+        category: Optional[str] = None,
     ):
+        """Queue ``text`` and speak it now if the backend is free.
+
+        ``category`` names a repeating status announcement (LetterFall's
+        letter queue, for example); a newer one replaces one still waiting.
+        """
         if not self.enabled or not text:
             return
         with self._lock:
@@ -230,30 +270,67 @@ class Speech:
                 # can always interrupt and hear the next focused item.
                 if now < self._priority_until and not interrupt:
                     return
-            try:
-                if self.backend == "tolk":
-                    tolk.speak(text, interrupt=interrupt)
-                elif self.backend == "tts":
-                    if self._sapi_voice is None and self._engine is None and not self._init_tts_engine():
-                        return
-                    if self._sapi_voice is not None:
-                        flags = _SAPI_ASYNC_FLAG | (_SAPI_PURGE_FLAG if interrupt else 0)
-                        self._sapi_voice.Speak(text, flags)
-                    else:
-                        with self._tts_queue_lock:
-                            self._tts_pending_text = text
-                            self._tts_pending_interrupt = interrupt
-                        # Best-effort immediate cut-off for currently playing utterance.
-                        if interrupt:
-                            try:
-                                self._engine.stop()
-                            except Exception:
-                                pass
-                        self._tts_event.set()
+            self._scheduler.submit(
+                text,
+                speech_scheduler.request_priority(priority, interrupt),
+                interrupt,
+                category,
+            )
+            self._send_due()
+
+    def pump(self) -> None:
+        """Send queued speech whose backend gap has passed. Called every loop."""
+        with self._lock:
+            if not self.enabled:
+                self._scheduler.clear()
+                return
+            self._send_due()
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Seconds until pump() has speech to send, or None when nothing is queued."""
+        with self._lock:
+            if not self._probed:
+                return None
+            return self._scheduler.seconds_until_due(self.backend)
+
+    def scheduler_stats(self) -> dict:
+        with self._lock:
+            return self._scheduler.stats()
+
+    def _send_due(self) -> None:
+        if not self._probed:
+            return
+        while True:
+            request = self._scheduler.pop_due(self.backend)
+            if request is None:
+                return
+            self._speak(request.text, request.interrupt)
+
+    def _speak(self, text: str, interrupt: bool) -> None:
+        try:
+            if self.backend == "tolk":
+                tolk.speak(text, interrupt=interrupt)
+            elif self.backend == "tts":
+                if self._sapi_voice is None and self._engine is None and not self._init_tts_engine():
+                    return
+                if self._sapi_voice is not None:
+                    flags = _SAPI_ASYNC_FLAG | (_SAPI_PURGE_FLAG if interrupt else 0)
+                    self._sapi_voice.Speak(text, flags)
                 else:
-                    print(text)
-            except Exception as e:
-                log_exception(e)
+                    with self._tts_queue_lock:
+                        self._tts_pending_text = text
+                        self._tts_pending_interrupt = interrupt
+                    # Best-effort immediate cut-off for currently playing utterance.
+                    if interrupt:
+                        try:
+                            self._engine.stop()
+                        except Exception:
+                            pass
+                    self._tts_event.set()
+            else:
+                print(text)
+        except Exception as e:
+            log_exception(e)
 
     def apply_mode(self, mode: str):
         """Apply a speech mode and switch backends accordingly.
@@ -261,12 +338,18 @@ class Speech:
         Modes: off | auto | screen_reader | tts
         """
         mode = (mode or "").strip().lower()
+        if not self._probed:
+            self._pending_mode = mode
 
         if mode == "off":
             self.enabled = False
+            with self._lock:
+                self._scheduler.clear()
             return
 
         self.enabled = True
+        if not self._probed:
+            return
 
         if mode == "auto":
             if self._screen_reader_detected and self._screen_reader_detected != "Narrator":
@@ -317,7 +400,51 @@ class Speech:
         print(f"Unknown speech mode '{mode}', leaving backend unchanged ({self.backend})")
 
     def refresh_backend(self, mode: str) -> bool:
-        """Refresh backend selection at runtime.
+        """Probe for a screen reader and switch backends to match.
+
+        The app runs the Narrator process probe on ``SpeechBackendWatcher``'s
+        thread and passes its result to ``detect_screen_reader()``; this
+        does everything in one call.
+
+        Returns:
+            True if backend changed, False otherwise.
+        """
+        mode = (mode or "").strip().lower()
+        detected_reader = self.detect_screen_reader() if mode == "auto" else None
+        return self.apply_detected_reader(detected_reader, mode)
+
+    def detect_screen_reader(self, narrator_running: Optional[bool] = None) -> Optional[str]:
+        """Name of the running screen reader, "Narrator", or None.
+
+        Asks Tolk first. Tolk is not thread-safe, so call this on the thread
+        that speaks. ``narrator_running`` is the watcher's last Narrator
+        probe; when omitted, ``narrator_running()`` runs here.
+        """
+        detected_reader = None
+        if self._tolk_available:
+            with self._lock:
+                try:
+                    detected_reader = tolk.detect_screen_reader()
+                except Exception as e:
+                    log_exception(e)
+                    detected_reader = None
+
+        if detected_reader:
+            return detected_reader
+        if narrator_running is None:
+            narrator_running = self.narrator_running()
+        return "Narrator" if narrator_running else None
+
+    def narrator_running(self) -> bool:
+        """True when the Narrator process is running.
+
+        Runs ``tasklist``, which can take a noticeable fraction of a second,
+        and touches no speech backend, so it is safe on any thread.
+        """
+        return self._detect_narrator_process()
+
+    def apply_detected_reader(self, detected_reader: Optional[str], mode: str) -> bool:
+        """Pick the backend for ``detected_reader`` in auto mode.
 
         Returns:
             True if backend changed, False otherwise.
@@ -332,18 +459,6 @@ class Speech:
             return False
 
         previous_backend = self.backend
-        detected_reader = None
-
-        if self._tolk_available:
-            try:
-                detected_reader = tolk.detect_screen_reader()
-            except Exception as e:
-                log_exception(e)
-                detected_reader = None
-
-        if not detected_reader and self._detect_narrator_process():
-            detected_reader = "Narrator"
-
         self._screen_reader_detected = detected_reader
 
         if detected_reader and detected_reader != "Narrator":
@@ -356,6 +471,10 @@ class Speech:
 
         return self.backend != previous_backend
 
+    @property
+    def screen_reader_detected(self) -> Optional[str]:
+        return self._screen_reader_detected
+
     def get_available_voices(self):
         """Get list of available TTS voices.
 
@@ -389,6 +508,9 @@ class Speech:
             volume: Volume level (0.0-1.0, default 1.0)
             voice_id: Voice ID to use (empty string = default)
         """
+        if not self._probed:
+            self._pending_tts_settings = (rate, volume, voice_id)
+            return
         if self._sapi_voice is None and self._engine is None:
             if not self._init_tts_engine():
                 print("TTS engine not available")
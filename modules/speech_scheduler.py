@@ -0,0 +1,139 @@
+"""Priority queue between ``Speech.say()`` and the speech backends.
+
+``say()`` used to hand every call straight to Tolk, SAPI, or pyttsx3. Fast
+typing and LetterFall's periodic letter announcements then sent bursts of
+utterances that cut each other off and kept the screen reader busy.
+``SpeechScheduler`` sits in between:
+
+- Each backend gets a minimum gap between utterances. When the backend is
+  free, a request goes out at once, on the calling thread, as before.
+- A request that arrives inside the gap waits. ``Speech.pump()`` sends it
+  once the gap has passed; the app calls it every loop.
+- An interrupting request would cut off anything queued before it, so it
+  replaces the waiting requests of the same or lower priority.
+- When both the waiting request and its replacement are short tokens
+  (typed digits, letters, "Empty"), they are read together instead.
+- A request with a ``category`` replaces the waiting request of that
+  category, so only the latest status announcement is read.
+
+Higher priorities go out first. ``stats()`` reports how long requests
+waited.
+"""
+
+import heapq
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+PRIORITY_HIGH = 0  # say(priority=True): prompts, feedback, and results
+PRIORITY_NORMAL = 1  # interrupting navigation speech
+PRIORITY_LOW = 2  # say(interrupt=False): queued behind whatever is speaking
+
+# Minimum seconds between utterances sent to each backend. Screen readers
+# queue and cut off on their own, so their gap is shorter than SAPI's.
+BACKEND_MIN_INTERVALS: Dict[str, float] = {"tolk": 0.05, "tts": 0.12}
+
+# Queued tokens up to this long are merged rather than dropped, up to the
+# merged length limit.
+SHORT_TOKEN_CHARS = 12
+MERGED_TOKEN_CHARS = 40
+
+
+@dataclass(order=True)
+class SpeechRequest:
+    priority: int
+    seq: int
+    text: str = field(compare=False)
+    interrupt: bool = field(default=True, compare=False)
+    category: Optional[str] = field(default=None, compare=False)
+    queued_at: float = field(default=0.0, compare=False)
+
+    def is_short(self) -> bool:
+        return self.category is None and len(self.text) <= SHORT_TOKEN_CHARS
+
+
+def request_priority(priority: bool, interrupt: bool) -> int:
+    """Scheduler priority for ``say()``'s ``priority`` and ``interrupt`` flags."""
+    if priority:
+        return PRIORITY_HIGH
+    return PRIORITY_NORMAL if interrupt else PRIORITY_LOW
+
+
+class SpeechScheduler:
+    """Queue of pending utterances with per-backend pacing. Not thread-safe;
+    ``Speech`` calls it under its own lock."""
+
+    def __init__(self, intervals: Optional[Dict[str, float]] = None, clock=time.perf_counter):
+        self.intervals = dict(BACKEND_MIN_INTERVALS if intervals is None else intervals)
+        self._clock = clock
+        self._queue: List[SpeechRequest] = []
+        self._seq = 0
+        self._last_sent: Dict[str, float] = {}
+        self.sent = 0
+        self.replaced = 0
+        self.merged = 0
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def submit(self, text: str, priority: int, interrupt: bool = True, category: Optional[str] = None) -> None:
+        self._seq += 1
+        request = SpeechRequest(priority, self._seq, text, interrupt, category, self._clock())
+        kept = []
+        for waiting in self._queue:
+            if category is not None and waiting.category == category:
+                self.replaced += 1
+            elif interrupt and waiting.priority >= priority:
+                if waiting.is_short() and request.is_short() and waiting.priority == priority:
+                    merged = f"{waiting.text} {request.text}"
+                    if len(merged) <= MERGED_TOKEN_CHARS:
+                        # Read the tokens together, timed from the first one.
+                        request.text = merged
+                        request.queued_at = waiting.queued_at
+                        self.merged += 1
+                        continue
+                self.replaced += 1
+            else:
+                kept.append(waiting)
+        kept.append(request)
+        heapq.heapify(kept)
+        self._queue = kept
+
+    def seconds_until_due(self, backend: str) -> Optional[float]:
+        """Seconds until the next request may go to ``backend``; None when idle."""
+        if not self._queue:
+            return None
+        last = self._last_sent.get(backend)
+        if last is None:
+            return 0.0
+        return max(0.0, last + self.intervals.get(backend, 0.0) - self._clock())
+
+    def pop_due(self, backend: str) -> Optional[SpeechRequest]:
+        """The next request to send to ``backend`` now, or None if it must wait."""
+        due_in = self.seconds_until_due(backend)
+        if due_in is None or due_in > 0.0:
+            return None
+        request = heapq.heappop(self._queue)
+        now = self._clock()
+        self._last_sent[backend] = now
+        latency_ms = (now - request.queued_at) * 1000.0
+        self.sent += 1
+        self.latency_total_ms += latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+        return request
+
+    def clear(self) -> None:
+        self._queue.clear()
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self._queue),
+            "sent": self.sent,
+            "replaced": self.replaced,
+            "merged": self.merged,
+            "latency_avg_ms": self.latency_total_ms / self.sent if self.sent else 0.0,
+            "latency_max_ms": self.latency_max_ms,
+        }
@@ -0,0 +1,181 @@
+"""Startup phase timings.
+
+``keyquest_app`` marks each startup phase as it finishes: module imports,
+window, speech, audio, progress, the first frame, the work deferred until
+after it, and the main menu announcement. Set ``KEYQUEST_STARTUP_TIMELINE=1``
+to print the timeline once the menu has been announced, in the same
+self/cumulative layout as ``python -X importtime``:
+
+    startup:  self [ms] | cumulative [ms] | phase
+    startup:     231.4 |     231.4 | imports
+    startup:      12.0 |     243.4 | pygame init
+
+Set ``KEYQUEST_STARTUP_TRACE=<path>`` (or pass ``--startup-trace <path>``)
+to also write the timeline as JSON at the same point.
+``tools/dev/trace_startup.py`` runs startup headless, writes that report,
+and checks it against a stored baseline with ``check_regressions``.
+"""
+
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+ENV_VAR = "KEYQUEST_STARTUP_TIMELINE"
+TRACE_ENV_VAR = "KEYQUEST_STARTUP_TRACE"
+TRACE_FLAG = "--startup-trace"
+REPORT_VERSION = 1
+
+# Time zero: the first thing keyquest_app imports is this module.
+_origin = time.perf_counter()
+
+
+class StartupTimeline:
+    """Ordered (phase, seconds since origin) marks."""
+
+    def __init__(self, origin: Optional[float] = None, clock=time.perf_counter):
+        self._clock = clock
+        self.origin = clock() if origin is None else origin
+        self.marks: List[Tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, phase: str) -> None:
+        self.marks.append((phase, self._clock() - self.origin))
+
+    def phases(self) -> List[Tuple[str, float, float]]:
+        """(phase, self ms, cumulative ms) for every mark."""
+        rows = []
+        previous = 0.0
+        for phase, elapsed in self.marks:
+            rows.append((phase, (elapsed - previous) * 1000.0, elapsed * 1000.0))
+            previous = elapsed
+        return rows
+
+    def format_report(self) -> str:
+        lines = ["startup:  self [ms] | cumulative [ms] | phase"]
+        for phase, self_ms, cumulative_ms in self.phases():
+            lines.append(f"startup: {self_ms:9.1f} | {cumulative_ms:9.1f} | {phase}")
+        return "\n".join(lines)
+
+    def to_dict(self, extra: Optional[dict] = None) -> dict:
+        """JSON-ready report: each phase's start, end, and own time in ms."""
+        phases = []
+        for phase, self_ms, cumulative_ms in self.phases():
+            phases.append({
+                "phase": phase,
+                "start_ms": round(cumulative_ms - self_ms, 3),
+                "end_ms": round(cumulative_ms, 3),
+                "self_ms": round(self_ms, 3),
+            })
+        report = {
+            "version": REPORT_VERSION,
+            "clock": "perf_counter",
+            "phases": phases,
+            "first_frame_ms": next((row["end_ms"] for row in phases if row["phase"] == "first frame"), None),
+            "environment": {
+                "python": platform.python_version(),
+                "platform": sys.platform,
+                "video_driver": os.environ.get("SDL_VIDEODRIVER", ""),
+                "audio_driver": os.environ.get("SDL_AUDIODRIVER", ""),
+            },
+        }
+        if extra:
+            report.update(extra)
+        return report
+
+    def write_json(self, path: str, extra: Optional[dict] = None) -> None:
+        tmp_path = f"{path}.tmp"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(extra), f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+
+
+def check_regressions(
+    report: dict,
+    baseline: dict,
+    tolerance: float = 0.5,
+    slack_ms: float = 100.0,
+) -> List[str]:
+    """Phases (and the first frame) that got slower than the baseline allows.
+
+    A time regresses when it exceeds ``baseline * (1 + tolerance) + slack_ms``;
+    the slack keeps millisecond-sized phases from failing on scheduler noise.
+    Phases missing from either report are skipped.
+    """
+    current = {row["phase"]: row["self_ms"] for row in report.get("phases", [])}
+    failures = []
+    limits: List[Tuple[str, Optional[float], Optional[float]]] = [
+        ("first frame (cumulative)", report.get("first_frame_ms"), baseline.get("first_frame_ms"))
+    ]
+    limits.extend((row["phase"], current.get(row["phase"]), row["self_ms"]) for row in baseline.get("phases", []))
+    for name, measured, expected in limits:
+        if measured is None or expected is None:
+            continue
+        limit = expected * (1.0 + tolerance) + slack_ms
+        if measured > limit:
+            failures.append(f"{name}: {measured:.1f} ms > {limit:.1f} ms (baseline {expected:.1f} ms)")
+    return failures
+
+
+def median_report(reports: Sequence[dict]) -> dict:
+    """One report whose times are the per-phase medians of ``reports``."""
+    def median(values: List[float]) -> float:
+        values = sorted(values)
+        middle = len(values) // 2
+        return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+    by_phase: Dict[str, List[dict]] = {}
+    for report in reports:
+        for row in report["phases"]:
+            by_phase.setdefault(row["phase"], []).append(row)
+    result = dict(reports[0])
+    result["runs"] = len(reports)
+    result["phases"] = []
+    for first in reports[0]["phases"]:
+        rows = by_phase[first["phase"]]
+        merged = {"phase": first["phase"]}
+        for key in ("start_ms", "end_ms", "self_ms"):
+            merged[key] = round(median([row[key] for row in rows]), 3)
+        result["phases"].append(merged)
+    frames = [report["first_frame_ms"] for report in reports if report.get("first_frame_ms") is not None]
+    result["first_frame_ms"] = round(median(frames), 3) if frames else None
+    return result
+
+
+TIMELINE = StartupTimeline(origin=_origin)
+
+
+def mark(phase: str) -> None:
+    """Record that ``phase`` just finished."""
+    TIMELINE.mark(phase)
+
+
+def enabled() -> bool:
+    return os.environ.get(ENV_VAR, "") not in ("", "0")
+
+
+def trace_path(argv: Optional[Sequence[str]] = None) -> str:
+    """Where to write the JSON report: ``--startup-trace <path>`` or the env var."""
+    args = list(sys.argv[1:] if argv is None else argv)
+    for index, arg in enumerate(args):
+        if arg.startswith(TRACE_FLAG + "="):
+            return arg.split("=", 1)[1]
+        if arg == TRACE_FLAG and index + 1 < len(args):
+            return args[index + 1]
+    return os.environ.get(TRACE_ENV_VAR, "")
+
+
+def report_once(extra: Optional[dict] = None) -> None:
+    """Print and/or write the timeline the first time startup finishes, when enabled."""
+    if TIMELINE.reported:
+        return
+    TIMELINE.reported = True
+    if enabled():
+        print(TIMELINE.format_report())
+    path = trace_path()
+    if path:
+        TIMELINE.write_json(path, extra)
@@ -8,7 +8,9 @@ import pathlib
 from datetime import date
 from dataclasses import dataclass, field
 from collections import Counter, deque
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
+
+from modules import progress_store
 
 
 # =========== Performance Tracking ===========
@@ -267,6 +269,30 @@ class Settings:
     pet_happiness: int = 50  # Pet happiness (0-100)
     pet_mood: str = "happy"  # Current mood
     pet_last_fed: str = ""  # Last fed timestamp (ISO format)
+    # Dashboard aggregates kept up to date by dashboard_manager.record_session()
+    dashboard_days: Dict[str, Dict] = field(default_factory=dict)  # YYYY-MM-DD: day totals and per-activity totals
+    dashboard_totals: Dict[str, int] = field(default_factory=dict)  # version, lifetime session and perfect counts
+    # Full session history when progress lives in SQLite (not saved as a field)
+    history_store: Optional[object] = field(default=None, repr=False, compare=False)
+    # Digraph latency tables from keystroke timing (not saved as a field)
+    transition_stats: Optional[object] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        # Assigning a saved field marks all of it for the next save.
+        if name in _PROGRESS_FIELD_NAMES:
+            self.__dict__.setdefault("_changes", {})[name] = None
+        object.__setattr__(self, name, value)
+
+    def pending_fields(self) -> Set[str]:
+        """Fields whose progress section has not been loaded yet."""
+        loaders = self.__dict__.get("_section_loaders")
+        return set(loaders) if loaders else set()
+
+    def take_changes(self) -> Dict[str, object]:
+        """Return and clear the change marks (see mark_changed())."""
+        changes = self.__dict__.get("_changes") or {}
+        self.__dict__["_changes"] = {}
+        return changes
 
 
 @dataclass
@@ -298,22 +324,274 @@ class AppState:
 
 PROGRESS_SCHEMA_VERSION = 1
 
-class ProgressManager:
-    """Manages saving and loading user progress."""
+# Persisted Settings fields, in file order.
+PROGRESS_FIELDS = (
+    "current_lesson", "unlocked_lessons", "speech_mode", "typing_sound_intensity", "visual_theme",
+    "font_scale", "focus_assist", "sentence_language", "auto_update_check", "auto_start_next_lesson",
+    "tts_rate", "tts_volume", "tts_voice", "current_streak", "last_practice_date", "longest_streak",
+    "lesson_stars", "lesson_best_wpm", "lesson_best_accuracy", "earned_badges", "badge_notifications",
+    "total_lessons_completed", "total_practice_time", "highest_wpm", "xp", "level", "key_stats",
+    "daily_challenge_date", "daily_challenge_completed", "daily_challenge_streak", "active_quests",
+    "completed_quests", "quest_notifications", "session_history", "coins", "total_coins_earned",
+    "owned_items", "inventory", "pet_type", "pet_name", "pet_xp", "pet_happiness", "pet_mood",
+    "pet_last_fed", "dashboard_days", "dashboard_totals",
+)
+_PROGRESS_FIELD_NAMES = frozenset(PROGRESS_FIELDS)
+
+# Progress fields grouped by what needs them. With a SQLite store, load()
+# applies "core" (what the main menu and startup checks read) and every other
+# section is read the first time one of its fields is used.
+PROGRESS_SECTIONS = {
+    "core": (
+        "current_lesson", "unlocked_lessons", "speech_mode", "typing_sound_intensity", "visual_theme",
+        "font_scale", "focus_assist", "sentence_language", "auto_update_check", "auto_start_next_lesson",
+        "tts_rate", "tts_volume", "tts_voice", "current_streak", "last_practice_date", "longest_streak",
+        "lesson_stars", "lesson_best_wpm", "lesson_best_accuracy", "total_lessons_completed",
+        "total_practice_time", "highest_wpm", "xp", "level", "daily_challenge_date",
+        "daily_challenge_completed", "daily_challenge_streak",
+    ),
+    "economy": (
+        "earned_badges", "badge_notifications", "active_quests", "completed_quests", "quest_notifications",
+        "coins", "total_coins_earned", "owned_items", "inventory",
+    ),
+    "pet": ("pet_type", "pet_name", "pet_xp", "pet_happiness", "pet_mood", "pet_last_fed"),
+    "history": ("session_history",),
+    "analytics": ("key_stats", "dashboard_days", "dashboard_totals"),
+}
+LAZY_SECTIONS = ("economy", "pet", "history", "analytics")
+
+_NO_DEFAULT = object()
+
+
+class _SectionField:
+    """Class attribute for a Settings field in a lazily loaded section.
+
+    An instance value shadows it, so loaded fields read at normal speed.
+    While ``ProgressManager.load()`` has the field unset, reading it loads
+    its section first. On the class it still reads as the dataclass default.
+    """
+
+    def __init__(self, name: str, default=_NO_DEFAULT):
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            if self.default is _NO_DEFAULT:
+                raise AttributeError(f"type object {owner.__name__!r} has no attribute {self.name!r}")
+            return self.default
+        loaders = instance.__dict__.get("_section_loaders")
+        loader = loaders.get(self.name) if loaders else None
+        if loader is None:
+            raise AttributeError(f"{type(instance).__name__!r} object has no attribute {self.name!r}")
+        loader()
+        return instance.__dict__[self.name]
+
+
+for _section in LAZY_SECTIONS:
+    for _name in PROGRESS_SECTIONS[_section]:
+        setattr(Settings, _name, _SectionField(_name, Settings.__dict__.get(_name, _NO_DEFAULT)))
+
+_SET_FIELDS = {"unlocked_lessons", "earned_badges", "completed_quests", "owned_items"}
+_INT_KEY_FIELDS = {"lesson_stars", "lesson_best_wpm", "lesson_best_accuracy"}
+
+
+def _encode_field(name: str, value):
+    """Settings value -> JSON-friendly form written to progress files."""
+    if name in _SET_FIELDS:
+        return sorted(list(value))
+    if name in _INT_KEY_FIELDS:
+        return {str(k): v for k, v in value.items()}
+    if name == "current_lesson":
+        return int(value)
+    return value
+
+
+def mark_changed(settings, name: str, *keys) -> None:
+    """Note that progress field ``name`` was changed in place.
+
+    Assigning a Settings field marks it already; code that mutates a field's
+    container in place calls this so the next save writes it. With ``keys``
+    only those entries of a dict field are written (keys no longer present
+    are removed). Settings-like objects that do not track changes are ignored.
+    """
+    changes = getattr(settings, "__dict__", {}).get("_changes")
+    if changes is None:
+        return
+    current = changes.get(name, _NO_DEFAULT)
+    if not keys or current is None:
+        changes[name] = None
+    elif current is _NO_DEFAULT:
+        changes[name] = set(keys)
+    elif isinstance(current, set):
+        current.update(keys)
+    else:
+        changes[name] = None
+
+
+def mark_appended(settings, name: str, count: int = 1) -> None:
+    """Note that ``count`` items were appended to list field ``name``.
+
+    The list may also have been trimmed from the front; the next save
+    journals just the new items.
+    """
+    changes = getattr(settings, "__dict__", {}).get("_changes")
+    if changes is None:
+        return
+    current = changes.get(name, 0)
+    changes[name] = current + count if isinstance(current, int) else None
+
+
+def _json_copy(value):
+    return json.loads(json.dumps(value))
+
+
+def _apply_economy(settings: "Settings", data: dict) -> None:
+    settings.earned_badges = set(data.get("earned_badges", []))
+    settings.badge_notifications = data.get("badge_notifications", [])
+    settings.active_quests = data.get("active_quests", {})
+    settings.completed_quests = set(data.get("completed_quests", []))
+    settings.quest_notifications = data.get("quest_notifications", [])
+    settings.coins = data.get("coins", 0)
+    settings.total_coins_earned = data.get("total_coins_earned", 0)
+    settings.owned_items = set(data.get("owned_items", []))
+    settings.inventory = data.get("inventory", {})
+
+
+def _apply_pet(settings: "Settings", data: dict) -> None:
+    settings.pet_type = data.get("pet_type", "")
+    settings.pet_name = data.get("pet_name", "")
+    settings.pet_xp = data.get("pet_xp", 0)
+    settings.pet_happiness = data.get("pet_happiness", 50)
+    settings.pet_mood = data.get("pet_mood", "happy")
+    settings.pet_last_fed = data.get("pet_last_fed", "")
+
+    # Passive happiness decay: 5 points per day since last fed, floor at 0.
+    if settings.pet_type and settings.pet_last_fed:
+        try:
+            last_fed = date.fromisoformat(settings.pet_last_fed[:10])
+            days_away = (date.today() - last_fed).days
+            if days_away > 0:
+                settings.pet_happiness = max(0, settings.pet_happiness - days_away * 5)
+        except ValueError:
+            pass
+
+
+def _apply_history(settings: "Settings", data: dict) -> None:
+    settings.session_history = data.get("session_history", [])
+
+
+def _apply_analytics(settings: "Settings", data: dict) -> None:
+    settings.key_stats = data.get("key_stats", {})
+    # Journal merges add new days at the end; dashboard_manager expects date order.
+    settings.dashboard_days = dict(sorted(data.get("dashboard_days", {}).items()))
+    settings.dashboard_totals = data.get("dashboard_totals", {})
+
 
-    def __init__(self, filename: str = "progress.json"):
+_SECTION_APPLIERS = {
+    "economy": _apply_economy,
+    "pet": _apply_pet,
+    "history": _apply_history,
+    "analytics": _apply_analytics,
+}
+
+# Sessions kept in Settings.session_history (the JSON file's cap); the SQLite
+# store keeps every session.
+SESSION_HISTORY_LIMIT = 100
+
+# The journal is folded into a new snapshot once it reaches either limit.
+JOURNAL_COMPACT_RECORDS = 200
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+
+def _apply_journal_ops(data: dict, ops: List[dict]) -> None:
+    """Replay one journal record's ops onto a progress dict."""
+    for op in ops:
+        kind = op["op"]
+        key = op["key"]
+        if kind == "set":
+            data[key] = op["value"]
+        elif kind == "append":
+            items = list(data.get(key) or []) + list(op["items"])
+            keep = int(op["keep"])
+            data[key] = items[len(items) - keep:] if keep else []
+        elif kind == "merge":
+            merged = dict(data.get(key) or {})
+            merged.update(op["set"])
+            for removed in op["del"]:
+                merged.pop(removed, None)
+            data[key] = merged
+
+
+class ProgressManager:
+    """Manages saving and loading user progress.
+
+    ``progress.json`` is a full snapshot. Settings marks the fields that
+    change (see mark_changed()), and ``changes()`` turns just those into
+    journal ops: new session history entries, the key stats entries that
+    were touched, coins, badges, ... When ``journal`` is on, each save
+    appends one line of ops to ``progress.journal``, and load replays those
+    lines onto the snapshot. Every record carries a sequence number and the
+    snapshot stores the last one it includes, so a crash at any point leaves
+    either the old or the new state readable. Files written before the
+    journal existed load unchanged.
+
+    With ``database`` set, progress lives in a SQLite ``ProgressStore``
+    instead. The first load imports ``progress.json`` (and its journal), and
+    each save applies the same ops to the database in one transaction.
+    ``lazy_sections`` applies to the store only: a section is a query there,
+    while ``progress.json`` has to be parsed whole anyway.
+    """
+
+    def __init__(
+        self,
+        filename: str = "progress.json",
+        journal: bool = True,
+        compact_records: int = JOURNAL_COMPACT_RECORDS,
+        compact_bytes: int = JOURNAL_COMPACT_BYTES,
+        database: Optional[str] = None,
+        lazy_sections: bool = True,
+    ):
         self.filename = filename
+        self.database = database
+        self.lazy_sections = lazy_sections
+        self.store: Optional[progress_store.ProgressStore] = None
+        self.journal_path = str(pathlib.Path(filename).with_suffix(".journal"))
+        self.journal = journal
+        self.compact_records = max(1, int(compact_records))
+        self.compact_bytes = max(1, int(compact_bytes))
+        # True once the files hold a complete progress record this manager
+        # read or wrote; until then writes rebuild it from the ops alone.
+        self._synced = False
+        # Ops from a failed write, retried ahead of the next ones.
+        self._unwritten: List[dict] = []
+        self._seq = 0
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._journal_broken = False
 
     def load(self, state: AppState, stage_letters_count: int) -> None:
         """Load progress from file and update app state.
 
+        From a SQLite store with ``lazy_sections``, only the core section is
+        applied here; the economy, pet, history, and analytics sections are
+        each queried the first time one of their fields is used. From
+        ``progress.json`` every section is applied.
+
         Args:
             state: AppState object to update
             stage_letters_count: Number of available lessons (for validation)
         """
+        self._synced = False
+        self._unwritten = []
+        state.settings.__dict__.pop("_section_loaders", None)
+        lazy = self.lazy_sections and bool(self.database)
         try:
-            with open(self.filename, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if self.database:
+                data = self._read_store(state)
+            else:
+                data = self._read()
+            fetch = self._store_section if lazy else self._section_fetcher(data)
 
             _schema_version = int(data.get("schema_version", 0))
 
@@ -354,50 +632,35 @@ class ProgressManager:
             lesson_best_accuracy_data = data.get("lesson_best_accuracy", {})
             state.settings.lesson_best_accuracy = {int(k): float(v) for k, v in lesson_best_accuracy_data.items()}
 
-            state.settings.earned_badges = set(data.get("earned_badges", []))
-            state.settings.badge_notifications = data.get("badge_notifications", [])
             state.settings.total_lessons_completed = data.get("total_lessons_completed", 0)
             state.settings.total_practice_time = data.get("total_practice_time", 0.0)
             state.settings.highest_wpm = data.get("highest_wpm", 0.0)
 
             state.settings.xp = data.get("xp", 0)
             state.settings.level = data.get("level", 1)
-            state.settings.key_stats = data.get("key_stats", {})
             state.settings.daily_challenge_date = data.get("daily_challenge_date", "")
             state.settings.daily_challenge_completed = data.get("daily_challenge_completed", False)
             state.settings.daily_challenge_streak = data.get("daily_challenge_streak", 0)
-            state.settings.active_quests = data.get("active_quests", {})
-            state.settings.completed_quests = set(data.get("completed_quests", []))
-            state.settings.quest_notifications = data.get("quest_notifications", [])
-            state.settings.session_history = data.get("session_history", [])
-            state.settings.coins = data.get("coins", 0)
-            state.settings.total_coins_earned = data.get("total_coins_earned", 0)
-            state.settings.owned_items = set(data.get("owned_items", []))
-            state.settings.inventory = data.get("inventory", {})
-            state.settings.pet_type = data.get("pet_type", "")
-            state.settings.pet_name = data.get("pet_name", "")
-            state.settings.pet_xp = data.get("pet_xp", 0)
-            state.settings.pet_happiness = data.get("pet_happiness", 50)
-            state.settings.pet_mood = data.get("pet_mood", "happy")
-            state.settings.pet_last_fed = data.get("pet_last_fed", "")
-
-            # Passive happiness decay: 5 points per day since last fed, floor at 0.
-            if state.settings.pet_type and state.settings.pet_last_fed:
-                try:
-                    last_fed = date.fromisoformat(state.settings.pet_last_fed[:10])
-                    days_away = (date.today() - last_fed).days
-                    if days_away > 0:
-                        state.settings.pet_happiness = max(
-                            0, state.settings.pet_happiness - days_away * 5
-                        )
-                except ValueError:
-                    pass
 
             # Ensure current lesson is unlocked and at least lesson 0 is unlocked
             state.settings.unlocked_lessons.add(0)
             state.settings.unlocked_lessons.add(state.settings.current_lesson)
+
+            for section in LAZY_SECTIONS:
+                if lazy:
+                    self._defer_section(state.settings, section, fetch)
+                else:
+                    _SECTION_APPLIERS[section](state.settings, fetch(section))
+            # What was just loaded is already saved.
+            state.settings.take_changes()
+            self._synced = True
         except Exception:
             # Use defaults on load failure
+            state.settings.__dict__.pop("_section_loaders", None)
+            for section in LAZY_SECTIONS:
+                for name in PROGRESS_SECTIONS[section]:
+                    if name not in state.settings.__dict__:
+                        setattr(state.settings, name, getattr(Settings(), name))
             state.settings.current_lesson = 0
             state.settings.unlocked_lessons = {0}
             state.lesson.stage = 0
@@ -409,6 +672,39 @@ class ProgressManager:
             state.settings.sentence_language = "English"
             state.settings.auto_update_check = True
             state.settings.auto_start_next_lesson = False
+            # The next save writes every field.
+            for name in PROGRESS_FIELDS:
+                mark_changed(state.settings, name)
+
+    def _defer_section(self, settings: Settings, section: str, fetch) -> None:
+        """Unset a section's fields so the first read loads them."""
+        names = PROGRESS_SECTIONS[section]
+        loaders = settings.__dict__.setdefault("_section_loaders", {})
+
+        def load_section():
+            for name in names:
+                loaders.pop(name, None)
+            scratch = Settings()
+            try:
+                _SECTION_APPLIERS[section](scratch, fetch(section))
+            except Exception:
+                # Unreadable sections fall back to defaults, as load() does.
+                scratch = Settings()
+            for name in names:
+                # Fields assigned before the section loaded keep their value.
+                if name not in settings.__dict__:
+                    settings.__dict__[name] = scratch.__dict__[name]
+
+        for name in names:
+            settings.__dict__.pop(name, None)
+            loaders[name] = load_section
+
+    @staticmethod
+    def _section_fetcher(data: dict):
+        """Section reader over already parsed progress data."""
+        def fetch(section: str) -> dict:
+            return {name: data[name] for name in PROGRESS_SECTIONS[section] if name in data}
+        return fetch
 
     def save(self, state: AppState) -> None:
         """Save progress to file.
@@ -417,56 +713,198 @@ class ProgressManager:
             state: AppState object to save
         """
         try:
-            data = {
-                "schema_version": PROGRESS_SCHEMA_VERSION,
-                "current_lesson": int(state.settings.current_lesson),
-                "unlocked_lessons": sorted(list(state.settings.unlocked_lessons)),
-                "speech_mode": state.settings.speech_mode,
-                "typing_sound_intensity": state.settings.typing_sound_intensity,
-                "visual_theme": state.settings.visual_theme,
-                "font_scale": state.settings.font_scale,
-                "focus_assist": state.settings.focus_assist,
-                "sentence_language": state.settings.sentence_language,
-                "auto_update_check": state.settings.auto_update_check,
-                "auto_start_next_lesson": state.settings.auto_start_next_lesson,
-                "tts_rate": state.settings.tts_rate,
-                "tts_volume": state.settings.tts_volume,
-                "tts_voice": state.settings.tts_voice,
-                "current_streak": state.settings.current_streak,
-                "last_practice_date": state.settings.last_practice_date,
-                "longest_streak": state.settings.longest_streak,
-                "lesson_stars": {str(k): v for k, v in state.settings.lesson_stars.items()},
-                "lesson_best_wpm": {str(k): v for k, v in state.settings.lesson_best_wpm.items()},
-                "lesson_best_accuracy": {str(k): v for k, v in state.settings.lesson_best_accuracy.items()},
-                "earned_badges": sorted(list(state.settings.earned_badges)),
-                "badge_notifications": state.settings.badge_notifications,
-                "total_lessons_completed": state.settings.total_lessons_completed,
-                "total_practice_time": state.settings.total_practice_time,
-                "highest_wpm": state.settings.highest_wpm,
-                "xp": state.settings.xp,
-                "level": state.settings.level,
-                "key_stats": state.settings.key_stats,
-                "daily_challenge_date": state.settings.daily_challenge_date,
-                "daily_challenge_completed": state.settings.daily_challenge_completed,
-                "daily_challenge_streak": state.settings.daily_challenge_streak,
-                "active_quests": state.settings.active_quests,
-                "completed_quests": sorted(list(state.settings.completed_quests)),
-                "quest_notifications": state.settings.quest_notifications,
-                "session_history": state.settings.session_history,
-                "coins": state.settings.coins,
-                "total_coins_earned": state.settings.total_coins_earned,
-                "owned_items": sorted(list(state.settings.owned_items)),
-                "inventory": state.settings.inventory,
-                "pet_type": state.settings.pet_type,
-                "pet_name": state.settings.pet_name,
-                "pet_xp": state.settings.pet_xp,
-                "pet_happiness": state.settings.pet_happiness,
-                "pet_mood": state.settings.pet_mood,
-                "pet_last_fed": state.settings.pet_last_fed
-            }
-            tmp = pathlib.Path(str(self.filename) + ".tmp")
-            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            tmp.replace(self.filename)
+            self.write(self.changes(state))
         except Exception:
             # Progress save failures should not crash the app.
             pass
+
+    def changes(self, state: AppState) -> List[dict]:
+        """Return journal ops for the fields changed since the last call.
+
+        Only marked fields are serialized. The ops are fresh JSON-shaped
+        copies that share nothing with state, so write() may run on another
+        thread; an empty list means there is nothing to save.
+        """
+        settings = state.settings
+        ops = []
+        for name, mark in settings.take_changes().items():
+            value = getattr(settings, name)
+            if mark is None:
+                ops.append({"op": "set", "key": name, "value": _json_copy(_encode_field(name, value))})
+            elif isinstance(mark, set):
+                present = {key: value[key] for key in mark if key in value}
+                removed = [str(key) for key in mark if key not in value]
+                changed = _json_copy(_encode_field(name, present))
+                ops.append({"op": "merge", "key": name, "set": changed, "del": removed})
+            else:
+                items = _json_copy(value[-mark:]) if mark else []
+                ops.append({"op": "append", "key": name, "items": items, "keep": len(value)})
+        return ops
+
+    def write(self, ops: List[dict]) -> None:
+        """Persist ops from changes(); raises on failure.
+
+        With the journal enabled the ops are appended to it; the full
+        snapshot is rewritten on the first write and whenever the journal
+        grows past its compaction limits. Ops from a failed write are
+        retried with the next call. Writes must not run concurrently
+        (SaveWorker runs them on one thread).
+        """
+        ops = self._unwritten + list(ops)
+        self._unwritten = []
+        try:
+            if self.database:
+                self._save_store(ops)
+            elif self.journal and self._synced and not self._needs_compaction():
+                if ops:
+                    self._append_journal(ops)
+            else:
+                self._write_snapshot(self._merged(ops))
+        except Exception:
+            self._unwritten = ops
+            raise
+        self._synced = True
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot (called on clean exit)."""
+        if self.store is not None:
+            try:
+                self.store.checkpoint()
+            except Exception:
+                pass
+            return
+        if not self._synced or not (self._journal_records or self._unwritten):
+            return
+        try:
+            self._write_snapshot(self._merged(self._unwritten))
+        except Exception:
+            return
+        self._unwritten = []
+
+    def _merged(self, ops: List[dict]) -> dict:
+        """The stored progress with ``ops`` applied, for a new snapshot."""
+        data = self._read() if self._synced else {}
+        _apply_journal_ops(data, ops)
+        data["schema_version"] = PROGRESS_SCHEMA_VERSION
+        return data
+
+    # ---- SQLite storage ----
+
+    def _open_store(self) -> progress_store.ProgressStore:
+        if self.store is None:
+            self.store = progress_store.ProgressStore(self.database)
+        return self.store
+
+    def _read_store(self, state: AppState) -> dict:
+        store = self._open_store()
+        if store.is_empty():
+            try:
+                data = self._read()
+            except FileNotFoundError:
+                data = None
+            if data is not None:
+                store.replace_progress(data)
+        state.settings.history_store = store
+        if store.is_empty():
+            raise FileNotFoundError(self.database)
+        if self.lazy_sections:
+            return store.load_fields(("schema_version",) + PROGRESS_SECTIONS["core"])
+        return store.load_progress(SESSION_HISTORY_LIMIT)
+
+    def _store_section(self, section: str) -> dict:
+        """Read one lazily loaded section from the store."""
+        return self.store.load_fields(PROGRESS_SECTIONS[section], SESSION_HISTORY_LIMIT)
+
+    def _save_store(self, ops: List[dict]) -> None:
+        if not self._synced:
+            # Nothing usable was loaded; the ops carry every field.
+            ops = [{"op": "set", "key": "schema_version", "value": PROGRESS_SCHEMA_VERSION}] + ops
+        if ops:
+            self._open_store().apply_ops(ops)
+
+    # ---- snapshot + journal storage ----
+
+    def _read(self) -> dict:
+        """Return the snapshot with newer journal records replayed onto it."""
+        records = self._read_journal()
+        with open(self.filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        snapshot_seq = int(data.pop("journal_seq", 0))
+        self._seq = max(self._seq, snapshot_seq)
+        for record in records:
+            # Records already folded into the snapshot (a compaction that
+            # stopped before clearing the journal) are skipped.
+            if record["seq"] > snapshot_seq:
+                _apply_journal_ops(data, record["ops"])
+        return data
+
+    def _read_journal(self) -> List[dict]:
+        self._seq = 0
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._journal_broken = False
+        try:
+            with open(self.journal_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        valid = 0
+        for line in raw.splitlines(keepends=True):
+            # A line cut short by a crash ends the journal.
+            if not line.endswith(b"\n"):
+                break
+            try:
+                record = json.loads(line.decode("utf-8"))
+                seq = int(record["seq"])
+                ops = list(record["ops"])
+            except (ValueError, KeyError, TypeError):
+                break
+            records.append({"seq": seq, "ops": ops})
+            self._seq = max(self._seq, seq)
+            valid += len(line)
+
+        if valid < len(raw):
+            try:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(valid)
+            except OSError:
+                self._journal_broken = True
+        self._journal_records = len(records)
+        self._journal_bytes = valid
+        return records
+
+    def _needs_compaction(self) -> bool:
+        return (
+            self._journal_broken
+            or self._journal_records >= self.compact_records
+            or self._journal_bytes >= self.compact_bytes
+        )
+
+    def _append_journal(self, ops: List[dict]) -> None:
+        line = json.dumps({"seq": self._seq + 1, "ops": ops}, separators=(",", ":")) + "\n"
+        encoded = line.encode("utf-8")
+        try:
+            with open(self.journal_path, "ab") as f:
+                f.write(encoded)
+        except Exception:
+            # The tail may be torn; the next save rewrites the snapshot instead.
+            self._journal_broken = True
+            raise
+        self._seq += 1
+        self._journal_records += 1
+        self._journal_bytes += len(encoded)
+
+    def _write_snapshot(self, data: dict) -> None:
+        snapshot = dict(data)
+        snapshot["journal_seq"] = self._seq
+        tmp = pathlib.Path(str(self.filename) + ".tmp")
+        tmp.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
+        tmp.replace(self.filename)
+        # Every journal record is now part of the snapshot.
+        with open(self.journal_path, "wb"):
+            pass
+        self._journal_records = 0
+        self._journal_bytes = 0
+        self._journal_broken = False
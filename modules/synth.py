@@ -0,0 +1,331 @@
+"""Vectorized note-sequence synthesis for KeyQuest sound effects.
+
+Effects used to be built note by note: a fresh ``np.linspace`` time base per
+note, a waveform, an envelope, and a Python-level ``np.concatenate`` at the
+end. ``render()`` instead takes the whole sequence as ``Note`` specs and fills
+one preallocated float32 buffer. Partials shared by every note are computed
+in a single vectorized pass over the whole sequence; time bases, sample
+layouts, and envelopes are cached per duration and spec, so effects with the
+same rhythm share them instead of rebuilding them on every call.
+
+Waveforms and envelopes match the per-note helpers games/sounds.py used to
+build effects with (sine, square, triangle, pulse; ADSR envelopes, linear
+pitch slides via accumulated phase).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+SAMPLE_RATE = 44100
+
+SINE = "sine"
+SQUARE = "square"
+TRIANGLE = "triangle"
+PULSE = "pulse"
+SILENCE = "silence"
+
+WAVEFORMS = (SINE, SQUARE, TRIANGLE, PULSE, SILENCE)
+
+
+def adsr(attack=0.01, decay=0.05, sustain_level=0.7, release=0.1) -> Tuple:
+    """ADSR envelope spec: linear attack to 1, decay to ``sustain_level``, release to 0."""
+    return ("adsr", float(attack), float(decay), float(sustain_level), float(release))
+
+
+def exp_decay(rate: float) -> Tuple:
+    """Exponential decay spec: ``exp(-rate * t / duration)``."""
+    return ("exp", float(rate))
+
+
+def bell(width: float) -> Tuple:
+    """Bell-shaped envelope spec: ``exp(-width * ((t - duration / 2) / duration) ** 2)``."""
+    return ("bell", float(width))
+
+
+@dataclass(frozen=True)
+class Note:
+    """One note of a sequence.
+
+    ``partials`` are ``(frequency multiple, amplitude)`` or
+    ``(frequency multiple, amplitude, waveform)`` entries summed for the note;
+    the default is a single full-amplitude partial of ``wave``. Chords are
+    partials whose multiples are the frequency ratios of the chord tones.
+    ``end_freq`` turns the note into a linear pitch slide and ``vibrato`` is an
+    optional ``(rate Hz, depth)`` frequency wobble; both integrate the
+    instantaneous frequency into phase. ``tremolo`` is an optional
+    ``(rate Hz, depth)`` amplitude wobble.
+    """
+
+    freq: float
+    duration: float
+    wave: str = SINE
+    amplitude: float = 1.0
+    partials: Tuple = ((1.0, 1.0),)
+    envelope: Optional[Tuple] = None
+    end_freq: Optional[float] = None
+    duty: float = 0.5
+    tremolo: Optional[Tuple[float, float]] = None
+    vibrato: Optional[Tuple[float, float]] = None
+
+
+def rest(duration: float) -> Note:
+    """Silent note used for gaps between sounds."""
+    return Note(0.0, duration, wave=SILENCE, amplitude=0.0, partials=())
+
+
+def chord(freqs, duration: float, harmonics=(), **kwargs) -> Note:
+    """Build a chord note from absolute frequencies.
+
+    Args:
+        freqs: Chord tone frequencies; the first is the note's base frequency
+        duration: Note duration in seconds
+        harmonics: Extra ``(multiple, relative amplitude)`` partials added for
+            every chord tone
+        kwargs: Other Note fields (wave, amplitude, envelope, ...)
+    """
+    base = float(freqs[0])
+    partials = []
+    for freq in freqs:
+        ratio = float(freq) / base
+        partials.append((ratio, 1.0))
+        for multiple, amp in harmonics:
+            partials.append((ratio * multiple, amp))
+    return Note(base, duration, partials=tuple(partials), **kwargs)
+
+
+class _Layout:
+    """Sample layout shared by every sequence with the same note durations."""
+
+    __slots__ = ("lengths", "starts", "slices", "total", "local_time")
+
+    def __init__(self, durations: Tuple[float, ...], sample_rate: int):
+        bases = [time_base(duration, sample_rate) for duration in durations]
+        self.lengths = [len(base) for base in bases]
+        self.starts = []
+        self.slices = []
+        position = 0
+        for count in self.lengths:
+            self.starts.append(position)
+            self.slices.append(slice(position, position + count))
+            position += count
+        self.total = position
+        # Local time restarts at zero for every note.
+        self.local_time = np.concatenate(bases) if bases else np.zeros(0)
+        self.local_time.setflags(write=False)
+
+
+@lru_cache(maxsize=128)
+def _layout(durations: Tuple[float, ...], sample_rate: int) -> _Layout:
+    return _Layout(durations, sample_rate)
+
+
+@lru_cache(maxsize=64)
+def time_base(duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Return a shared, read-only time base for ``duration`` seconds."""
+    base = np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+    base.setflags(write=False)
+    return base
+
+
+_TWO_PI = np.float32(2 * np.pi)
+
+
+def _fill_shape(wave: str, cycles: np.ndarray, duty, scratch: np.ndarray, dest: np.ndarray) -> np.ndarray:
+    """Write ``wave`` evaluated at ``cycles`` into the float32 ``dest`` buffer.
+
+    ``cycles`` (float64) is clobbered: it is reduced to its fractional part so
+    the sine can run in float32 without losing phase accuracy on long notes.
+    """
+    np.floor(cycles, out=scratch)
+    np.subtract(cycles, scratch, out=cycles)
+    if wave in (PULSE, SQUARE):
+        # A square wave is a 50% pulse; deciding on the float64 phase avoids
+        # sign flips that a float32 sine would introduce at zero crossings.
+        np.copyto(dest, np.where(cycles < (0.5 if wave == SQUARE else duty), 1.0, -1.0), casting="same_kind")
+        return dest
+    np.copyto(dest, cycles, casting="same_kind")
+    if wave == TRIANGLE:
+        dest *= 2
+        dest -= 1
+        np.abs(dest, out=dest)
+        dest *= 2
+        dest -= 1
+        return dest
+    if wave != SINE:
+        raise ValueError(f"Unknown waveform: {wave}")
+    dest *= _TWO_PI
+    np.sin(dest, out=dest)
+    return dest
+
+
+def _adsr_envelope(count, attack, decay, sustain_level, release, sample_rate):
+    """ADSR envelope for a ``count``-sample note; release is cut short if the note is."""
+    attack_samples = int(attack * sample_rate)
+    decay_samples = int(decay * sample_rate)
+    release_samples = int(release * sample_rate)
+    sustain_samples = max(0, count - attack_samples - decay_samples - release_samples)
+
+    envelope = np.ones(count)
+    if attack_samples > 0:
+        envelope[:attack_samples] = np.linspace(0, 1, attack_samples)
+    if decay_samples > 0:
+        start = attack_samples
+        envelope[start:start + decay_samples] = np.linspace(1, sustain_level, decay_samples)
+    if sustain_samples > 0:
+        start = attack_samples + decay_samples
+        envelope[start:start + sustain_samples] = sustain_level
+    if release_samples > 0:
+        start = attack_samples + decay_samples + sustain_samples
+        actual = min(release_samples, count - start)
+        if actual > 0:
+            envelope[start:start + actual] = np.linspace(sustain_level, 0, actual)
+    return envelope
+
+
+def _envelope_time(count: int, duration: float, sample_rate: int) -> np.ndarray:
+    """Time axis of exactly ``count`` samples for an envelope over ``duration``.
+
+    A single note's axis is its time base. A sequence-wide envelope spans the
+    sum of per-note sample counts, which ``int(sample_rate * duration)`` can
+    miss by one, so it counts samples instead.
+    """
+    base = time_base(duration, sample_rate)
+    if len(base) == count:
+        return base
+    return np.arange(count) / float(sample_rate)
+
+
+@lru_cache(maxsize=256)
+def _envelope(spec: Optional[Tuple], count: int, duration: float, sample_rate: int) -> np.ndarray:
+    """Return a shared, read-only envelope of ``count`` samples for ``spec``."""
+    kind = spec[0] if spec is not None else None
+    if kind is None:
+        envelope = np.ones(count)
+    elif kind == "adsr":
+        envelope = _adsr_envelope(count, *spec[1:], sample_rate)
+    elif kind == "exp":
+        envelope = np.exp(-spec[1] * _envelope_time(count, duration, sample_rate) / duration)
+    elif kind == "bell":
+        t = _envelope_time(count, duration, sample_rate)
+        envelope = np.exp(-spec[1] * ((t - duration / 2) / duration) ** 2)
+    else:
+        raise ValueError(f"Unknown envelope: {kind}")
+    envelope.setflags(write=False)
+    return envelope
+
+
+@lru_cache(maxsize=128)
+def _sequence_envelope(specs: Tuple, durations: Tuple[float, ...], sample_rate: int) -> np.ndarray:
+    """Per-note envelopes laid end to end as one float32 array."""
+    parts = [
+        _envelope(spec, len(time_base(duration, sample_rate)), duration, sample_rate)
+        for spec, duration in zip(specs, durations)
+    ]
+    envelope = np.concatenate(parts).astype(np.float32)
+    envelope.setflags(write=False)
+    return envelope
+
+
+def render(
+    notes: Iterable[Note],
+    gain: float = 1.0,
+    envelope: Optional[Tuple] = None,
+    sample_rate: int = SAMPLE_RATE,
+) -> np.ndarray:
+    """Render a note sequence into one float32 buffer.
+
+    Args:
+        notes: Note specs played back to back
+        gain: Overall gain applied to the finished sequence
+        envelope: Optional envelope spec applied across the whole sequence
+        sample_rate: Output sample rate
+
+    Returns:
+        float32 numpy array of samples
+    """
+    notes = tuple(notes)
+    durations = tuple(float(note.duration) for note in notes)
+    layout = _layout(durations, sample_rate)
+    total = layout.total
+    out = np.zeros(total, dtype=np.float32)
+    if total == 0:
+        return out
+
+    t = layout.local_time
+    lengths = layout.lengths
+    freqs = np.array([note.freq for note in notes], dtype=np.float64)
+    # Scratch buffers reused by every partial group instead of per-op temporaries.
+    cycles = np.empty(total)
+    scratch = np.empty(total)
+    shape = np.empty(total, dtype=np.float32)
+
+    # Slides and vibrato integrate instantaneous frequency into phase, in cycles.
+    slides = {}
+    for i, note in enumerate(notes):
+        if (note.end_freq is None and note.vibrato is None) or not lengths[i]:
+            continue
+        local = t[layout.slices[i]]
+        inst_freq = np.full(len(local), float(note.freq))
+        if note.end_freq is not None:
+            inst_freq += (note.end_freq - note.freq) * (local / note.duration)
+        if note.vibrato is not None:
+            rate, depth = note.vibrato
+            inst_freq *= 1 + depth * np.sin(2 * np.pi * rate * local)
+        slides[i] = np.cumsum(2 * np.pi * inst_freq / sample_rate) / (2 * np.pi)
+
+    # Collect partial amplitudes per (waveform, multiple) so each group is one pass.
+    groups = {}
+    for i, note in enumerate(notes):
+        if note.wave == SILENCE:
+            continue
+        for partial in note.partials:
+            wave = partial[2] if len(partial) > 2 else note.wave
+            amps = groups.setdefault((wave, float(partial[0])), [0.0] * len(notes))
+            amps[i] += note.amplitude * partial[1]
+
+    for (wave, multiple), amps in groups.items():
+        active = [i for i, amp in enumerate(amps) if amp and lengths[i]]
+        if len(active) == len(notes):
+            # Dense group: the whole sequence in one vectorized pass.
+            np.multiply(np.repeat(multiple * freqs, lengths), t, out=cycles)
+            for i, slide in slides.items():
+                np.multiply(slide, multiple, out=cycles[layout.slices[i]])
+            duties = {note.duty for note in notes}
+            duty = duties.pop() if len(duties) == 1 else np.repeat([note.duty for note in notes], lengths)
+            _fill_shape(wave, cycles, duty, scratch, shape)
+            levels = set(amps)
+            if len(levels) == 1:
+                shape *= np.float32(levels.pop())
+            else:
+                shape *= np.repeat(np.asarray(amps, dtype=np.float32), lengths)
+            out += shape
+            continue
+        # Sparse group (chord tones, per-note harmonics): only the notes that use it.
+        for i in active:
+            sl = layout.slices[i]
+            if i in slides:
+                np.multiply(slides[i], multiple, out=cycles[sl])
+            else:
+                np.multiply(t[sl], multiple * freqs[i], out=cycles[sl])
+            part = _fill_shape(wave, cycles[sl], notes[i].duty, scratch[sl], shape[sl])
+            part *= np.float32(amps[i])
+            out[sl] += part
+
+    for i, note in enumerate(notes):
+        if note.tremolo is not None and lengths[i]:
+            rate, depth = note.tremolo
+            sl = layout.slices[i]
+            out[sl] *= (1 + depth * np.sin(2 * np.pi * rate * t[sl])).astype(np.float32)
+
+    specs = tuple(note.envelope for note in notes)
+    if any(spec is not None for spec in specs):
+        out *= _sequence_envelope(specs, durations, sample_rate)
+    if envelope is not None:
+        out *= _envelope(envelope, total, total / float(sample_rate), sample_rate).astype(np.float32)
+    if gain != 1.0:
+        out *= np.float32(gain)
+    return out
@@ -158,6 +158,9 @@ def load_next_sentence(app) -> None:
 
 def finish_test(app) -> None:
     app.state.test.running = False
+    recorder = getattr(app, "keystrokes", None)
+    if recorder is not None:
+        recorder.end_session()
     t = app.state.test
     prev_highest_wpm = app.state.settings.highest_wpm
 
@@ -295,6 +298,7 @@ def process_test_typing(app, event) -> None:
     if event.unicode and event.unicode.isprintable():
         ch = event.unicode
     elif event.key == pygame.K_BACKSPACE:
+        _record_timing(app, "test", app.state.test, "backspace", False)
         _record_typing_error(app, app.state.test)
         return
     else:
@@ -306,8 +310,10 @@ def process_test_typing(app, event) -> None:
             t.start_time = time.time()
             t.running = True
         pos = len(t.typed)
+        correct = pos < len(t.current) and ch == t.current[pos]
+        _record_timing(app, "test", t, ch, correct)
 
-        if pos < len(t.current) and ch == t.current[pos]:
+        if correct:
             t.typed += ch
             t.correct_chars += 1
             t.total_chars += 1
@@ -453,6 +459,9 @@ def load_next_practice_sentence(app) -> None:
 def finish_practice(app) -> None:
     """Finish sentence practice and show results."""
     app.state.test.running = False
+    recorder = getattr(app, "keystrokes", None)
+    if recorder is not None:
+        recorder.end_session()
     t = app.state.test
     prev_highest_wpm = app.state.settings.highest_wpm
 
@@ -585,6 +594,7 @@ def process_practice_typing(app, event) -> None:
     if event.unicode and event.unicode.isprintable():
         ch = event.unicode
     elif event.key == pygame.K_BACKSPACE:
+        _record_timing(app, "practice", app.state.test, "backspace", False)
         _record_typing_error(app, app.state.test)
         return
     if not ch:
@@ -592,8 +602,10 @@ def process_practice_typing(app, event) -> None:
 
     t = app.state.test
     pos = len(t.typed)
+    correct = pos < len(t.current) and ch == t.current[pos]
+    _record_timing(app, "practice", t, ch, correct)
 
-    if pos < len(t.current) and ch == t.current[pos]:
+    if correct:
         t.typed += ch
         t.correct_chars += 1
         t.total_chars += 1
@@ -618,6 +630,16 @@ def speak_practice_remaining(app) -> None:
     )
 
 
+def _record_timing(app, mode: str, test_state, typed: str, correct: bool) -> None:
+    """Log the keystroke's timing for hesitation / latency analysis."""
+    recorder = getattr(app, "keystrokes", None)
+    if recorder is None:
+        return
+    pos = len(test_state.typed)
+    expected = test_state.current[pos] if pos < len(test_state.current) else ""
+    recorder.record(mode, expected, typed, correct)
+
+
 def _record_typing_error(app, test_state) -> None:
     """Handle a typing error without modifying already typed text."""
     pos = len(test_state.typed)
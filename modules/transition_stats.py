@@ -0,0 +1,373 @@
+"""Inter-key latency (digraph and trigraph) statistics.
+
+Built from ``keystroke_log`` rows: for each pair of consecutive keystrokes
+in one session, where the first was typed correctly and the gap is under
+``MAX_GAP_MS``, the pair of *expected* keys gets one attempt, an error when
+the second keystroke was wrong, and (when it was right) its latency. Three
+keystrokes in a row on letters and space feed the trigraph tables the same
+way.
+
+Characters are folded onto physical keys (``A`` and ``!`` count as ``a``
+and ``1``), so every table is a small dense numpy array indexed by key id:
+
+- ``pair_attempts`` / ``pair_errors``: (KEYS, KEYS) counts
+- ``pair_total_ms``: (KEYS, KEYS) latency sums for the mean
+- ``pair_hist``: (KEYS, KEYS, bins) latency histogram for the median
+- ``tri_*``: (TRI_KEYS,) * 3 counts and sums over space and letters
+
+``update()`` adds a flushed batch of rows with a few ``bincount`` calls, so
+the cost per session is independent of how many keystrokes came before. The
+tables live in ``transitions.npz`` (about 450 KB) and are only read on the
+first update or query, never during progress load. When the file is missing
+they are rebuilt once from the full keystroke log.
+
+Updates and saves run on the save worker while queries run on the pygame
+thread. Loading, updating, and saving hold a lock, and an update replaces
+each table with a new array instead of adding in place. A query therefore
+reads whole tables, either from before a batch or after it.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from modules import error_logging
+
+
+TRANSITIONS_FILE = "transitions.npz"
+TRANSITIONS_VERSION = 1
+
+# Space and letters come first so trigraph ids are a prefix of the key ids.
+KEY_NAMES = (" ",) + tuple("abcdefghijklmnopqrstuvwxyz") + tuple("0123456789") + tuple("`-=[]\\;',./")
+KEYS = len(KEY_NAMES) + 1  # id 0 is "not tracked"
+TRI_KEYS = 28  # ids 0..27: untracked, space, a-z
+
+_SHIFTED = dict(zip('~!@#$%^&*()_+{}|:"<>?', "`1234567890-=[]\\;',./"))
+
+# Pauses longer than this are thinking time, not a transition.
+MAX_GAP_MS = 2000.0
+
+# Histogram bin edges in milliseconds (16 bins up to MAX_GAP_MS).
+LATENCY_EDGES_MS = np.array(
+    [0, 40, 60, 80, 100, 125, 150, 175, 200, 250, 300, 400, 500, 700, 1000, 1500, MAX_GAP_MS],
+    dtype=np.float64,
+)
+BINS = len(LATENCY_EDGES_MS) - 1
+
+_CODE_TO_ID = np.zeros(128, dtype=np.intp)
+for _index, _name in enumerate(KEY_NAMES, start=1):
+    _CODE_TO_ID[ord(_name)] = _index
+    if _name.isalpha():
+        _CODE_TO_ID[ord(_name.upper())] = _index
+for _shifted, _base in _SHIFTED.items():
+    _CODE_TO_ID[ord(_shifted)] = KEY_NAMES.index(_base) + 1
+
+
+def key_ids(codes: np.ndarray) -> np.ndarray:
+    """Map keystroke_log character codes to key ids (0 for untracked keys)."""
+    codes = np.asarray(codes, dtype=np.int64)
+    ids = np.zeros(codes.shape, dtype=np.intp)
+    ascii_codes = codes < 128
+    ids[ascii_codes] = _CODE_TO_ID[codes[ascii_codes]]
+    return ids
+
+
+def key_id(key: str) -> int:
+    """Key id for one character (0 for untracked keys)."""
+    return int(_CODE_TO_ID[ord(key)]) if len(key) == 1 and ord(key) < 128 else 0
+
+
+def key_name(index: int) -> str:
+    return KEY_NAMES[index - 1] if 0 < index <= len(KEY_NAMES) else ""
+
+
+def _histogram_medians(hists: np.ndarray) -> np.ndarray:
+    """Median latency of each histogram row, interpolated inside its bin."""
+    hists = np.asarray(hists, dtype=np.float64).reshape(-1, BINS)
+    half = hists.sum(axis=1) / 2.0
+    cumulative = np.cumsum(hists, axis=1)
+    bin_index = np.minimum((cumulative < half[:, None]).sum(axis=1), BINS - 1)
+    rows = np.arange(len(hists))
+    before = np.where(bin_index > 0, cumulative[rows, bin_index - 1], 0.0)
+    in_bin = hists[rows, bin_index]
+    fraction = np.divide(half - before, in_bin, out=np.zeros_like(half), where=in_bin > 0)
+    low, high = LATENCY_EDGES_MS[bin_index], LATENCY_EDGES_MS[bin_index + 1]
+    return np.where(half > 0, low + (high - low) * fraction, 0.0)
+
+
+class TransitionStats:
+    """Digraph and trigraph latency tables, updated per flushed session."""
+
+    def __init__(self, path: Optional[str] = TRANSITIONS_FILE, source: Optional[Callable[[], np.ndarray]] = None):
+        self.path = path
+        # Returns every stored keystroke row; used to rebuild a missing file.
+        self.source = source
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._dirty = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self.pair_attempts = np.zeros((KEYS, KEYS), dtype=np.uint32)
+        self.pair_errors = np.zeros((KEYS, KEYS), dtype=np.uint32)
+        self.pair_total_ms = np.zeros((KEYS, KEYS), dtype=np.float64)
+        self.pair_hist = np.zeros((KEYS, KEYS, BINS), dtype=np.uint32)
+        self.tri_attempts = np.zeros((TRI_KEYS,) * 3, dtype=np.uint32)
+        self.tri_errors = np.zeros((TRI_KEYS,) * 3, dtype=np.uint32)
+        self.tri_total_ms = np.zeros((TRI_KEYS,) * 3, dtype=np.float64)
+        # The last two rows seen, so pairs spanning two flushes are counted.
+        self._carry = None
+
+    # ---- loading and saving ----
+
+    @property
+    def loaded(self) -> bool:
+        """True once the tables have been read or rebuilt."""
+        return self._loaded
+
+    def ensure_loaded(self) -> None:
+        """Read the tables (or rebuild them) the first time they are needed."""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._loaded = True
+
+    def _load(self) -> None:
+        if self.path and os.path.exists(self.path):
+            try:
+                with np.load(self.path) as data:
+                    if int(data["version"]) == TRANSITIONS_VERSION:
+                        for name in (
+                            "pair_attempts", "pair_errors", "pair_total_ms", "pair_hist",
+                            "tri_attempts", "tri_errors", "tri_total_ms",
+                        ):
+                            setattr(self, name, data[name].copy())
+                        return
+            except Exception as e:
+                error_logging.log_exception(e)
+                self._reset()
+        if self.source is not None:
+            try:
+                self._add_rows(self.source())
+            except Exception as e:
+                error_logging.log_exception(e)
+                self._reset()
+                return
+            self._carry = None
+            self._dirty = True
+
+    def save(self) -> bool:
+        """Write the tables if they changed. Returns False on failure."""
+        with self._lock:
+            return self._save()
+
+    def _save(self) -> bool:
+        if not self._dirty or not self.path:
+            return True
+        tmp_path = f"{self.path}.tmp.npz"
+        try:
+            np.savez(
+                tmp_path,
+                version=np.int32(TRANSITIONS_VERSION),
+                pair_attempts=self.pair_attempts,
+                pair_errors=self.pair_errors,
+                pair_total_ms=self.pair_total_ms,
+                pair_hist=self.pair_hist,
+                tri_attempts=self.tri_attempts,
+                tri_errors=self.tri_errors,
+                tri_total_ms=self.tri_total_ms,
+            )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            error_logging.log_exception(e)
+            return False
+        self._dirty = False
+        return True
+
+    # ---- updates ----
+
+    def update(self, rows: np.ndarray) -> None:
+        """Add newly flushed keystroke rows (oldest first)."""
+        if not len(rows):
+            return
+        with self._lock:
+            self.ensure_loaded()
+            self._add_rows(rows)
+            self._dirty = True
+
+    def _add_rows(self, rows: np.ndarray) -> None:
+        carried = 0
+        if self._carry is not None:
+            carried = len(self._carry)
+            rows = np.concatenate((self._carry, rows))
+        self._carry = rows[-2:].copy()
+        if len(rows) < 2:
+            return
+
+        ids = key_ids(rows["expected"])
+        correct = rows["correct"].astype(bool)
+        gap_ms = np.diff(rows["t_ns"]).astype(np.float64) / 1e6
+        # valid[i]: keystroke i + 1 follows keystroke i as a timed transition.
+        valid = (
+            (rows["session"][1:] == rows["session"][:-1])
+            & (rows["mode"][1:] == rows["mode"][:-1])
+            & correct[:-1]
+            & (gap_ms > 0)
+            & (gap_ms <= MAX_GAP_MS)
+            & (ids[:-1] > 0)
+            & (ids[1:] > 0)
+        )
+
+        # Pairs entirely inside the carried rows were counted last time.
+        counted = valid.copy()
+        counted[: max(0, carried - 1)] = False
+        first, second = ids[:-1][counted], ids[1:][counted]
+        pair = first * KEYS + second
+        ok = correct[1:][counted]
+        gaps = gap_ms[counted]
+        size = KEYS * KEYS
+        pair_attempts = np.bincount(pair, minlength=size).reshape(KEYS, KEYS).astype(np.uint32)
+        self.pair_attempts = self.pair_attempts + pair_attempts
+        pair_errors = np.bincount(pair[~ok], minlength=size).reshape(KEYS, KEYS).astype(np.uint32)
+        self.pair_errors = self.pair_errors + pair_errors
+        pair_total_ms = np.bincount(pair[ok], weights=gaps[ok], minlength=size).reshape(KEYS, KEYS)
+        self.pair_total_ms = self.pair_total_ms + pair_total_ms
+        bins = np.clip(np.searchsorted(LATENCY_EDGES_MS, gaps[ok], side="right") - 1, 0, BINS - 1)
+        self.pair_hist = self.pair_hist + (
+            np.bincount(pair[ok] * BINS + bins, minlength=size * BINS).reshape(KEYS, KEYS, BINS).astype(np.uint32)
+        )
+
+        if len(rows) < 3:
+            return
+        # Two valid transitions in a row; the middle keystroke was correct.
+        tri_valid = valid[:-1] & valid[1:] & (ids[:-2] < TRI_KEYS) & (ids[1:-1] < TRI_KEYS) & (ids[2:] < TRI_KEYS)
+        triple = (ids[:-2][tri_valid] * TRI_KEYS + ids[1:-1][tri_valid]) * TRI_KEYS + ids[2:][tri_valid]
+        tri_ok = correct[2:][tri_valid]
+        tri_ms = (gap_ms[:-1] + gap_ms[1:])[tri_valid]
+        shape = (TRI_KEYS,) * 3
+        tri_size = TRI_KEYS ** 3
+        tri_attempts = np.bincount(triple, minlength=tri_size).reshape(shape).astype(np.uint32)
+        self.tri_attempts = self.tri_attempts + tri_attempts
+        tri_errors = np.bincount(triple[~tri_ok], minlength=tri_size).reshape(shape).astype(np.uint32)
+        self.tri_errors = self.tri_errors + tri_errors
+        tri_total_ms = np.bincount(triple[tri_ok], weights=tri_ms[tri_ok], minlength=tri_size).reshape(shape)
+        self.tri_total_ms = self.tri_total_ms + tri_total_ms
+
+    # ---- queries ----
+
+    @property
+    def transitions(self) -> int:
+        self.ensure_loaded()
+        return int(self.pair_attempts.sum())
+
+    def pair(self, first: str, second: str) -> Optional[dict]:
+        """Stats for one key pair, or None when it was never typed."""
+        self.ensure_loaded()
+        i, j = key_id(first), key_id(second)
+        if not i or not j or not self.pair_attempts[i, j]:
+            return None
+        return self._pair_entry(i, j)
+
+    def _pair_entry(self, i: int, j: int) -> dict:
+        attempts = int(self.pair_attempts[i, j])
+        timed = int(self.pair_hist[i, j].sum())
+        return {
+            "keys": key_name(i) + key_name(j),
+            "attempts": attempts,
+            "errors": int(self.pair_errors[i, j]),
+            "error_rate": float(self.pair_errors[i, j]) / attempts * 100.0,
+            "mean_ms": float(self.pair_total_ms[i, j]) / timed if timed else 0.0,
+            "median_ms": float(_histogram_medians(self.pair_hist[i, j])[0]),
+        }
+
+    def slowest_pairs(self, limit: int = 5, min_samples: int = 10) -> List[dict]:
+        """Key pairs with the highest median latency, slowest first."""
+        self.ensure_loaded()
+        timed = self.pair_hist.sum(axis=2)
+        candidates = np.argwhere(timed >= max(1, min_samples))
+        if not len(candidates):
+            return []
+        medians = _histogram_medians(self.pair_hist[candidates[:, 0], candidates[:, 1]])
+        order = np.argsort(-medians, kind="stable")[:limit]
+        return [self._pair_entry(int(i), int(j)) for i, j in candidates[order]]
+
+    def slowest_trigraphs(self, limit: int = 5, min_samples: int = 10) -> List[dict]:
+        """Three-key sequences over letters and space with the highest mean latency."""
+        self.ensure_loaded()
+        timed = self.tri_attempts.astype(np.int64) - self.tri_errors
+        candidates = np.argwhere(timed >= max(1, min_samples))
+        if not len(candidates):
+            return []
+        i, j, k = candidates.T
+        means = self.tri_total_ms[i, j, k] / timed[i, j, k]
+        entries = []
+        for i, j, k in candidates[np.argsort(-means, kind="stable")[:limit]]:
+            count = int(timed[i, j, k])
+            attempts = int(self.tri_attempts[i, j, k])
+            entries.append(
+                {
+                    "keys": key_name(int(i)) + key_name(int(j)) + key_name(int(k)),
+                    "attempts": attempts,
+                    "error_rate": float(self.tri_errors[i, j, k]) / attempts * 100.0,
+                    "mean_ms": float(self.tri_total_ms[i, j, k]) / count,
+                }
+            )
+        return entries
+
+    def overall_median_ms(self) -> float:
+        """Median latency over every timed transition (0 without data)."""
+        self.ensure_loaded()
+        return float(_histogram_medians(self.pair_hist.sum(axis=(0, 1)))[0])
+
+    def key_medians(self, keys: List[str], min_samples: int = 10) -> Dict[str, float]:
+        """Median latency of transitions into each key that has enough samples."""
+        self.ensure_loaded()
+        tracked = [(key, key_id(key)) for key in keys if key_id(key)]
+        if not tracked:
+            return {}
+        hists = self.pair_hist[:, [index for _, index in tracked]].sum(axis=0)
+        medians = _histogram_medians(hists)
+        counts = hists.sum(axis=1)
+        return {key: float(medians[n]) for n, (key, _) in enumerate(tracked) if counts[n] >= min_samples}
+
+    def pair_medians(self, keys: List[str], min_samples: int = 10) -> Dict[tuple, float]:
+        """Median latency of each (first, second) pair of ``keys`` with enough samples."""
+        self.ensure_loaded()
+        tracked = [(key, key_id(key)) for key in keys if key_id(key)]
+        if not tracked:
+            return {}
+        ids = [index for _, index in tracked]
+        hists = self.pair_hist[np.ix_(ids, ids)]
+        counts = hists.sum(axis=2)
+        rows, cols = np.nonzero(counts >= max(1, min_samples))
+        medians = _histogram_medians(hists[rows, cols])
+        return {(tracked[r][0], tracked[c][0]): float(m) for r, c, m in zip(rows, cols, medians)}
+
+    def key_group_latency(self, keys: List[str], min_samples: int = 10) -> Optional[dict]:
+        """Median latency and error rate of transitions *into* any of ``keys``."""
+        self.ensure_loaded()
+        columns = [key_id(key) for key in keys if key_id(key)]
+        if not columns:
+            return None
+        hist = self.pair_hist[:, columns].sum(axis=(0, 1))
+        if int(hist.sum()) < min_samples:
+            return None
+        attempts = int(self.pair_attempts[:, columns].sum())
+        return {
+            "attempts": attempts,
+            "error_rate": float(self.pair_errors[:, columns].sum()) / attempts * 100.0,
+            "median_ms": float(_histogram_medians(hist)[0]),
+        }
+
+    def group_latencies(self, groups: Dict[str, List[str]], min_samples: int = 10) -> Dict[str, dict]:
+        """``key_group_latency()`` for each named group that has enough data."""
+        results = {}
+        for name, keys in groups.items():
+            latency = self.key_group_latency(keys, min_samples)
+            if latency is not None:
+                results[name] = latency
+        return results
@@ -325,12 +325,22 @@ if not errorlevel 1 (
 if exist "%BACKUP_DIR%" rmdir /s /q "%BACKUP_DIR%"
 mkdir "%BACKUP_DIR%" >nul 2>&1
 if exist "%APP_DIR%\\progress.json" copy /Y "%APP_DIR%\\progress.json" "%BACKUP_DIR%\\progress.json" >nul
+if exist "%APP_DIR%\\progress.journal" copy /Y "%APP_DIR%\\progress.journal" "%BACKUP_DIR%\\progress.journal" >nul
+if exist "%APP_DIR%\\progress.db" copy /Y "%APP_DIR%\\progress.db" "%BACKUP_DIR%\\progress.db" >nul
+if exist "%APP_DIR%\\progress.db-wal" copy /Y "%APP_DIR%\\progress.db-wal" "%BACKUP_DIR%\\progress.db-wal" >nul
 if exist "%APP_DIR%\\Sentences" robocopy "%APP_DIR%\\Sentences" "%BACKUP_DIR%\\Sentences" /E /R:2 /W:1 /NFL /NDL /NJH /NJS /NP >nul
 
 start "" /wait "%INSTALLER%" /CURRENTUSER /VERYSILENT /SUPPRESSMSGBOXES /NOCANCEL /CLOSEAPPLICATIONS /FORCECLOSEAPPLICATIONS
 if errorlevel 1 exit /b %errorlevel%
 
 if exist "%BACKUP_DIR%\\progress.json" copy /Y "%BACKUP_DIR%\\progress.json" "%APP_DIR%\\progress.json" >nul
+if exist "%BACKUP_DIR%\\progress.journal" copy /Y "%BACKUP_DIR%\\progress.journal" "%APP_DIR%\\progress.journal" >nul
+if exist "%BACKUP_DIR%\\progress.db" (
+    if exist "%APP_DIR%\\progress.db-wal" del /F /Q "%APP_DIR%\\progress.db-wal" >nul
+    if exist "%APP_DIR%\\progress.db-shm" del /F /Q "%APP_DIR%\\progress.db-shm" >nul
+    copy /Y "%BACKUP_DIR%\\progress.db" "%APP_DIR%\\progress.db" >nul
+)
+if exist "%BACKUP_DIR%\\progress.db-wal" copy /Y "%BACKUP_DIR%\\progress.db-wal" "%APP_DIR%\\progress.db-wal" >nul
 {sentence_merge_command}
 if errorlevel 1 exit /b %errorlevel%
 
@@ -383,7 +393,7 @@ powershell -NoProfile -ExecutionPolicy Bypass -Command ^
 {sentence_merge_command}
 if errorlevel 1 exit /b %errorlevel%
 
-robocopy "%EXTRACT_DIR%\\KeyQuest" "%APP_DIR%" /E /R:2 /W:1 /NFL /NDL /NJH /NJS /NP /XF progress.json
+robocopy "%EXTRACT_DIR%\\KeyQuest" "%APP_DIR%" /E /R:2 /W:1 /NFL /NDL /NJH /NJS /NP /XF progress.json progress.journal progress.db progress.db-wal progress.db-shm
 set "ROBOCODE=%ERRORLEVEL%"
 if %ROBOCODE% GEQ 8 exit /b %ROBOCODE%
 
@@ -0,0 +1,177 @@
+"""Weak-key weighting and weighted practice generation.
+
+Lessons used to build random practice strings with a uniform
+``random.choice`` per character. ``WeakKeyGenerator`` draws characters in
+proportion to how much each key needs practice instead:
+
+- long-term accuracy from ``Settings.key_stats`` (misses push a key up),
+- typing speed from ``Settings.transition_stats`` when timing data exists
+  (keys, and key-to-key transitions, slower than the learner's typical
+  latency push up),
+- keys the lesson wants to focus on (new keys, in-session struggling keys),
+  scaled to take a fixed share of the draws.
+
+The weights are turned into Walker alias tables once per batch, so each
+character costs two random numbers, and a batch costs O(batch length).
+After the first character, the next one is drawn from a table conditioned
+on the previous key, which is how slow transitions get repeated.
+
+``key_weights()`` is the same model without sampling; ``key_analytics``
+uses it to rank lessons to recommend.
+"""
+
+import random
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Weight added per unit of smoothed error rate: a key missed a quarter of
+# the time weighs four times as much as a key never missed.
+ERROR_WEIGHT = 12.0
+# Attempts assumed before any data, so one early miss does not dominate.
+PRIOR_ATTEMPTS = 5
+# Cap on how much slower-than-typical latency can multiply a weight.
+MAX_LATENCY_FACTOR = 2.5
+# Share of draws that go to focus keys (the old per-character rolls gave
+# struggling and new keys roughly this much).
+FOCUS_SHARE = 0.6
+# Timed transitions needed before latency counts.
+MIN_LATENCY_SAMPLES = 10
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(1) weighted draws after O(n) setup."""
+
+    def __init__(self, items: Sequence, weights: Sequence[float], rng=random):
+        if not items:
+            raise ValueError("AliasTable needs at least one item")
+        self.items = list(items)
+        self._rng = rng
+        count = len(self.items)
+        total = float(sum(weights))
+        if total <= 0:
+            scaled = [1.0] * count
+        else:
+            scaled = [max(0.0, float(weight)) * count / total for weight in weights]
+        self._prob = [1.0] * count
+        self._alias = list(range(count))
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self._prob[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Leftovers are 1.0 up to rounding.
+
+    def draw(self):
+        index = int(self._rng.random() * len(self.items))
+        if self._rng.random() >= self._prob[index]:
+            index = self._alias[index]
+        return self.items[index]
+
+
+def _latency_factor(median_ms: float, typical_ms: float) -> float:
+    if typical_ms <= 0:
+        return 1.0
+    return min(MAX_LATENCY_FACTOR, max(1.0, median_ms / typical_ms))
+
+
+def key_weights(
+    keys: Iterable[str],
+    key_stats: Optional[dict] = None,
+    transitions=None,
+    focus: Iterable[str] = (),
+    focus_share: float = FOCUS_SHARE,
+) -> Dict[str, float]:
+    """Practice weight for each key (1.0 for a key with no known weakness)."""
+    keys = list(keys)
+    key_stats = key_stats or {}
+    focus = set(focus)
+    latency = {}
+    typical_ms = 0.0
+    if transitions is not None:
+        typical_ms = transitions.overall_median_ms()
+        latency = transitions.key_medians(keys, MIN_LATENCY_SAMPLES)
+
+    weights = {}
+    for key in keys:
+        stats = key_stats.get(key) or {}
+        attempts = stats.get("attempts", 0)
+        errors = stats.get("errors", attempts - stats.get("correct", attempts))
+        weight = 1.0 + ERROR_WEIGHT * max(0, errors) / (attempts + PRIOR_ATTEMPTS)
+        if key in latency:
+            weight *= _latency_factor(latency[key], typical_ms)
+        weights[key] = weight
+
+    focused = [key for key in keys if key in focus]
+    if focused and len(focused) < len(weights):
+        focus_total = sum(weights[key] for key in focused)
+        other_total = sum(weights.values()) - focus_total
+        scale = focus_share / (1.0 - focus_share) * other_total / focus_total
+        for key in focused:
+            weights[key] *= scale
+    return weights
+
+
+class WeakKeyGenerator:
+    """Weighted practice strings over a lesson's keys."""
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        key_stats: Optional[dict] = None,
+        transitions=None,
+        focus: Iterable[str] = (),
+        rng=random,
+    ):
+        self.keys = sorted(set(keys))
+        self._rng = rng
+        self.weights = key_weights(self.keys, key_stats, transitions, focus)
+        unigram = [self.weights[key] for key in self.keys]
+        self._first = AliasTable(self.keys, unigram, rng)
+
+        pair_latency = {}
+        typical_ms = 0.0
+        if transitions is not None:
+            typical_ms = transitions.overall_median_ms()
+            pair_latency = transitions.pair_medians(self.keys, MIN_LATENCY_SAMPLES)
+        # A table per previous key with timed transitions out of it (slow
+        # ones weigh more); other keys reuse the first-character table.
+        self._next = {}
+        for previous in {first for first, _ in pair_latency}:
+            row = [
+                self.weights[key] * _latency_factor(pair_latency.get((previous, key), 0.0), typical_ms)
+                for key in self.keys
+            ]
+            self._next[previous] = AliasTable(self.keys, row, rng)
+
+    @classmethod
+    def for_settings(cls, settings, keys: Iterable[str], focus: Iterable[str] = (), rng=random) -> "WeakKeyGenerator":
+        """Generator using a Settings object's key stats and timing tables, if any.
+
+        Timing tables that are not loaded yet are skipped (the prewarm thread
+        reads them), so a lesson never waits on the disk for latency weights.
+        """
+        transitions = getattr(settings, "transition_stats", None)
+        if transitions is not None and not getattr(transitions, "loaded", True):
+            transitions = None
+        return cls(
+            keys,
+            key_stats=getattr(settings, "key_stats", None),
+            transitions=transitions,
+            focus=focus,
+            rng=rng,
+        )
+
+    def key(self) -> str:
+        return self._first.draw()
+
+    def word(self, length: int) -> str:
+        chars = [self._first.draw()]
+        while len(chars) < length:
+            chars.append(self._next.get(chars[-1], self._first).draw())
+        return "".join(chars)
+
+    def words(self, count: int, min_length: int, max_length: int) -> List[str]:
+        return [self.word(self._rng.randint(min_length, max_length)) for _ in range(count)]
@@ -0,0 +1,215 @@
+"""Precomputed index of real words by the keys needed to type them.
+
+Each word is stored with a bitmask of its keys. Bits follow lesson order
+(``key_order_for_stages(STAGE_LETTERS)``), and words are sorted by mask
+value. A word is typeable with a key set exactly when its mask is a subset
+of the set's mask, and a subset is never numerically larger. So:
+
+- every typeable word sits before ``searchsorted(masks, allowed)``;
+- when the allowed keys are a prefix of lesson order (any lesson's
+  cumulative keys), that whole prefix qualifies, which is one binary search;
+- other sets (free practice selections, review keys) filter just that
+  prefix with one vectorized ``&``.
+
+``tools/dev/build_word_index.py`` builds ``cache/word_index.bin`` from the
+Sentences files and the offline Hangman word list at packaging time. The
+file is memory-mapped on first use; without it, lessons keep their authored
+words only.
+
+File layout (little endian): ``KQWI`` magic, u16 version, u16 key count,
+u32 word count, u32 text size, the key order (one ASCII byte per key),
+zero padding to 8 bytes, u64 masks, u32 text offsets (count + 1), then the
+UTF-8 words back to back.
+"""
+
+import os
+import random
+import re
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from modules import error_logging
+from modules.app_paths import get_app_dir
+
+
+WORD_INDEX_FILE = os.path.join("cache", "word_index.bin")
+WORD_INDEX_VERSION = 1
+_MAGIC = b"KQWI"
+_HEADER = struct.Struct("<4sHHII")
+
+# Lowercase words, optionally joined by an apostrophe or hyphen ("don't").
+_WORD_PATTERN = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+
+# Query results kept per (allowed, required) mask pair.
+_QUERY_CACHE_SIZE = 64
+
+
+def key_order_for_stages(stage_letters: Sequence[Iterable[str]]) -> str:
+    """Single-character keys in the order lessons introduce them (no space)."""
+    order = []
+    for keys in stage_letters:
+        for key in sorted(keys):
+            if len(key) == 1 and key != " " and key not in order:
+                order.append(key)
+    return "".join(order)
+
+
+def extract_words(text: str, min_length: int = 2) -> List[str]:
+    """Lowercase words from free text."""
+    return [word for word in _WORD_PATTERN.findall(text.lower()) if len(word) >= min_length]
+
+
+def build_word_index(words: Iterable[str], key_order: str, path: str) -> int:
+    """Write the index for ``words`` (skipping untypeable ones). Returns the word count."""
+    bits = {key: 1 << index for index, key in enumerate(key_order)}
+    entries = {}
+    for word in words:
+        word = word.strip().lower()
+        if not word or word in entries:
+            continue
+        mask = 0
+        for char in word:
+            bit = bits.get(char)
+            if bit is None:
+                break
+            mask |= bit
+        else:
+            entries[word] = mask
+
+    ordered = sorted(entries.items(), key=lambda item: (item[1], item[0]))
+    encoded = [word.encode("utf-8") for word, _ in ordered]
+    offsets = np.zeros(len(encoded) + 1, dtype="<u4")
+    np.cumsum([len(word) for word in encoded], out=offsets[1:])
+    key_bytes = key_order.encode("ascii")
+    header = _HEADER.pack(_MAGIC, WORD_INDEX_VERSION, len(key_bytes), len(encoded), int(offsets[-1])) + key_bytes
+    padding = b"\0" * (-len(header) % 8)
+
+    tmp_path = f"{path}.tmp"
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(tmp_path, "wb") as f:
+        f.write(header + padding)
+        f.write(np.array([mask for _, mask in ordered], dtype="<u8").tobytes())
+        f.write(offsets.tobytes())
+        f.write(b"".join(encoded))
+    os.replace(tmp_path, path)
+    return len(encoded)
+
+
+class WordIndex:
+    """Memory-mapped word index; see the module docstring for the layout."""
+
+    def __init__(self, path: str):
+        self.path = path
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        magic, version, key_count, count, text_size = _HEADER.unpack(bytes(data[: _HEADER.size]))
+        if magic != _MAGIC or version != WORD_INDEX_VERSION:
+            raise ValueError(f"{path} is not a version {WORD_INDEX_VERSION} word index")
+        start = _HEADER.size + key_count
+        self.key_order = bytes(data[_HEADER.size:start]).decode("ascii")
+        start += -start % 8
+        self.masks = data[start:start + 8 * count].view("<u8")
+        start += 8 * count
+        self.offsets = data[start:start + 4 * (count + 1)].view("<u4")
+        start += 4 * (count + 1)
+        self._text = data[start:start + text_size]
+        self._bits = {key: 1 << index for index, key in enumerate(self.key_order)}
+        self._lengths = None
+        self._cache: Dict[tuple, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def key_mask(self, keys: Iterable[str]) -> int:
+        """Bitmask of the indexed keys among ``keys`` (others are ignored)."""
+        mask = 0
+        for key in keys:
+            mask |= self._bits.get(key, 0)
+        return mask
+
+    def word(self, position: int) -> str:
+        return bytes(self._text[self.offsets[position]:self.offsets[position + 1]]).decode("utf-8")
+
+    def positions(self, keys: Iterable[str], require: Iterable[str] = ()) -> np.ndarray:
+        """Positions of words typeable with ``keys`` that use one of ``require``."""
+        allowed = self.key_mask(keys)
+        required = self.key_mask(require)
+        cache_key = (allowed, required)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        end = int(np.searchsorted(self.masks, np.uint64(allowed), side="right"))
+        if allowed & (allowed + 1) == 0:
+            # Allowed keys are a prefix of lesson order: every word before ``end`` fits.
+            result = np.arange(end)
+        else:
+            prefix = self.masks[:end]
+            result = np.flatnonzero((prefix & np.uint64(~allowed & (2 ** 64 - 1))) == 0)
+        if required:
+            result = result[(self.masks[result] & np.uint64(required)) != 0]
+
+        if len(self._cache) >= _QUERY_CACHE_SIZE:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[cache_key] = result
+        return result
+
+    def count(self, keys: Iterable[str], require: Iterable[str] = ()) -> int:
+        return len(self.positions(keys, require))
+
+    def words_for_keys(
+        self,
+        keys: Iterable[str],
+        require: Iterable[str] = (),
+        min_length: int = 1,
+        max_length: Optional[int] = None,
+    ) -> List[str]:
+        """Every indexed word typeable with ``keys``."""
+        positions = self._filter_length(self.positions(keys, require), min_length, max_length)
+        return [self.word(int(position)) for position in positions]
+
+    def sample(
+        self,
+        keys: Iterable[str],
+        count: int,
+        require: Iterable[str] = (),
+        min_length: int = 1,
+        max_length: Optional[int] = None,
+        rng=random,
+    ) -> List[str]:
+        """Up to ``count`` distinct random words typeable with ``keys``."""
+        positions = self._filter_length(self.positions(keys, require), min_length, max_length)
+        picks = rng.sample(range(len(positions)), min(count, len(positions)))
+        return [self.word(int(positions[pick])) for pick in picks]
+
+    def _filter_length(self, positions: np.ndarray, min_length: int, max_length: Optional[int]) -> np.ndarray:
+        if min_length <= 1 and max_length is None:
+            return positions
+        if self._lengths is None:
+            self._lengths = np.diff(self.offsets.astype(np.int64))
+        lengths = self._lengths[positions]
+        keep = lengths >= min_length
+        if max_length is not None:
+            keep &= lengths <= max_length
+        return positions[keep]
+
+
+_index: Optional[WordIndex] = None
+_index_loaded = False
+
+
+def get_word_index() -> Optional[WordIndex]:
+    """The packaged word index, or None when it has not been built."""
+    global _index, _index_loaded
+    if not _index_loaded:
+        path = os.path.join(get_app_dir(), WORD_INDEX_FILE)
+        if os.path.exists(path):
+            try:
+                _index = WordIndex(path)
+            except (OSError, ValueError) as e:
+                error_logging.log_exception(e)
+                _index = None
+        # Set last: the prewarm thread may be opening it while a lesson asks.
+        _index_loaded = True
+    return _index
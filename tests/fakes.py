@@ -0,0 +1,17 @@
+"""Shared test doubles."""
+
+
+class FakeClock:
+    """Callable clock for code that takes a ``clock=`` argument.
+
+    Each call advances ``now`` by ``step`` and returns it; tests may also
+    move ``now`` themselves.
+    """
+
+    def __init__(self, start=0.0, step=0.0):
+        self.now = start
+        self.step = step
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
@@ -0,0 +1,66 @@
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from games import sounds
+from modules.audio_cache import AudioDiskCache, generator_name
+
+
+class TestAudioDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def test_store_then_load_round_trips_stereo_pcm(self):
+        cache = AudioDiskCache(self.root, channels=2)
+        pcm = np.arange(20, dtype=np.int16).reshape(-1, 2)
+        key = cache.key_for(sounds.letter_hit)
+        self.assertTrue(cache.store(key, pcm))
+
+        loaded = cache.load(key)
+        self.assertEqual(loaded.shape, (10, 2))
+        np.testing.assert_array_equal(np.asarray(loaded), pcm)
+
+    def test_missing_key_loads_none(self):
+        cache = AudioDiskCache(self.root)
+        self.assertIsNone(cache.load("not-there"))
+
+    def test_load_or_build_builds_once(self):
+        cache = AudioDiskCache(self.root, channels=1)
+        calls = []
+
+        def build():
+            calls.append(1)
+            return np.ones(8, dtype=np.int16)
+
+        key = cache.key_for(sounds.letter_miss)
+        cache.load_or_build(key, build)
+        again = cache.load_or_build(key, build)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(again), 8)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_depends_on_generator_params_and_layout(self):
+        stereo = AudioDiskCache(self.root, channels=2)
+        mono = AudioDiskCache(self.root, channels=1)
+        base = stereo.key_for(sounds.combo_sound, (1,))
+        self.assertEqual(base, stereo.key_for(sounds.combo_sound, (1,)))
+        self.assertNotEqual(base, stereo.key_for(sounds.combo_sound, (2,)))
+        self.assertNotEqual(base, stereo.key_for(sounds.powerup_sound, (1,)))
+        self.assertNotEqual(base, mono.key_for(sounds.combo_sound, (1,)))
+
+    def test_clear_removes_cached_files(self):
+        cache = AudioDiskCache(self.root, channels=1)
+        cache.store(cache.key_for(sounds.menu_move), np.zeros(4, dtype=np.int16))
+        cache.store(cache.key_for(sounds.menu_select), np.zeros(4, dtype=np.int16))
+        self.assertEqual(cache.clear(), 2)
+        self.assertIsNone(cache.load(cache.key_for(sounds.menu_move)))
+
+    def test_generator_name_is_qualified(self):
+        self.assertEqual(generator_name(sounds.letter_hit), "games.sounds.letter_hit")
+
+
+if __name__ == "__main__":
+    unittest.main()
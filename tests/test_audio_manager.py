@@ -1,4 +1,6 @@
+import threading
 import unittest
+from unittest import mock
 
 import numpy as np
 
@@ -284,5 +286,105 @@ class TestTypingIntensityConstants(unittest.TestCase):
         )
 
 
+class TestSoundBankPlayback(unittest.TestCase):
+    """play_* methods synthesize each effect once and replay it from the bank."""
+
+    def _make_audio(self):
+        audio = AudioManager()
+        patcher = mock.patch.object(
+            AudioManager, "_make_sound_object", side_effect=lambda wave: mock.Mock()
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return audio
+
+    def test_repeated_celebration_is_built_once(self):
+        audio = self._make_audio()
+        with mock.patch.object(
+            AudioManager, "make_victory_sound", wraps=AudioManager.make_victory_sound
+        ) as gen:
+            audio.play_victory()
+            audio.play_victory()
+        self.assertEqual(gen.call_count, 1)
+        stats = audio.get_sound_bank_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+
+    def test_intensity_change_only_drops_typing_effects(self):
+        audio = self._make_audio()
+        audio.play_success()
+        audio.play_badge()
+        self.assertEqual(audio.get_sound_bank_stats()["size"], 2)
+        audio.set_typing_sound_intensity("strong")
+        self.assertEqual(audio.get_sound_bank_stats()["size"], 1)
+        audio.play_badge()
+        self.assertEqual(audio.get_sound_bank_stats()["hits"], 1)
+
+    def test_pet_sounds_are_banked_per_type(self):
+        audio = self._make_audio()
+        audio.play_pet_sound("owl")
+        audio.play_pet_sound("owl")
+        audio.play_pet_sound("cat")
+        audio.play_pet_sound("unknown")
+        stats = audio.get_sound_bank_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["hits"], 1)
+
+
+class TestProgressiveToneTable(unittest.TestCase):
+    """play_progressive() quantizes to a prebuilt table of pitch steps."""
+
+    def test_progressive_step_bounds(self):
+        last = AudioManager.PROGRESSIVE_TONE_STEPS - 1
+        self.assertEqual(AudioManager.progressive_step(0.0), 0)
+        self.assertEqual(AudioManager.progressive_step(1.0), last)
+        self.assertEqual(AudioManager.progressive_step(-0.5), 0)
+        self.assertEqual(AudioManager.progressive_step(2.0), last)
+
+    def test_progressive_step_is_monotonic(self):
+        steps = [AudioManager.progressive_step(i / 100) for i in range(101)]
+        self.assertEqual(steps, sorted(steps))
+
+    def test_keystrokes_reuse_table_entries(self):
+        audio = AudioManager()
+        with mock.patch.object(
+            AudioManager, "_make_sound_object", side_effect=lambda wave: mock.Mock()
+        ) as make_sound:
+            audio._progressive_tones.clear()
+            audio._channels = mock.Mock()
+            audio.play_progressive(0.5)
+            audio.play_progressive(0.5)
+            audio.play_progressive(0.51)
+        self.assertEqual(make_sound.call_count, 1)
+        self.assertEqual(audio._channels.play.call_count, 3)
+        groups = {call.args[0] for call in audio._channels.play.call_args_list}
+        self.assertEqual(groups, {"typing"})
+
+    def test_intensity_change_resets_table(self):
+        audio = AudioManager()
+        with mock.patch.object(
+            AudioManager, "_make_sound_object", side_effect=lambda wave: mock.Mock()
+        ):
+            audio.prebuild_progressive_tones()
+            self.assertEqual(len(audio._progressive_tones), AudioManager.PROGRESSIVE_TONE_STEPS)
+            audio.set_typing_sound_intensity("strong")
+        self.assertEqual(len(audio._progressive_tones), 0)
+
+    def test_concurrent_prebuild_builds_each_step_once(self):
+        audio = AudioManager()
+        with mock.patch.object(
+            AudioManager, "_make_sound_object", side_effect=lambda wave: mock.Mock()
+        ) as make_sound:
+            audio.set_typing_sound_intensity("strong")
+            make_sound.reset_mock()
+            threads = [threading.Thread(target=audio.prebuild_progressive_tones) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(make_sound.call_count, AudioManager.PROGRESSIVE_TONE_STEPS)
+        self.assertEqual(len(audio._progressive_tones), AudioManager.PROGRESSIVE_TONE_STEPS)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from games.base_game import BaseGame
 from modules import dialog_manager
 
@@ -47,5 +49,35 @@ class TestBaseGameSessionCallback(unittest.TestCase):
         self.assertEqual(captured["stats"]["pet_xp"], 15)
 
 
+
+class TestBaseGamePlayEffect(unittest.TestCase):
+    def _make_game(self, play_sound=None, play_effect=None):
+        return _DummyGame(
+            screen=None,
+            fonts={"title_font": None, "text_font": None, "small_font": None},
+            speech=None,
+            play_sound_func=play_sound or (lambda wave: None),
+            show_info_dialog_func=lambda title, content: None,
+            play_effect_func=play_effect,
+        )
+
+    def test_play_effect_uses_effect_callback(self):
+        calls = []
+        game = self._make_game(play_effect=lambda gen, *params, gain=1.0: calls.append((gen, params, gain)))
+
+        def generator(level):
+            raise AssertionError("generator should not run in the game")
+
+        game.play_effect(generator, 3, gain=0.5)
+        self.assertEqual(calls, [(generator, (3,), 0.5)])
+
+    def test_play_effect_falls_back_to_play_sound(self):
+        waves = []
+        game = self._make_game(play_sound=waves.append)
+        game.play_effect(lambda: np.array([0.5, -0.5]), gain=0.5)
+        self.assertEqual(len(waves), 1)
+        self.assertEqual(list(waves[0]), [0.25, -0.25])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks import harness
+from tests.fakes import FakeClock
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_measure_reports_per_call_times_and_prepares_untimed(self):
+        calls = []
+        result = harness.measure(
+            lambda: calls.append("op"),
+            number=4,
+            repeat=3,
+            prepare=lambda: calls.append("prepare"),
+            clock=FakeClock(step=0.002),
+        )
+        # One warmup plus three samples, each prepared once and run four times.
+        self.assertEqual(calls.count("prepare"), 4)
+        self.assertEqual(calls.count("op"), 16)
+        self.assertEqual(result["repeat"], 3)
+        self.assertAlmostEqual(result["median_ms"], 0.5)
+
+    def test_compare_flags_changes_past_threshold(self):
+        previous = {"a": {"median_ms": 10.0}, "b": {"median_ms": 10.0}, "c": {"median_ms": 10.0}, "gone": {"median_ms": 1.0}}
+        current = {"a": {"median_ms": 10.5}, "b": {"median_ms": 12.0}, "c": {"median_ms": 8.0}, "new": {"median_ms": 1.0}}
+        statuses = {name: status for name, _, _, status in harness.compare(current, previous, threshold=0.10)}
+        self.assertEqual(statuses, {"a": "same", "b": "slower", "c": "faster", "gone": "missing", "new": "new"})
+
+    def test_results_round_trip_and_reject_other_versions(self):
+        document = harness.results_document({"a": {"median_ms": 1.0}})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "results.json")
+            harness.save_results(document, path)
+            self.assertEqual(harness.load_results(path)["results"], {"a": {"median_ms": 1.0}})
+            harness.save_results(dict(document, version=0), path)
+            with self.assertRaises(ValueError):
+                harness.load_results(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
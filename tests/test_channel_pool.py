@@ -0,0 +1,96 @@
+import unittest
+
+from modules import channel_pool
+from modules.channel_pool import ChannelScheduler
+
+
+class FakeChannel:
+    def __init__(self):
+        self.busy = False
+        self.sound = None
+        self.plays = 0
+
+    def get_busy(self):
+        return self.busy
+
+    def play(self, sound):
+        self.sound = sound
+        self.busy = True
+        self.plays += 1
+
+    def stop(self):
+        self.busy = False
+
+
+def _scheduler(typing=2, sfx=1):
+    channels = {
+        "typing": [FakeChannel() for _ in range(typing)],
+        "sfx": [FakeChannel() for _ in range(sfx)],
+    }
+    return ChannelScheduler(channels), channels
+
+
+class TestChannelSchedulerPlayback(unittest.TestCase):
+    def test_uses_idle_voices_first(self):
+        scheduler, channels = _scheduler()
+        self.assertTrue(scheduler.play("typing", "a"))
+        self.assertTrue(scheduler.play("typing", "b"))
+        self.assertEqual([c.sound for c in channels["typing"]], ["a", "b"])
+        self.assertEqual(scheduler.stats()["typing"]["stolen"], 0)
+
+    def test_steals_oldest_voice_of_equal_priority(self):
+        scheduler, channels = _scheduler()
+        scheduler.play("typing", "a")
+        scheduler.play("typing", "b")
+        self.assertTrue(scheduler.play("typing", "c"))
+        self.assertEqual(channels["typing"][0].sound, "c")
+        self.assertEqual(scheduler.stats()["typing"]["stolen"], 1)
+
+    def test_steals_lowest_priority_voice(self):
+        scheduler, channels = _scheduler()
+        scheduler.play("typing", "miss", channel_pool.PRIORITY_HIGH)
+        scheduler.play("typing", "tick", channel_pool.PRIORITY_LOW)
+        scheduler.play("typing", "next", channel_pool.PRIORITY_NORMAL)
+        self.assertEqual(channels["typing"][0].sound, "miss")
+        self.assertEqual(channels["typing"][1].sound, "next")
+
+    def test_drops_when_group_is_busy_with_more_important_sounds(self):
+        scheduler, channels = _scheduler(typing=1)
+        scheduler.play("typing", "miss", channel_pool.PRIORITY_HIGH)
+        self.assertFalse(scheduler.play("typing", "tick", channel_pool.PRIORITY_LOW))
+        self.assertEqual(channels["typing"][0].sound, "miss")
+        self.assertEqual(scheduler.stats()["typing"]["dropped"], 1)
+
+    def test_groups_are_isolated(self):
+        scheduler, channels = _scheduler(typing=1, sfx=1)
+        scheduler.play("sfx", "boom", channel_pool.PRIORITY_HIGH)
+        scheduler.play("typing", "tick")
+        self.assertEqual(channels["sfx"][0].sound, "boom")
+        self.assertEqual(channels["typing"][0].sound, "tick")
+
+    def test_unknown_group_is_dropped(self):
+        scheduler, _ = _scheduler()
+        self.assertFalse(scheduler.play("missing", "a"))
+
+
+class TestChannelSchedulerStats(unittest.TestCase):
+    def test_stats_report_voices_and_busy(self):
+        scheduler, channels = _scheduler(typing=2)
+        scheduler.play("typing", "a")
+        stats = scheduler.stats()["typing"]
+        self.assertEqual(stats["voices"], 2)
+        self.assertEqual(stats["busy"], 1)
+        self.assertEqual(stats["played"], 1)
+
+    def test_reset_and_stop_group(self):
+        scheduler, channels = _scheduler()
+        scheduler.play("typing", "a")
+        scheduler.stop_group("typing")
+        scheduler.reset_stats()
+        stats = scheduler.stats()["typing"]
+        self.assertEqual(stats["busy"], 0)
+        self.assertEqual(stats["played"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
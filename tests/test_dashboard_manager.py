@@ -1,6 +1,8 @@
 import unittest
+from datetime import datetime, timedelta
 
 from modules import dashboard_manager
+from modules.state_manager import Settings
 
 
 class _Settings:
@@ -82,5 +84,91 @@ class TestPracticeLogFormatting(unittest.TestCase):
         )
 
 
+
+def _recent_session(days_ago, wpm, accuracy, summary="Lesson 3"):
+    day = datetime.now() - timedelta(days=days_ago)
+    return {
+        "type": "lesson",
+        "summary": summary,
+        "date": day.strftime("%Y-%m-%d"),
+        "time": "4:15 PM",
+        "timestamp": day.strftime("%Y-%m-%dT16:15:00"),
+        "duration": 120,
+        "wpm": wpm,
+        "accuracy": accuracy,
+    }
+
+
+class TestDashboardAggregates(unittest.TestCase):
+    def _sessions(self):
+        return [
+            _recent_session(12, 30.0, 90.0),
+            _recent_session(9, 32.0, 100.0, "Speed Test (English)"),
+            _recent_session(3, 40.0, 95.0),
+            _recent_session(3, 44.0, 100.0, "Speed Test (English)"),
+            _recent_session(1, 0, 0, "Hangman"),
+        ]
+
+    def _recorded(self, sessions):
+        settings = Settings()
+        for session in sessions:
+            dashboard_manager.record_session(settings, dict(session))
+        return settings
+
+    def test_views_match_history_scan(self):
+        sessions = self._sessions()
+        settings = self._recorded(sessions)
+        legacy = _Settings([dict(session) for session in sessions])
+
+        self.assertEqual(settings.dashboard_totals["sessions"], 5)
+        self.assertEqual(settings.dashboard_totals["perfect"], 2)
+        self.assertEqual(
+            dashboard_manager.format_weekly_summary(settings),
+            dashboard_manager.format_weekly_summary(legacy),
+        )
+        dashboard = dashboard_manager.format_dashboard(settings)
+        self.assertIn("This Week Average: 42.0 WPM", dashboard)
+        self.assertIn("Perfect Accuracy Sessions: 2", dashboard)
+
+        day = settings.dashboard_days[sessions[2]["date"]]
+        self.assertEqual(day["totals"]["count"], 2)
+        self.assertEqual(list(day["activities"]), ["Speed Test (English)", "Lesson 3"])
+        self.assertIn("2 activities: Speed Test (English), Lesson 3.", dashboard_manager.format_practice_log(settings))
+
+    def test_missing_aggregates_are_rebuilt_from_history(self):
+        settings = Settings()
+        settings.session_history = [dict(session) for session in self._sessions()[:4]]
+
+        dashboard_manager.record_session(settings, _recent_session(0, 50.0, 100.0))
+
+        expected_days, expected_totals = dashboard_manager.rebuild_dashboard_stats(settings.session_history)
+        self.assertEqual(settings.dashboard_days, expected_days)
+        self.assertEqual(settings.dashboard_totals, expected_totals)
+        self.assertEqual(settings.dashboard_totals["sessions"], 5)
+
+    def test_verify_repairs_drifted_days(self):
+        sessions = self._sessions()
+        settings = self._recorded(sessions)
+        self.assertEqual(dashboard_manager.verify_dashboard_stats(settings), [])
+
+        broken_day = sessions[2]["date"]
+        settings.dashboard_days[broken_day]["totals"]["count"] = 7
+        settings.dashboard_totals["perfect"] = 0
+
+        self.assertEqual(dashboard_manager.verify_dashboard_stats(settings), [broken_day, "totals"])
+        self.assertEqual(dashboard_manager.verify_dashboard_stats(settings, repair=False), [])
+        self.assertEqual(settings.dashboard_days[broken_day]["totals"]["count"], 2)
+
+    def test_verify_only_checks_days_still_in_capped_history(self):
+        settings = self._recorded(self._sessions())
+        oldest_day = self._sessions()[0]["date"]
+        # History older than the cap is gone; its day totals must be kept.
+        settings.session_history = settings.session_history[2:]
+
+        self.assertEqual(dashboard_manager.verify_dashboard_stats(settings), [])
+        self.assertEqual(settings.dashboard_days[oldest_day]["totals"]["count"], 1)
+        self.assertEqual(settings.dashboard_totals["sessions"], 5)
+
+
 if __name__ == "__main__":
     unittest.main()
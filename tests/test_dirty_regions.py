@@ -0,0 +1,55 @@
+import unittest
+
+import pygame
+
+from modules.dirty_regions import DirtyRegions
+
+
+class TestDirtyRegions(unittest.TestCase):
+    def test_first_frame_is_full(self):
+        dirty = DirtyRegions()
+        self.assertTrue(dirty.pending)
+        full, rects = dirty.take()
+        self.assertTrue(full)
+        self.assertEqual(rects, [])
+        self.assertFalse(dirty.pending)
+
+    def test_clean_frame_is_skipped(self):
+        dirty = DirtyRegions()
+        dirty.take()
+        self.assertEqual(dirty.take(), (False, []))
+        stats = dirty.stats()
+        self.assertEqual(stats["frames_drawn"], 1)
+        self.assertEqual(stats["frames_skipped"], 1)
+        self.assertAlmostEqual(stats["skip_rate"], 0.5)
+
+    def test_partial_marks_are_returned_and_cleared(self):
+        dirty = DirtyRegions()
+        dirty.take()
+        dirty.mark((0, 0, 100, 20))
+        dirty.mark(pygame.Rect(10, 30, 5, 5))
+        full, rects = dirty.take()
+        self.assertFalse(full)
+        self.assertEqual(rects, [pygame.Rect(0, 0, 100, 20), pygame.Rect(10, 30, 5, 5)])
+        self.assertEqual(DirtyRegions.union(rects), pygame.Rect(0, 0, 100, 35))
+        self.assertFalse(dirty.pending)
+
+    def test_full_mark_absorbs_partial_marks(self):
+        dirty = DirtyRegions()
+        dirty.take()
+        dirty.mark((0, 0, 10, 10))
+        dirty.mark_full()
+        dirty.mark((20, 20, 10, 10))
+        self.assertEqual(dirty.take(), (True, []))
+
+    def test_empty_rects_are_ignored(self):
+        dirty = DirtyRegions()
+        dirty.take()
+        dirty.mark((0, 0, 0, 10))
+        dirty.mark(None)
+        self.assertFalse(dirty.pending)
+        self.assertIsNone(DirtyRegions.union([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
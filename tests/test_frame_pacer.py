@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+import pygame
+
+from modules import frame_pacer
+from modules.frame_pacer import FramePacer
+from tests.fakes import FakeClock
+
+
+class _PygameClock:
+    def __init__(self):
+        self.ticks = []
+
+    def tick(self, fps=0):
+        self.ticks.append(fps)
+        return 0
+
+
+def _pacer():
+    wall, cpu = FakeClock(), FakeClock()
+    return FramePacer(_PygameClock(), wall_time=wall, cpu_time=cpu), wall, cpu
+
+
+class TestFramePacerWaiting(unittest.TestCase):
+    def test_paced_frames_tick_at_the_pace_rate(self):
+        pacer, _, _ = _pacer()
+        with mock.patch.object(frame_pacer.pygame.event, "get", return_value=["key"]) as get:
+            events = pacer.wait(frame_pacer.PACE_REALTIME)
+        self.assertEqual(events, ["key"])
+        self.assertEqual(pacer.clock.ticks, [60])
+        get.assert_called_once()
+
+    def test_idle_frame_blocks_until_next_wakeup(self):
+        pacer, _, _ = _pacer()
+        noevent = pygame.event.Event(pygame.NOEVENT)
+        with mock.patch.object(frame_pacer.pygame.event, "peek", return_value=False), mock.patch.object(
+            frame_pacer.pygame.event, "wait", return_value=noevent
+        ) as wait:
+            events = pacer.wait(frame_pacer.PACE_IDLE, wake_in=0.25)
+        self.assertEqual(events, [])
+        wait.assert_called_once_with(250)
+
+    def test_idle_wait_is_capped(self):
+        pacer, _, _ = _pacer()
+        noevent = pygame.event.Event(pygame.NOEVENT)
+        with mock.patch.object(frame_pacer.pygame.event, "peek", return_value=False), mock.patch.object(
+            frame_pacer.pygame.event, "wait", return_value=noevent
+        ) as wait:
+            pacer.wait(frame_pacer.PACE_IDLE)
+        wait.assert_called_once_with(int(frame_pacer.MAX_IDLE_WAIT * 1000))
+
+    def test_idle_frame_returns_queued_events_without_blocking(self):
+        pacer, _, _ = _pacer()
+        with mock.patch.object(frame_pacer.pygame.event, "peek", return_value=True), mock.patch.object(
+            frame_pacer.pygame.event, "get", return_value=["a", "b"]
+        ), mock.patch.object(frame_pacer.pygame.event, "wait") as wait:
+            events = pacer.wait(frame_pacer.PACE_IDLE, wake_in=5.0)
+        self.assertEqual(events, ["a", "b"])
+        wait.assert_not_called()
+
+    def test_first_faster_frame_after_idle_gets_one_frame_of_dt(self):
+        pacer, wall, _ = _pacer()
+        wall.now = 3.0
+        with mock.patch.object(frame_pacer.pygame.event, "get", return_value=[]):
+            pacer.wait(frame_pacer.PACE_REALTIME)
+        self.assertAlmostEqual(pacer.frame_dt(), 1 / 60)
+        wall.now = 3.05
+        with mock.patch.object(frame_pacer.pygame.event, "get", return_value=[]):
+            pacer.wait(frame_pacer.PACE_REALTIME)
+        self.assertAlmostEqual(pacer.frame_dt(), 0.05)
+
+
+class TestFramePacerStats(unittest.TestCase):
+    def test_stats_report_fps_frame_time_and_cpu_busy(self):
+        pacer, wall, cpu = _pacer()
+        with mock.patch.object(frame_pacer.pygame.event, "get", return_value=[]):
+            for _ in range(11):
+                pacer.wait(frame_pacer.PACE_TIMER)
+                wall.now += 0.02
+                cpu.now += 0.01
+                pacer.end_frame()
+                wall.now += 0.08
+        self.assertTrue(pacer.stats_updated)
+        stats = pacer.stats()
+        self.assertFalse(pacer.stats_updated)
+        self.assertEqual(stats["pace"], frame_pacer.PACE_TIMER)
+        self.assertAlmostEqual(stats["frame_ms"], 20.0)
+        self.assertAlmostEqual(stats["cpu_busy"], 0.11 / 1.02 * 100)
+        self.assertAlmostEqual(stats["fps"], 11 / 1.02)
+
+    def test_stats_wait_for_a_full_window(self):
+        pacer, wall, _ = _pacer()
+        with mock.patch.object(frame_pacer.pygame.event, "get", return_value=[]):
+            pacer.wait(frame_pacer.PACE_REALTIME)
+        wall.now = 0.5
+        pacer.end_frame()
+        self.assertFalse(pacer.stats_updated)
+        self.assertEqual(pacer.stats()["fps"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,14 @@
+import os
+import random
+import tempfile
 import unittest
+from pathlib import Path
+from unittest.mock import patch
+
 import pygame
 
+import games.hangman as hangman_mod
+from games.hangman_dictionary import HangmanDictionary, write_hangman_dictionary
 from games.hangman import (
     HangmanGame,
     WORD_BANK,
@@ -161,5 +169,75 @@ class TestHangmanProgressFormatting(unittest.TestCase):
             self.assertTrue(describe_hangman_stage(stage))
 
 
+class TestCompactHangmanDictionary(unittest.TestCase):
+    ENTRIES = [
+        ("keyboard", "An input device with keys."),
+        ("piano", "A keyboard instrument."),
+        ("cafes", "Small restaurants, like a café."),
+        ("piano", "Duplicate entries keep the first definition."),
+        ("tomorrow", "The day after today."),
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "hangman_dictionary.bin")
+        self.assertEqual(write_hangman_dictionary(self.ENTRIES, self.path), 4)
+
+    def tearDown(self):
+        hangman_mod._COMPACT_DICTIONARY_CACHE = None
+        hangman_mod._CANDIDATE_POOL_CACHE = None
+        hangman_mod._CANDIDATE_LENGTH_BUCKETS_CACHE = None
+        self._tmp.cleanup()
+
+    def test_entries_are_grouped_by_length(self):
+        dictionary = HangmanDictionary(self.path)
+        self.assertEqual(dictionary.bucket_sizes(), {5: 2, 8: 2})
+        self.assertEqual(
+            list(dictionary.entries()),
+            [
+                ("cafes", "Small restaurants, like a café."),
+                ("piano", "A keyboard instrument."),
+                ("keyboard", "An input device with keys."),
+                ("tomorrow", "The day after today."),
+            ],
+        )
+        self.assertIn(dictionary.random_entry(8, random.Random(1))[0], {"keyboard", "tomorrow"})
+        self.assertIsNone(dictionary.random_entry(6))
+
+    def test_candidate_pool_and_buckets_are_views_of_the_compact_file(self):
+        hangman_mod._COMPACT_DICTIONARY_CACHE = None
+        hangman_mod._CANDIDATE_POOL_CACHE = None
+        hangman_mod._CANDIDATE_LENGTH_BUCKETS_CACHE = None
+        with patch.object(hangman_mod, "EXTERNAL_DICTIONARY_PATH", Path(self.path)):
+            decode_entry = HangmanDictionary._entry
+            with patch.object(
+                HangmanDictionary, "_entry", autospec=True, side_effect=decode_entry
+            ) as decode:
+                pool = load_candidate_pool()
+                buckets = load_candidate_length_buckets()
+                self.assertEqual(decode.call_count, 0)
+                self.assertEqual(len(pool), 4)
+                self.assertEqual({length: len(bucket) for length, bucket in buckets.items()}, {5: 2, 8: 2})
+                self.assertEqual(buckets[8][-1], ("tomorrow", "The day after today."))
+                self.assertIn(random.choice(buckets[5])[0], {"cafes", "piano"})
+                self.assertEqual(decode.call_count, 2)
+        self.assertEqual(list(buckets[5]), [
+            ("cafes", "Small restaurants, like a café."),
+            ("piano", "A keyboard instrument."),
+        ])
+        self.assertEqual(pool[0], ("cafes", "Small restaurants, like a café."))
+        with self.assertRaises(IndexError):
+            buckets[5][2]
+
+    def test_game_picks_words_from_compact_dictionary(self):
+        hangman_mod._COMPACT_DICTIONARY_CACHE = None
+        with patch.object(hangman_mod, "EXTERNAL_DICTIONARY_PATH", Path(self.path)):
+            with patch.object(hangman_mod, "load_external_definitions", side_effect=AssertionError("JSON parsed")):
+                game = HangmanGame.__new__(HangmanGame)
+                words = {game._choose_word()[0] for _ in range(50)}
+        self.assertTrue(words <= {"cafes", "piano", "keyboard", "tomorrow"})
+        self.assertGreater(len(words), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
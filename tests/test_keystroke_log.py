@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from modules import keystroke_log
+from modules.keystroke_log import KeystrokeRecorder, load_keystrokes
+from tests.fakes import FakeClock
+
+
+class TestCharCodes(unittest.TestCase):
+    def test_characters_and_named_keys_round_trip(self):
+        for text in ("a", "Z", " ", "ñ", "tab", "f12", "backspace"):
+            self.assertEqual(keystroke_log.code_char(keystroke_log.char_code(text)), text)
+
+    def test_empty_and_unknown_names_store_zero(self):
+        self.assertEqual(keystroke_log.char_code(""), 0)
+        self.assertEqual(keystroke_log.char_code(None), 0)
+        self.assertEqual(keystroke_log.char_code("hyperkey"), 0)
+        self.assertEqual(keystroke_log.code_char(0), "")
+
+
+class TestKeystrokeRecorder(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "keystrokes.bin")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_rows_hold_timing_and_context(self):
+        recorder = KeystrokeRecorder(self.path, clock=FakeClock(1_000, 1_000_000))
+        recorder.record("lesson", "a", "a", True, lesson=3)
+        recorder.record("lesson", "s", "d", False, lesson=3)
+        rows = recorder.pending_rows()
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(int(rows["t_ns"][1] - rows["t_ns"][0]), 1_000_000)
+        self.assertEqual(rows["lesson"].tolist(), [3, 3])
+        self.assertEqual(rows["correct"].tolist(), [1, 0])
+        self.assertEqual(rows["session"][0], rows["session"][1])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_end_session_appends_rows_in_bulk(self):
+        recorder = KeystrokeRecorder(self.path, clock=FakeClock(1_000, 1_000_000))
+        for ch in "hello":
+            recorder.record("test", ch, ch, True)
+        self.assertTrue(recorder.end_session())
+        recorder.record("game", "x", "y", False)
+        recorder.end_session()
+
+        rows = load_keystrokes(self.path)
+        self.assertEqual(len(rows), 6)
+        self.assertEqual("".join(keystroke_log.code_char(c) for c in rows["typed"][:5]), "hello")
+        self.assertEqual(recorder.pending, 0)
+        self.assertEqual(recorder.stats()["flushed"], 6)
+
+    def test_full_buffer_flushes_instead_of_growing(self):
+        recorder = KeystrokeRecorder(self.path, capacity=4, clock=FakeClock(1_000, 1_000_000))
+        for _ in range(10):
+            recorder.record("practice", "a", "a", True)
+        self.assertLessEqual(recorder.pending, 4)
+        self.assertEqual(len(load_keystrokes(self.path)) + recorder.pending, 10)
+
+    def test_without_a_file_oldest_rows_are_overwritten(self):
+        recorder = KeystrokeRecorder(None, capacity=3, clock=FakeClock(1_000, 1_000_000))
+        for ch in "abcde":
+            recorder.record("test", ch, ch, True)
+        rows = recorder.pending_rows()
+        self.assertEqual([keystroke_log.code_char(c) for c in rows["typed"]], ["c", "d", "e"])
+        self.assertEqual(recorder.stats()["dropped"], 2)
+
+    def test_file_is_trimmed_to_newest_rows(self):
+        recorder = KeystrokeRecorder(self.path, capacity=2, max_file_records=4, clock=FakeClock(1_000, 1_000_000))
+        for ch in "abcdef":
+            recorder.record("test", ch, ch, True)
+            recorder.flush()
+        rows = load_keystrokes(self.path)
+        self.assertLessEqual(len(rows), 4)
+        self.assertEqual(keystroke_log.code_char(rows["typed"][-1]), "f")
+
+    def test_partial_row_from_interrupted_write_is_dropped(self):
+        recorder = KeystrokeRecorder(self.path, clock=FakeClock(1_000, 1_000_000))
+        recorder.record("test", "a", "a", True)
+        recorder.flush()
+        with open(self.path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+        self.assertEqual(len(load_keystrokes(self.path)), 1)
+        recorder.record("test", "b", "b", True)
+        recorder.flush()
+        rows = load_keystrokes(self.path)
+        self.assertEqual([keystroke_log.code_char(c) for c in rows["typed"]], ["a", "b"])
+
+    def test_deferred_flush_detaches_rows_and_writes_later(self):
+        recorder = KeystrokeRecorder(self.path, clock=FakeClock(1_000, 1_000_000))
+        tasks = []
+        recorder.defer = tasks.append
+        recorder.transitions = type("Tables", (), {
+            "saved": 0,
+            "rows": 0,
+            "ensure_loaded": lambda self: None,
+            "update": lambda self, rows: setattr(self, "rows", self.rows + len(rows)),
+            "save": lambda self: setattr(self, "saved", self.saved + 1),
+        })()
+        for ch in "abc":
+            recorder.record("test", ch, ch, True)
+        self.assertTrue(recorder.end_session())
+        self.assertEqual(recorder.pending, 0)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(len(tasks), 2)
+
+        for task in tasks:
+            task()
+        self.assertEqual(len(load_keystrokes(self.path)), 3)
+        self.assertEqual(recorder.transitions.rows, 3)
+        self.assertEqual(recorder.transitions.saved, 1)
+        self.assertEqual(recorder.flushed, 3)
+
+    def test_failed_deferred_batch_counts_as_dropped(self):
+        recorder = KeystrokeRecorder(os.path.join(self.path, "missing", "keystrokes.bin"), clock=FakeClock(1_000, 1_000_000))
+        tasks = []
+        recorder.defer = tasks.append
+        recorder.record("test", "a", "a", True)
+        recorder.end_session()
+        with mock.patch("modules.keystroke_log.error_logging.log_exception") as log:
+            tasks[0]()
+        log.assert_called_once()
+        self.assertEqual(recorder.dropped, 1)
+        self.assertEqual(recorder.flush_errors, 1)
+
+    def test_new_context_starts_a_new_session(self):
+        recorder = KeystrokeRecorder(None, clock=FakeClock(1_000, 1_000_000))
+        recorder.record("lesson", "a", "a", True, lesson=1)
+        recorder.end_session()
+        self.assertIsNone(recorder._context)
+        recorder.record("lesson", "a", "a", True, lesson=2)
+        self.assertEqual(recorder._context, (keystroke_log.MODES.index("lesson"), 2))
+
+    def test_sessions_started_in_the_same_second_get_distinct_ids(self):
+        recorder = KeystrokeRecorder(None, clock=FakeClock(1_000, 1_000_000))
+        with mock.patch.object(keystroke_log.time, "time", return_value=1_700_000_000.5):
+            recorder.record("lesson", "a", "a", True, lesson=1)
+            recorder.record("test", "a", "a", True)
+            recorder.record("lesson", "a", "a", True, lesson=1)
+        sessions = recorder.pending_rows()["session"].tolist()
+        self.assertEqual(sessions, [1_700_000_000, 1_700_000_001, 1_700_000_002])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from modules import prewarm, sentences_manager
+from modules.prewarm import PrewarmScheduler
+
+
+class TestPrewarmScheduler(unittest.TestCase):
+    def test_tasks_run_in_priority_order_once(self):
+        ran = []
+        scheduler = PrewarmScheduler()
+        scheduler.add("sentences", lambda: ran.append("sentences"), priority=3)
+        scheduler.add("sounds", lambda: ran.append("sounds"), priority=0)
+        scheduler.add("words", lambda: ran.append("words"), priority=1)
+        scheduler.start()
+        self.assertTrue(scheduler.ensure("sentences", timeout=5))
+        self.assertTrue(scheduler.cancel())
+
+        self.assertEqual(ran, ["sounds", "words", "sentences"])
+        self.assertEqual(scheduler.stats()["done"], 3)
+
+    def test_ensure_runs_a_task_that_has_not_started_on_the_caller(self):
+        callers = []
+        scheduler = PrewarmScheduler()
+        scheduler.add("hangman_words", lambda: callers.append(threading.current_thread()))
+        self.assertTrue(scheduler.ensure("hangman_words", "unknown"))
+        self.assertTrue(scheduler.ensure("hangman_words"))
+        self.assertEqual(callers, [threading.current_thread()])
+
+    def test_ensure_waits_for_a_running_task(self):
+        started = threading.Event()
+        release = threading.Event()
+        finished = []
+
+        def slow():
+            started.set()
+            release.wait(5)
+            finished.append(True)
+
+        scheduler = PrewarmScheduler()
+        scheduler.add("game_sounds", slow)
+        scheduler.start()
+        self.assertTrue(started.wait(5))
+        self.assertFalse(scheduler.ensure("game_sounds", timeout=0.05))
+        release.set()
+        self.assertTrue(scheduler.ensure("game_sounds", timeout=5))
+        self.assertEqual(finished, [True])
+        scheduler.cancel()
+
+    def test_promote_moves_a_pending_task_to_the_front(self):
+        ran = []
+        finished = threading.Event()
+        scheduler = PrewarmScheduler()
+        scheduler.add("typing_tones", lambda: ran.append("typing_tones"), priority=0)
+        scheduler.add("word_index", lambda: (ran.append("word_index"), finished.set()), priority=1)
+        scheduler.add("game_sounds", lambda: ran.append("game_sounds"), priority=2)
+        scheduler.promote("game_sounds", "unknown")
+        scheduler.start()
+        self.assertTrue(finished.wait(5))
+        self.assertTrue(scheduler.cancel())
+
+        self.assertEqual(ran, ["game_sounds", "typing_tones", "word_index"])
+
+    def test_cancel_drops_pending_tasks_and_failures_are_reported(self):
+        scheduler = PrewarmScheduler()
+        scheduler.add("pending", lambda: None)
+        scheduler.add("broken", lambda: 1 / 0)
+        self.assertTrue(scheduler.cancel())
+        self.assertEqual(scheduler.state("pending"), prewarm.CANCELLED)
+        scheduler.start()
+        self.assertEqual(scheduler.state("pending"), prewarm.CANCELLED)
+
+        with patch.object(prewarm.error_logging, "log_exception") as log:
+            self.assertFalse(scheduler.ensure("broken"))
+        log.assert_called_once()
+        self.assertEqual(scheduler.stats()["failed"], 1)
+
+
+class TestSentenceFileCache(unittest.TestCase):
+    def test_preloaded_files_are_reread_after_edits(self):
+        with tempfile.TemporaryDirectory() as app_dir:
+            os.makedirs(os.path.join(app_dir, "Sentences"))
+            path = os.path.join(app_dir, "Sentences", "Geography.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Rivers flow.\n\n")
+            self.assertEqual(sentences_manager.preload_sentence_files(app_dir), 1)
+            with patch("builtins.open", side_effect=AssertionError("file read again")):
+                self.assertEqual(sentences_manager.load_practice_sentences("Geography", app_dir=app_dir), ["Rivers flow."])
+
+            with open(path, "a", encoding="utf-8") as f:
+                f.write("Mountains rise.\n")
+            self.assertEqual(
+                sentences_manager.load_practice_sentences("Geography", app_dir=app_dir),
+                ["Rivers flow.", "Mountains rise."],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,250 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime
+
+from modules import dashboard_manager, keystroke_log
+from modules.progress_store import ProgressStore
+from modules.state_manager import AppState, ProgressManager, mark_changed
+
+
+def _session(n, date=None, accuracy=95.0):
+    return {
+        "date": date or datetime.now().strftime("%Y-%m-%d"),
+        "type": "lesson",
+        "wpm": 20.0 + n,
+        "accuracy": accuracy,
+        "n": n,
+    }
+
+
+class TestProgressStore(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmpdir = self._tmp.name
+        self.json_path = os.path.join(self.tmpdir, "progress.json")
+        self.db_path = os.path.join(self.tmpdir, "progress.db")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            if manager.store is not None:
+                manager.store.close()
+        self._tmp.cleanup()
+
+    def _manager(self):
+        manager = ProgressManager(self.json_path, database=self.db_path)
+        self.managers.append(manager)
+        return manager
+
+    def _load(self):
+        state = AppState()
+        manager = self._manager()
+        manager.load(state, stage_letters_count=50)
+        return state, manager
+
+    def test_first_load_imports_progress_json(self):
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "current_lesson": 3,
+                    "coins": 12,
+                    "key_stats": {"a": {"attempts": 4, "correct": 3}},
+                    "session_history": [_session(1), _session(2)],
+                },
+                f,
+            )
+
+        state, manager = self._load()
+
+        self.assertEqual(state.settings.current_lesson, 3)
+        self.assertEqual(state.settings.coins, 12)
+        self.assertEqual(state.settings.key_stats, {"a": {"attempts": 4, "correct": 3}})
+        self.assertEqual([s["n"] for s in state.settings.session_history], [1, 2])
+        self.assertIs(state.settings.history_store, manager.store)
+
+        # Later changes to progress.json are ignored once the store has data.
+        with open(self.json_path, "w", encoding="utf-8") as f:
+            json.dump({"coins": 99}, f)
+        reloaded, _ = self._load()
+        self.assertEqual(reloaded.settings.coins, 12)
+
+    def test_history_is_unlimited_in_store(self):
+        state, manager = self._load()
+        manager.save(state)
+        for n in range(130):
+            dashboard_manager.record_session(state.settings, _session(n))
+            manager.save(state)
+
+        self.assertEqual(len(state.settings.session_history), 100)
+        self.assertEqual(manager.store.count_sessions(), 130)
+
+        reloaded, _ = self._load()
+        self.assertEqual([s["n"] for s in reloaded.settings.session_history], list(range(30, 130)))
+        self.assertEqual(len(dashboard_manager.get_recent_sessions(reloaded.settings, 7)), 130)
+
+    def test_history_rewrite_keeps_stored_sessions(self):
+        state, manager = self._load()
+        manager.save(state)
+        for n in range(130):
+            dashboard_manager.record_session(state.settings, _session(n))
+            manager.save(state)
+
+        # Not expressible as an append, so it is journaled as a "set".
+        edited = list(state.settings.session_history)
+        edited[0] = dict(edited[0], accuracy=50.0)
+        state.settings.session_history = edited + [_session(130)]
+        manager.save(state)
+
+        self.assertEqual(manager.store.count_sessions(), 132)
+        reloaded, _ = self._load()
+        self.assertEqual(reloaded.settings.session_history[-1]["n"], 130)
+        self.assertEqual(len(dashboard_manager.get_recent_sessions(reloaded.settings, 7)), 132)
+
+    def test_saves_apply_changed_fields(self):
+        state, manager = self._load()
+        manager.save(state)
+        state.settings.coins = 5
+        state.settings.earned_badges.add("first_lesson")
+        mark_changed(state.settings, "earned_badges")
+        state.settings.key_stats["f"] = {"attempts": 1, "correct": 1}
+        mark_changed(state.settings, "key_stats", "f")
+        manager.save(state)
+        state.settings.key_stats["f"]["attempts"] = 2
+        del state.settings.key_stats["f"]
+        state.settings.key_stats["j"] = {"attempts": 3, "correct": 2}
+        mark_changed(state.settings, "key_stats", "f", "j")
+        manager.save(state)
+
+        reloaded, _ = self._load()
+        self.assertEqual(reloaded.settings.coins, 5)
+        self.assertEqual(reloaded.settings.earned_badges, {"first_lesson"})
+        self.assertEqual(reloaded.settings.key_stats, {"j": {"attempts": 3, "correct": 2}})
+
+    def test_dashboard_days_are_saved_one_row_per_day(self):
+        state, manager = self._load()
+        manager.save(state)
+        for n, day in enumerate(("2026-10-15", "2026-10-16")):
+            dashboard_manager.record_session(state.settings, dict(_session(n, day), timestamp=f"{day}T10:00:00"))
+        manager.save(state)
+        dashboard_manager.record_session(state.settings, dict(_session(3), timestamp="2026-10-16T11:00:00"))
+        ops = manager.changes(state)
+        manager.write(ops)
+
+        days_op = next(op for op in ops if op["key"] == "dashboard_days")
+        self.assertEqual(list(days_op["set"]), ["2026-10-16"])
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("SELECT key FROM dashboard_days ORDER BY key").fetchall()
+        self.assertEqual(rows, [("2026-10-15",), ("2026-10-16",)])
+        reloaded, _ = self._load()
+        self.assertEqual(reloaded.settings.dashboard_days, state.settings.dashboard_days)
+
+    def test_schema_1_dashboard_days_move_to_their_table(self):
+        days = {"2026-10-15": {"totals": {"count": 1}}, "2026-10-16": {"totals": {"count": 2}}}
+        store = ProgressStore(self.db_path)
+        store.close()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("INSERT INTO progress (field, value) VALUES ('coins', '3')")
+            conn.execute("INSERT INTO progress (field, value) VALUES ('dashboard_days', ?)", (json.dumps(days),))
+
+        state, _ = self._load()
+
+        self.assertEqual(state.settings.coins, 3)
+        self.assertEqual(state.settings.dashboard_days, days)
+        with sqlite3.connect(self.db_path) as conn:
+            fields = [row[0] for row in conn.execute("SELECT field FROM progress")]
+        self.assertNotIn("dashboard_days", fields)
+
+    def test_checkpoint_leaves_nothing_only_in_the_wal(self):
+        state, manager = self._load()
+        state.settings.coins = 7
+        manager.save(state)
+        self.assertGreater(os.path.getsize(self.db_path + "-wal"), 0)
+
+        manager.compact()
+
+        # The updater backs up progress.db on its own once the app exits.
+        self.assertEqual(os.path.getsize(self.db_path + "-wal"), 0)
+        copy_dir = os.path.join(self.tmpdir, "backup")
+        os.mkdir(copy_dir)
+        self.db_path = shutil.copy(self.db_path, os.path.join(copy_dir, "progress.db"))
+        reloaded, _ = self._load()
+        self.assertEqual(reloaded.settings.coins, 7)
+
+    def test_checkpoint_reports_a_busy_wal(self):
+        state, manager = self._load()
+        manager.save(state)
+        reader = sqlite3.connect(self.db_path)
+        try:
+            reader.execute("BEGIN")
+            reader.execute("SELECT COUNT(*) FROM sessions").fetchone()
+            state.settings.coins = 3
+            manager.save(state)
+            self.assertFalse(manager.store.checkpoint())
+        finally:
+            reader.close()
+        self.assertTrue(manager.store.checkpoint())
+
+    def test_lazy_history_does_not_rewrite_stored_sessions(self):
+        state, manager = self._load()
+        state.settings.session_history = [_session(n) for n in range(150)]
+        manager.save(state)
+
+        reloaded, manager = self._load()
+        self.assertIn("session_history", reloaded.settings.pending_fields())
+        dashboard_manager.record_session(reloaded.settings, _session(150))
+        manager.save(reloaded)
+
+        self.assertEqual(manager.store.count_sessions(), 151)
+        self.assertEqual(len(reloaded.settings.session_history), 100)
+
+    def test_session_queries_use_date_and_type(self):
+        store = ProgressStore(self.db_path)
+        try:
+            store.replace_progress(
+                {
+                    "coins": 0,
+                    "session_history": [
+                        _session(1, date="2026-01-01", accuracy=100.0),
+                        _session(2, date="2026-02-01"),
+                        dict(_session(3, date="2026-03-01"), type="speed_test"),
+                    ],
+                }
+            )
+            self.assertEqual([s["n"] for s in store.sessions_since("2026-02-01")], [2, 3])
+            self.assertEqual([s["n"] for s in store.sessions_since("2026-01-01", "speed_test")], [3])
+            self.assertEqual([s["n"] for s in store.recent_sessions(2)], [2, 3])
+            self.assertEqual(store.count_sessions(min_accuracy=100), 1)
+            plan = " ".join(
+                row[-1]
+                for row in store._conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT data FROM sessions WHERE type = ? AND date >= ?",
+                    ("lesson", "2026-01-01"),
+                )
+            )
+            self.assertIn("idx_sessions_type_date", plan)
+            mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(mode, "wal")
+        finally:
+            store.close()
+
+    def test_keystroke_rows_flush_into_store(self):
+        state, manager = self._load()
+        recorder = keystroke_log.KeystrokeRecorder(path=None, clock=iter(range(1, 100)).__next__)
+        recorder.store = manager.store
+        recorder.record("lesson", "a", "a", True, lesson=2)
+        recorder.record("lesson", "s", "d", False, lesson=2)
+        self.assertTrue(recorder.end_session())
+
+        rows = manager.store.load_keystrokes()
+        self.assertEqual(list(rows["t_ns"]), [1, 2])
+        self.assertEqual([keystroke_log.code_char(c) for c in rows["typed"]], ["a", "d"])
+        self.assertEqual(list(rows["correct"]), [1, 0])
+        self.assertEqual(recorder.pending, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+import operator
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from modules.save_worker import SaveWorker
+from modules.state_manager import AppState, ProgressManager, mark_appended
+
+
+class _BlockingWriter:
+    """Records writes; the first one waits until released."""
+
+    def __init__(self):
+        self.written = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, snapshot):
+        self.started.set()
+        self.release.wait(5)
+        self.written.append(snapshot)
+
+
+class TestSaveWorker(unittest.TestCase):
+    def test_snapshots_queued_during_a_write_are_coalesced(self):
+        writer = _BlockingWriter()
+        worker = SaveWorker(writer)
+        try:
+            worker.submit({"coins": 1})
+            self.assertTrue(writer.started.wait(5))
+            for coins in (2, 3, 4):
+                worker.submit({"coins": coins})
+            self.assertTrue(worker.busy)
+            writer.release.set()
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.close()
+
+        self.assertEqual(writer.written, [{"coins": 1}, {"coins": 4}])
+        stats = worker.stats()
+        self.assertEqual(stats["submitted"], 4)
+        self.assertEqual(stats["written"], 2)
+        self.assertEqual(stats["coalesced"], 2)
+        self.assertFalse(worker.busy)
+
+    def test_queued_saves_are_merged_when_merge_is_given(self):
+        writer = _BlockingWriter()
+        worker = SaveWorker(writer, merge=operator.add)
+        try:
+            worker.submit([1])
+            self.assertTrue(writer.started.wait(5))
+            for ops in ([2], [3, 4]):
+                worker.submit(ops)
+            writer.release.set()
+            self.assertTrue(worker.flush(timeout=5))
+        finally:
+            worker.close()
+
+        self.assertEqual(writer.written, [[1], [2, 3, 4]])
+        self.assertEqual(worker.stats()["coalesced"], 1)
+
+    def test_close_writes_pending_snapshot(self):
+        writer = _BlockingWriter()
+        worker = SaveWorker(writer)
+        worker.submit({"coins": 1})
+        self.assertTrue(writer.started.wait(5))
+        worker.submit({"coins": 2})
+        writer.release.set()
+        self.assertTrue(worker.close())
+
+        self.assertEqual(writer.written[-1], {"coins": 2})
+        # Saves after shutdown still reach the disk.
+        worker.submit({"coins": 3})
+        self.assertEqual(writer.written[-1], {"coins": 3})
+
+    def test_save_after_timed_out_close_waits_for_the_thread(self):
+        writer = _BlockingWriter()
+        active = []
+        overlaps = []
+
+        def write(snapshot):
+            active.append(1)
+            overlaps.append(len(active) > 1)
+            try:
+                writer(snapshot)
+            finally:
+                active.pop()
+
+        worker = SaveWorker(write)
+        worker.submit({"coins": 1})
+        self.assertTrue(writer.started.wait(5))
+        self.assertFalse(worker.close(timeout=0.05))
+        worker.submit({"coins": 2})
+        self.assertEqual(writer.written, [])
+        writer.release.set()
+        self.assertTrue(worker.close())
+        self.assertEqual(writer.written, [{"coins": 1}, {"coins": 2}])
+        self.assertEqual(overlaps, [False, False])
+
+    def test_deferred_tasks_run_in_order_on_the_worker(self):
+        worker = SaveWorker(lambda snapshot: None)
+        ran = []
+        worker.defer(lambda: ran.append((1, threading.current_thread().name)))
+        worker.defer(lambda: ran.append((2, threading.current_thread().name)))
+        self.assertTrue(worker.flush(5))
+        self.assertEqual([number for number, _ in ran], [1, 2])
+        self.assertTrue(all(name == "KeyQuestSaveWorker" for _, name in ran))
+
+        self.assertTrue(worker.close())
+        worker.defer(lambda: ran.append((3, threading.current_thread().name)))
+        self.assertEqual(ran[-1], (3, threading.current_thread().name))
+
+    def test_failures_and_latency_are_reported(self):
+        ticks = iter([10.0, 10.25])
+
+        def failing_write(snapshot):
+            raise OSError("disk full")
+
+        worker = SaveWorker(failing_write, clock=lambda: next(ticks))
+        with patch("modules.save_worker.error_logging.log_exception") as log:
+            worker.submit({"coins": 1})
+            worker.close()
+        log.assert_called_once()
+
+        stats = worker.stats()
+        self.assertEqual(stats["failures"], 1)
+        self.assertEqual(stats["written"], 0)
+        self.assertIn("disk full", stats["last_error"])
+        self.assertAlmostEqual(stats["last_latency_ms"], 250.0)
+
+    def test_progress_manager_write_through_worker(self):
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path)
+            worker = SaveWorker(manager.write, merge=operator.add)
+            state.settings.coins = 4
+            worker.submit(manager.changes(state))
+            # Later changes to state do not leak into the queued ops.
+            state.settings.coins = 8
+            state.settings.session_history.append({"n": 1})
+            mark_appended(state.settings, "session_history")
+            ops = manager.changes(state)
+            state.settings.session_history[0]["n"] = 3
+            state.settings.session_history.append({"n": 2})
+            worker.submit(ops)
+            worker.close()
+
+            loaded = AppState()
+            ProgressManager(path).load(loaded, stage_letters_count=50)
+
+        self.assertEqual(loaded.settings.coins, 8)
+        self.assertEqual(loaded.settings.session_history, [{"n": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -186,6 +186,7 @@ class TestHangmanFileLoadingFallback(unittest.TestCase):
         hangman_mod._EXTERNAL_DEFINITIONS_CACHE = None
         hangman_mod._CANDIDATE_POOL_CACHE = None
         hangman_mod._CANDIDATE_LENGTH_BUCKETS_CACHE = None
+        hangman_mod._COMPACT_DICTIONARY_CACHE = None
 
     def tearDown(self):
         # Restore caches to None so other tests are not affected.
@@ -194,6 +195,7 @@ class TestHangmanFileLoadingFallback(unittest.TestCase):
         hangman_mod._EXTERNAL_DEFINITIONS_CACHE = None
         hangman_mod._CANDIDATE_POOL_CACHE = None
         hangman_mod._CANDIDATE_LENGTH_BUCKETS_CACHE = None
+        hangman_mod._COMPACT_DICTIONARY_CACHE = None
 
     def test_load_external_words_returns_empty_list_when_file_missing(self):
         """load_external_words() must return [] not raise when the wordlist is absent."""
@@ -223,9 +225,11 @@ class TestHangmanFileLoadingFallback(unittest.TestCase):
         from pathlib import Path
         nonexistent_words = Path("/no/such/path/hangman_words.txt")
         nonexistent_defs = Path("/no/such/path/hangman_definitions.json")
+        nonexistent_dictionary = Path("/no/such/path/hangman_dictionary.bin")
         with patch.object(hangman_mod, "EXTERNAL_WORDLIST_PATH", nonexistent_words):
             with patch.object(hangman_mod, "EXTERNAL_DEFINITIONS_PATH", nonexistent_defs):
-                pool = hangman_mod.load_candidate_pool()
+                with patch.object(hangman_mod, "EXTERNAL_DICTIONARY_PATH", nonexistent_dictionary):
+                    pool = hangman_mod.load_candidate_pool()
         self.assertIsInstance(pool, list)
         self.assertTrue(len(pool) > 0, "Pool should contain WORD_BANK entries as fallback")
         # Every candidate must be a (word, definition) tuple
@@ -0,0 +1,159 @@
+import threading
+import time
+import unittest
+
+from modules.sound_bank import SoundBank
+
+
+class TestSoundBankLookup(unittest.TestCase):
+    def test_miss_builds_then_hit_reuses(self):
+        bank = SoundBank()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return object()
+
+        key = SoundBank.make_key("victory")
+        first = bank.get_or_build(key, build)
+        second = bank.get_or_build(key, build)
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(bank.hits, 1)
+        self.assertEqual(bank.misses, 1)
+
+    def test_none_result_is_not_cached(self):
+        bank = SoundBank()
+        key = SoundBank.make_key("victory")
+        self.assertIsNone(bank.get_or_build(key, lambda: None))
+        self.assertNotIn(key, bank)
+        self.assertEqual(bank.misses, 1)
+
+    def test_key_includes_params_and_intensity(self):
+        self.assertNotEqual(
+            SoundBank.make_key("success", (), "normal"),
+            SoundBank.make_key("success", (), "strong"),
+        )
+        self.assertNotEqual(
+            SoundBank.make_key("combo", (1,)),
+            SoundBank.make_key("combo", (2,)),
+        )
+
+
+class TestSoundBankEviction(unittest.TestCase):
+    def test_capacity_evicts_least_recently_used(self):
+        bank = SoundBank(capacity=2)
+        bank.get_or_build("a", object)
+        bank.get_or_build("b", object)
+        bank.get_or_build("a", object)  # a is now most recent
+        bank.get_or_build("c", object)
+        self.assertIn("a", bank)
+        self.assertNotIn("b", bank)
+        self.assertIn("c", bank)
+        self.assertEqual(bank.evictions, 1)
+
+    def test_invalidate_with_predicate(self):
+        bank = SoundBank()
+        bank.get_or_build(SoundBank.make_key("success", (), "normal"), object)
+        bank.get_or_build(SoundBank.make_key("victory"), object)
+        dropped = bank.invalidate(lambda key: key[2] is not None)
+        self.assertEqual(dropped, 1)
+        self.assertIn(SoundBank.make_key("victory"), bank)
+
+    def test_format_change_clears_bank(self):
+        bank = SoundBank()
+        self.assertFalse(bank.check_format((44100, -16, 2)))
+        bank.get_or_build("a", object)
+        self.assertFalse(bank.check_format((44100, -16, 2)))
+        self.assertEqual(len(bank), 1)
+        self.assertTrue(bank.check_format((22050, -16, 1)))
+        self.assertEqual(len(bank), 0)
+
+    def test_stats_report_hit_rate(self):
+        bank = SoundBank()
+        bank.get_or_build("a", object)
+        bank.get_or_build("a", object)
+        stats = bank.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+
+
+class TestSoundBankThreads(unittest.TestCase):
+    def test_concurrent_misses_build_once(self):
+        bank = SoundBank()
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.02)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(bank.get_or_build("a", build)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_hit_does_not_wait_for_another_build(self):
+        bank = SoundBank()
+        bank.get_or_build("built", object)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return object()
+
+        thread = threading.Thread(target=bank.get_or_build, args=("slow", slow))
+        thread.start()
+        try:
+            self.assertTrue(started.wait(5))
+            begun = time.perf_counter()
+            self.assertIsNotNone(bank.get_or_build("built", object))
+            self.assertLess(time.perf_counter() - begun, 1.0)
+            self.assertNotIn("slow", bank)
+        finally:
+            release.set()
+            thread.join()
+        self.assertIn("slow", bank)
+
+    def test_build_started_before_invalidate_is_not_stored(self):
+        bank = SoundBank()
+
+        def build():
+            bank.invalidate()
+            return object()
+
+        self.assertIsNotNone(bank.get_or_build("a", build))
+        self.assertNotIn("a", bank)
+
+    def test_invalidate_while_another_thread_fills(self):
+        bank = SoundBank(capacity=1000)
+        stop = threading.Event()
+
+        def fill():
+            index = 0
+            while not stop.is_set():
+                bank.get_or_build(("fill", index, "normal" if index % 2 else None), object)
+                index += 1
+
+        thread = threading.Thread(target=fill)
+        thread.start()
+        try:
+            for _ in range(200):
+                bank.invalidate(lambda key: key[2] is not None)
+        finally:
+            stop.set()
+            thread.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from modules import speech_backend_watcher
+from modules.speech_backend_watcher import SpeechBackendWatcher
+
+
+class TestSpeechBackendWatcher(unittest.TestCase):
+    def test_change_is_published_once_and_notifies(self):
+        results = ["NVDA", "NVDA", None]
+        notified = []
+        watcher = SpeechBackendWatcher(lambda: results.pop(0), initial=None, notify=lambda: notified.append(1))
+
+        watcher._probe_once()
+        self.assertEqual(watcher.poll(), (True, "NVDA"))
+        self.assertEqual(watcher.poll(), (False, "NVDA"))
+        watcher._probe_once()
+        self.assertEqual(watcher.poll(), (False, "NVDA"))
+        watcher._probe_once()
+        self.assertEqual(watcher.poll(), (True, None))
+        self.assertEqual(len(notified), 2)
+        self.assertEqual(watcher.stats()["probes"], 3)
+
+    def test_probe_runs_on_the_thread_only_while_active(self):
+        probed = threading.Event()
+        watcher = SpeechBackendWatcher(lambda: probed.set() or "JAWS", interval=0.1)
+        watcher.start()
+        try:
+            self.assertFalse(probed.wait(0.3))
+            watcher.set_active(True)
+            self.assertTrue(probed.wait(2.0))
+            self.assertTrue(watcher.changed.wait(2.0))
+        finally:
+            self.assertTrue(watcher.stop())
+        self.assertEqual(watcher.poll(), (True, "JAWS"))
+
+    def test_start_replaces_the_initial_result(self):
+        watcher = SpeechBackendWatcher(lambda: True, interval=60, initial=False)
+        watcher.start(initial=True)
+        try:
+            self.assertEqual(watcher.poll(), (False, True))
+        finally:
+            watcher.stop()
+
+    def test_failed_probe_keeps_the_last_result(self):
+        def probe():
+            raise OSError("tasklist missing")
+
+        watcher = SpeechBackendWatcher(probe, initial="NVDA")
+        with patch("modules.speech_backend_watcher.error_logging.log_exception") as log:
+            watcher._probe_once()
+        log.assert_called_once()
+        self.assertEqual(watcher.poll(), (False, "NVDA"))
+
+    def test_interval_from_env(self):
+        env = speech_backend_watcher.ENV_VAR
+        with patch.dict(os.environ, {env: "2.5"}):
+            self.assertEqual(speech_backend_watcher.interval_from_env(), 2.5)
+        with patch.dict(os.environ, {env: "0"}):
+            self.assertEqual(speech_backend_watcher.interval_from_env(), speech_backend_watcher.MIN_INTERVAL)
+        with patch.dict(os.environ, {env: "soon"}):
+            self.assertEqual(speech_backend_watcher.interval_from_env(), speech_backend_watcher.DEFAULT_INTERVAL)
+
+
+class TestApplyDetectedReader(unittest.TestCase):
+    def _speech(self):
+        with (
+            patch("modules.speech_manager.Speech._init_tts_engine", return_value=False),
+            patch("modules.speech_manager.TOLK_AVAILABLE", False),
+        ):
+            from modules.speech_manager import Speech
+            return Speech()
+
+    def test_auto_mode_switches_to_the_detected_screen_reader_and_back(self):
+        speech = self._speech()
+        speech._sapi_voice = object()
+
+        self.assertTrue(speech.apply_detected_reader("NVDA", "auto"))
+        self.assertEqual(speech.backend, "tolk")
+        self.assertEqual(speech.screen_reader_detected, "NVDA")
+        self.assertTrue(speech.apply_detected_reader("Narrator", "auto"))
+        self.assertEqual(speech.backend, "tts")
+        self.assertFalse(speech.apply_detected_reader(None, "auto"))
+
+    def test_detect_uses_the_watchers_narrator_result(self):
+        speech = self._speech()
+        with patch.object(speech, "_detect_narrator_process") as probe:
+            self.assertEqual(speech.detect_screen_reader(narrator_running=True), "Narrator")
+            self.assertIsNone(speech.detect_screen_reader(narrator_running=False))
+        probe.assert_not_called()
+
+    def test_tolk_is_asked_under_the_speech_lock(self):
+        speech = self._speech()
+        speech._tolk_available = True
+        held = []
+
+        def detect():
+            held.append(speech._lock.locked())
+            return "NVDA"
+
+        with patch("modules.speech_manager.tolk", create=True) as tolk:
+            tolk.detect_screen_reader.side_effect = detect
+            self.assertEqual(speech.detect_screen_reader(narrator_running=False), "NVDA")
+        self.assertEqual(held, [True])
+
+    def test_other_modes_ignore_detection(self):
+        speech = self._speech()
+        self.assertFalse(speech.apply_detected_reader("NVDA", "tts"))
+        self.assertEqual(speech.backend, "none")
+        self.assertFalse(speech.apply_detected_reader("NVDA", "off"))
+        self.assertFalse(speech.enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,7 @@ Tests are fast and deterministic.
 import threading
 import time
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 
 # ---------------------------------------------------------------------------
@@ -66,6 +66,8 @@ class TestSayDebounce(unittest.TestCase):
         """Return a Speech with backend='tolk' and a mock tolk.speak."""
         speech = _make_speech_no_engine()
         speech.backend = "tolk"
+        # No gap between utterances; pacing is covered in test_speech_scheduler.
+        speech._scheduler.intervals = {}
         return speech
 
     def test_identical_text_within_debounce_is_dropped(self):
@@ -142,6 +144,8 @@ class TestSayPriority(unittest.TestCase):
     def _make_speech_with_mock_tolk(self):
         speech = _make_speech_no_engine()
         speech.backend = "tolk"
+        # No gap between utterances; pacing is covered in test_speech_scheduler.
+        speech._scheduler.intervals = {}
         return speech
 
     def test_priority_call_sets_priority_until(self):
@@ -270,6 +274,35 @@ class TestApplyMode(unittest.TestCase):
         self.assertEqual(speech.backend, "none")
 
 
+class TestDeferredProbe(unittest.TestCase):
+    """Speech(probe=False) holds speech and settings until probe() runs."""
+
+    def test_speech_and_mode_wait_for_probe(self):
+        with (
+            patch("modules.speech_manager.Speech._init_tts_engine", return_value=False) as init_tts,
+            patch("modules.speech_manager.TOLK_AVAILABLE", False),
+            patch("builtins.print") as mock_print,
+        ):
+            from modules.speech_manager import Speech
+            speech = Speech(probe=False)
+            speech.apply_mode("auto")
+            speech.apply_tts_settings(rate=250)
+            speech.say("Main menu")
+            self.assertFalse(speech.probed)
+            self.assertIsNone(speech.seconds_until_due())
+            init_tts.assert_not_called()
+            self.assertNotIn(call("Main menu"), mock_print.call_args_list)
+
+            speech.probe()
+            speech.probe()
+
+        self.assertTrue(speech.probed)
+        self.assertIn(call("Main menu"), mock_print.call_args_list)
+        # Once by probe(), once more for the pending TTS settings.
+        self.assertEqual(init_tts.call_count, 2)
+        self.assertIn(call("Auto mode: No speech backend available"), mock_print.call_args_list)
+
+
 class TestThreadSafety(unittest.TestCase):
     """say() can be called concurrently without raising exceptions."""
 
@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from modules import speech_scheduler
+from modules.speech_scheduler import PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_NORMAL, SpeechScheduler
+from tests.fakes import FakeClock
+
+
+def _drain(scheduler, backend="tolk"):
+    sent = []
+    while True:
+        request = scheduler.pop_due(backend)
+        if request is None:
+            return sent
+        sent.append(request.text)
+
+
+class TestSpeechScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(100.0)
+        self.scheduler = SpeechScheduler({"tolk": 0.05}, clock=self.clock)
+
+    def test_requests_inside_the_gap_wait_for_it(self):
+        self.scheduler.submit("Lesson practice", PRIORITY_HIGH)
+        self.assertEqual(_drain(self.scheduler), ["Lesson practice"])
+        self.scheduler.submit("Type f", PRIORITY_HIGH)
+        self.assertEqual(_drain(self.scheduler), [])
+        self.assertAlmostEqual(self.scheduler.seconds_until_due("tolk"), 0.05)
+
+        self.clock.now += 0.05
+        self.assertEqual(_drain(self.scheduler), ["Type f"])
+        self.assertIsNone(self.scheduler.seconds_until_due("tolk"))
+        self.assertAlmostEqual(self.scheduler.stats()["latency_max_ms"], 50.0)
+
+    def test_interrupting_request_replaces_waiting_ones_of_equal_or_lower_priority(self):
+        self.scheduler.submit("first", PRIORITY_HIGH)
+        _drain(self.scheduler)
+        self.scheduler.submit("Target A, like alpha. 2 waiting.", PRIORITY_HIGH)
+        self.scheduler.submit("queued politely", PRIORITY_LOW, interrupt=False)
+        self.scheduler.submit("That was s. Try d.", PRIORITY_NORMAL)
+
+        self.clock.now += 1.0
+        self.assertEqual(_drain(self.scheduler), ["Target A, like alpha. 2 waiting."])
+        self.clock.now += 1.0
+        self.assertEqual(_drain(self.scheduler), ["That was s. Try d."])
+        self.assertEqual(self.scheduler.stats()["replaced"], 1)
+
+    def test_short_tokens_are_merged_instead_of_dropped(self):
+        self.scheduler.submit("Duration", PRIORITY_HIGH)
+        _drain(self.scheduler)
+        for digit in "125":
+            self.scheduler.submit(digit, PRIORITY_HIGH)
+
+        self.clock.now += 1.0
+        self.assertEqual(_drain(self.scheduler), ["1 2 5"])
+        self.assertEqual(self.scheduler.stats()["merged"], 2)
+
+    def test_category_keeps_only_the_latest_status(self):
+        self.scheduler.submit("Score 10", PRIORITY_HIGH)
+        _drain(self.scheduler)
+        self.scheduler.submit("A. 1 waiting.", PRIORITY_LOW, interrupt=False, category="letters")
+        self.scheduler.submit("Speed up!", PRIORITY_LOW, interrupt=False)
+        self.scheduler.submit("B. 2 waiting.", PRIORITY_LOW, interrupt=False, category="letters")
+
+        self.clock.now += 1.0
+        self.assertEqual(_drain(self.scheduler), ["Speed up!"])
+        self.clock.now += 1.0
+        self.assertEqual(_drain(self.scheduler), ["B. 2 waiting."])
+
+    def test_request_priority_maps_say_flags(self):
+        self.assertEqual(speech_scheduler.request_priority(True, False), PRIORITY_HIGH)
+        self.assertEqual(speech_scheduler.request_priority(False, True), PRIORITY_NORMAL)
+        self.assertEqual(speech_scheduler.request_priority(False, False), PRIORITY_LOW)
+
+
+class TestSpeechPacing(unittest.TestCase):
+    def test_say_queues_inside_the_gap_and_pump_sends_later(self):
+        with (
+            patch("modules.speech_manager.Speech._init_tts_engine", return_value=False),
+            patch("modules.speech_manager.TOLK_AVAILABLE", False),
+        ):
+            from modules.speech_manager import Speech
+            speech = Speech()
+        clock = FakeClock(100.0)
+        speech._scheduler = SpeechScheduler({"tolk": 0.05}, clock=clock)
+        speech.backend = "tolk"
+
+        with patch("modules.speech_manager.tolk") as mock_tolk:
+            mock_tolk.speak = MagicMock()
+            speech.say("Type f", priority=True)
+            speech.say("Type j", priority=True)
+            self.assertEqual(mock_tolk.speak.call_count, 1)
+            speech.pump()
+            self.assertEqual(mock_tolk.speak.call_count, 1)
+
+            clock.now += 0.05
+            self.assertEqual(speech.seconds_until_due(), 0.0)
+            speech.pump()
+
+        self.assertEqual([call.args[0] for call in mock_tolk.speak.call_args_list], ["Type f", "Type j"])
+        self.assertIsNone(speech.seconds_until_due())
+
+
+if __name__ == "__main__":
+    unittest.main()
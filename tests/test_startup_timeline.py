@@ -0,0 +1,95 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+from modules import startup_timeline
+from modules.startup_timeline import StartupTimeline
+
+
+class TestStartupTimeline(unittest.TestCase):
+    def test_phases_report_self_and_cumulative_time(self):
+        timeline = StartupTimeline(clock=iter([10.0, 10.2, 10.25, 11.0]).__next__)
+        for phase in ("imports", "pygame init", "first frame"):
+            timeline.mark(phase)
+
+        rows = [(phase, round(own, 1), round(total, 1)) for phase, own, total in timeline.phases()]
+        self.assertEqual(rows, [("imports", 200.0, 200.0), ("pygame init", 50.0, 250.0), ("first frame", 750.0, 1000.0)])
+        report = timeline.format_report().splitlines()
+        self.assertEqual(report[0], "startup:  self [ms] | cumulative [ms] | phase")
+        self.assertEqual(report[3], "startup:     750.0 |    1000.0 | first frame")
+
+    def test_report_prints_once_and_only_when_enabled(self):
+        timeline = StartupTimeline()
+        timeline.mark("menus")
+        with patch.object(startup_timeline, "TIMELINE", timeline):
+            with patch.dict(os.environ, {startup_timeline.ENV_VAR: "1"}):
+                out = io.StringIO()
+                with redirect_stdout(out):
+                    startup_timeline.report_once()
+                    startup_timeline.report_once()
+        self.assertEqual(out.getvalue().count("| menus"), 1)
+
+        quiet = StartupTimeline()
+        with patch.object(startup_timeline, "TIMELINE", quiet):
+            with patch.dict(os.environ, {startup_timeline.ENV_VAR: "0"}):
+                out = io.StringIO()
+                with redirect_stdout(out):
+                    startup_timeline.report_once()
+        self.assertEqual(out.getvalue(), "")
+
+    def test_json_report_records_phase_boundaries(self):
+        timeline = StartupTimeline(clock=iter([0.0, 0.1, 0.3]).__next__)
+        timeline.mark("imports")
+        timeline.mark("first frame")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace", "startup.json")
+            timeline.write_json(path, {"prewarm_ms": {"sentences": 4.0}})
+            with open(path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+
+        self.assertEqual(report["version"], startup_timeline.REPORT_VERSION)
+        self.assertEqual(report["phases"][1], {"phase": "first frame", "start_ms": 100.0, "end_ms": 300.0, "self_ms": 200.0})
+        self.assertEqual(report["first_frame_ms"], 300.0)
+        self.assertEqual(report["prewarm_ms"], {"sentences": 4.0})
+
+    def test_trace_path_reads_flag_before_env_var(self):
+        with patch.dict(os.environ, {startup_timeline.TRACE_ENV_VAR: "env.json"}):
+            self.assertEqual(startup_timeline.trace_path(["--startup-trace", "flag.json"]), "flag.json")
+            self.assertEqual(startup_timeline.trace_path(["--startup-trace=eq.json"]), "eq.json")
+            self.assertEqual(startup_timeline.trace_path([]), "env.json")
+        with patch.dict(os.environ, {startup_timeline.TRACE_ENV_VAR: ""}):
+            self.assertEqual(startup_timeline.trace_path([]), "")
+
+    def test_regressions_allow_tolerance_and_slack(self):
+        def report(first_frame, audio):
+            return {
+                "first_frame_ms": first_frame,
+                "phases": [{"phase": "audio", "start_ms": 0.0, "end_ms": audio, "self_ms": audio}],
+            }
+
+        baseline = report(200.0, 10.0)
+        self.assertEqual(startup_timeline.check_regressions(report(250.0, 22.0), baseline, 0.25, 10.0), [])
+        failures = startup_timeline.check_regressions(report(250.0, 30.0), baseline, 0.25, 10.0)
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(failures[0].startswith("audio: 30.0 ms > 22.5 ms"))
+        failures = startup_timeline.check_regressions(report(400.0, 10.0), baseline, 0.25, 10.0)
+        self.assertTrue(failures[0].startswith("first frame"))
+
+    def test_median_report_takes_per_phase_medians(self):
+        runs = [
+            {"first_frame_ms": ms, "phases": [{"phase": "audio", "start_ms": 0.0, "end_ms": ms, "self_ms": ms}]}
+            for ms in (30.0, 10.0, 20.0)
+        ]
+        report = startup_timeline.median_report(runs)
+        self.assertEqual(report["runs"], 3)
+        self.assertEqual(report["first_frame_ms"], 20.0)
+        self.assertEqual(report["phases"][0]["self_ms"], 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,18 @@ import json
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
-from modules.state_manager import AppState, ProgressManager, PROGRESS_SCHEMA_VERSION
+from modules.state_manager import (
+    AppState,
+    ProgressManager,
+    PROGRESS_FIELDS,
+    PROGRESS_SCHEMA_VERSION,
+    PROGRESS_SECTIONS,
+    Settings,
+    mark_appended,
+    mark_changed,
+)
 
 
 class TestProgressManager(unittest.TestCase):
@@ -434,5 +444,336 @@ class TestSchemaMigration(unittest.TestCase):
         self.assertIn(0, state.settings.unlocked_lessons)
 
 
+class TestProgressJournal(unittest.TestCase):
+    """Tests for the append-only progress journal."""
+
+    def _journal_lines(self, path):
+        journal = os.path.splitext(path)[0] + ".journal"
+        if not os.path.exists(journal):
+            return []
+        with open(journal, "r", encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def _reload(self, path) -> AppState:
+        state = AppState()
+        ProgressManager(path).load(state, stage_letters_count=50)
+        return state
+
+    def test_later_saves_append_only_changes(self):
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path)
+            manager.save(state)
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = f.read()
+
+            state.settings.coins = 15
+            state.settings.session_history.append({"date": "2026-10-17", "wpm": 30})
+            mark_appended(state.settings, "session_history")
+            state.settings.key_stats["a"] = {"attempts": 3, "correct": 2}
+            mark_changed(state.settings, "key_stats", "a")
+            manager.save(state)
+            manager.save(state)  # nothing changed: nothing written
+
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(f.read(), snapshot)
+            lines = self._journal_lines(path)
+            self.assertEqual(len(lines), 1)
+            ops = {op["key"]: op for op in lines[0]["ops"]}
+            self.assertEqual(set(ops), {"coins", "session_history", "key_stats"})
+            self.assertEqual(ops["session_history"]["items"], [{"date": "2026-10-17", "wpm": 30}])
+            self.assertEqual(ops["key_stats"]["set"], {"a": {"attempts": 3, "correct": 2}})
+
+            loaded = self._reload(path)
+
+        self.assertEqual(loaded.settings.coins, 15)
+        self.assertEqual(loaded.settings.session_history, [{"date": "2026-10-17", "wpm": 30}])
+        self.assertEqual(loaded.settings.key_stats, {"a": {"attempts": 3, "correct": 2}})
+
+    def test_capped_history_appends_and_trims(self):
+        state = AppState()
+        state.settings.session_history = [{"n": i} for i in range(5)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path)
+            manager.save(state)
+            del state.settings.session_history[:-4]
+            state.settings.session_history.append({"n": 5})
+            mark_appended(state.settings, "session_history")
+            manager.save(state)
+
+            op = self._journal_lines(path)[0]["ops"][0]
+            loaded = self._reload(path)
+
+        self.assertEqual(op["op"], "append")
+        self.assertEqual(op["items"], [{"n": 5}])
+        self.assertEqual(loaded.settings.session_history, [{"n": i} for i in range(1, 6)])
+
+    def test_changes_to_loaded_sections_are_journaled(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"current_lesson": 2, "key_stats": {"a": {"attempts": 1}}}, f)
+
+            state = AppState()
+            manager = ProgressManager(path)
+            manager.load(state, stage_letters_count=50)
+            manager.save(state)  # nothing changed since load
+            state.settings.key_stats["a"]["attempts"] = 2
+            mark_changed(state.settings, "key_stats", "a")
+            manager.save(state)
+
+            self.assertEqual(len(self._journal_lines(path)), 1)
+            loaded = self._reload(path)
+
+        self.assertEqual(loaded.settings.current_lesson, 2)
+        self.assertEqual(loaded.settings.key_stats, {"a": {"attempts": 2}})
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path, compact_records=3)
+            # One snapshot, three journal records, then a compacting snapshot.
+            for coins in range(1, 7):
+                state.settings.coins = coins
+                manager.save(state)
+
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self.assertEqual(snapshot["coins"], 5)
+            self.assertEqual([line["seq"] for line in self._journal_lines(path)], [4])
+
+            manager.compact()
+            self.assertEqual(self._journal_lines(path), [])
+            self.assertEqual(self._reload(path).settings.coins, 6)
+
+    def test_torn_journal_tail_is_ignored_and_trimmed(self):
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path)
+            manager.save(state)
+            state.settings.coins = 7
+            manager.save(state)
+            journal = os.path.splitext(path)[0] + ".journal"
+            with open(journal, "a", encoding="utf-8") as f:
+                f.write('{"seq": 2, "ops": [{"op": "set", "key": "coi')
+
+            reloaded = AppState()
+            manager = ProgressManager(path)
+            manager.load(reloaded, stage_letters_count=50)
+            self.assertEqual(reloaded.settings.coins, 7)
+            self.assertEqual(len(self._journal_lines(path)), 1)
+
+            reloaded.settings.coins = 9
+            manager.save(reloaded)
+            self.assertEqual(self._reload(path).settings.coins, 9)
+
+    def test_records_already_in_snapshot_are_not_replayed(self):
+        """A compaction interrupted before clearing the journal replays nothing twice."""
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path)
+            manager.save(state)
+            state.settings.session_history.append({"n": 1})
+            mark_appended(state.settings, "session_history")
+            manager.save(state)
+            journal = os.path.splitext(path)[0] + ".journal"
+            with open(journal, "r", encoding="utf-8") as f:
+                stale = f.read()
+
+            manager.compact()
+            with open(journal, "w", encoding="utf-8") as f:
+                f.write(stale)
+
+            loaded = self._reload(path)
+
+        self.assertEqual(loaded.settings.session_history, [{"n": 1}])
+
+    def test_changes_serialize_only_marked_fields_and_keys(self):
+        state = AppState()
+        manager = ProgressManager("unused.json")
+        self.assertEqual(len(manager.changes(state)), len(PROGRESS_FIELDS))
+        self.assertEqual(manager.changes(state), [])
+
+        state.settings.key_stats = {key: {"attempts": 1} for key in "abcdef"}
+        state.settings.lesson_stars = {3: 2}
+        manager.changes(state)
+        state.settings.key_stats["b"]["attempts"] = 2
+        del state.settings.key_stats["c"]
+        mark_changed(state.settings, "key_stats", "b", "c")
+        state.settings.lesson_stars[4] = 1
+        mark_changed(state.settings, "lesson_stars", 4)
+        state.settings.xp = 10
+
+        self.assertEqual(
+            manager.changes(state),
+            [
+                {"op": "merge", "key": "key_stats", "set": {"b": {"attempts": 2}}, "del": ["c"]},
+                {"op": "merge", "key": "lesson_stars", "set": {"4": 1}, "del": []},
+                {"op": "set", "key": "xp", "value": 10},
+            ],
+        )
+
+    def test_failed_write_is_retried_with_the_next_save(self):
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path)
+            manager.save(state)
+            state.settings.coins = 4
+            with patch.object(manager, "_append_journal", side_effect=OSError("disk full")):
+                manager.save(state)
+            state.settings.xp = 9
+            manager.save(state)
+
+            loaded = self._reload(path)
+
+        self.assertEqual(loaded.settings.coins, 4)
+        self.assertEqual(loaded.settings.xp, 9)
+
+    def test_unreadable_file_is_rewritten_whole_on_next_save(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("{not json")
+            state = AppState()
+            manager = ProgressManager(path)
+            manager.load(state, stage_letters_count=50)
+            manager.save(state)
+
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+
+        self.assertEqual(snapshot["schema_version"], PROGRESS_SCHEMA_VERSION)
+        self.assertTrue(set(PROGRESS_FIELDS) <= set(snapshot))
+
+    def test_journal_disabled_rewrites_snapshot(self):
+        state = AppState()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "progress.json")
+            manager = ProgressManager(path, journal=False)
+            manager.save(state)
+            state.settings.coins = 3
+            manager.save(state)
+
+            self.assertEqual(self._journal_lines(path), [])
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["coins"], 3)
+
+
+class TestLazySections(unittest.TestCase):
+    """Tests for progress sections loaded on first access from the SQLite store."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "progress.json")
+        self.database = os.path.join(self._tmp.name, "progress.db")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            if manager.store is not None:
+                manager.store.close()
+        self._tmp.cleanup()
+
+    def _write(self, data):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def _load(self, **kwargs):
+        state = AppState()
+        manager = ProgressManager(self.path, database=self.database, **kwargs)
+        self.managers.append(manager)
+        manager.load(state, stage_letters_count=50)
+        return state, manager
+
+    def test_sections_every_field_once(self):
+        names = [name for fields in PROGRESS_SECTIONS.values() for name in fields]
+        self.assertEqual(sorted(names), sorted(PROGRESS_FIELDS))
+
+    def test_lazy_sections_load_on_first_access(self):
+        self._write({"current_lesson": 2, "coins": 40, "pet_type": "owl", "key_stats": {"a": {"attempts": 1}}})
+        state, _ = self._load()
+
+        self.assertEqual(state.settings.current_lesson, 2)
+        self.assertIn("key_stats", state.settings.pending_fields())
+        self.assertIn("coins", state.settings.pending_fields())
+        self.assertEqual(state.settings.coins, 40)
+        self.assertNotIn("inventory", state.settings.pending_fields())
+        self.assertIn("pet_type", state.settings.pending_fields())
+        self.assertEqual(state.settings.pet_type, "owl")
+        self.assertEqual(state.settings.key_stats, {"a": {"attempts": 1}})
+        self.assertEqual(state.settings.pending_fields(), {"session_history"})
+
+    def test_json_progress_loads_every_section(self):
+        self._write({"coins": 40, "session_history": [{"n": 1}]})
+        state = AppState()
+        ProgressManager(self.path).load(state, stage_letters_count=50)
+
+        self.assertEqual(state.settings.pending_fields(), set())
+        self.assertEqual(state.settings.coins, 40)
+        self.assertEqual(state.settings.session_history, [{"n": 1}])
+
+    def test_save_keeps_sections_that_were_never_loaded(self):
+        self._write({"coins": 40, "session_history": [{"n": 1}], "key_stats": {"a": {"attempts": 1}}})
+        state, manager = self._load()
+        state.settings.current_lesson = 3
+        manager.save(state)
+        state.settings.current_lesson = 4
+        manager.save(state)
+        self.assertIn("session_history", state.settings.pending_fields())
+
+        loaded, _ = self._load()
+        self.assertEqual(loaded.settings.current_lesson, 4)
+        self.assertEqual(loaded.settings.coins, 40)
+        self.assertEqual(loaded.settings.session_history, [{"n": 1}])
+        self.assertEqual(loaded.settings.key_stats, {"a": {"attempts": 1}})
+
+    def test_assignment_before_load_wins(self):
+        self._write({"coins": 40, "total_coins_earned": 90})
+        state, _ = self._load()
+
+        state.settings.coins = 5
+        self.assertEqual(state.settings.coins, 5)
+        self.assertEqual(state.settings.total_coins_earned, 90)
+
+    def test_class_defaults_stay_on_settings(self):
+        self.assertEqual(Settings.coins, 0)
+        self.assertEqual(Settings.pet_mood, "happy")
+        self.assertEqual(Settings().coins, 0)
+
+    def test_getattr_with_default_loads_the_section(self):
+        self._write({"coins": 40})
+        state, _ = self._load()
+
+        self.assertEqual(getattr(state.settings, "coins", None), 40)
+        self.assertTrue(hasattr(state.settings, "pet_type"))
+        self.assertNotIn("coins", state.settings.pending_fields())
+
+    def test_marked_changes_to_lazy_sections_are_saved(self):
+        self._write({"current_lesson": 1, "key_stats": {"a": {"attempts": 1}}, "session_history": [{"n": 1}]})
+        state, manager = self._load()
+        state.settings.key_stats["a"]["attempts"] = 2
+        mark_changed(state.settings, "key_stats", "a")
+        state.settings.session_history.append({"n": 2})
+        mark_appended(state.settings, "session_history")
+        manager.save(state)
+
+        loaded, _ = self._load()
+        self.assertEqual(loaded.settings.key_stats, {"a": {"attempts": 2}})
+        self.assertEqual(loaded.settings.session_history, [{"n": 1}, {"n": 2}])
+
+    def test_eager_loading_materializes_everything(self):
+        self._write({"coins": 40})
+        state, _ = self._load(lazy_sections=False)
+
+        self.assertEqual(state.settings.pending_fields(), set())
+        self.assertEqual(state.settings.coins, 40)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+
+import numpy as np
+
+from modules import synth
+from modules.synth import Note, adsr, bell, chord, exp_decay, rest
+
+
+# Per-note reference formulas the effects used to be built from.
+def _time(duration, sample_rate=44100):
+    return np.linspace(0, duration, int(sample_rate * duration), endpoint=False)
+
+
+def _sine(freq, duration):
+    return np.sin(2 * np.pi * freq * _time(duration))
+
+
+def _triangle(freq, duration):
+    phase = (freq * _time(duration)) % 1.0
+    return 2 * np.abs(2 * phase - 1) - 1
+
+
+def _pulse(freq, duration, duty_cycle):
+    phase = (freq * _time(duration)) % 1.0
+    return np.where(phase < duty_cycle, 1.0, -1.0)
+
+
+def _adsr(wave, attack, decay, sustain_level, release, sample_rate=44100):
+    attack_n, decay_n, release_n = (int(x * sample_rate) for x in (attack, decay, release))
+    sustain_n = max(0, len(wave) - attack_n - decay_n - release_n)
+    envelope = np.concatenate([
+        np.linspace(0, 1, attack_n),
+        np.linspace(1, sustain_level, decay_n),
+        np.full(sustain_n, sustain_level),
+        np.linspace(sustain_level, 0, release_n),
+    ])[:len(wave)]
+    return wave * envelope
+
+
+def _pitch_slide(start_freq, end_freq, duration, sample_rate=44100):
+    t = _time(duration)
+    freq = start_freq + (end_freq - start_freq) * (t / duration)
+    return np.sin(np.cumsum(2 * np.pi * freq / sample_rate))
+
+
+class TestSynthMatchesWaveHelpers(unittest.TestCase):
+    """Single notes render the same samples as the per-note reference formulas."""
+
+    def test_sine_note(self):
+        wave = synth.render([Note(440, 0.05)])
+        np.testing.assert_allclose(wave, _sine(440, 0.05), atol=1e-6)
+
+    def test_triangle_note(self):
+        wave = synth.render([Note(523, 0.05, wave=synth.TRIANGLE)])
+        np.testing.assert_allclose(wave, _triangle(523, 0.05), atol=1e-6)
+
+    def test_pulse_note(self):
+        wave = synth.render([Note(659, 0.05, wave=synth.PULSE, duty=0.25)])
+        np.testing.assert_allclose(wave, _pulse(659, 0.05, 0.25), atol=1e-6)
+
+    def test_adsr_envelope(self):
+        spec = adsr(attack=0.01, decay=0.03, sustain_level=0.5, release=0.08)
+        wave = synth.render([Note(784, 0.12, envelope=spec)])
+        expected = _adsr(_sine(784, 0.12), attack=0.01, decay=0.03, sustain_level=0.5, release=0.08)
+        np.testing.assert_allclose(wave, expected, atol=1e-6)
+
+    def test_pitch_slide(self):
+        wave = synth.render([Note(988, 0.04, end_freq=1319)])
+        np.testing.assert_allclose(wave, _pitch_slide(988, 1319, 0.04), atol=1e-5)
+
+
+class TestSynthSequences(unittest.TestCase):
+    def test_sequence_length_and_dtype(self):
+        wave = synth.render([Note(523, 0.05), rest(0.02), Note(659, 0.06)], gain=0.5)
+        self.assertEqual(wave.dtype, np.float32)
+        self.assertEqual(len(wave), int(44100 * 0.05) + int(44100 * 0.02) + int(44100 * 0.06))
+
+    def test_rest_is_silent(self):
+        wave = synth.render([Note(523, 0.05), rest(0.02)])
+        self.assertTrue(np.all(wave[int(44100 * 0.05):] == 0))
+
+    def test_notes_restart_phase(self):
+        wave = synth.render([Note(440, 0.05), Note(440, 0.05)])
+        half = len(wave) // 2
+        np.testing.assert_allclose(wave[:half], wave[half:], atol=1e-6)
+
+    def test_chord_sums_tones(self):
+        wave = synth.render([chord([392, 494], 0.05, amplitude=0.25)])
+        expected = 0.25 * _sine(392, 0.05) + 0.25 * _sine(494, 0.05)
+        np.testing.assert_allclose(wave, expected, atol=1e-5)
+
+    def test_exp_decay_envelope(self):
+        wave = synth.render([Note(1319, 0.11, envelope=exp_decay(6.0))])
+        t = np.linspace(0, 0.11, int(44100 * 0.11), endpoint=False)
+        expected = np.sin(2 * np.pi * 1319 * t) * np.exp(-6.0 * t / 0.11)
+        np.testing.assert_allclose(wave, expected, atol=1e-5)
+
+    def test_sequence_envelope_over_odd_durations(self):
+        # The per-note sample counts can add up to one more than
+        # int(sample_rate * total duration); the envelope must follow them.
+        for index in range(40):
+            durations = (0.013 + index * 0.0071, 0.029 + index * 0.0113, 0.0417)
+            notes = [Note(440, durations[0]), rest(durations[1]), Note(660, durations[2])]
+            for spec in (exp_decay(4.0), bell(8.0)):
+                with self.subTest(durations=durations, spec=spec[0]):
+                    wave = synth.render(notes, envelope=spec)
+                    expected = sum(int(44100 * duration) for duration in durations)
+                    self.assertEqual(len(wave), expected)
+
+    def test_sequence_exp_decay_matches_sample_time(self):
+        notes = [Note(440, 0.05), Note(440, 0.05)]
+        plain = synth.render(notes)
+        wave = synth.render(notes, envelope=exp_decay(3.0))
+        total = len(plain)
+        t = np.arange(total) / 44100.0
+        expected = plain * np.exp(-3.0 * t / (total / 44100.0))
+        np.testing.assert_allclose(wave, expected, atol=1e-6)
+
+    def test_empty_sequence(self):
+        self.assertEqual(len(synth.render([])), 0)
+        self.assertEqual(len(synth.render([Note(440, 0.0)])), 0)
+
+    def test_time_base_is_shared(self):
+        self.assertIs(synth.time_base(0.08), synth.time_base(0.08))
+        self.assertFalse(synth.time_base(0.08).flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from modules import test_modes
+from modules import keystroke_log, test_modes
 
 
 class _DummySpeech:
@@ -94,6 +94,20 @@ class TestTestModesAnnouncements(unittest.TestCase):
         )
 
 
+class TestTestModesKeystrokeTiming(unittest.TestCase):
+    def test_typed_characters_are_recorded_with_expected_character(self):
+        app = _DummyApp(current="ab", typed="")
+        app.keystrokes = keystroke_log.KeystrokeRecorder(path=None)
+        test_modes.process_practice_typing(app, _DummyEvent("a"))
+        test_modes.process_practice_typing(app, _DummyEvent("x"))
+
+        rows = app.keystrokes.pending_rows()
+        self.assertEqual([keystroke_log.code_char(c) for c in rows["expected"]], ["a", "b"])
+        self.assertEqual([keystroke_log.code_char(c) for c in rows["typed"]], ["a", "x"])
+        self.assertEqual(rows["correct"].tolist(), [1, 0])
+        self.assertTrue((rows["mode"] == keystroke_log.MODES.index("practice")).all())
+
+
 class TestPracticeTopicRandomization(unittest.TestCase):
     def test_random_topic_pool_excludes_spanish_topics(self):
         topics = ["English", "Spanish", "Windows Commands", "Spanish Sentences"]
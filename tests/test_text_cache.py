@@ -0,0 +1,98 @@
+import unittest
+
+import pygame
+
+from ui import text_cache
+from ui.text_cache import TextSurfaceCache
+
+
+class _Font:
+    """Renders real surfaces, 10 px wide per character."""
+
+    size = 20
+    style = 0
+
+    def __init__(self):
+        self.renders = 0
+
+    def render(self, text, color, bgcolor=None):
+        self.renders += 1
+        surf = pygame.Surface((max(1, len(text) * 10), 20), pygame.SRCALPHA)
+        return surf, surf.get_rect()
+
+
+class _FakeSurfaceFont:
+    def render(self, text, color):
+        return object(), None
+
+
+class TestTextSurfaceCache(unittest.TestCase):
+    def test_repeated_render_reuses_surface(self):
+        cache = TextSurfaceCache()
+        font = _Font()
+        first, _ = cache.render(font, "Menu", (255, 255, 255))
+        second, rect = cache.render(font, "Menu", (255, 255, 255))
+        self.assertIs(first, second)
+        self.assertEqual(font.renders, 1)
+        self.assertEqual(rect.size, first.get_size())
+        self.assertEqual(cache.stats()["hit_rate"], 0.5)
+
+    def test_returned_rect_is_a_copy(self):
+        cache = TextSurfaceCache()
+        font = _Font()
+        _, rect = cache.render(font, "Menu", (0, 0, 0))
+        rect.x = 500
+        _, again = cache.render(font, "Menu", (0, 0, 0))
+        self.assertEqual(again.x, 0)
+
+    def test_color_font_and_style_are_part_of_the_key(self):
+        cache = TextSurfaceCache()
+        font, other = _Font(), _Font()
+        cache.render(font, "Menu", (0, 0, 0))
+        cache.render(font, "Menu", pygame.Color(255, 0, 0))
+        cache.render(other, "Menu", (0, 0, 0))
+        font.style = 1
+        cache.render(font, "Menu", (0, 0, 0))
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_memory_budget_evicts_least_recently_used(self):
+        font = _Font()
+        one_line = font.render("abcd", None)[0]
+        budget = one_line.get_pitch() * one_line.get_height() * 2
+        cache = TextSurfaceCache(max_bytes=budget)
+        cache.render(font, "aaaa", (0, 0, 0))
+        cache.render(font, "bbbb", (0, 0, 0))
+        cache.render(font, "aaaa", (0, 0, 0))
+        cache.render(font, "cccc", (0, 0, 0))
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["bytes"], budget)
+        renders = font.renders
+        cache.render(font, "aaaa", (0, 0, 0))
+        self.assertEqual(font.renders, renders)
+
+    def test_entry_limit_is_enforced(self):
+        cache = TextSurfaceCache(max_entries=3)
+        font = _Font()
+        for text in ("a", "b", "c", "d", "e"):
+            cache.render(font, text, (0, 0, 0))
+        self.assertEqual(cache.stats()["entries"], 3)
+
+    def test_non_surface_results_pass_through_uncached(self):
+        cache = TextSurfaceCache()
+        surf, rect = cache.render(_FakeSurfaceFont(), "x", (0, 0, 0))
+        self.assertIsNone(rect)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_clear_text_cache_drops_shared_surfaces(self):
+        font = _Font()
+        text_cache.render_text(font, "Title", (1, 2, 3))
+        text_cache.clear_text_cache()
+        stats = text_cache.text_cache_stats()
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual(stats["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
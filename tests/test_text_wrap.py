@@ -0,0 +1,129 @@
+import unittest
+
+import pygame
+
+from ui import text_wrap
+from ui.text_wrap import WrapCache
+
+
+class _Surface:
+    def __init__(self, width):
+        self._width = width
+
+    def get_width(self):
+        return self._width
+
+
+class _RenderOnlyFont:
+    """Font without metrics: 10 px per character."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def render(self, text, color):
+        self.renders += 1
+        return _Surface(len(text) * 10), None
+
+
+class _MetricFont(_RenderOnlyFont):
+    """Font with glyph metrics: 10 px advance per glyph, ink 1 px narrower."""
+
+    size = 20
+    style = 0
+
+    def __init__(self):
+        super().__init__()
+        self.rects = 0
+
+    def get_rect(self, text):
+        self.rects += 1
+        return pygame.Rect(0, 0, max(0, len(text) * 10 - 1), 20)
+
+    def get_metrics(self, text):
+        return [(0, 9, 0, 10, 10.0, 0.0) for _ in text]
+
+
+def _legacy_wrap(font, text, max_width):
+    words = text.split()
+    lines, current = [], ""
+    for word in words:
+        candidate = f"{current} {word}".strip()
+        if font.get_rect(candidate).width <= max_width:
+            current = candidate
+        else:
+            if current:
+                lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return lines
+
+
+class TestWrapLayout(unittest.TestCase):
+    def test_matches_render_per_word_wrapping(self):
+        text = "the quick brown fox jumps over the lazy dog and keeps on running far away"
+        for width in (40, 59, 60, 99, 100, 150, 333, 1000):
+            with self.subTest(width=width):
+                font = _MetricFont()
+                self.assertEqual(WrapCache().wrap(font, text, width), _legacy_wrap(font, text, width))
+
+    def test_long_word_gets_its_own_line(self):
+        lines = WrapCache().wrap(_MetricFont(), "a incomprehensibilities b", 50)
+        self.assertEqual(lines, ["a", "incomprehensibilities", "b"])
+
+    def test_empty_text_has_no_lines(self):
+        self.assertEqual(WrapCache().wrap(_MetricFont(), "   ", 100), [])
+
+    def test_render_only_fonts_still_wrap(self):
+        font = _RenderOnlyFont()
+        self.assertEqual(WrapCache().wrap(font, "one two three four", 90, (0, 0, 0)), ["one two", "three", "four"])
+
+
+class TestWrapCache(unittest.TestCase):
+    def test_repeated_wrap_is_served_from_cache(self):
+        cache = WrapCache()
+        font = _MetricFont()
+        first = cache.wrap(font, "one two three four five six", 100)
+        measured = font.rects
+        second = cache.wrap(font, "one two three four five six", 100)
+        self.assertEqual(first, second)
+        self.assertEqual(font.rects, measured)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_returned_lines_can_be_mutated_safely(self):
+        cache = WrapCache()
+        font = _MetricFont()
+        cache.wrap(font, "one two three", 50).append("extra")
+        self.assertEqual(cache.wrap(font, "one two three", 50), ["one", "two", "three"])
+
+    def test_width_and_font_are_part_of_the_key(self):
+        cache = WrapCache()
+        font, other = _MetricFont(), _MetricFont()
+        cache.wrap(font, "one two three", 50)
+        cache.wrap(font, "one two three", 200)
+        cache.wrap(other, "one two three", 50)
+        self.assertEqual(cache.stats()["misses"], 3)
+
+    def test_least_recently_used_layouts_are_evicted(self):
+        cache = WrapCache(max_layouts=2)
+        font = _MetricFont()
+        cache.wrap(font, "a", 100)
+        cache.wrap(font, "b", 100)
+        cache.wrap(font, "a", 100)
+        cache.wrap(font, "c", 100)
+        self.assertEqual(cache.stats()["layouts"], 2)
+        cache.wrap(font, "a", 100)
+        self.assertEqual(cache.stats()["hits"], 2)
+        cache.wrap(font, "b", 100)
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_clear_wrap_cache_forgets_module_layouts(self):
+        font = _MetricFont()
+        text_wrap.wrap_text(font, "one two", 100)
+        text_wrap.clear_wrap_cache()
+        self.assertEqual(text_wrap.wrap_cache_stats()["layouts"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+
+from modules import key_analytics
+from modules.keystroke_log import KeystrokeRecorder, load_keystrokes
+from modules.state_manager import Settings
+from modules.transition_stats import TransitionStats
+
+
+MS = 1_000_000
+
+
+class _StepClock:
+    """Advances by the next gap (in ms) on every call."""
+
+    def __init__(self, gaps_ms):
+        self.now = 10_000 * MS
+        self.gaps = list(gaps_ms)
+
+    def __call__(self):
+        self.now += self.gaps.pop(0) * MS if self.gaps else 100 * MS
+        return self.now
+
+
+def _type(recorder, keys, correct=None):
+    for index, key in enumerate(keys):
+        ok = True if correct is None else correct[index]
+        recorder.record("practice", key, key if ok else "x", ok)
+
+
+class TestTransitionStats(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self._tmp.name, "keystrokes.bin")
+        self.stats_path = os.path.join(self._tmp.name, "transitions.npz")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _recorder(self, gaps_ms, stats=None):
+        recorder = KeystrokeRecorder(self.log_path, clock=_StepClock(gaps_ms))
+        recorder.transitions = stats or TransitionStats(self.stats_path)
+        return recorder
+
+    def test_pairs_record_latency_errors_and_fold_shifted_keys(self):
+        recorder = self._recorder([0, 120, 300, 80, 3000, 90])
+        _type(recorder, ["t", "H", "e", "t", "h", "e"], correct=[True, True, False, True, True, True])
+        recorder.end_session()
+        stats = recorder.transitions
+
+        th = stats.pair("t", "h")
+        # t->H (120 ms); t->h comes after a 3 s pause and is ignored.
+        self.assertEqual(th["attempts"], 1)
+        self.assertAlmostEqual(th["mean_ms"], 120.0)
+        he = stats.pair("h", "e")
+        self.assertEqual((he["attempts"], he["errors"]), (2, 1))
+        self.assertAlmostEqual(he["mean_ms"], 90.0)
+        # The wrong "e" does not start a transition.
+        self.assertIsNone(stats.pair("e", "t"))
+
+    def test_pairs_span_flushes_and_survive_reload(self):
+        recorder = self._recorder([0] + [100] * 40)
+        for _ in range(10):
+            _type(recorder, ["t", "h", "e", " "])
+            recorder.flush()
+        recorder.end_session()
+
+        reloaded = TransitionStats(self.stats_path)
+        self.assertEqual(reloaded.pair("e", " ")["attempts"], 10)
+        self.assertEqual(reloaded.pair(" ", "t")["attempts"], 9)
+        self.assertAlmostEqual(reloaded.pair("t", "h")["median_ms"], 112.5)
+        self.assertEqual(reloaded.slowest_trigraphs(1, min_samples=9)[0]["mean_ms"], 200.0)
+
+    def test_missing_file_is_rebuilt_from_log_once(self):
+        recorder = KeystrokeRecorder(self.log_path, clock=_StepClock([0, 150, 150]))
+        _type(recorder, ["a", "s", "d"])
+        recorder.end_session()
+
+        stats = TransitionStats(self.stats_path, source=lambda: load_keystrokes(self.log_path))
+        recorder = self._recorder([5_000, 150, 150], stats)
+        _type(recorder, ["a", "s", "d"])
+        recorder.end_session()
+
+        self.assertEqual(stats.pair("a", "s")["attempts"], 2)
+        self.assertEqual(stats.pair("s", "d")["attempts"], 2)
+        self.assertTrue(os.path.exists(self.stats_path))
+
+    def test_report_names_slowest_transitions_and_finger(self):
+        recorder = self._recorder([0] + [90, 400] * 20)
+        _type(recorder, ["f", "p"] * 20)
+        recorder.end_session()
+        settings = Settings()
+        settings.key_stats = {"p": {"attempts": 20, "correct": 20, "errors": 0}}
+        settings.transition_stats = recorder.transitions
+
+        report = key_analytics.format_key_performance_report(settings)
+        self.assertIn("Slowest Key Transitions:", report)
+        self.assertIn("P to F:", report)
+        self.assertIn("Slowest finger: Left Index", report)
+
+        finger = key_analytics.get_weakest_finger(settings)
+        self.assertEqual(finger["finger"], "Right Pinky")
+        self.assertEqual(finger["slowest_finger"], "Left Index")
+        self.assertGreater(finger["slowest_finger_ms"], finger["latency_ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -135,6 +135,9 @@ class TestUpdateManager(unittest.TestCase):
         self.assertIn("/NOCANCEL", content)
         self.assertIn('BACKUP_DIR', content)
         self.assertIn('progress.json', content)
+        self.assertIn('"%APP_DIR%\\progress.db-wal" "%BACKUP_DIR%\\progress.db-wal"', content)
+        self.assertIn('"%BACKUP_DIR%\\progress.db-wal" "%APP_DIR%\\progress.db-wal"', content)
+        self.assertIn('del /F /Q "%APP_DIR%\\progress.db-shm"', content)
         self.assertIn('Get-Content -LiteralPath $_.FullName', content)
         self.assertIn('Get-Content -LiteralPath $dest', content)
         self.assertIn('Set-Content -LiteralPath $dest -Value $merged', content)
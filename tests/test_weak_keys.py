@@ -0,0 +1,85 @@
+import random
+import unittest
+from collections import Counter
+
+from modules import key_analytics, lesson_manager, transition_stats
+from modules.state_manager import LessonState, Settings
+from modules.weak_keys import AliasTable, WeakKeyGenerator, key_weights
+
+
+class _Transitions:
+    """Timing tables where j -> f is slow and every key is typed at 100 ms."""
+
+    def overall_median_ms(self):
+        return 100.0
+
+    def key_medians(self, keys, min_samples):
+        return {key: 100.0 for key in keys}
+
+    def pair_medians(self, keys, min_samples):
+        return {("j", "f"): 250.0} if "j" in keys and "f" in keys else {}
+
+
+class TestWeakKeys(unittest.TestCase):
+    def test_alias_table_matches_weights(self):
+        table = AliasTable(["a", "b", "c"], [1, 2, 7], random.Random(3))
+        counts = Counter(table.draw() for _ in range(20000))
+        self.assertAlmostEqual(counts["c"] / 20000, 0.7, delta=0.02)
+        self.assertAlmostEqual(counts["a"] / 20000, 0.1, delta=0.02)
+
+    def test_weights_follow_long_term_errors_and_focus_share(self):
+        stats = {
+            "a": {"attempts": 95, "correct": 95, "errors": 0},
+            "s": {"attempts": 95, "correct": 70, "errors": 25},
+        }
+        weights = key_weights(["a", "s"], stats)
+        self.assertEqual(weights["a"], 1.0)
+        self.assertAlmostEqual(weights["s"], 4.0)
+
+        focused = key_weights(["a", "s", "d", "f"], stats, focus=["d"])
+        self.assertAlmostEqual(focused["d"] / sum(focused.values()), 0.6)
+
+    def test_generator_repeats_slow_transitions(self):
+        generator = WeakKeyGenerator(["f", "j", "k"], transitions=_Transitions(), rng=random.Random(5))
+        words = generator.words(3000, 2, 2)
+        after_j = Counter(word[1] for word in words if word[0] == "j")
+        self.assertGreater(after_j["f"], 2 * after_j["k"])
+
+    def test_for_settings_skips_timing_tables_until_loaded(self):
+        reads = []
+        settings = Settings()
+        settings.transition_stats = transition_stats.TransitionStats(path=None, source=lambda: reads.append(1))
+        generator = WeakKeyGenerator.for_settings(settings, ["f", "j", "k"])
+        self.assertEqual(reads, [])
+        self.assertFalse(settings.transition_stats.loaded)
+        self.assertEqual(generator._next, {})
+
+        timed = _Transitions()
+        timed.loaded = True
+        settings.transition_stats = timed
+        generator = WeakKeyGenerator.for_settings(settings, ["f", "j", "k"])
+        self.assertIn("j", generator._next)
+
+    def test_build_batch_leans_on_weak_keys(self):
+        settings = Settings()
+        settings.key_stats = {"f": {"attempts": 50, "correct": 20, "errors": 30}}
+        lesson = LessonState()
+        lesson.use_words = False
+        random.seed(11)
+        lesson_manager.LessonManager.build_batch(lesson, 3, settings)
+
+        counts = Counter("".join(lesson.batch_words))
+        self.assertEqual(len(lesson.batch_words), lesson_manager.LESSON_BATCH)
+        self.assertGreater(counts["f"], counts["s"])
+
+    def test_recommended_lessons_rank_weakest_keys_first(self):
+        settings = Settings()
+        settings.key_stats = {
+            "q": {"attempts": 40, "correct": 20, "errors": 20},
+            "a": {"attempts": 40, "correct": 38, "errors": 2},
+        }
+        self.assertEqual(key_analytics.recommend_lessons_for_keys(settings, ["a", "q", "b"]), [11, 0, 18])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import random
+import tempfile
+import unittest
+
+from modules import lesson_manager, word_index
+from modules.word_index import WordIndex
+
+
+class TestWordIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "word_index.bin")
+        self.key_order = word_index.key_order_for_stages(lesson_manager.STAGE_LETTERS)
+        text = "Dad asks: fall, flask, salad! Sad lads add jade. Don't jest; tea-time ok? Café 42"
+        count = word_index.build_word_index(word_index.extract_words(text), self.key_order, self.path)
+        self.assertGreater(count, 0)
+        self.index = WordIndex(self.path)
+
+    def tearDown(self):
+        del self.index
+        self._tmp.cleanup()
+
+    def test_key_order_follows_lessons(self):
+        self.assertTrue(self.key_order.startswith("asdfjkl;gh"))
+        self.assertNotIn(" ", self.key_order)
+
+    def test_lesson_prefix_returns_typeable_words(self):
+        words = self.index.words_for_keys(lesson_manager._STAGE_ALLOWED[3])
+        self.assertEqual(sorted(words), ["add", "dad", "sad"])
+        self.assertEqual(self.index.count(lesson_manager._STAGE_ALLOWED[7]), 8)
+
+    def test_arbitrary_key_sets_and_required_keys(self):
+        keys = set("adjest'-iomn")
+        self.assertEqual(sorted(self.index.words_for_keys(keys)), ["add", "dad", "don't", "jade", "jest", "sad", "tea-time"])
+        self.assertEqual(sorted(self.index.words_for_keys(keys, require="j")), ["jade", "jest"])
+        self.assertEqual(self.index.words_for_keys(keys, min_length=5), ["don't", "tea-time"])
+        # Accented and capitalised text is folded or skipped, never indexed raw.
+        self.assertNotIn("café", self.index.words_for_keys(self.key_order))
+
+    def test_sample_is_distinct_and_bounded(self):
+        picks = self.index.sample(lesson_manager._STAGE_ALLOWED[7], 20, rng=random.Random(2))
+        self.assertEqual(len(picks), 8)
+        self.assertEqual(len(set(picks)), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
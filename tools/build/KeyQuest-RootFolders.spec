@@ -78,6 +78,7 @@ coll = COLLECT(
 # Post-build: Copy folders to root (alongside .exe)
 import shutil
 import fnmatch
+import subprocess
 dist_dir = os.path.join(DISTPATH, 'KeyQuest')
 print("\n=== Copying folders to distribution root ===")
 
@@ -146,4 +147,22 @@ if os.path.exists(readme_html_src):
     shutil.copy(readme_html_src, os.path.join(dist_dir, 'README.html'))
     print("Copied README.html to distribution root")
 
+# Prebuild synthesized audio so first launch loads effects instead of generating them.
+audio_cache_dst = os.path.join(dist_dir, 'cache', 'audio')
+audio_cache_result = subprocess.run(
+    [sys.executable, os.path.join(REPO_ROOT, 'tools', 'dev', 'build_audio_cache.py'), '--output', audio_cache_dst, '--clear'],
+    cwd=REPO_ROOT,
+)
+if audio_cache_result.returncode != 0:
+    print("WARNING: Audio cache prebuild failed; effects will be synthesized on first use")
+
+# Index real words by the keys they need so lessons and free practice can draw them.
+word_index_dst = os.path.join(dist_dir, 'cache', 'word_index.bin')
+word_index_result = subprocess.run(
+    [sys.executable, os.path.join(REPO_ROOT, 'tools', 'dev', 'build_word_index.py'), '--output', word_index_dst],
+    cwd=REPO_ROOT,
+)
+if word_index_result.returncode != 0:
+    print("WARNING: Word index build failed; lessons will use authored words only")
+
 print("=== Folders copied successfully! ===\n")
@@ -0,0 +1,155 @@
+"""Measure progress load time and peak memory for a large, long-lived profile.
+
+Builds a synthetic profile in a temporary folder: a full 100-session JSON
+history with a pending journal, every printable key in ``key_stats``, a pet,
+quests, and inventory; and for the SQLite store, ``--sessions`` sessions of
+unlimited history. It then times ``ProgressManager.load()`` (what startup
+pays) and the first touch of the deferred sections (what opening the
+dashboard or key report pays), with peak memory from tracemalloc. Sections
+are only deferred with the SQLite store; ``progress.json`` always loads
+whole.
+
+Usage:
+  python tools/dev/bench_progress_load.py
+  python tools/dev/bench_progress_load.py --sessions 200000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from modules import dashboard_manager, key_analytics, state_manager  # noqa: E402
+from modules.state_manager import AppState, ProgressManager  # noqa: E402
+
+
+def _session(n: int) -> dict:
+    day = date(2024, 1, 1) + timedelta(days=n // 6)
+    return {
+        "type": ("lesson", "speed_test", "sentence_practice", "game")[n % 4],
+        "summary": f"Lesson {n % 40 + 1}",
+        "date": day.isoformat(),
+        "time": "4:15 PM",
+        "timestamp": f"{day.isoformat()}T16:15:00",
+        "wpm": 20.0 + n % 40,
+        "accuracy": 90.0 + n % 10,
+        "duration": 60.0 + n % 300,
+        "stars": n % 4,
+        "earned": "12 XP, 5 coins",
+    }
+
+
+def build_state(sessions: int) -> AppState:
+    state = AppState()
+    settings = state.settings
+    settings.current_lesson = 30
+    settings.unlocked_lessons = set(range(31))
+    settings.lesson_stars = {i: 3 for i in range(31)}
+    settings.lesson_best_wpm = {i: 40.0 + i for i in range(31)}
+    settings.lesson_best_accuracy = {i: 98.5 for i in range(31)}
+    settings.key_stats = {
+        chr(c): {"attempts": 5000 + c, "correct": 4800 + c, "errors": 200, "recent": [1, 1, 0, 1, 1, 1, 1, 0, 1, 1]}
+        for c in range(32, 127)
+    }
+    settings.earned_badges = {f"badge_{i}" for i in range(10)}
+    settings.active_quests = {f"quest_{i}": {"progress": i, "target": 10, "completed": False} for i in range(10)}
+    settings.completed_quests = {f"quest_{i}" for i in range(10, 20)}
+    settings.coins = 4200
+    settings.owned_items = {f"item_{i}" for i in range(20)}
+    settings.inventory = {f"treat_{i}": i for i in range(10)}
+    settings.pet_type = "dragon"
+    settings.pet_name = "Ember"
+    settings.pet_last_fed = date.today().isoformat()
+    settings.session_history = [_session(n) for n in range(sessions)]
+    return state
+
+
+def build_profiles(tmpdir: str, sessions: int) -> dict:
+    """Write a JSON profile (with a journal) and a SQLite profile; return their managers' args."""
+    json_path = os.path.join(tmpdir, "progress.json")
+    state = build_state(100)
+    manager = ProgressManager(json_path)
+    manager.save(state)
+    # A day of play since the last compaction: sessions and key stat changes in the journal.
+    for n in range(100, 160):
+        dashboard_manager.record_session(state.settings, _session(n))
+        key_analytics.record_keystroke(state.settings, "e", True)
+        state.settings.coins += 1
+        manager.save(state)
+
+    db_json = os.path.join(tmpdir, "db_progress.json")
+    db_path = os.path.join(tmpdir, "progress.db")
+    big = build_state(sessions)
+    db_manager = ProgressManager(db_json, database=db_path)
+    db_manager.write(db_manager.changes(big))
+    db_manager.store.close()
+    return {
+        "json": {"filename": json_path},
+        "sqlite": {"filename": db_json, "database": db_path},
+    }
+
+
+def measure(kwargs: dict, lazy: bool, repeat: int) -> dict:
+    best_load = best_touch = float("inf")
+    peak = 0
+    for _ in range(repeat):
+        gc.collect()
+        state = AppState()
+        manager = ProgressManager(lazy_sections=lazy, **kwargs)
+        tracemalloc.start()
+        started = time.perf_counter()
+        manager.load(state, stage_letters_count=50)
+        loaded = time.perf_counter()
+        startup_peak = tracemalloc.get_traced_memory()[1]
+        # Opening the dashboard and key report touches the rest.
+        len(state.settings.session_history)
+        len(state.settings.key_stats)
+        state.settings.pet_happiness
+        state.settings.coins
+        touched = time.perf_counter()
+        tracemalloc.stop()
+        best_load = min(best_load, loaded - started)
+        best_touch = min(best_touch, touched - loaded)
+        peak = max(peak, startup_peak)
+        if manager.store is not None:
+            manager.store.close()
+    return {"load_ms": best_load * 1000.0, "touch_ms": best_touch * 1000.0, "peak_kb": peak / 1024.0}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure progress load time and memory for a large profile.")
+    parser.add_argument("--sessions", type=int, default=50000, help="Sessions stored in the SQLite profile")
+    parser.add_argument("--repeat", type=int, default=5, help="Loads per variant (best time, worst memory)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        profiles = build_profiles(tmpdir, args.sessions)
+        print(
+            f"JSON profile: 100 sessions + {len(state_manager.PROGRESS_SECTIONS)} sections, 60 journal records; "
+            f"SQLite profile: {args.sessions} sessions"
+        )
+        print(f"{'profile':<9}{'loading':<8}{'startup ms':>12}{'peak KB':>10}{'first touch ms':>16}")
+        for name, kwargs in profiles.items():
+            for lazy in (False, True) if name == "sqlite" else (False,):
+                result = measure(kwargs, lazy, args.repeat)
+                label = "lazy" if lazy else "eager"
+                print(
+                    f"{name:<9}{label:<8}{result['load_ms']:>12.2f}{result['peak_kb']:>10.0f}{result['touch_ms']:>16.2f}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,149 @@
+"""Compare sound effect generation time before and after the synthesis engine.
+
+Loads games/sounds.py and modules/audio_manager.py as they were at a baseline
+git revision, then times every effect generator in the baseline and current
+trees and reports per-effect timings, speedup, and the largest sample
+difference between the two outputs.
+
+Usage:
+  python tools/dev/bench_sound_synthesis.py
+  python tools/dev/bench_sound_synthesis.py --baseline <rev> --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np  # noqa: E402
+
+from games import sounds  # noqa: E402
+from modules.audio_manager import AudioManager  # noqa: E402
+
+
+GAME_EFFECTS = (
+    ("letter_hit", ()),
+    ("letter_miss", ()),
+    ("combo_sound", (3,)),
+    ("powerup_sound", ()),
+    ("life_lost", ()),
+    ("game_over", ()),
+    ("level_start", ()),
+    ("level_complete", ()),
+    ("menu_move", ()),
+    ("menu_select", ()),
+    ("coin_collect", ()),
+    ("speed_up", ()),
+    ("countdown_beep", (0,)),
+    ("warning_beep", ()),
+)
+
+# make_dog_sound adds random noise, so its output is not compared.
+AUDIO_EFFECTS = (
+    ("make_tone", (440.0, 100)),
+    ("make_coin_sound", ()),
+    ("make_miss_sound", ()),
+    ("make_progressive_tone", (0.5,)),
+    ("make_success_tones", ()),
+    ("make_buzz_sound", ()),
+    ("make_victory_sound", ()),
+    ("make_unlock_sound", ()),
+    ("make_badge_sound", ()),
+    ("make_levelup_sound", ()),
+    ("make_quest_sound", ()),
+    ("make_robot_sound", ()),
+    ("make_dragon_sound", ()),
+    ("make_owl_sound", ()),
+    ("make_cat_sound", ()),
+    ("make_phoenix_sound", ()),
+    ("make_tribble_sound", ()),
+    ("make_pet_feed_sound", ()),
+    ("make_pet_play_sound", ()),
+    ("make_pet_evolve_sound", ()),
+)
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def default_baseline() -> str:
+    """Return the revision just before modules/synth.py was added (HEAD if uncommitted)."""
+    added = _git("log", "--diff-filter=A", "--format=%H", "--", "modules/synth.py").split()
+    return f"{added[-1]}^" if added else "HEAD"
+
+
+def load_baseline_module(rev: str, path: str, name: str) -> types.ModuleType:
+    """Execute ``path`` as it was at ``rev`` into a fresh module object."""
+    source = _git("show", f"{rev}:{path}")
+    module = types.ModuleType(name)
+    module.__file__ = f"{rev}:{path}"
+    exec(compile(source, module.__file__, "exec"), module.__dict__)
+    return module
+
+
+def time_call(func, args, repeat: int) -> float:
+    """Return the best-of-``repeat`` wall time for ``func(*args)`` in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1e6
+
+
+def compare(label, old_func, new_func, args, repeat):
+    old_us = time_call(old_func, args, repeat)
+    new_us = time_call(new_func, args, repeat)
+    old_wave, new_wave = old_func(*args), new_func(*args)
+    if old_wave.shape == new_wave.shape:
+        diff = float(np.max(np.abs(old_wave - new_wave))) if old_wave.size else 0.0
+    else:
+        diff = float("nan")
+    return label, old_us, new_us, diff
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark sound synthesis before/after the synthesis engine.")
+    parser.add_argument("--baseline", default=None, help="Git revision with the old generators")
+    parser.add_argument("--repeat", type=int, default=30, help="Timed runs per effect (best is reported)")
+    args = parser.parse_args()
+
+    rev = args.baseline or default_baseline()
+    old_sounds = load_baseline_module(rev, "games/sounds.py", "baseline_sounds")
+    old_audio = load_baseline_module(rev, "modules/audio_manager.py", "baseline_audio_manager").AudioManager
+
+    rows = []
+    for name, params in GAME_EFFECTS:
+        rows.append(compare(f"sounds.{name}", getattr(old_sounds, name), getattr(sounds, name), params, args.repeat))
+    for name, params in AUDIO_EFFECTS:
+        rows.append(
+            compare(f"AudioManager.{name}", getattr(old_audio, name), getattr(AudioManager, name), params, args.repeat)
+        )
+
+    print(f"Baseline: {rev}  (best of {args.repeat} runs)")
+    print(f"{'effect':<38}{'old us':>10}{'new us':>10}{'speedup':>9}{'max diff':>11}")
+    for label, old_us, new_us, diff in rows:
+        print(f"{label:<38}{old_us:>10.1f}{new_us:>10.1f}{old_us / new_us:>8.2f}x{diff:>11.1e}")
+    total_old = sum(row[1] for row in rows)
+    total_new = sum(row[2] for row in rows)
+    print(f"{'total':<38}{total_old:>10.1f}{total_new:>10.1f}{total_old / total_new:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+"""Benchmark text wrapping on the longest practice sentences.
+
+Takes the longest lines from Sentences/*.txt and wraps each one at several
+widths with the old render-every-candidate wrapper, the glyph-metric wrapper
+with an empty cache (first frame), and the glyph-metric wrapper with a warm
+layout cache (every later frame). Also checks that the new layouts match
+the old ones.
+
+Usage:
+  python tools/dev/bench_text_wrap.py
+  python tools/dev/bench_text_wrap.py --lines 50 --repeat 20 --font-scale 150%
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pygame.freetype  # noqa: E402
+
+from modules import font_manager  # noqa: E402
+from ui import text_wrap  # noqa: E402
+
+
+WIDTHS = (300, 500, 760, 1100)
+
+
+def legacy_wrap(font, text, max_width, measure_color):
+    """The wrapper this benchmark replaces: one render per candidate line."""
+    words = (text or "").split()
+    if not words:
+        return []
+    lines = []
+    current_line = ""
+    for word in words:
+        test_line = f"{current_line} {word}".strip()
+        test_surf, _ = font.render(test_line, measure_color)
+        if test_surf.get_width() <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word
+    if current_line:
+        lines.append(current_line)
+    return lines
+
+
+def longest_lines(count: int):
+    lines = []
+    for path in sorted((ROOT / "Sentences").glob("*.txt")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                lines.append(line)
+    lines.sort(key=len, reverse=True)
+    return lines[:count]
+
+
+def time_pass(func, lines, repeat: int) -> float:
+    """Best-of-``repeat`` time to wrap every line at every width, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for line in lines:
+            for width in WIDTHS:
+                func(line, width)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark text wrapping on the longest sentence lines.")
+    parser.add_argument("--lines", type=int, default=40, help="How many of the longest lines to wrap")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed passes per variant (best is reported)")
+    parser.add_argument("--font-scale", default="100%", help="Font Size setting passed to build_fonts()")
+    args = parser.parse_args()
+
+    pygame.freetype.init()
+    _, text_font, small_font = font_manager.build_fonts(args.font_scale)
+    color = (255, 255, 255)
+    lines = longest_lines(args.lines)
+
+    mismatches = 0
+    for font in (text_font, small_font):
+        for line in lines:
+            for width in WIDTHS:
+                text_wrap.clear_wrap_cache()
+                if legacy_wrap(font, line, width, color) != text_wrap.wrap_text(font, line, width, color):
+                    mismatches += 1
+
+    def cold(line, width):
+        text_wrap.clear_wrap_cache()
+        text_wrap.wrap_text(text_font, line, width, color)
+
+    def warm(line, width):
+        text_wrap.wrap_text(text_font, line, width, color)
+
+    legacy_ms = time_pass(lambda line, width: legacy_wrap(text_font, line, width, color), lines, args.repeat)
+    cold_ms = time_pass(cold, lines, args.repeat)
+    warm(lines[0], WIDTHS[0])
+    warm_ms = time_pass(warm, lines, args.repeat)
+
+    calls = len(lines) * len(WIDTHS)
+    longest = len(lines[0]) if lines else 0
+    print(f"{len(lines)} lines (longest {longest} chars) x {len(WIDTHS)} widths = {calls} wraps, best of {args.repeat}")
+    print(f"{'variant':<28}{'total ms':>10}{'us/wrap':>10}{'speedup':>9}")
+    for label, ms in (("legacy render-per-word", legacy_ms), ("glyph metrics, cold", cold_ms), ("layout cache, warm", warm_ms)):
+        print(f"{label:<28}{ms:>10.2f}{ms * 1000.0 / calls:>10.1f}{legacy_ms / ms:>8.1f}x")
+    print(f"layouts differing from legacy: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
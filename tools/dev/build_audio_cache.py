@@ -0,0 +1,79 @@
+"""Prebuild KeyQuest's on-disk synthesized audio cache.
+
+Runs every effect the app and games play through AudioManager so the PCM is
+written to the audio cache folder ahead of time. Packaging runs this against
+the dist folder so the first launch loads effects instead of synthesizing them.
+
+Usage:
+  python tools/dev/build_audio_cache.py
+  python tools/dev/build_audio_cache.py --output dist/KeyQuest/cache/audio --clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+# The mixer only needs a format here, not a real output device.
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from games import sounds  # noqa: E402
+from modules import audio_cache  # noqa: E402
+from modules.audio_manager import AudioManager  # noqa: E402
+
+
+def build_cache(output: str, clear: bool = False) -> dict:
+    """Synthesize every known effect into ``output``. Returns disk cache stats."""
+    cache = audio_cache.AudioDiskCache(output, sample_rate=AudioManager.SAMPLE_RATE, channels=2)
+    if clear:
+        removed = cache.clear()
+        print(f"Removed {removed} cached effect(s) from {output}")
+
+    pygame.mixer.pre_init(AudioManager.SAMPLE_RATE, -16, 2, 512)
+    pygame.mixer.init()
+    try:
+        audio = AudioManager(disk_cache=cache)
+        for intensity in AudioManager.TYPING_INTENSITY_GAIN:
+            audio.set_typing_sound_intensity(intensity)
+            audio.prebuild_progressive_tones()
+            audio.prebuild_sound_bank()
+        audio.set_typing_sound_intensity("normal")
+        audio.prebuild_effects(sounds.GAME_EFFECTS)
+    finally:
+        pygame.mixer.quit()
+    return cache.stats()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Prebuild the synthesized audio cache.")
+    parser.add_argument(
+        "--output",
+        default=str(ROOT / audio_cache.CACHE_SUBDIR),
+        help="Cache folder to fill (default: cache/audio in the repo root)",
+    )
+    parser.add_argument("--clear", action="store_true", help="Delete existing cached effects first")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = build_cache(args.output, clear=args.clear)
+    elapsed = time.perf_counter() - started
+    print(
+        f"Audio cache ready in {elapsed:.2f}s: {stats['misses']} built, "
+        f"{stats['hits']} already cached, {stats['write_errors']} write error(s) -> {stats['root']}"
+    )
+    return 1 if stats["write_errors"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
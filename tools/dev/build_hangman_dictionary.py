@@ -1,7 +1,12 @@
 """Build offline Hangman word/definition data from Kaikki Wiktionary.
 
+Writes hangman_definitions.json, hangman_words.txt, and the memory-mapped
+hangman_dictionary.bin the game reads (see games/hangman_dictionary.py).
+--compact-only rebuilds just the .bin from an existing JSON file.
+
 Usage:
   python tools/dev/build_hangman_dictionary.py --target 220000
+  python tools/dev/build_hangman_dictionary.py --compact-only
 """
 
 from __future__ import annotations
@@ -10,6 +15,7 @@ import argparse
 import gzip
 import json
 import re
+import sys
 import urllib.request
 from pathlib import Path
 
@@ -20,6 +26,12 @@ DATA_DIR = ROOT / "data" / "wordlists"
 KAIKKI_GZ_PATH = DATA_DIR / "kaikki_english.jsonl.gz"
 DEFINITIONS_PATH = DATA_DIR / "hangman_definitions.json"
 WORDS_PATH = DATA_DIR / "hangman_words.txt"
+DICTIONARY_PATH = DATA_DIR / "hangman_dictionary.bin"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from games.hangman_dictionary import write_hangman_dictionary  # noqa: E402
 
 MIN_LEN = 5
 BAD_TAGS = {"obsolete", "archaic", "dated", "rare"}
@@ -170,6 +182,20 @@ def write_outputs(definitions: dict[str, str]) -> None:
     print(f"Wrote {len(sorted_words):,} words -> {WORDS_PATH}")
 
 
+def write_compact_dictionary(definitions: dict[str, str]) -> None:
+    entries = []
+    for raw_word, raw_definition in definitions.items():
+        word = raw_word.strip().lower()
+        definition = raw_definition.strip() if isinstance(raw_definition, str) else ""
+        # Same filter as the game's JSON fallback: plain A-Z words with a definition.
+        if len(word) >= MIN_LEN and word.isascii() and word.isalpha() and definition:
+            entries.append((word, definition))
+
+    count = write_hangman_dictionary(entries, str(DICTIONARY_PATH))
+    size_mb = DICTIONARY_PATH.stat().st_size / (1024 * 1024)
+    print(f"Wrote {count:,} playable entries ({size_mb:.1f} MB) -> {DICTIONARY_PATH}")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build Hangman dictionary data.")
     parser.add_argument("--target", type=int, default=200000, help="Desired minimum number of words.")
@@ -178,11 +204,22 @@ def main() -> None:
         action="store_true",
         help="Keep downloaded Kaikki .jsonl.gz after build (default: remove to save space).",
     )
+    parser.add_argument(
+        "--compact-only",
+        action="store_true",
+        help="Only rebuild hangman_dictionary.bin from the existing hangman_definitions.json.",
+    )
     args = parser.parse_args()
 
+    if args.compact_only:
+        with DEFINITIONS_PATH.open("r", encoding="utf-8") as f:
+            write_compact_dictionary(json.load(f))
+        return
+
     download_kaikki_if_missing()
     definitions = build_definitions(target=args.target)
     write_outputs(definitions)
+    write_compact_dictionary(definitions)
     if not args.keep_source and KAIKKI_GZ_PATH.exists():
         KAIKKI_GZ_PATH.unlink()
         print(f"Removed source dump: {KAIKKI_GZ_PATH}")
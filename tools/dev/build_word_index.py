@@ -0,0 +1,70 @@
+"""Build the word index lessons and free practice draw real words from.
+
+Collects words from every Sentences/*.txt file and, when present, the
+offline Hangman word list (data/wordlists/hangman_words.txt), and writes
+cache/word_index.bin (see modules/word_index.py for the format). Packaging
+runs this against the dist folder.
+
+Usage:
+  python tools/dev/build_word_index.py
+  python tools/dev/build_word_index.py --output dist/KeyQuest/cache/word_index.bin
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from modules import lesson_manager, word_index  # noqa: E402
+
+
+SENTENCES_DIR = ROOT / "Sentences"
+HANGMAN_WORDS_PATH = ROOT / "data" / "wordlists" / "hangman_words.txt"
+# Lessons are English; other-language topics stay out of the index.
+SKIPPED_SENTENCE_FILES = {"spanish sentences.txt"}
+
+
+def collect_words(sentences_dir: Path, wordlist_path: Path) -> list[str]:
+    words: list[str] = []
+    for path in sorted(sentences_dir.glob("*.txt")):
+        if path.name.lower() in SKIPPED_SENTENCE_FILES:
+            continue
+        words.extend(word_index.extract_words(path.read_text(encoding="utf-8")))
+    if wordlist_path.exists():
+        with wordlist_path.open("r", encoding="utf-8") as f:
+            words.extend(line.strip().lower() for line in f if line.strip())
+    return words
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the lesson word index.")
+    parser.add_argument(
+        "--output",
+        default=str(ROOT / word_index.WORD_INDEX_FILE),
+        help="Index file to write (default: cache/word_index.bin in the repo root)",
+    )
+    parser.add_argument("--sentences", default=str(SENTENCES_DIR), help="Folder of sentence files")
+    parser.add_argument("--wordlist", default=str(HANGMAN_WORDS_PATH), help="One word per line (optional)")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    words = collect_words(Path(args.sentences), Path(args.wordlist))
+    key_order = word_index.key_order_for_stages(lesson_manager.STAGE_LETTERS)
+    count = word_index.build_word_index(words, key_order, args.output)
+    size = Path(args.output).stat().st_size
+    print(
+        f"Indexed {count:,} words ({len(key_order)} keys) in {time.perf_counter() - started:.2f}s: "
+        f"{size / 1024:.0f} KB -> {args.output}"
+    )
+    return 0 if count else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
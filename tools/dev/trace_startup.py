@@ -0,0 +1,129 @@
+"""Trace KeyQuest startup headless and check it against a stored baseline.
+
+Each run starts a fresh interpreter with SDL's dummy video and audio
+drivers, an empty profile in a temporary working folder, and
+KEYQUEST_STARTUP_TRACE pointing at a JSON file. The child builds the app
+the way ``main()`` does, draws the first frame, starts the deferred work,
+waits for the prewarm thread, and writes the report (see
+modules/startup_timeline.py). Phase times are the median over ``--runs``.
+
+With ``--check`` the median is compared to the baseline and the script
+exits 1 when the first frame or any phase is slower than
+``baseline * (1 + tolerance) + slack``. Baselines are machine specific;
+refresh them with ``--write-baseline`` on the machine that runs the check.
+
+Usage:
+  python tools/dev/trace_startup.py
+  python tools/dev/trace_startup.py --runs 5 --output startup.json
+  python tools/dev/trace_startup.py --check --baseline tools/dev/startup_baseline.json
+  python tools/dev/trace_startup.py --write-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+DEFAULT_BASELINE = ROOT / "tools" / "dev" / "startup_baseline.json"
+
+
+def run_child(prewarm_timeout: float) -> int:
+    """Startup as main() runs it, stopping once background prewarming is done."""
+    # Imported first, as in keyquest_app, so time zero matches a normal launch.
+    from modules import startup_timeline
+
+    import pygame
+    from modules.keyquest_app import KeyQuestApp
+
+    app = KeyQuestApp()
+    app._render_frame()
+    startup_timeline.mark("first frame")
+    app._finish_startup()
+    app.prewarm.ensure(*app.prewarm.names(), timeout=prewarm_timeout)
+    startup_timeline.mark("prewarm finished")
+    startup_timeline.report_once(app._startup_report_extra())
+    app._shutdown_storage()
+    pygame.quit()
+    return 0
+
+
+def trace_once(prewarm_timeout: float) -> dict:
+    with tempfile.TemporaryDirectory(prefix="keyquest-startup-") as work:
+        trace_path = os.path.join(work, "startup.json")
+        env = dict(os.environ)
+        env.update({
+            "SDL_VIDEODRIVER": "dummy",
+            "SDL_AUDIODRIVER": "dummy",
+            "HOME": work,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH", "")])),
+            "KEYQUEST_STARTUP_TRACE": trace_path,
+        })
+        env.pop("KEYQUEST_STARTUP_TIMELINE", None)
+        command = [sys.executable, str(Path(__file__).resolve()), "--child", "--prewarm-timeout", str(prewarm_timeout)]
+        result = subprocess.run(command, cwd=work, env=env, capture_output=True, text=True)
+        if result.returncode != 0 or not os.path.exists(trace_path):
+            raise RuntimeError(f"Startup trace failed (exit {result.returncode}):\n{result.stdout}{result.stderr}")
+        with open(trace_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def print_report(report: dict) -> None:
+    print("startup:  self [ms] | cumulative [ms] | phase")
+    for row in report["phases"]:
+        print(f"startup: {row['self_ms']:9.1f} | {row['end_ms']:9.1f} | {row['phase']}")
+    for name, ms in sorted(report.get("prewarm_ms", {}).items(), key=lambda item: -item[1]):
+        print(f"prewarm: {ms:9.1f} | {name}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Trace KeyQuest startup headless.")
+    parser.add_argument("--runs", type=int, default=3, help="Startups to run; times are medians (default: 3)")
+    parser.add_argument("--output", help="Write the median report to this JSON file")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON report")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if startup regressed against the baseline")
+    parser.add_argument("--write-baseline", action="store_true", help="Save the median report as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="Allowed relative slowdown (default: 0.5)")
+    parser.add_argument("--slack-ms", type=float, default=100.0, help="Allowed absolute slowdown (default: 100)")
+    parser.add_argument("--prewarm-timeout", type=float, default=60.0, help=argparse.SUPPRESS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.prewarm_timeout)
+
+    from modules import startup_timeline
+
+    reports = [trace_once(args.prewarm_timeout) for _ in range(max(1, args.runs))]
+    report = startup_timeline.median_report(reports)
+    print_report(report)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Report -> {args.output}")
+    if args.write_baseline:
+        Path(args.baseline).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline -> {args.baseline}")
+    if args.check:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        failures = startup_timeline.check_regressions(report, baseline, args.tolerance, args.slack_ms)
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+        if failures:
+            return 1
+        print(f"No startup regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,5 @@
 import pygame
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -77,10 +78,10 @@ def draw_controls_hint(*, screen, small_font, text, screen_w: int, y: int, accen
     """Draw a consistent controls row across screens."""
     message = f"Controls: {text}"
     lines = wrap_text(small_font, message, max(240, screen_w - 40), accent) or [message]
-    sample_surf, _ = small_font.render(lines[0], accent)
+    sample_surf, _ = render_text(small_font, lines[0], accent)
     line_height = sample_surf.get_height() + 4
     start_y = y - ((len(lines) - 1) * line_height)
     for idx, line in enumerate(lines):
-        surf, _ = small_font.render(line, accent)
+        surf, _ = render_text(small_font, line, accent)
         x = screen_w // 2 - surf.get_width() // 2
         screen.blit(surf, (x, start_y + (idx * line_height)))
@@ -1,6 +1,7 @@
 import pygame
 from typing import Optional
 
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -40,7 +41,7 @@ def get_footer_y(screen_h: int, *, padding: int = 30) -> int:
 
 def draw_centered_text(*, screen, font, text: str, color, screen_w: int, y: int):
     """Draw a single centered line and return its rect."""
-    surf, _ = font.render(text, color)
+    surf, _ = render_text(font, text, color)
     rect = surf.get_rect(topleft=(center_x(screen_w, surf.get_width()), y))
     screen.blit(surf, rect)
     return rect
@@ -93,7 +94,7 @@ def draw_left_wrapped_text(
     rect = None
     current_y = y
     for line in lines:
-        surf, _ = font.render(line, color)
+        surf, _ = render_text(font, line, color)
         line_rect = surf.get_rect(topleft=(x, current_y))
         screen.blit(surf, line_rect)
         rect = line_rect if rect is None else rect.union(line_rect)
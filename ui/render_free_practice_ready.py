@@ -5,6 +5,7 @@ from ui.a11y import (
     draw_focus_frame,
     get_visible_window,
 )
+from ui.text_cache import render_text
 
 
 def draw_free_practice_ready_screen(
@@ -23,11 +24,11 @@ def draw_free_practice_ready_screen(
     current_index: int,
     available_keys_count: int,
 ):
-    title_surf, _ = title_font.render("Free Practice Mode", hilite)
+    title_surf, _ = render_text(title_font, "Free Practice Mode", hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 40))
 
     subtitle = f"Choose an unlocked lesson. Keys available: {available_keys_count}"
-    subtitle_surf, _ = small_font.render(subtitle, accent)
+    subtitle_surf, _ = render_text(small_font, subtitle, accent)
     screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, 90))
 
     visible_count = max(5, min(8, (screen_h - 240) // 44))
@@ -35,7 +36,7 @@ def draw_free_practice_ready_screen(
 
     y = 145
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 120))
 
     for idx in range(start, end):
@@ -45,7 +46,7 @@ def draw_free_practice_ready_screen(
         selected = idx == current_index
         color = hilite if selected else fg
         item_text = f"> {line}" if selected else f"  {line}"
-        line_surf, _ = text_font.render(item_text, color)
+        line_surf, _ = render_text(text_font, item_text, color)
         line_rect = line_surf.get_rect(topleft=(screen_w // 2 - line_surf.get_width() // 2, y))
         if selected:
             draw_active_panel(screen, line_rect, accent, fg)
@@ -55,7 +56,7 @@ def draw_free_practice_ready_screen(
         y += 44
 
     if end < len(unlocked_lessons):
-        more_below_surf, _ = small_font.render("v  more below  v", accent)
+        more_below_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_below_surf, (screen_w // 2 - more_below_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
@@ -1,4 +1,5 @@
 from ui.a11y import draw_active_panel, draw_controls_hint
+from ui.text_cache import render_text
 
 
 def draw_keyboard_explorer_screen(
@@ -13,7 +14,7 @@ def draw_keyboard_explorer_screen(
     accent,
     hilite,
 ):
-    title_surf, _ = title_font.render("Keyboard Explorer", hilite)
+    title_surf, _ = render_text(title_font, "Keyboard Explorer", hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 80))
 
     instructions = [
@@ -24,7 +25,7 @@ def draw_keyboard_explorer_screen(
 
     y = 200
     for instruction in instructions:
-        inst_surf, _ = text_font.render(instruction, fg)
+        inst_surf, _ = render_text(text_font, instruction, fg)
         inst_rect = inst_surf.get_rect(topleft=(screen_w // 2 - inst_surf.get_width() // 2, y))
         if instruction == instructions[0]:
             draw_active_panel(screen, inst_rect, accent, fg)
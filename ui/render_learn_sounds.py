@@ -1,4 +1,5 @@
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_controls_hint, draw_focus_frame, get_visible_window
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -16,7 +17,7 @@ def draw_learn_sounds_menu(
     sound_items: list,
     current_index: int,
 ):
-    title_surf, _ = title_font.render("Learn Sounds", hilite)
+    title_surf, _ = render_text(title_font, "Learn Sounds", hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 50))
 
     visible_count = max(4, min(6, (screen_h - 250) // 70))
@@ -24,7 +25,7 @@ def draw_learn_sounds_menu(
 
     y = 120
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 90))
 
     for idx in range(start, end):
@@ -33,7 +34,7 @@ def draw_learn_sounds_menu(
         selected = idx == current_index
         color = hilite if selected else fg
         item_text = f"> {text}" if selected else f"  {text}"
-        text_surf, _ = text_font.render(item_text, color)
+        text_surf, _ = render_text(text_font, item_text, color)
         x = screen_w // 2 - text_surf.get_width() // 2
         item_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -47,13 +48,13 @@ def draw_learn_sounds_menu(
         if selected:
             desc = sound_item.get("description", "")
             for line in wrap_text(small_font, desc, screen_w - 120, accent):
-                desc_surf, _ = small_font.render(line, accent)
+                desc_surf, _ = render_text(small_font, line, accent)
                 screen.blit(desc_surf, (screen_w // 2 - desc_surf.get_width() // 2, y))
                 y += 22
             y += 6
 
     if end < len(sound_items):
-        more_surf, _ = small_font.render("v  more below  v", accent)
+        more_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_surf, (screen_w // 2 - more_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
@@ -6,6 +6,7 @@ from ui.a11y import (
     draw_focus_frame,
     draw_secondary_panel,
 )
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text as wrap_text_for_font
 
 
@@ -20,7 +21,7 @@ def _draw_centered_lines(screen, font, lines, color, screen_w: int, start_y: int
     y = start_y
 
     for line in lines:
-        surf, _ = font.render(line, color)
+        surf, _ = render_text(font, line, color)
         rect = surf.get_rect(topleft=(screen_w // 2 - surf.get_width() // 2, y))
         screen.blit(surf, rect)
         rects.append(rect)
@@ -54,7 +55,7 @@ def draw_lesson_screen(
 ):
     max_text_width = screen_w - 140
 
-    target_label_surf, _ = text_font.render("Type now:", accent)
+    target_label_surf, _ = render_text(text_font, "Type now:", accent)
     target_label_y = 95
     screen.blit(target_label_surf, (screen_w // 2 - target_label_surf.get_width() // 2, target_label_y))
 
@@ -66,7 +67,7 @@ def draw_lesson_screen(
     draw_focus_frame(screen, target_rect, hilite, accent)
     draw_action_emphasis(screen, target_rect, hilite, strong=focus_assist)
 
-    typed_label_surf, _ = small_font.render("You typed:", accent)
+    typed_label_surf, _ = render_text(small_font, "You typed:", accent)
     typed_label_y = next_y + 16
     screen.blit(typed_label_surf, (screen_w // 2 - typed_label_surf.get_width() // 2, typed_label_y))
 
@@ -83,7 +84,7 @@ def draw_lesson_screen(
     if lesson_state.show_guidance and lesson_state.guidance_message:
         guidance_lines = wrap_text(lesson_state.guidance_message, screen_w - 80)
         for line in guidance_lines:
-            guide_surf, _ = text_font.render(line, hilite)
+            guide_surf, _ = render_text(text_font, line, hilite)
             screen.blit(guide_surf, (screen_w // 2 - guide_surf.get_width() // 2, y))
             y += 35
 
@@ -91,7 +92,7 @@ def draw_lesson_screen(
             y += 5
             hint_lines = wrap_text(lesson_state.hint_message, screen_w - 80)
             for line in hint_lines:
-                hint_surf, _ = small_font.render(line, accent)
+                hint_surf, _ = render_text(small_font, line, accent)
                 screen.blit(hint_surf, (screen_w // 2 - hint_surf.get_width() // 2, y))
                 y += 28
 
@@ -100,13 +101,13 @@ def draw_lesson_screen(
         stage = lesson_state.stage
         current_keys = set().union(*lesson_manager.STAGE_LETTERS[: stage + 1])
         info = f"Lesson {stage}: {', '.join(sorted(current_keys))}"
-        info_surf, _ = small_font.render(info, accent)
+        info_surf, _ = render_text(small_font, info, accent)
         info_rect = info_surf.get_rect(topleft=(screen_w // 2 - info_surf.get_width() // 2, y))
         y += 30
 
         acc = lesson_state.tracker.overall_accuracy() * 100
         acc_text = f"Accuracy: {acc:.0f}%"
-        acc_surf, _ = small_font.render(acc_text, accent)
+        acc_surf, _ = render_text(small_font, acc_text, accent)
         acc_rect = acc_surf.get_rect(topleft=(screen_w // 2 - acc_surf.get_width() // 2, y))
         draw_secondary_panel(screen, info_rect.union(acc_rect), accent, fg, strong=focus_assist)
         screen.blit(info_surf, info_rect)
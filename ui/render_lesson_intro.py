@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from ui.text_wrap import wrap_text
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_controls_hint, draw_focus_frame
+from ui.text_cache import render_text
 
 
 def draw_lesson_intro_screen(
@@ -26,7 +27,7 @@ def draw_lesson_intro_screen(
     keys_found_display: str,
 ):
     title = f"Lesson {lesson_num}: {lesson_name}"
-    title_surf, _ = title_font.render(title, hilite)
+    title_surf, _ = render_text(title_font, title, hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 40))
 
     if lesson_info:
@@ -39,7 +40,7 @@ def draw_lesson_intro_screen(
             widest = 0
             rendered = []
             for line in text_lines:
-                line_surf, _ = small_font.render(line, fg)
+                line_surf, _ = render_text(small_font, line, fg)
                 widest = max(widest, line_surf.get_width())
                 rendered.append(line_surf)
             block_rect = None
@@ -59,12 +60,12 @@ def draw_lesson_intro_screen(
             y = block_bottom + 20
 
         if keys_to_find_display:
-            find_label_surf, _ = text_font.render("Find these keys:", hilite)
+            find_label_surf, _ = render_text(text_font, "Find these keys:", hilite)
             screen.blit(find_label_surf, (screen_w // 2 - find_label_surf.get_width() // 2, y))
             y += 35
 
             for line in wrap_text(small_font, keys_to_find_display, screen_w - 100, fg):
-                keys_surf, _ = small_font.render(line, fg)
+                keys_surf, _ = render_text(small_font, line, fg)
                 keys_rect = keys_surf.get_rect(topleft=(screen_w // 2 - keys_surf.get_width() // 2, y))
                 draw_active_panel(screen, keys_rect, accent, fg)
                 screen.blit(keys_surf, keys_rect)
@@ -73,7 +74,7 @@ def draw_lesson_intro_screen(
                 y += 30
 
         if keys_found_display:
-            found_surf, _ = small_font.render(f"Found: {keys_found_display}", accent)
+            found_surf, _ = render_text(small_font, f"Found: {keys_found_display}", accent)
             screen.blit(found_surf, (screen_w // 2 - found_surf.get_width() // 2, y))
 
     draw_controls_hint(
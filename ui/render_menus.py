@@ -6,6 +6,7 @@ from ui.a11y import (
     get_visible_window,
 )
 from ui.layout import center_x, draw_centered_wrapped_text, get_footer_y
+from ui.text_cache import render_text
 
 
 def draw_main_menu(
@@ -24,7 +25,7 @@ def draw_main_menu(
     total_count: int,
     streak_text: str = "",
 ):
-    title_surf, _ = title_font.render("KeyQuest", hilite)
+    title_surf, _ = render_text(title_font, "KeyQuest", hilite)
     screen.blit(title_surf, (center_x(screen_w, title_surf.get_width()), 30))
 
     visible_count = max(6, min(9, (screen_h - 240) // 50))
@@ -32,7 +33,7 @@ def draw_main_menu(
 
     y = 110
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (center_x(screen_w, more_above_surf.get_width()), 90))
 
     for idx in range(start, end):
@@ -40,7 +41,7 @@ def draw_main_menu(
         selected = idx == current_index
         color = hilite if selected else fg
         item_text = f"> {item}" if selected else f"  {item}"
-        text_surf, _ = title_font.render(item_text, color)
+        text_surf, _ = render_text(title_font, item_text, color)
         x = center_x(screen_w, text_surf.get_width())
         item_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -52,16 +53,16 @@ def draw_main_menu(
         y += 50
 
     if end < len(menu_items):
-        more_below_surf, _ = small_font.render("v  more below  v", accent)
+        more_below_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_below_surf, (center_x(screen_w, more_below_surf.get_width()), y - 8))
 
     info = f"Unlocked Lessons: {unlocked_count} / {total_count}"
-    info_surf, _ = small_font.render(info, accent)
+    info_surf, _ = render_text(small_font, info, accent)
     info_y = min(screen_h - 110, y + 20)
     screen.blit(info_surf, (center_x(screen_w, info_surf.get_width()), info_y))
 
     if streak_text:
-        streak_surf, _ = small_font.render(streak_text, hilite)
+        streak_surf, _ = render_text(small_font, streak_text, hilite)
         streak_y = min(screen_h - 80, info_y + 30)
         screen.blit(streak_surf, (center_x(screen_w, streak_surf.get_width()), streak_y))
 
@@ -91,7 +92,7 @@ def draw_lesson_menu(
     hilite,
 ):
     title = "Select a Lesson"
-    title_surf, _ = title_font.render(title, hilite)
+    title_surf, _ = render_text(title_font, title, hilite)
     screen.blit(title_surf, (center_x(screen_w, title_surf.get_width()), 50))
 
     visible_count = max(6, min(9, (screen_h - 240) // 40))
@@ -99,7 +100,7 @@ def draw_lesson_menu(
 
     y = 120
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (center_x(screen_w, more_above_surf.get_width()), 90))
 
     for idx in range(start, end):
@@ -113,7 +114,7 @@ def draw_lesson_menu(
         selected = idx == current_index
         color = hilite if selected else fg
         item_text = f"> {text}" if selected else f"  {text}"
-        text_surf, _ = text_font.render(item_text, color)
+        text_surf, _ = render_text(text_font, item_text, color)
         x = center_x(screen_w, text_surf.get_width())
         item_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -125,7 +126,7 @@ def draw_lesson_menu(
         y += 40
 
     if end < len(unlocked_lessons):
-        more_surf, _ = small_font.render("v  more below  v", accent)
+        more_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_surf, (center_x(screen_w, more_surf.get_width()), min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
@@ -153,7 +154,7 @@ def draw_games_menu(
     hilite,
 ):
     title = "Select a Game"
-    title_surf, _ = title_font.render(title, hilite)
+    title_surf, _ = render_text(title_font, title, hilite)
     screen.blit(title_surf, (center_x(screen_w, title_surf.get_width()), 50))
 
     visible_count = max(4, min(6, (screen_h - 260) // 70))
@@ -161,7 +162,7 @@ def draw_games_menu(
 
     y = 120
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (center_x(screen_w, more_above_surf.get_width()), 90))
 
     for idx in range(start, end):
@@ -171,7 +172,7 @@ def draw_games_menu(
         selected = idx == current_index
         color = hilite if selected else fg
         item_text = f"> {text}" if selected else f"  {text}"
-        text_surf, _ = text_font.render(item_text, color)
+        text_surf, _ = render_text(text_font, item_text, color)
         x = center_x(screen_w, text_surf.get_width())
         item_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -197,7 +198,7 @@ def draw_games_menu(
             y = description_rect.bottom + 8
 
     if end < len(games):
-        more_surf, _ = small_font.render("v  more below  v", accent)
+        more_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_surf, (center_x(screen_w, more_surf.get_width()), min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
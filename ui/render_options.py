@@ -1,4 +1,5 @@
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_controls_hint, draw_focus_frame, get_visible_window
+from ui.text_cache import render_text
 
 
 def draw_options(
@@ -16,7 +17,7 @@ def draw_options(
     hilite,
 ):
     title = "Options"
-    title_surf, _ = title_font.render(title, hilite)
+    title_surf, _ = render_text(title_font, title, hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 50))
 
     visible_count = max(6, min(8, (screen_h - 220) // 50))
@@ -24,7 +25,7 @@ def draw_options(
 
     y = 120
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 90))
 
     for idx in range(start, end):
@@ -32,7 +33,7 @@ def draw_options(
         selected = idx == current_index
         color = hilite if selected else fg
         option_text = f"> {option}" if selected else f"  {option}"
-        text_surf, _ = text_font.render(option_text, color)
+        text_surf, _ = render_text(text_font, option_text, color)
         x = screen_w // 2 - text_surf.get_width() // 2
         option_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -44,7 +45,7 @@ def draw_options(
         y += 50
 
     if end < len(options):
-        more_below_surf, _ = small_font.render("v  more below  v", accent)
+        more_below_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_below_surf, (screen_w // 2 - more_below_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
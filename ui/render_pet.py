@@ -2,6 +2,7 @@ from modules import pet_manager
 from modules import shop_manager
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_controls_hint, draw_focus_frame, get_visible_window
 from ui.pet_visuals import draw_pet_avatar
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -24,7 +25,7 @@ def draw_pet(
     pet_menu_index: int,
 ):
     title = "Pets"
-    title_surf, _ = title_font.render(title, hilite)
+    title_surf, _ = render_text(title_font, title, hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 50))
     is_dark_fg = sum(fg) > 380
     panel_color = (22, 22, 22) if is_dark_fg else (238, 238, 238)
@@ -72,19 +73,19 @@ def draw_pet(
             )
             y = 250
 
-        equip_surf, _ = small_font.render(f"Visual Items: {equipped_text}", fg)
+        equip_surf, _ = render_text(small_font, f"Visual Items: {equipped_text}", fg)
         screen.blit(equip_surf, (screen_w // 2 - equip_surf.get_width() // 2, y))
         y += 28
 
         subtitle = "Choose Your Pet"
-        subtitle_surf, _ = text_font.render(subtitle, accent)
+        subtitle_surf, _ = render_text(text_font, subtitle, accent)
         screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, y))
         y += 60
 
         visible_count = max(3, min(5, (screen_h - 360) // 70))
         start, end = get_visible_window(len(pet_types), pet_choose_index, visible_count)
         if start > 0:
-            more_above_surf, _ = small_font.render("^  more above  ^", accent)
+            more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
             screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, y - 28))
 
         for idx in range(start, end):
@@ -96,7 +97,7 @@ def draw_pet(
             selected = idx == pet_choose_index
             color = hilite if selected else fg
             item_text = f"> {pet_info['name']}" if selected else f"  {pet_info['name']}"
-            text_surf, _ = text_font.render(item_text, color)
+            text_surf, _ = render_text(text_font, item_text, color)
             x = screen_w // 2 - text_surf.get_width() // 2
             item_rect = text_surf.get_rect(topleft=(x, y))
             if selected:
@@ -109,13 +110,13 @@ def draw_pet(
 
             if selected:
                 for line in wrap_text(small_font, pet_info["description"], screen_w - 120, accent):
-                    desc_surf, _ = small_font.render(line, accent)
+                    desc_surf, _ = render_text(small_font, line, accent)
                     screen.blit(desc_surf, (screen_w // 2 - desc_surf.get_width() // 2, y))
                     y += 22
                 y += 6
 
         if end < len(pet_types):
-            more_surf, _ = small_font.render("v  more below  v", accent)
+            more_surf, _ = render_text(small_font, "v  more below  v", accent)
             screen.blit(more_surf, (screen_w // 2 - more_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
         draw_controls_hint(
@@ -142,7 +143,7 @@ def draw_pet(
     )
     y = 260
 
-    equip_surf, _ = small_font.render(f"Visual Items: {equipped_text}", fg)
+    equip_surf, _ = render_text(small_font, f"Visual Items: {equipped_text}", fg)
     screen.blit(equip_surf, (screen_w // 2 - equip_surf.get_width() // 2, y))
     y += 32
 
@@ -155,7 +156,7 @@ def draw_pet(
     ]
 
     for line in info_lines:
-        line_surf, _ = small_font.render(line, fg)
+        line_surf, _ = render_text(small_font, line, fg)
         screen.blit(line_surf, (screen_w // 2 - line_surf.get_width() // 2, y))
         y += 30
 
@@ -163,7 +164,7 @@ def draw_pet(
     visible_count = max(3, min(5, (screen_h - y - 90) // 40))
     start, end = get_visible_window(len(pet_options), pet_menu_index, visible_count)
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, y - 28))
 
     for idx in range(start, end):
@@ -171,7 +172,7 @@ def draw_pet(
         selected = idx == pet_menu_index
         color = hilite if selected else fg
         item_text = f"> {option}" if selected else f"  {option}"
-        text_surf, _ = text_font.render(item_text, color)
+        text_surf, _ = render_text(text_font, item_text, color)
         x = screen_w // 2 - text_surf.get_width() // 2
         item_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -183,7 +184,7 @@ def draw_pet(
         y += 40
 
     if end < len(pet_options):
-        more_surf, _ = small_font.render("v  more below  v", accent)
+        more_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_surf, (screen_w // 2 - more_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
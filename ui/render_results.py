@@ -1,4 +1,5 @@
 from ui.a11y import draw_active_panel, draw_action_emphasis, draw_controls_hint, draw_focus_frame, draw_secondary_panel
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -20,14 +21,14 @@ def draw_results_screen(
     current_index: int,
     focus_assist: bool = False,
 ):
-    title_surf, _ = title_font.render(title, accent)
+    title_surf, _ = render_text(title_font, title, accent)
     title_rect = title_surf.get_rect(topleft=(screen_w // 2 - title_surf.get_width() // 2, 40))
     screen.blit(title_surf, title_rect)
 
     instruction_lines = wrap_text(small_font, instructions, screen_w - 120, accent)
     y = title_rect.bottom + 20
     for ln in instruction_lines:
-        surf, _ = small_font.render(ln, accent)
+        surf, _ = render_text(small_font, ln, accent)
         screen.blit(surf, (screen_w // 2 - surf.get_width() // 2, y))
         y += surf.get_height() + 10
 
@@ -38,7 +39,7 @@ def draw_results_screen(
     max_width = 0
     total_height = 0
     for ln in lines:
-        surf, _ = text_font.render(ln, fg)
+        surf, _ = render_text(text_font, ln, fg)
         max_width = max(max_width, surf.get_width())
         total_height += surf.get_height() + 14
     import pygame
@@ -50,7 +51,7 @@ def draw_results_screen(
     )
     draw_active_panel(screen, panel_rect, accent, fg, strong=focus_assist)
     for ln in lines:
-        surf, _ = text_font.render(ln, fg)
+        surf, _ = render_text(text_font, ln, fg)
         screen.blit(surf, (screen_w // 2 - surf.get_width() // 2, y))
         y += surf.get_height() + 14
 
@@ -58,7 +59,7 @@ def draw_results_screen(
     for idx, option in enumerate(options):
         prefix = "> " if idx == current_index else "  "
         color = hilite if idx == current_index else fg
-        surf, _ = text_font.render(f"{prefix}{option}", color)
+        surf, _ = render_text(text_font, f"{prefix}{option}", color)
         rect = surf.get_rect(topleft=(screen_w // 2 - surf.get_width() // 2, y))
         if idx == current_index:
             draw_secondary_panel(screen, rect, accent, fg, strong=focus_assist)
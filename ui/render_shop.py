@@ -1,6 +1,7 @@
 from modules import currency_manager
 from modules import shop_manager
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_controls_hint, draw_focus_frame, get_visible_window
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -22,12 +23,12 @@ def draw_shop(
     shop_category_index: int,
     shop_item_index: int,
 ):
-    title_surf, _ = title_font.render(shop_title, hilite)
+    title_surf, _ = render_text(title_font, shop_title, hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 50))
 
     balance = currency_manager.get_balance(settings)
     balance_text = f"Balance: {currency_manager.format_balance(balance)}"
-    balance_surf, _ = text_font.render(balance_text, accent)
+    balance_surf, _ = render_text(text_font, balance_text, accent)
     screen.blit(balance_surf, (screen_w // 2 - balance_surf.get_width() // 2, 100))
 
     y = 150
@@ -35,7 +36,7 @@ def draw_shop(
         visible_count = max(4, min(6, (screen_h - 260) // 70))
         start, end = get_visible_window(len(shop_categories), shop_category_index, visible_count)
         if start > 0:
-            more_above_surf, _ = small_font.render("^  more above  ^", accent)
+            more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
             screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 126))
 
         for idx in range(start, end):
@@ -44,7 +45,7 @@ def draw_shop(
             selected = idx == shop_category_index
             color = hilite if selected else fg
             item_text = f"> {cat_info['name']}" if selected else f"  {cat_info['name']}"
-            text_surf, _ = text_font.render(item_text, color)
+            text_surf, _ = render_text(text_font, item_text, color)
             x = screen_w // 2 - text_surf.get_width() // 2
             item_rect = text_surf.get_rect(topleft=(x, y))
             if selected:
@@ -57,13 +58,13 @@ def draw_shop(
 
             if selected:
                 for line in wrap_text(small_font, cat_info["description"], screen_w - 120, accent):
-                    desc_surf, _ = small_font.render(line, accent)
+                    desc_surf, _ = render_text(small_font, line, accent)
                     screen.blit(desc_surf, (screen_w // 2 - desc_surf.get_width() // 2, y))
                     y += 24
                 y += 6
 
         if end < len(shop_categories):
-            more_surf, _ = small_font.render("v  more below  v", accent)
+            more_surf, _ = render_text(small_font, "v  more below  v", accent)
             screen.blit(more_surf, (screen_w // 2 - more_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
         draw_controls_hint(
@@ -80,14 +81,14 @@ def draw_shop(
     cat_info = shop_manager.SHOP_CATEGORIES[cat_id]
     items = shop_manager.get_category_items(cat_id)
 
-    subtitle_surf, _ = text_font.render(cat_info["name"], accent)
+    subtitle_surf, _ = render_text(text_font, cat_info["name"], accent)
     screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, 150))
 
     visible_count = max(4, min(6, (screen_h - 300) // 55))
     start, end = get_visible_window(len(items), shop_item_index, visible_count)
     y = 200
     if start > 0:
-        more_above_surf, _ = small_font.render("^  more above  ^", accent)
+        more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
         screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 176))
 
     for idx in range(start, end):
@@ -103,7 +104,7 @@ def draw_shop(
         selected = idx == shop_item_index
         color = hilite if selected else fg
         item_text = f"> {display_text}" if selected else f"  {display_text}"
-        text_surf, _ = small_font.render(item_text, color)
+        text_surf, _ = render_text(small_font, item_text, color)
         x = screen_w // 2 - text_surf.get_width() // 2
         item_rect = text_surf.get_rect(topleft=(x, y))
         if selected:
@@ -116,13 +117,13 @@ def draw_shop(
 
         if selected:
             for line in wrap_text(small_font, item["description"], screen_w - 120, accent):
-                desc_surf, _ = small_font.render(line, accent)
+                desc_surf, _ = render_text(small_font, line, accent)
                 screen.blit(desc_surf, (screen_w // 2 - desc_surf.get_width() // 2, y))
                 y += 22
             y += 4
 
     if end < len(items):
-        more_surf, _ = small_font.render("v  more below  v", accent)
+        more_surf, _ = render_text(small_font, "v  more below  v", accent)
         screen.blit(more_surf, (screen_w // 2 - more_surf.get_width() // 2, min(screen_h - 95, y - 8)))
 
     draw_controls_hint(
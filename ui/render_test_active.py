@@ -7,6 +7,7 @@ from ui.a11y import (
     draw_focus_frame,
     draw_secondary_panel,
 )
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -21,7 +22,7 @@ def _draw_centered_lines(screen, font, lines, color, screen_w: int, start_y: int
     y = start_y
 
     for line in lines:
-        surf, _ = font.render(line, color)
+        surf, _ = render_text(font, line, color)
         rect = surf.get_rect(topleft=(screen_w // 2 - surf.get_width() // 2, y))
         screen.blit(surf, rect)
         rects.append(rect)
@@ -52,7 +53,7 @@ def draw_test_screen(
 ):
     max_text_width = screen_w - 140
 
-    current_label_surf, _ = small_font.render("Type now:", accent)
+    current_label_surf, _ = render_text(small_font, "Type now:", accent)
     current_label_y = 130
     screen.blit(current_label_surf, (screen_w // 2 - current_label_surf.get_width() // 2, current_label_y))
 
@@ -64,7 +65,7 @@ def draw_test_screen(
     draw_focus_frame(screen, cur_rect, accent, fg)
     draw_action_emphasis(screen, cur_rect, accent, strong=focus_assist)
 
-    typed_label_surf, _ = small_font.render("You typed:", accent)
+    typed_label_surf, _ = render_text(small_font, "You typed:", accent)
     typed_label_y = next_y + 14
     screen.blit(typed_label_surf, (screen_w // 2 - typed_label_surf.get_width() // 2, typed_label_y))
 
@@ -78,7 +79,7 @@ def draw_test_screen(
     )
 
     time_msg = f"{int(remaining_seconds):>2}s left"
-    time_surf, _ = small_font.render(time_msg, accent)
+    time_surf, _ = render_text(small_font, time_msg, accent)
     time_y = typed_bottom_y + 14
     time_rect = time_surf.get_rect(topleft=(screen_w // 2 - time_surf.get_width() // 2, time_y))
     draw_secondary_panel(screen, time_rect, accent, fg, strong=focus_assist)
@@ -111,7 +112,7 @@ def draw_practice_screen(
 ):
     max_text_width = screen_w - 140
 
-    current_label_surf, _ = small_font.render("Type now:", accent)
+    current_label_surf, _ = render_text(small_font, "Type now:", accent)
     current_label_y = 120
     screen.blit(current_label_surf, (screen_w // 2 - current_label_surf.get_width() // 2, current_label_y))
 
@@ -123,7 +124,7 @@ def draw_practice_screen(
     draw_focus_frame(screen, cur_rect, accent, fg)
     draw_action_emphasis(screen, cur_rect, accent, strong=focus_assist)
 
-    typed_label_surf, _ = small_font.render("You typed:", accent)
+    typed_label_surf, _ = render_text(small_font, "You typed:", accent)
     typed_label_y = next_y + 14
     screen.blit(typed_label_surf, (screen_w // 2 - typed_label_surf.get_width() // 2, typed_label_y))
 
@@ -139,13 +140,13 @@ def draw_practice_screen(
     minutes = int(elapsed_seconds // 60)
     seconds = int(elapsed_seconds % 60)
     time_msg = f"Time: {minutes}:{seconds:02d}"
-    time_surf, _ = small_font.render(time_msg, accent)
+    time_surf, _ = render_text(small_font, time_msg, accent)
     time_y = typed_bottom_y + 14
     time_rect = time_surf.get_rect(topleft=(screen_w // 2 - time_surf.get_width() // 2, time_y))
     screen.blit(time_surf, time_rect)
 
     sentence_msg = f"Sentences completed: {sentences_completed}"
-    sentence_surf, _ = small_font.render(sentence_msg, accent)
+    sentence_surf, _ = render_text(small_font, sentence_msg, accent)
     sentence_y = time_y + 34
     sentence_rect = sentence_surf.get_rect(topleft=(screen_w // 2 - sentence_surf.get_width() // 2, sentence_y))
     group_rect = time_rect.union(sentence_rect)
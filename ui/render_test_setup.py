@@ -1,5 +1,6 @@
 from modules import sentences_manager
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_focus_frame, get_visible_window
+from ui.text_cache import render_text
 from ui.text_wrap import wrap_text
 
 
@@ -20,11 +21,11 @@ def draw_test_setup_screen(
     topic_index: int,
     focus_assist: bool = False,
 ):
-    title_surf, _ = title_font.render("Speed Test Setup", hilite)
+    title_surf, _ = render_text(title_font, "Speed Test Setup", hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 100))
 
     if view == "topic":
-        question_surf, _ = text_font.render("Choose language", fg)
+        question_surf, _ = render_text(text_font, "Choose language", fg)
         screen.blit(question_surf, (screen_w // 2 - question_surf.get_width() // 2, 180))
 
         y = 250
@@ -33,7 +34,7 @@ def draw_test_setup_screen(
             color = hilite if selected else fg
             display_topic = sentences_manager.get_practice_topic_display_name(topic)
             label = f"> {display_topic}" if selected else f"  {display_topic}"
-            line_surf, _ = text_font.render(label, color)
+            line_surf, _ = render_text(text_font, label, color)
             line_rect = line_surf.get_rect(topleft=(screen_w // 2 - line_surf.get_width() // 2, y))
             if selected:
                 draw_active_panel(screen, line_rect, accent, fg, strong=focus_assist)
@@ -49,14 +50,14 @@ def draw_test_setup_screen(
             "Escape: Return to menu",
         ]
     else:
-        question_surf, _ = text_font.render("How many minutes for the test?", fg)
+        question_surf, _ = render_text(text_font, "How many minutes for the test?", fg)
         screen.blit(question_surf, (screen_w // 2 - question_surf.get_width() // 2, 200))
 
-        input_label_surf, _ = text_font.render("Type minutes:", accent)
+        input_label_surf, _ = render_text(text_font, "Type minutes:", accent)
         screen.blit(input_label_surf, (screen_w // 2 - input_label_surf.get_width() // 2, 245))
 
         input_text = duration_input if duration_input else "_"
-        input_surf, _ = title_font.render(input_text, hilite)
+        input_surf, _ = render_text(title_font, input_text, hilite)
         input_rect = input_surf.get_rect(topleft=(screen_w // 2 - input_surf.get_width() // 2, 280))
         draw_active_panel(screen, input_rect, accent, fg, strong=focus_assist)
         screen.blit(input_surf, input_rect)
@@ -74,7 +75,7 @@ def draw_test_setup_screen(
     y = 380
     for line in instructions:
         if line:
-            text_surf, _ = small_font.render(line, accent)
+            text_surf, _ = render_text(small_font, line, accent)
             screen.blit(text_surf, (screen_w // 2 - text_surf.get_width() // 2, y))
         y += 35
 
@@ -97,18 +98,18 @@ def draw_practice_setup_screen(
     topic_options,
     topic_index: int,
 ):
-    title_surf, _ = title_font.render("Sentence Practice Setup", hilite)
+    title_surf, _ = render_text(title_font, "Sentence Practice Setup", hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 80))
 
     if view == "menu":
-        subtitle_surf, _ = text_font.render("Choose how to start", fg)
+        subtitle_surf, _ = render_text(text_font, "Choose how to start", fg)
         screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, 165))
 
         visible_count = max(3, min(4, (screen_h - 340) // 55))
         start, end = get_visible_window(len(menu_options), menu_index, visible_count)
         y = 250
         if start > 0:
-            more_above_surf, _ = small_font.render("^  more above  ^", accent)
+            more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
             screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 220))
 
         for idx in range(start, end):
@@ -116,7 +117,7 @@ def draw_practice_setup_screen(
             selected = idx == menu_index
             color = hilite if selected else fg
             line_text = f"> {option}" if selected else f"  {option}"
-            line_surf, _ = text_font.render(line_text, color)
+            line_surf, _ = render_text(text_font, line_text, color)
             line_rect = line_surf.get_rect(topleft=(screen_w // 2 - line_surf.get_width() // 2, y))
             if selected:
                 draw_active_panel(screen, line_rect, accent, fg, strong=focus_assist)
@@ -127,7 +128,7 @@ def draw_practice_setup_screen(
             y += 55
 
         if end < len(menu_options):
-            more_below_surf, _ = small_font.render("v  more below  v", accent)
+            more_below_surf, _ = render_text(small_font, "v  more below  v", accent)
             screen.blit(more_below_surf, (screen_w // 2 - more_below_surf.get_width() // 2, min(screen_h - 130, y - 8)))
 
         instructions = [
@@ -137,7 +138,7 @@ def draw_practice_setup_screen(
             "Escape: Return to menu",
         ]
     else:
-        subtitle_surf, _ = text_font.render("Select a sentence file", fg)
+        subtitle_surf, _ = render_text(text_font, "Select a sentence file", fg)
         screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, 165))
 
         visible_count = max(5, min(7, (screen_h - 330) // 38))
@@ -146,7 +147,7 @@ def draw_practice_setup_screen(
 
         y = 235
         if start > 0:
-            more_above_surf, _ = small_font.render("^  more above  ^", accent)
+            more_above_surf, _ = render_text(small_font, "^  more above  ^", accent)
             screen.blit(more_above_surf, (screen_w // 2 - more_above_surf.get_width() // 2, 205))
 
         for i, topic in enumerate(visible):
@@ -154,7 +155,7 @@ def draw_practice_setup_screen(
             selected = absolute_idx == topic_index
             color = hilite if selected else fg
             line_text = f"> {topic}" if selected else f"  {topic}"
-            line_surf, _ = small_font.render(line_text, color)
+            line_surf, _ = render_text(small_font, line_text, color)
             line_rect = line_surf.get_rect(topleft=(screen_w // 2 - line_surf.get_width() // 2, y))
             if selected:
                 draw_active_panel(screen, line_rect, accent, fg, strong=focus_assist)
@@ -165,7 +166,7 @@ def draw_practice_setup_screen(
             y += 38
 
         if end < len(topic_options):
-            more_below_surf, _ = small_font.render("v  more below  v", accent)
+            more_below_surf, _ = render_text(small_font, "v  more below  v", accent)
             screen.blit(more_below_surf, (screen_w // 2 - more_below_surf.get_width() // 2, min(screen_h - 130, y - 8)))
 
         instructions = [
@@ -178,7 +179,7 @@ def draw_practice_setup_screen(
     y = 490
     for line in instructions:
         for wrapped in wrap_text(small_font, line, screen_w - 100, accent):
-            text_surf, _ = small_font.render(wrapped, accent)
+            text_surf, _ = render_text(small_font, wrapped, accent)
             screen.blit(text_surf, (screen_w // 2 - text_surf.get_width() // 2, y))
             y += 24
         y += 6
@@ -1,4 +1,5 @@
 from ui.a11y import draw_action_emphasis, draw_active_panel, draw_controls_hint, draw_focus_frame
+from ui.text_cache import render_text
 
 
 def _tutorial_keyset(tutorial_state, tutorial_data):
@@ -31,18 +32,18 @@ def draw_tutorial_screen(
 ):
     if tutorial_state.in_intro:
         title = f"Tutorial Key Guide (Phase {tutorial_state.phase})"
-        title_surf, _ = title_font.render(title, accent)
+        title_surf, _ = render_text(title_font, title, accent)
         screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 70))
 
         if tutorial_state.intro_items:
             name, desc = tutorial_state.intro_items[tutorial_state.intro_index]
             header = f"{tutorial_data.FRIENDLY.get(name, name)} ({tutorial_state.intro_index + 1}/{len(tutorial_state.intro_items)})"
-            header_surf, _ = text_font.render(header, fg)
+            header_surf, _ = render_text(text_font, header, fg)
             screen.blit(header_surf, (screen_w // 2 - header_surf.get_width() // 2, 140))
 
             y = 200
             for line in wrap_text(desc, screen_w - 120):
-                line_surf, _ = small_font.render(line, fg)
+                line_surf, _ = render_text(small_font, line, fg)
                 screen.blit(line_surf, (screen_w // 2 - line_surf.get_width() // 2, y))
                 y += 30
 
@@ -57,9 +58,9 @@ def draw_tutorial_screen(
         return
 
     prompt = f"Press {tutorial_data.FRIENDLY[tutorial_state.required_name]}"
-    prompt_label_surf, _ = text_font.render("Type now:", accent)
+    prompt_label_surf, _ = render_text(text_font, "Type now:", accent)
     screen.blit(prompt_label_surf, (screen_w // 2 - prompt_label_surf.get_width() // 2, 65))
-    prompt_surf, _ = title_font.render(prompt, fg)
+    prompt_surf, _ = render_text(title_font, prompt, fg)
     prompt_rect = prompt_surf.get_rect(topleft=(screen_w // 2 - prompt_surf.get_width() // 2, 100))
     draw_active_panel(screen, prompt_rect, accent, fg, strong=focus_assist)
     screen.blit(prompt_surf, prompt_rect)
@@ -73,21 +74,21 @@ def draw_tutorial_screen(
         cnt = tutorial_state.counts_done.get(name, 0)
         total = tutorial_state.target_counts.get(name, tutorial_data.TUTORIAL_EACH_COUNT)
         lbl = f"{tutorial_data.FRIENDLY[name]}: {cnt}/{total}"
-        surf, _ = text_font.render(lbl, fg)
+        surf, _ = render_text(text_font, lbl, fg)
         screen.blit(surf, (screen_w // 2 - surf.get_width() // 2, y))
         y += 40
 
     if tutorial_state.guidance_message:
         y += 20
         for line in wrap_text(tutorial_state.guidance_message, screen_w - 80):
-            guide_surf, _ = text_font.render(line, hilite)
+            guide_surf, _ = render_text(text_font, line, hilite)
             screen.blit(guide_surf, (screen_w // 2 - guide_surf.get_width() // 2, y))
             y += 35
 
     if tutorial_state.hint_message:
         y += 10
         for line in wrap_text(tutorial_state.hint_message, screen_w - 80):
-            hint_surf, _ = small_font.render(line, accent)
+            hint_surf, _ = render_text(small_font, line, accent)
             screen.blit(hint_surf, (screen_w // 2 - hint_surf.get_width() // 2, y))
             y += 28
 
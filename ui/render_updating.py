@@ -1,6 +1,7 @@
 """Render the in-app update progress screen."""
 
 from ui.a11y import draw_active_panel, draw_controls_hint, draw_secondary_panel
+from ui.text_cache import render_text
 
 
 def _format_size(byte_count: int) -> str:
@@ -33,15 +34,15 @@ def draw_updating_screen(
     downloaded_bytes: int,
     total_bytes: int,
 ):
-    title_surf, _ = title_font.render("Updating KeyQuest", hilite)
+    title_surf, _ = render_text(title_font, "Updating KeyQuest", hilite)
     screen.blit(title_surf, (screen_w // 2 - title_surf.get_width() // 2, 90))
 
-    subtitle_surf, _ = text_font.render("Please wait", accent)
+    subtitle_surf, _ = render_text(text_font, "Please wait", accent)
     screen.blit(subtitle_surf, (screen_w // 2 - subtitle_surf.get_width() // 2, 150))
 
     y = 240
     for line in wrap_text(status_text, screen_w - 140):
-        line_surf, _ = small_font.render(line, fg)
+        line_surf, _ = render_text(small_font, line, fg)
         line_rect = line_surf.get_rect(topleft=(screen_w // 2 - line_surf.get_width() // 2, y))
         if y == 240:
             draw_active_panel(screen, line_rect, accent, fg)
@@ -50,7 +51,7 @@ def draw_updating_screen(
 
     if total_bytes > 0:
         progress_text = f"Downloaded {_format_size(downloaded_bytes)} of {_format_size(total_bytes)}"
-        progress_surf, _ = small_font.render(progress_text, accent)
+        progress_surf, _ = render_text(small_font, progress_text, accent)
         progress_rect = progress_surf.get_rect(topleft=(screen_w // 2 - progress_surf.get_width() // 2, y + 20))
         draw_secondary_panel(screen, progress_rect, accent, fg)
         screen.blit(progress_surf, progress_rect)
@@ -61,7 +62,7 @@ def draw_updating_screen(
     ]
     y = screen_h - 110
     for line in note_lines:
-        line_surf, _ = small_font.render(line, accent)
+        line_surf, _ = render_text(small_font, line, accent)
         screen.blit(line_surf, (screen_w // 2 - line_surf.get_width() // 2, y))
         y += 28
 
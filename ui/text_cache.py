@@ -0,0 +1,120 @@
+"""Shared cache of rendered text surfaces.
+
+Screens redraw the same titles, menu items, and control hints on every frame.
+``render_text(font, text, color)`` is a drop-in for ``font.render(text, color)``
+that keeps finished surfaces in an LRU keyed by font, size, style, text, and
+colors, bounded by entry count and by pixel memory. Fonts and theme colors
+change only through KeyQuestApp._rebuild_fonts() and apply_visual_theme(),
+which call clear_text_cache().
+
+Returned surfaces are shared between callers: blit them, scale them into a
+new surface, but never draw on them or change their alpha in place.
+"""
+
+from collections import OrderedDict
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+
+MAX_ENTRIES = 1024
+MAX_BYTES = 24 * 1024 * 1024
+
+
+def _color_key(color):
+    if color is None:
+        return None
+    return tuple(color)
+
+
+def _surface_bytes(surf) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+class TextSurfaceCache:
+    """LRU of rendered text surfaces bounded by entries and memory."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, bgcolor=None):
+        key = (
+            id(font),
+            getattr(font, "size", None),
+            getattr(font, "style", None),
+            text,
+            _color_key(color),
+            _color_key(bgcolor),
+        )
+        entry = self._entries.get(key)
+        # Entries hold their font, so the id cannot be reused while cached.
+        if entry is not None and entry[0] is font:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            surf, rect = entry[1], entry[2]
+            return surf, (rect.copy() if rect is not None else None)
+
+        self.misses += 1
+        if bgcolor is None:
+            surf, rect = font.render(text, color)
+        else:
+            surf, rect = font.render(text, color, bgcolor)
+        # Only real surfaces have a known size; anything else passes through.
+        if pygame is None or not isinstance(surf, pygame.Surface):
+            return surf, rect
+
+        size = _surface_bytes(surf)
+        if size > self.max_bytes:
+            return surf, rect
+        if entry is not None:
+            self._drop(key)
+        self._entries[key] = (font, surf, rect.copy() if rect is not None else None, size)
+        self.bytes_used += size
+        while len(self._entries) > self.max_entries or self.bytes_used > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+        return surf, rect
+
+    def _drop(self, key) -> None:
+        entry = self._entries.pop(key)
+        self.bytes_used -= entry[3]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.bytes_used = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+_cache = TextSurfaceCache()
+
+
+def render_text(font, text, color, bgcolor=None):
+    """Cached ``font.render(text, color)``; returns (surface, rect)."""
+    return _cache.render(font, text, color, bgcolor)
+
+
+def clear_text_cache() -> None:
+    """Drop every cached surface (after fonts or theme colors change)."""
+    _cache.clear()
+
+
+def text_cache_stats() -> dict:
+    return _cache.stats()
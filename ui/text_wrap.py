@@ -1,22 +1,150 @@
-def wrap_text(font, text: str, max_width: int, measure_color):
+"""Word wrapping measured with glyph metrics and memoized per font.
+
+Wrapping used to render a surface for every candidate line just to read its
+width, and ran on every frame. Lines are now laid out from cached per-word
+advance widths (``font.get_metrics``), and only the line boundaries are
+checked against the exact ink width from ``font.get_rect``, so the result
+matches the old render-and-measure wrapping. Finished layouts are kept in an
+LRU keyed by (font, size, text, max_width); redrawing the same text is a
+dictionary lookup.
+
+Fonts without ``get_rect`` / ``get_metrics`` are measured by rendering.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+LAYOUT_CACHE_SIZE = 512
+# Words remembered per font before the advance table is reset.
+WORD_CACHE_SIZE = 4096
+# Fonts with advance tables before all tables are reset.
+MAX_CACHED_FONTS = 16
+
+
+def _ink_width(font, text: str, measure_color=None) -> int:
+    """Width of the rendered text, the same value the render surface has."""
+    get_rect = getattr(font, "get_rect", None)
+    if get_rect is not None:
+        return get_rect(text).width
+    surf, _ = font.render(text, measure_color if measure_color is not None else (0, 0, 0))
+    return surf.get_width()
+
+
+def _advance_width(font, text: str, measure_color=None) -> float:
+    """Sum of glyph advances for ``text`` (falls back to its ink width)."""
+    get_metrics = getattr(font, "get_metrics", None)
+    if get_metrics is not None:
+        metrics = get_metrics(text)
+        if metrics and all(glyph is not None for glyph in metrics):
+            return float(sum(glyph[4] for glyph in metrics))
+    return float(_ink_width(font, text, measure_color))
+
+
+class WrapCache:
+    """LRU of wrapped layouts plus per-font word advance tables."""
+
+    def __init__(self, max_layouts: int = LAYOUT_CACHE_SIZE):
+        self.max_layouts = max(1, int(max_layouts))
+        self._layouts: "OrderedDict[tuple, Tuple[object, Tuple[str, ...]]]" = OrderedDict()
+        self._advances: Dict[int, Tuple[object, Dict[str, float]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _font_key(font) -> tuple:
+        return (id(font), getattr(font, "size", None), getattr(font, "style", None))
+
+    def wrap(self, font, text: str, max_width: int, measure_color=None) -> List[str]:
+        key = self._font_key(font) + (text, max_width)
+        entry = self._layouts.get(key)
+        # Entries hold their font, so the id cannot be reused while cached.
+        if entry is not None and entry[0] is font:
+            self._layouts.move_to_end(key)
+            self.hits += 1
+            return list(entry[1])
+
+        self.misses += 1
+        lines = tuple(self._layout(font, text, max_width, measure_color))
+        self._layouts[key] = (font, lines)
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return list(lines)
+
+    def _word_table(self, font) -> Dict[str, float]:
+        entry = self._advances.get(id(font))
+        if entry is None or entry[0] is not font:
+            if len(self._advances) >= MAX_CACHED_FONTS:
+                self._advances.clear()
+            entry = (font, {})
+            self._advances[id(font)] = entry
+        table = entry[1]
+        if len(table) > WORD_CACHE_SIZE:
+            table.clear()
+        return table
+
+    def _layout(self, font, text: str, max_width: int, measure_color) -> List[str]:
+        words = (text or "").split()
+        if not words:
+            return []
+
+        table = self._word_table(font)
+        advances = []
+        for word in words:
+            width = table.get(word)
+            if width is None:
+                width = _advance_width(font, word, measure_color)
+                table[word] = width
+            advances.append(width)
+        space = table.get(" ")
+        if space is None:
+            space = _advance_width(font, " ", measure_color)
+            table[" "] = space
+
+        lines = []
+        start = 0
+        count = len(words)
+        while start < count:
+            # Estimate the break from advances, then settle it with exact widths.
+            end = start + 1
+            width = advances[start]
+            while end < count and width + space + advances[end] <= max_width:
+                width += space + advances[end]
+                end += 1
+            while end - start > 1 and _ink_width(font, " ".join(words[start:end]), measure_color) > max_width:
+                end -= 1
+            while end < count and _ink_width(font, " ".join(words[start:end + 1]), measure_color) <= max_width:
+                end += 1
+            lines.append(" ".join(words[start:end]))
+            start = end
+        return lines
+
+    def clear(self) -> None:
+        self._layouts.clear()
+        self._advances.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "layouts": len(self._layouts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+_cache = WrapCache()
+
+
+def wrap_text(font, text: str, max_width: int, measure_color=None):
     """Wrap text into lines that fit within max_width pixels using the given font."""
-    words = (text or "").split()
-    if not words:
-        return []
-
-    lines = []
-    current_line = ""
-    for word in words:
-        test_line = f"{current_line} {word}".strip()
-        test_surf, _ = font.render(test_line, measure_color)
-        if test_surf.get_width() <= max_width:
-            current_line = test_line
-        else:
-            if current_line:
-                lines.append(current_line)
-            current_line = word
-
-    if current_line:
-        lines.append(current_line)
-    return lines
+    return _cache.wrap(font, text, max_width, measure_color)
+
+
+def clear_wrap_cache() -> None:
+    """Forget cached layouts and word widths (call after fonts are rebuilt)."""
+    _cache.clear()
+
 
+def wrap_cache_stats() -> dict:
+    return _cache.stats()